@@ -0,0 +1,121 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark the creation of Docker build contexts for large source roots.
+
+Usage: `python scripts/benchmark_build_context.py --files 50000`
+"""
+import os
+import tempfile
+import time
+from typing import Callable
+
+import click
+
+from zenml.constants import ENV_ZENML_CONFIG_PATH
+
+
+def _create_source_root(root: str, num_files: int, file_size: int) -> None:
+    """Creates a source root with files in nested directories.
+
+    Args:
+        root: The directory in which to create the files.
+        num_files: The number of files to create.
+        file_size: The size of each file in bytes.
+    """
+    for i in range(num_files):
+        directory = os.path.join(root, f"package_{i % 100}", f"module_{i % 7}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"file_{i}.py"), "wb") as f:
+            f.write(os.urandom(file_size // 2).hex().encode())
+
+    # Excluded directories that a typical repository contains
+    for excluded_directory in [".git", "node_modules", ".venv"]:
+        for i in range(num_files // 10):
+            directory = os.path.join(root, excluded_directory, str(i % 50))
+            os.makedirs(directory, exist_ok=True)
+            with open(os.path.join(directory, f"{i}.bin"), "wb") as f:
+                f.write(b"0" * file_size)
+
+    with open(os.path.join(root, ".dockerignore"), "w") as f:
+        f.write("\n".join([".git", "node_modules", ".venv", "**/*.pyc"]))
+
+    # Make sure all files are old enough to be stored in the manifest
+    timestamp = time.time() - 60
+    for directory, _, files in os.walk(root):
+        for file in files:
+            os.utime(os.path.join(directory, file), (timestamp, timestamp))
+
+
+def _measure(name: str, function: Callable[[], object]) -> None:
+    """Measures and prints the duration of a function call.
+
+    Args:
+        name: The name to print.
+        function: The function to call.
+    """
+    start = time.perf_counter()
+    function()
+    duration = time.perf_counter() - start
+    click.echo(f"{name:<32}{duration:8.2f}s")
+
+
+@click.command()
+@click.option("--files", "num_files", default=50_000, type=int)
+@click.option("--file-size", default=4096, type=int)
+def main(num_files: int, file_size: int) -> None:
+    """Benchmarks build context checksums and archives.
+
+    Args:
+        num_files: The number of files in the source root.
+        file_size: The size of each file in bytes.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # Use a separate config directory so no existing manifest is used
+        os.environ[ENV_ZENML_CONFIG_PATH] = os.path.join(tmp_dir, "config")
+
+        from docker.utils import build as docker_build_utils
+
+        from zenml.image_builders import BuildContext
+
+        root = os.path.join(tmp_dir, "root")
+        click.echo(f"Creating {num_files} files in `{root}`...")
+        _create_source_root(root, num_files=num_files, file_size=file_size)
+
+        build_context = BuildContext(root=root)
+        patterns = build_context._get_exclude_patterns()
+
+        _measure(
+            "List files (docker)",
+            lambda: docker_build_utils.exclude_paths(root, list(patterns)),
+        )
+        _measure("List files", build_context._get_files)
+        _measure("Checksum (no manifest)", build_context.compute_checksum)
+        _measure("Checksum (unchanged files)", build_context.compute_checksum)
+
+        with tempfile.TemporaryFile() as f:
+            _measure(
+                "Archive (docker)",
+                lambda: docker_build_utils.create_archive(
+                    root=root,
+                    files=sorted(build_context._get_files()),
+                    fileobj=f,
+                    gzip=True,
+                ),
+            )
+        with tempfile.TemporaryFile() as f:
+            _measure("Archive", lambda: build_context.write_archive(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Benchmark the time it takes to import ZenML and start the CLI.
+
+Every measurement runs in a fresh interpreter, so nothing is cached in
+`sys.modules`. Usage: `python scripts/benchmark_import_time.py --repeats 5`
+"""
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, Optional
+
+import click
+
+_CLI_INVOCATION = """
+from zenml.cli.cli import cli
+try:
+    cli({args})
+except SystemExit:
+    pass
+"""
+
+BENCHMARKS: Dict[str, str] = {
+    "import zenml": "import zenml",
+    "import integration registry": (
+        "from zenml.integrations.registry import integration_registry"
+    ),
+    "activate integrations": (
+        "from zenml.integrations.registry import integration_registry\n"
+        "integration_registry.activate_integrations()"
+    ),
+    "zenml --help": _CLI_INVOCATION.format(args=["--help"]),
+    "zenml version": _CLI_INVOCATION.format(args=["version"]),
+    "zenml stack --help": _CLI_INVOCATION.format(args=["stack", "--help"]),
+}
+
+
+def _measure(code: str) -> float:
+    """Measures how long it takes to run code in a new interpreter.
+
+    The startup time of the interpreter itself is not included.
+
+    Args:
+        code: The code to run.
+
+    Returns:
+        The duration in seconds.
+
+    Raises:
+        RuntimeError: If running the code failed.
+    """
+    script = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{code}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+@click.command()
+@click.option("--repeats", default=5, type=int)
+@click.option(
+    "--max-seconds",
+    type=float,
+    default=None,
+    help="Fail if the median of any benchmark exceeds this duration.",
+)
+def main(repeats: int, max_seconds: Optional[float]) -> None:
+    """Benchmarks the import and CLI startup time of ZenML.
+
+    Args:
+        repeats: How often to run each benchmark.
+        max_seconds: Optional maximum duration of each benchmark.
+    """
+    # Run once to make sure all bytecode is compiled
+    _measure("from zenml.cli.cli import cli")
+
+    exceeded = False
+    start = time.perf_counter()
+    for name, code in BENCHMARKS.items():
+        durations = [_measure(code) for _ in range(repeats)]
+        median = statistics.median(durations)
+        click.echo(
+            f"{name:<32}{median:8.3f}s (min {min(durations):.3f}s, "
+            f"max {max(durations):.3f}s)"
+        )
+        if max_seconds is not None and median > max_seconds:
+            exceeded = True
+
+    click.echo(f"Total benchmark time: {time.perf_counter() - start:.1f}s")
+    if exceeded:
+        sys.exit(f"At least one benchmark exceeded {max_seconds}s.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Local disk cache for reading artifacts from remote artifact stores."""
+import hashlib
+import os
+import shutil
+from typing import List, Tuple
+from uuid import UUID, uuid4
+
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.utils import io_utils
+
+logger = get_logger(__name__)
+
+TEMPORARY_ENTRY_PREFIX = ".tmp-"
+
+
+class ArtifactReadCache:
+    """Read-through cache that keeps local copies of artifacts on disk.
+
+    Artifacts are immutable once the step run that produced them has finished,
+    so a local copy never needs to be refreshed. Entries are keyed by the
+    artifact ID and the URI of the artifact, and the least recently used
+    entries get evicted once the total size of the cache exceeds its maximum
+    size.
+    """
+
+    def __init__(self, path: str, max_size: int) -> None:
+        """Initializes the cache.
+
+        Args:
+            path: The local directory in which to store the cached artifacts.
+            max_size: The maximum total size of the cached artifacts in bytes.
+        """
+        self.path = path
+        self.max_size = max_size
+
+    def get_entry_path(self, artifact_id: UUID, uri: str) -> str:
+        """Gets the local path of the cache entry for an artifact.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            uri: The URI of the artifact.
+
+        Returns:
+            The local path of the cache entry.
+        """
+        uri_hash = hashlib.sha256(uri.encode()).hexdigest()[:16]
+        return os.path.join(self.path, f"{artifact_id}-{uri_hash}")
+
+    def get(self, artifact_id: UUID, uri: str) -> str:
+        """Gets the local path of an artifact, copying it if not cached yet.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            uri: The URI of the artifact.
+
+        Returns:
+            The local path of the cached artifact.
+        """
+        entry_path = self.get_entry_path(artifact_id=artifact_id, uri=uri)
+        if os.path.exists(entry_path):
+            logger.debug("Reading artifact `%s` from local cache.", uri)
+            # The modification time of an entry is its last access time
+            os.utime(entry_path)
+            return entry_path
+
+        logger.debug("Copying artifact `%s` to local cache.", uri)
+        io_utils.create_dir_recursive_if_not_exists(self.path)
+        temporary_path = os.path.join(
+            self.path, f"{TEMPORARY_ENTRY_PREFIX}{uuid4()}"
+        )
+        try:
+            if fileio.isdir(uri):
+                io_utils.copy_dir(uri, temporary_path)
+                # Empty artifact directories are not created by `copy_dir`
+                io_utils.create_dir_recursive_if_not_exists(temporary_path)
+            else:
+                fileio.copy(uri, temporary_path)
+        except Exception:
+            _remove(temporary_path)
+            raise
+
+        try:
+            os.replace(temporary_path, entry_path)
+        except OSError:
+            # Another process might have cached the same artifact in the
+            # meantime, in which case we use its copy
+            _remove(temporary_path)
+            if not os.path.exists(entry_path):
+                raise
+
+        self.evict(keep=entry_path)
+        return entry_path
+
+    def evict(self, keep: str = "") -> None:
+        """Evicts the least recently used entries until the cache fits.
+
+        Args:
+            keep: Path of an entry that should never be evicted, e.g. because
+                it is about to be read.
+        """
+        entries: List[Tuple[float, int, str]] = []
+        total_size = 0
+        for name in os.listdir(self.path):
+            if name.startswith(TEMPORARY_ENTRY_PREFIX):
+                continue
+            entry_path = os.path.join(self.path, name)
+            try:
+                last_access_time = os.path.getmtime(entry_path)
+                size = _get_size(entry_path)
+            except OSError:
+                # The entry was evicted concurrently by another process
+                continue
+            entries.append((last_access_time, size, entry_path))
+            total_size += size
+
+        for _, size, entry_path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            if entry_path == keep:
+                continue
+            logger.debug("Evicting `%s` from artifact cache.", entry_path)
+            _remove(entry_path)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Removes all entries from the cache."""
+        _remove(self.path)
+
+
+def _get_size(path: str) -> int:
+    """Gets the total size of a file or directory.
+
+    Args:
+        path: The local path of the file or directory.
+
+    Returns:
+        The size in bytes.
+    """
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+
+    return sum(
+        os.path.getsize(os.path.join(root, file))
+        for root, _, files in os.walk(path)
+        for file in files
+    )
+
+
+def _remove(path: str) -> None:
+    """Removes a local file or directory if it exists.
+
+    Args:
+        path: The local path to remove.
+    """
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+    elif os.path.exists(path):
+        os.remove(path)
@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """The base interface to extend the ZenML artifact store."""
+import os
 import textwrap
 from abc import abstractmethod
 from typing import (
@@ -28,9 +29,11 @@ from typing import (
     Union,
     cast,
 )
+from uuid import UUID
 
 from pydantic import root_validator
 
+from zenml.artifact_stores.artifact_read_cache import ArtifactReadCache
 from zenml.enums import StackComponentType
 from zenml.exceptions import ArtifactStoreInterfaceError
 from zenml.io import fileio
@@ -107,9 +110,21 @@ def _sanitize_paths(_func: Callable[..., Any]) -> Callable[..., Any]:
 
 
 class BaseArtifactStoreConfig(StackComponentConfig):
-    """Config class for `BaseArtifactStore`."""
+    """Config class for `BaseArtifactStore`.
+
+    Attributes:
+        path: The root path of the artifact store.
+        read_cache_size_mb: Maximum size in MB of the local disk cache from
+            which artifacts of a remote artifact store are read. Artifacts
+            are immutable, so each one only needs to be downloaded once per
+            machine. Set to 0 to disable the cache.
+        read_cache_path: Local directory of the read cache. Defaults to a
+            directory inside the global ZenML config directory.
+    """
 
     path: str
+    read_cache_size_mb: int = 0
+    read_cache_path: Optional[str] = None
 
     SUPPORTED_SCHEMES: ClassVar[Set[str]]
 
@@ -186,6 +201,44 @@ class BaseArtifactStore(StackComponent):
         """
         return self.config.path
 
+    def get_local_artifact_uri(self, artifact_id: UUID, uri: str) -> str:
+        """Gets the URI from which to read an artifact of this store.
+
+        If the read cache is enabled and the artifact is stored remotely, the
+        artifact is copied to the local cache once and subsequently read from
+        there.
+
+        Args:
+            artifact_id: The ID of the artifact.
+            uri: The URI of the artifact.
+
+        Returns:
+            The local path of the cached artifact, or the original URI if
+            the artifact is not cached.
+        """
+        if self.config.read_cache_size_mb <= 0 or not io_utils.is_remote(uri):
+            return uri
+
+        cache_path = self.config.read_cache_path or os.path.join(
+            io_utils.get_global_config_directory(),
+            "artifact_cache",
+            str(self.id),
+        )
+        cache = ArtifactReadCache(
+            path=cache_path,
+            max_size=self.config.read_cache_size_mb * 1024 * 1024,
+        )
+        try:
+            return cache.get(artifact_id=artifact_id, uri=uri)
+        except Exception as e:
+            logger.warning(
+                "Failed to cache artifact `%s` locally, reading it from the "
+                "artifact store instead: %s",
+                uri,
+                e,
+            )
+            return uri
+
     # --- User interface ---
     @abstractmethod
     def open(self, name: PathType, mode: str = "r") -> Any:
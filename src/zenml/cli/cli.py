@@ -13,19 +13,29 @@
 #  permissions and limitations under the License.
 """Core CLI functionality."""
 
+import importlib
 import os
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import click
 import rich
-from click import Command, Context, formatting
+from click import Context, formatting
+from click.utils import make_default_short_help
 
 from zenml import __version__
 from zenml.cli.formatter import ZenFormatter
-from zenml.client import Client
-from zenml.enums import CliCategories
+from zenml.enums import CliCategories, StackComponentType
 from zenml.logger import set_root_verbosity
-from zenml.utils import source_utils
 
 
 class TagGroup(click.Group):
@@ -62,11 +72,126 @@ class ZenContext(click.Context):
     formatter_class = ZenFormatter
 
 
+class LazyCommand(NamedTuple):
+    """A top-level CLI command that is only imported once it is invoked.
+
+    Attributes:
+        modules: The modules that need to be imported to register the command
+            and all its subcommands.
+        help: The short help of the command, shown in the help output.
+        tag: The tag of the command, used to group commands in the help
+            output.
+        hidden: Whether the command is hidden in the help output.
+    """
+
+    modules: Tuple[str, ...]
+    help: str
+    tag: CliCategories = CliCategories.OTHER_COMMANDS
+    hidden: bool = False
+
+
+class _LazyCommandDict(Dict[str, click.Command]):
+    """Dictionary of commands that imports lazy commands on access."""
+
+    def __init__(
+        self,
+        commands: Dict[str, click.Command],
+        lazy_commands: Mapping[str, LazyCommand],
+    ) -> None:
+        """Initializes the dictionary.
+
+        Args:
+            commands: The commands that are already loaded.
+            lazy_commands: Commands that are imported once they are accessed,
+                keyed by the command name.
+        """
+        super().__init__(commands)
+        self._lazy_commands = lazy_commands
+
+    def __missing__(self, key: str) -> click.Command:
+        """Imports a lazy command that is accessed by its name.
+
+        Args:
+            key: The name of the command.
+
+        Returns:
+            The command.
+
+        Raises:
+            KeyError: If no command with this name exists.
+        """
+        if key in self._lazy_commands:
+            for module in self._lazy_commands[key].modules:
+                importlib.import_module(module)
+
+        if not dict.__contains__(self, key):
+            raise KeyError(key)
+        return dict.__getitem__(self, key)
+
+
 class ZenMLCLI(click.Group):
-    """Custom click Group to create a custom format command help output."""
+    """Custom click Group to create a custom format command help output.
+
+    Commands that are passed as `lazy_commands` are only imported once they
+    are invoked, so running a single command doesn't pay the import cost of
+    all other commands.
+    """
 
     context_class = ZenContext
 
+    def __init__(
+        self,
+        *args: Any,
+        lazy_commands: Optional[Mapping[str, LazyCommand]] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initializes the group.
+
+        Args:
+            *args: Positional arguments passed to the click group.
+            lazy_commands: Commands that are imported once they are invoked,
+                keyed by the command name.
+            **kwargs: Keyword arguments passed to the click group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Mapping[str, LazyCommand] = lazy_commands or {}
+        # Accessing `cli.commands[name]` directly imports lazy commands too
+        self.commands = _LazyCommandDict(self.commands, self.lazy_commands)
+
+    def list_commands(self, ctx: Context) -> List[str]:
+        """Lists the names of all commands, including the lazy ones.
+
+        Args:
+            ctx: The click context.
+
+        Returns:
+            The sorted command names.
+        """
+        return sorted(set(self.commands).union(self.lazy_commands))
+
+    def get_command(
+        self, ctx: Context, cmd_name: str
+    ) -> Optional[click.Command]:
+        """Gets a command, importing it first if it is a lazy command.
+
+        Args:
+            ctx: The click context.
+            cmd_name: The name of the command.
+
+        Returns:
+            The command or `None` if no command with this name exists.
+        """
+        try:
+            return self.commands[cmd_name]
+        except KeyError:
+            return None
+
+    def load_all_commands(self) -> None:
+        """Imports all lazy commands."""
+        for lazy_command in self.lazy_commands.values():
+            for module in lazy_command.modules:
+                importlib.import_module(module)
+
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it.
 
@@ -98,10 +223,18 @@ class ZenMLCLI(click.Group):
             ctx: The click context.
             formatter: The click formatter.
         """
-        commands: List[
-            Tuple[CliCategories, str, Union[Command, TagGroup]]
-        ] = []
+        commands: List[Tuple[CliCategories, str, str]] = []
         for subcommand in self.list_commands(ctx):
+            if subcommand not in self.commands:
+                # Don't import lazy commands only to show their help
+                lazy_command = self.lazy_commands.get(subcommand)
+                if lazy_command and not lazy_command.hidden:
+                    help_ = make_default_short_help(
+                        lazy_command.help, max_length=formatter.width
+                    )
+                    commands.append((lazy_command.tag, subcommand, help_))
+                continue
+
             cmd = self.get_command(ctx, subcommand)
             # What is this, the tool lied about a command.  Ignore it
             if cmd is None or cmd.hidden:
@@ -115,7 +248,7 @@ class ZenMLCLI(click.Group):
                 (
                     category,
                     subcommand,
-                    cmd,
+                    cmd.get_short_help_str(limit=formatter.width),
                 )
             )
 
@@ -132,8 +265,7 @@ class ZenMLCLI(click.Group):
                 )
             )
             rows: List[Tuple[str, str, str]] = []
-            for (tag, subcommand, cmd) in commands:
-                help_ = cmd.get_short_help_str(limit=formatter.width)
+            for (tag, subcommand, help_) in commands:
                 rows.append((tag.value, subcommand, help_))
             if rows:
                 colored_section_title = (
@@ -143,10 +275,142 @@ class ZenMLCLI(click.Group):
                     formatter.write_dl(rows)  # type: ignore[arg-type]
 
 
-@click.group(cls=ZenMLCLI)
+def _get_lazy_commands() -> Dict[str, LazyCommand]:
+    """Gets all top-level commands that are defined in other CLI modules.
+
+    Returns:
+        The lazy commands keyed by their name.
+    """
+    management = CliCategories.MANAGEMENT_TOOLS
+    security = CliCategories.IDENTITY_AND_SECURITY
+    lazy_commands = {
+        "analytics": LazyCommand(
+            ("zenml.cli.config",),
+            "Analytics for opt-in and opt-out.",
+            management,
+        ),
+        "artifact": LazyCommand(
+            ("zenml.cli.artifact",), "List or delete artifacts.", management
+        ),
+        "clean": LazyCommand(
+            ("zenml.cli.base",),
+            "Delete all ZenML metadata, artifacts and stacks.",
+            hidden=True,
+        ),
+        "connect": LazyCommand(
+            ("zenml.cli.server",), "Connect to a remote ZenML server."
+        ),
+        "deploy": LazyCommand(
+            ("zenml.cli.server",), "Deploy ZenML in the cloud."
+        ),
+        "destroy": LazyCommand(
+            ("zenml.cli.server",),
+            "Tear down and clean up the cloud ZenML deployment.",
+        ),
+        "disconnect": LazyCommand(
+            ("zenml.cli.server",), "Disconnect from a ZenML server."
+        ),
+        "down": LazyCommand(
+            ("zenml.cli.server",), "Shut down the local ZenML dashboard."
+        ),
+        "example": LazyCommand(
+            ("zenml.cli.example",), "Access all ZenML examples."
+        ),
+        "go": LazyCommand(
+            ("zenml.cli.base",),
+            "Quickly explore ZenML with this walk-through.",
+        ),
+        "info": LazyCommand(
+            ("zenml.cli.base",),
+            "Show information about the current user setup.",
+            hidden=True,
+        ),
+        "init": LazyCommand(
+            ("zenml.cli.base",), "Initialize a ZenML repository."
+        ),
+        "integration": LazyCommand(
+            ("zenml.cli.integration",),
+            "Interact with external integrations.",
+            CliCategories.INTEGRATIONS,
+        ),
+        "logging": LazyCommand(
+            ("zenml.cli.config",),
+            "Configuration of logging for ZenML pipelines.",
+            management,
+        ),
+        "logs": LazyCommand(
+            ("zenml.cli.server",),
+            "Show the logs for the local or cloud ZenML server.",
+        ),
+        "permission": LazyCommand(
+            ("zenml.cli.role",), "Commands for role management.", security
+        ),
+        "pipeline": LazyCommand(
+            ("zenml.cli.pipeline",),
+            "Interact with pipelines, runs and schedules.",
+            management,
+        ),
+        "project": LazyCommand(
+            ("zenml.cli.workspace",),
+            "Deprecated commands for project management.",
+            management,
+        ),
+        "role": LazyCommand(
+            ("zenml.cli.role",), "Commands for role management.", security
+        ),
+        "secret": LazyCommand(
+            ("zenml.cli.secret",),
+            "Create, list, update, or delete secrets.",
+            security,
+        ),
+        "stack": LazyCommand(
+            ("zenml.cli.stack", "zenml.cli.stack_recipes"),
+            "Stacks to define various environments.",
+            management,
+        ),
+        "status": LazyCommand(
+            ("zenml.cli.server",),
+            "Show information about the current configuration.",
+        ),
+        "team": LazyCommand(
+            ("zenml.cli.user_management",),
+            "Commands for team management.",
+            security,
+        ),
+        "up": LazyCommand(
+            ("zenml.cli.server",), "Start the ZenML dashboard locally."
+        ),
+        "user": LazyCommand(
+            ("zenml.cli.user_management",),
+            "Commands for user management.",
+            security,
+        ),
+        "version": LazyCommand(("zenml.cli.version",), "Version of ZenML."),
+        "workspace": LazyCommand(
+            ("zenml.cli.workspace",),
+            "Commands for workspace management.",
+            management,
+        ),
+    }
+
+    for component_type in StackComponentType:
+        plural_display_name = component_type.plural.replace("_", " ")
+        lazy_commands[component_type.value.replace("_", "-")] = LazyCommand(
+            ("zenml.cli.stack_components",),
+            f"Commands to interact with {plural_display_name}.",
+            CliCategories.STACK_COMPONENTS,
+        )
+
+    return lazy_commands
+
+
+@click.group(cls=ZenMLCLI, lazy_commands=_get_lazy_commands())
 @click.version_option(__version__, "--version", "-v")
 def cli() -> None:
     """CLI base command for ZenML."""
+    from zenml.client import Client
+    from zenml.utils import source_utils
+
     set_root_verbosity()
     repo_root = Client.find_repository()
     if not repo_root:
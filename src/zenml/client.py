@@ -12,9 +12,12 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Client implementation."""
+import asyncio
 import json
+import math
 import os
 from abc import ABCMeta
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import partial
 from pathlib import Path
@@ -26,6 +29,7 @@ from typing import (
     List,
     Mapping,
     Optional,
+    Sequence,
     Set,
     TypeVar,
     Union,
@@ -37,6 +41,7 @@ from pydantic import SecretStr
 
 from zenml.config.global_config import GlobalConfiguration
 from zenml.constants import (
+    CLIENT_CACHE_TTL,
     ENV_ZENML_ACTIVE_STACK_ID,
     ENV_ZENML_ENABLE_REPO_INIT_WARNINGS,
     ENV_ZENML_REPOSITORY_PATH,
@@ -129,6 +134,7 @@ from zenml.utils import io_utils
 from zenml.utils.analytics_utils import AnalyticsEvent, event_handler, track
 from zenml.utils.filesync_model import FileSyncModel
 from zenml.utils.pagination_utils import depaginate
+from zenml.utils.ttl_cache import CacheInfo, TTLCache
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -251,9 +257,12 @@ class Client(metaclass=ClientMetaClass):
 
     The ZenML client manages configuration options for ZenML stacks as well
     as their components.
-    """
 
-    _active_user: Optional[UserResponseModel] = None
+    The models of the active user and stack are cached for
+    `CLIENT_CACHE_TTL` seconds, so that accessing them repeatedly doesn't
+    require a request to the ZenML store each time. The cache is invalidated
+    whenever the client changes or updates them.
+    """
 
     def __init__(
         self,
@@ -286,9 +295,21 @@ class Client(metaclass=ClientMetaClass):
         """
         self._root: Optional[Path] = None
         self._config: Optional[ClientConfiguration] = None
+        self._cache: TTLCache[str, Any] = TTLCache(ttl=CLIENT_CACHE_TTL)
 
         self._set_active_root(root)
 
+    def cache_info(self) -> CacheInfo:
+        """Returns statistics of the cache of the client.
+
+        The client caches the active user and stack models as well as the
+        flavors of the active stack components for a short time.
+
+        Returns:
+            The number of cache hits, misses and the current cache size.
+        """
+        return self._cache.cache_info()
+
     @classmethod
     def get_instance(cls) -> Optional["Client"]:
         """Return the Client singleton instance.
@@ -342,6 +363,8 @@ class Client(metaclass=ClientMetaClass):
             logger.debug("Using repository root %s.", self._root)
             self._config = self._load_config()
 
+        self._cache.invalidate()
+
         # Sanitize the client configuration to reflect the current
         # settings
         self._sanitize_config()
@@ -586,6 +609,8 @@ class Client(metaclass=ClientMetaClass):
         workspace = self.zen_store.get_workspace(
             workspace_name_or_id=workspace_name_or_id
         )  # raises KeyError
+        # Changing the workspace might also change the active stack
+        self._cache.invalidate()
         if self._config:
             self._config.set_active_workspace(workspace)
             # Sanitize the client configuration to reflect the current
@@ -608,9 +633,13 @@ class Client(metaclass=ClientMetaClass):
         Returns:
             The active user.
         """
-        if self._active_user is None:
-            self._active_user = self.zen_store.get_user(include_private=True)
-        return self._active_user
+        return cast(
+            UserResponseModel,
+            self._cache.get_or_load(
+                "active_user",
+                lambda: self.zen_store.get_user(include_private=True),
+            ),
+        )
 
     def create_user(
         self,
@@ -681,6 +710,8 @@ class Client(metaclass=ClientMetaClass):
         email: Optional[str] = None,
         active: Optional[bool] = None,
         email_opted_in: Optional[bool] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[UserResponseModel]:
         """List all users.
 
@@ -697,6 +728,9 @@ class Client(metaclass=ClientMetaClass):
             email: Use the user email for filtering
             active: User the user active status for filtering
             email_opted_in: Use the user opt in status for filtering
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             The User
@@ -706,6 +740,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
+                include_total=include_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -763,9 +799,11 @@ class Client(metaclass=ClientMetaClass):
         if updated_email_opt_in is not None:
             user_update.email_opted_in = updated_email_opt_in
 
-        return self.zen_store.update_user(
+        updated_user = self.zen_store.update_user(
             user_id=user.id, user_update=user_update
         )
+        self._cache.invalidate("active_user")
+        return updated_user
 
     # ---- #
     # TEAM #
@@ -802,6 +840,8 @@ class Client(metaclass=ClientMetaClass):
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[TeamResponseModel]:
         """List all teams.
 
@@ -814,6 +854,9 @@ class Client(metaclass=ClientMetaClass):
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             name: Use the team name for filtering
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             The Team
@@ -823,6 +866,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
+                include_total=include_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -965,6 +1010,8 @@ class Client(metaclass=ClientMetaClass):
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[RoleResponseModel]:
         """List all roles.
 
@@ -977,6 +1024,9 @@ class Client(metaclass=ClientMetaClass):
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             name: Use the role name for filtering
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             The Role
@@ -986,6 +1036,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
+                include_total=include_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1168,6 +1220,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         role_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[UserRoleAssignmentResponseModel]:
         """List all user role assignments.
 
@@ -1182,6 +1236,9 @@ class Client(metaclass=ClientMetaClass):
             workspace_id: The id of the workspace to filter by.
             user_id: The id of the user to filter by.
             role_id: The id of the role to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             The Team
@@ -1191,6 +1248,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
+                include_total=include_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1274,6 +1333,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         team_id: Optional[Union[str, UUID]] = None,
         role_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[TeamRoleAssignmentResponseModel]:
         """List all team role assignments.
 
@@ -1288,6 +1349,9 @@ class Client(metaclass=ClientMetaClass):
             workspace_id: The id of the workspace to filter by.
             team_id: The id of the team to filter by.
             role_id: The id of the role to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             The Team
@@ -1297,6 +1361,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
+                include_total=include_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1384,6 +1450,8 @@ class Client(metaclass=ClientMetaClass):
         created: Optional[Union[datetime, str]] = None,
         updated: Optional[Union[datetime, str]] = None,
         name: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[WorkspaceResponseModel]:
         """List all workspaces.
 
@@ -1396,6 +1464,9 @@ class Client(metaclass=ClientMetaClass):
             created: Use to filter by time of creation
             updated: Use the last updated date for filtering
             name: Use the team name for filtering
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             The Team
@@ -1405,6 +1476,8 @@ class Client(metaclass=ClientMetaClass):
                 sort_by=sort_by,
                 page=page,
                 size=size,
+                after=after,
+                include_total=include_total,
                 logical_operator=logical_operator,
                 id=id,
                 created=created,
@@ -1453,11 +1526,19 @@ class Client(metaclass=ClientMetaClass):
             workspace_update.name = new_name
         if new_description:
             workspace_update.description = new_description
-        return self.zen_store.update_workspace(
+        updated_workspace = self.zen_store.update_workspace(
             workspace_id=workspace.id,
             workspace_update=workspace_update,
         )
 
+        # Replace the cached model of the active workspace
+        if updated_workspace.id == self.active_workspace.id:
+            if self._config and self._config.active_workspace_id:
+                self._config.set_active_workspace(updated_workspace)
+            else:
+                GlobalConfiguration().set_active_workspace(updated_workspace)
+        return updated_workspace
+
     def delete_workspace(self, name_id_or_prefix: str) -> None:
         """Delete a workspace.
 
@@ -1498,13 +1579,17 @@ class Client(metaclass=ClientMetaClass):
         stack: Optional["StackResponseModel"] = None
 
         if ENV_ZENML_ACTIVE_STACK_ID in os.environ:
-            return self.get_stack(ENV_ZENML_ACTIVE_STACK_ID)
+            return self._get_cached_stack(
+                os.environ[ENV_ZENML_ACTIVE_STACK_ID]
+            )
 
-        if self._config:
-            stack = self.get_stack(self._config.active_stack_id)
+        if self._config and self._config.active_stack_id:
+            stack = self._get_cached_stack(self._config.active_stack_id)
 
         if not stack:
-            stack = self.get_stack(GlobalConfiguration().get_active_stack_id())
+            stack = self._get_cached_stack(
+                GlobalConfiguration().get_active_stack_id()
+            )
 
         if not stack:
             raise RuntimeError(
@@ -1514,6 +1599,44 @@ class Client(metaclass=ClientMetaClass):
 
         return stack
 
+    def _get_cached_stack(
+        self, stack_id: Union[UUID, str]
+    ) -> "StackResponseModel":
+        """Get a stack by ID, using the client cache.
+
+        Args:
+            stack_id: The ID of the stack.
+
+        Returns:
+            The model of the stack.
+        """
+        return cast(
+            "StackResponseModel",
+            self._cache.get_or_load(
+                f"stack:{stack_id}", lambda: self.get_stack(stack_id)
+            ),
+        )
+
+    def _pin_stack_and_flavors(
+        self,
+        stack: "StackResponseModel",
+        flavors: Sequence["FlavorResponseModel"],
+    ) -> None:
+        """Pins a stack and the flavors of its components in the cache.
+
+        Pinned entries don't expire, which allows short-lived processes like
+        step entrypoints to build the stack without querying the store.
+
+        Args:
+            stack: The stack to pin.
+            flavors: The flavors of the stack components.
+        """
+        self._cache.set(f"stack:{stack.id}", stack, ttl=math.inf)
+        for flavor in flavors:
+            self._cache.set(
+                f"flavor:{flavor.type}:{flavor.name}", flavor, ttl=math.inf
+            )
+
     @property
     def active_stack(self) -> "Stack":
         """The active stack for this client.
@@ -1714,10 +1837,12 @@ class Client(metaclass=ClientMetaClass):
 
             update_model.components = components_dict
 
-        return self.zen_store.update_stack(
+        updated_stack = self.zen_store.update_stack(
             stack_id=stack.id,
             stack_update=update_model,
         )
+        self._cache.set(f"stack:{stack.id}", updated_stack)
+        return updated_stack
 
     def delete_stack(self, name_id_or_prefix: Union[str, UUID]) -> None:
         """Deregisters a stack.
@@ -1768,6 +1893,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         component_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[StackResponseModel]:
         """Lists all stacks.
 
@@ -1785,6 +1912,9 @@ class Client(metaclass=ClientMetaClass):
             component_id: The id of the component to filter by.
             name: The name of the stack to filter by.
             is_shared: The shared status of the stack to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A page of stacks.
@@ -1792,6 +1922,8 @@ class Client(metaclass=ClientMetaClass):
         stack_filter_model = StackFilterModel(
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id,
@@ -1836,6 +1968,8 @@ class Client(metaclass=ClientMetaClass):
             # a local configuration
             GlobalConfiguration().set_active_stack(stack=stack)
 
+        self._cache.set(f"stack:{stack.id}", stack)
+
     def _validate_stack_configuration(
         self, stack: "StackRequestModel"
     ) -> None:
@@ -1987,6 +2121,8 @@ class Client(metaclass=ClientMetaClass):
         type: Optional[str] = None,
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[ComponentResponseModel]:
         """Lists all registered stack components.
 
@@ -2004,6 +2140,9 @@ class Client(metaclass=ClientMetaClass):
             user_id: The id of the user to filter by.
             name: The name of the component to filter by.
             is_shared: The shared status of the component to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A page of stack components.
@@ -2011,6 +2150,8 @@ class Client(metaclass=ClientMetaClass):
         component_filter_model = ComponentFilterModel(
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             workspace_id=workspace_id or self.active_workspace.id,
@@ -2171,11 +2312,15 @@ class Client(metaclass=ClientMetaClass):
             update_model.configuration = existing_configuration
 
         # Send the updated component to the ZenStore
-        return self.zen_store.update_stack_component(
+        updated_component = self.zen_store.update_stack_component(
             component_id=component.id,
             component_update=update_model,
         )
 
+        # Cached stacks might contain the component
+        self._cache.invalidate()
+        return updated_component
+
     def delete_stack_component(
         self,
         name_id_or_prefix: Union[str, UUID],
@@ -2327,6 +2472,8 @@ class Client(metaclass=ClientMetaClass):
         type: Optional[str] = None,
         integration: Optional[str] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[FlavorResponseModel]:
         """Fetches all the flavor models.
 
@@ -2342,6 +2489,9 @@ class Client(metaclass=ClientMetaClass):
             name: The name of the flavor to filter by.
             type: The type of the flavor to filter by.
             integration: The integration of the flavor to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A list of all the flavor models.
@@ -2349,6 +2499,8 @@ class Client(metaclass=ClientMetaClass):
         flavor_filter_model = FlavorFilterModel(
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -2396,6 +2548,10 @@ class Client(metaclass=ClientMetaClass):
         Raises:
             KeyError: If no flavor exists for the given type and name.
         """
+        cached_flavor = self._cache.get(f"flavor:{component_type}:{name}")
+        if cached_flavor:
+            return cast("FlavorResponseModel", cached_flavor)
+
         logger.debug(
             f"Fetching the flavor of type {component_type} with name {name}."
         )
@@ -2438,6 +2594,8 @@ class Client(metaclass=ClientMetaClass):
         docstring: Optional[str] = None,
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[PipelineResponseModel]:
         """List all pipelines.
 
@@ -2455,6 +2613,9 @@ class Client(metaclass=ClientMetaClass):
             docstring: The docstring of the pipeline to filter by.
             workspace_id: The id of the workspace to filter by.
             user_id: The id of the user to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -2463,6 +2624,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2586,6 +2749,9 @@ class Client(metaclass=ClientMetaClass):
         user_id: Optional[Union[str, UUID]] = None,
         pipeline_id: Optional[Union[str, UUID]] = None,
         stack_id: Optional[Union[str, UUID]] = None,
+        checksum: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[PipelineBuildResponseModel]:
         """List all builds.
 
@@ -2601,6 +2767,10 @@ class Client(metaclass=ClientMetaClass):
             user_id: The  id of the user to filter by.
             pipeline_id: The id of the pipeline to filter by.
             stack_id: The id of the stack to filter by.
+            checksum: The build checksum to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A page with builds fitting the filter description
@@ -2609,6 +2779,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2617,6 +2789,7 @@ class Client(metaclass=ClientMetaClass):
             user_id=user_id,
             pipeline_id=pipeline_id,
             stack_id=stack_id,
+            checksum=checksum,
         )
         build_filter_model.set_scope_workspace(self.active_workspace.id)
         return self.zen_store.list_builds(
@@ -2694,6 +2867,8 @@ class Client(metaclass=ClientMetaClass):
         pipeline_id: Optional[Union[str, UUID]] = None,
         stack_id: Optional[Union[str, UUID]] = None,
         build_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[PipelineDeploymentResponseModel]:
         """List all deployments.
 
@@ -2710,6 +2885,9 @@ class Client(metaclass=ClientMetaClass):
             pipeline_id: The id of the pipeline to filter by.
             stack_id: The id of the stack to filter by.
             build_id: The id of the build to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A page with deployments fitting the filter description
@@ -2718,6 +2896,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2812,6 +2992,8 @@ class Client(metaclass=ClientMetaClass):
         end_time: Optional[Union[datetime, str]] = None,
         interval_second: Optional[int] = None,
         catchup: Optional[Union[str, bool]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[ScheduleResponseModel]:
         """List schedules.
 
@@ -2834,6 +3016,9 @@ class Client(metaclass=ClientMetaClass):
             end_time: Use to filter by end time.
             interval_second: Use to filter by interval second.
             catchup: Use to filter by catchup.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A list of schedules.
@@ -2842,6 +3027,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -2928,6 +3115,8 @@ class Client(metaclass=ClientMetaClass):
         end_time: Optional[Union[datetime, str]] = None,
         num_steps: Optional[Union[int, str]] = None,
         unlisted: Optional[bool] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[PipelineRunResponseModel]:
         """List all pipeline runs.
 
@@ -2953,6 +3142,9 @@ class Client(metaclass=ClientMetaClass):
             end_time: The end_time for the pipeline run
             num_steps: The number of steps for the pipeline run
             unlisted: If the runs should be unlisted or not.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A page with Pipeline Runs fitting the filter description
@@ -2961,6 +3153,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3004,6 +3198,22 @@ class Client(metaclass=ClientMetaClass):
             allow_name_prefix_match=allow_name_prefix_match,
         )
 
+    def get_pipeline_runs_by_ids(
+        self, run_ids: Sequence[UUID]
+    ) -> List[PipelineRunResponseModel]:
+        """Get multiple pipeline runs by ID.
+
+        When connected to a ZenML server, the pipeline runs are fetched
+        concurrently.
+
+        Args:
+            run_ids: The IDs of the pipeline runs to get.
+
+        Returns:
+            The pipeline runs, in the order of the given IDs.
+        """
+        return self._get_resources_concurrently("get_run", run_ids)
+
     def delete_pipeline_run(
         self,
         name_id_or_prefix: Union[str, UUID],
@@ -3043,6 +3253,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         num_outputs: Optional[Union[int, str]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[StepRunResponseModel]:
         """List all pipelines.
 
@@ -3066,6 +3278,9 @@ class Client(metaclass=ClientMetaClass):
             cache_key: The cache_key of the run to filter by.
             status: The name of the run to filter by.
             num_outputs: The number of outputs for the step run
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A page with Pipeline fitting the filter description
@@ -3074,6 +3289,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             entrypoint_name=entrypoint_name,
@@ -3107,6 +3324,22 @@ class Client(metaclass=ClientMetaClass):
         """
         return self.zen_store.get_run_step(step_run_id)
 
+    def get_run_steps_by_ids(
+        self, step_run_ids: Sequence[UUID]
+    ) -> List[StepRunResponseModel]:
+        """Get multiple step runs by ID.
+
+        When connected to a ZenML server, the step runs are fetched
+        concurrently.
+
+        Args:
+            step_run_ids: The IDs of the step runs to get.
+
+        Returns:
+            The step runs, in the order of the given IDs.
+        """
+        return self._get_resources_concurrently("get_run_step", step_run_ids)
+
     # -------------
     # - Artifacts -
     # -------------
@@ -3129,6 +3362,8 @@ class Client(metaclass=ClientMetaClass):
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
         only_unused: Optional[bool] = False,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[ArtifactResponseModel]:
         """Get all artifacts.
 
@@ -3149,6 +3384,9 @@ class Client(metaclass=ClientMetaClass):
             workspace_id: The id of the workspace to filter by.
             user_id: The  id of the user to filter by.
             only_unused: Only return artifacts that are not used in any runs.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A list of artifacts.
@@ -3157,6 +3395,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3185,6 +3425,22 @@ class Client(metaclass=ClientMetaClass):
         """
         return self.zen_store.get_artifact(artifact_id)
 
+    def get_artifacts_by_ids(
+        self, artifact_ids: Sequence[UUID]
+    ) -> List[ArtifactResponseModel]:
+        """Get multiple artifacts by ID.
+
+        When connected to a ZenML server, the artifacts are fetched
+        concurrently.
+
+        Args:
+            artifact_ids: The IDs of the artifacts to get.
+
+        Returns:
+            The artifacts, in the order of the given IDs.
+        """
+        return self._get_resources_concurrently("get_artifact", artifact_ids)
+
     def delete_artifact(
         self,
         artifact_id: UUID,
@@ -3308,8 +3564,6 @@ class Client(metaclass=ClientMetaClass):
             ValueError: If not exactly one of either `pipeline_run_id`,
                 `step_run_id`, or `artifact_id` is provided.
         """
-        from zenml.metadata.metadata_types import get_metadata_type
-
         if not (pipeline_run_id or step_run_id or artifact_id):
             raise ValueError(
                 "Cannot create run metadata without linking it to any entity. "
@@ -3328,6 +3582,47 @@ class Client(metaclass=ClientMetaClass):
             )
 
         created_metadata: Dict[str, RunMetadataResponseModel] = {}
+        for run_metadata in self._get_run_metadata_requests(
+            metadata=metadata,
+            pipeline_run_id=pipeline_run_id,
+            step_run_id=step_run_id,
+            artifact_id=artifact_id,
+            stack_component_id=stack_component_id,
+        ):
+            metadata_model = self.zen_store.create_run_metadata(run_metadata)
+            created_metadata[run_metadata.key] = metadata_model
+        return created_metadata
+
+    def _get_run_metadata_requests(
+        self,
+        metadata: Dict[str, "MetadataType"],
+        pipeline_run_id: Optional[UUID] = None,
+        step_run_id: Optional[UUID] = None,
+        artifact_id: Optional[UUID] = None,
+        stack_component_id: Optional[UUID] = None,
+    ) -> List[RunMetadataRequestModel]:
+        """Converts metadata into request models that can be stored.
+
+        Metadata values that are too large or of an unsupported type are
+        skipped.
+
+        Args:
+            metadata: The metadata as a dictionary of key-value pairs.
+            pipeline_run_id: The ID of the pipeline run during which the
+                metadata was produced.
+            step_run_id: The ID of the step run during which the metadata was
+                produced.
+            artifact_id: The ID of the artifact for which the metadata was
+                produced.
+            stack_component_id: The ID of the stack component that produced
+                the metadata.
+
+        Returns:
+            The metadata request models.
+        """
+        from zenml.metadata.metadata_types import get_metadata_type
+
+        requests: List[RunMetadataRequestModel] = []
         for key, value in metadata.items():
 
             # Skip metadata that is too large to be stored in the database.
@@ -3348,20 +3643,20 @@ class Client(metaclass=ClientMetaClass):
                 )
                 continue
 
-            run_metadata = RunMetadataRequestModel(
-                workspace=self.active_workspace.id,
-                user=self.active_user.id,
-                pipeline_run_id=pipeline_run_id,
-                step_run_id=step_run_id,
-                artifact_id=artifact_id,
-                stack_component_id=stack_component_id,
-                key=key,
-                value=value,
-                type=metadata_type,
+            requests.append(
+                RunMetadataRequestModel(
+                    workspace=self.active_workspace.id,
+                    user=self.active_user.id,
+                    pipeline_run_id=pipeline_run_id,
+                    step_run_id=step_run_id,
+                    artifact_id=artifact_id,
+                    stack_component_id=stack_component_id,
+                    key=key,
+                    value=value,
+                    type=metadata_type,
+                )
             )
-            metadata_model = self.zen_store.create_run_metadata(run_metadata)
-            created_metadata[key] = metadata_model
-        return created_metadata
+        return requests
 
     def list_run_metadata(
         self,
@@ -3381,6 +3676,8 @@ class Client(metaclass=ClientMetaClass):
         key: Optional[str] = None,
         value: Optional["MetadataType"] = None,
         type: Optional[str] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[RunMetadataResponseModel]:
         """List run metadata.
 
@@ -3402,6 +3699,9 @@ class Client(metaclass=ClientMetaClass):
             key: The key of the metadata.
             value: The value of the metadata.
             type: The type of the metadata.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             The run metadata.
@@ -3410,6 +3710,8 @@ class Client(metaclass=ClientMetaClass):
             sort_by=sort_by,
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             logical_operator=logical_operator,
             id=id,
             created=created,
@@ -3652,6 +3954,8 @@ class Client(metaclass=ClientMetaClass):
         scope: Optional[SecretScope] = None,
         workspace_id: Optional[Union[str, UUID]] = None,
         user_id: Optional[Union[str, UUID]] = None,
+        after: Optional[str] = None,
+        include_total: bool = True,
     ) -> Page[SecretResponseModel]:
         """Fetches all the secret models.
 
@@ -3670,6 +3974,9 @@ class Client(metaclass=ClientMetaClass):
             scope: The scope of the secret to filter by.
             workspace_id: The id of the workspace to filter by.
             user_id: The  id of the user to filter by.
+            after: The cursor pointing to the last item of the previous
+                page. If set, the page number is ignored.
+            include_total: Whether to count the total number of items.
 
         Returns:
             A list of all the secret models without the secret values.
@@ -3681,6 +3988,8 @@ class Client(metaclass=ClientMetaClass):
         secret_filter_model = SecretFilterModel(
             page=page,
             size=size,
+            after=after,
+            include_total=include_total,
             sort_by=sort_by,
             logical_operator=logical_operator,
             user_id=user_id,
@@ -3812,6 +4121,60 @@ class Client(metaclass=ClientMetaClass):
 
         self.zen_store.delete_secret(secret_id=secret.id)
 
+    # ---- utility concurrent get functions -----
+
+    def _get_resources_concurrently(
+        self, get_method_name: str, resource_ids: Sequence[UUID]
+    ) -> List[Any]:
+        """Gets multiple resources from the ZenStore concurrently.
+
+        If the client is connected to a ZenML server, the requests are sent
+        concurrently using the `AsyncRestZenStore`. Otherwise, the resources
+        are fetched one after another from the local store.
+
+        Args:
+            get_method_name: Name of the store method to get a single
+                resource, e.g. `get_run_step`.
+            resource_ids: The IDs of the resources to get.
+
+        Returns:
+            The resources, in the order of the given IDs.
+        """
+        from zenml.zen_stores.rest_zen_store import RestZenStore
+
+        zen_store = self.zen_store
+        if not isinstance(zen_store, RestZenStore) or len(resource_ids) < 2:
+            get_method = getattr(zen_store, get_method_name)
+            return [get_method(resource_id) for resource_id in resource_ids]
+
+        try:
+            from zenml.zen_stores.async_rest_zen_store import (
+                AsyncRestZenStore,
+            )
+        except ImportError:
+            logger.debug(
+                "Fetching resources sequentially because `httpx` is not "
+                "installed."
+            )
+            get_method = getattr(zen_store, get_method_name)
+            return [get_method(resource_id) for resource_id in resource_ids]
+
+        async def _gather() -> List[Any]:
+            async with AsyncRestZenStore(zen_store) as async_store:
+                get_method = getattr(async_store, get_method_name)
+                coroutines = [get_method(id_) for id_ in resource_ids]
+                return list(await asyncio.gather(*coroutines))
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(_gather())
+
+        # An event loop is already running in this thread, e.g. inside a
+        # notebook, so the requests are sent from a separate thread instead
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, _gather()).result()
+
     # ---- utility prefix matching get functions -----
 
     @staticmethod
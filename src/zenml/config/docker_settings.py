@@ -135,6 +135,12 @@ class DockerSettings(BaseSettings):
             If this is set to `False`, ZenML will not copy any of your files
             into the Docker image and you're responsible that all the files
             to run your pipeline exist in the right place.
+        code_from_artifact_store: If `True`, user files are not copied into
+            the Docker image. Instead, they are uploaded to the artifact store
+            for each pipeline run and downloaded when a step starts. As the
+            image doesn't depend on the user files anymore, changes to the code
+            of a pipeline don't require a new image build. Only has an effect
+            if `copy_files` is `True`.
         copy_global_config: If `True`, the global configuration (contains
             connection info for your ZenStore) will be copied into the Docker
             image. If this is set to `False`, ZenML will not copy this
@@ -166,6 +172,7 @@ class DockerSettings(BaseSettings):
     environment: Dict[str, Any] = {}
     dockerignore: Optional[str] = None
     copy_files: bool = True
+    code_from_artifact_store: bool = False
     copy_global_config: bool = True
     user: Optional[str] = None
 
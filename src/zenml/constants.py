@@ -90,6 +90,9 @@ ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING = (
 )
 ENV_ZENML_DISABLE_WORKSPACE_WARNINGS = "ZENML_DISABLE_WORKSPACE_WARNINGS"
 ENV_ZENML_SKIP_IMAGE_BUILDER_DEFAULT = "ZENML_SKIP_IMAGE_BUILDER_DEFAULT"
+ENV_ZENML_CLIENT_CACHE_TTL = "ZENML_CLIENT_CACHE_TTL"
+ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH = "ZENML_DEPLOYMENT_SNAPSHOT_PATH"
+ENV_ZENML_SERVER_AUTH_CACHE_TTL = "ZENML_SERVER_AUTH_CACHE_TTL"
 
 
 # Logging variables
@@ -189,6 +192,9 @@ PIPELINE_CONFIGURATION = "/pipeline-configuration"
 STEP_CONFIGURATION = "/step-configuration"
 GRAPH = "/graph"
 STEPS = "/steps"
+CACHED = "/cached"
+COMPLETE = "/complete"
+UPSTREAM_STEPS = "/upstream-steps"
 ARTIFACTS = "/artifacts"
 COMPONENT_TYPES = "/component-types"
 REPOSITORIES = "/repositories"
@@ -224,6 +230,26 @@ PAGE_SIZE_MAXIMUM: int = handle_int_env_var(
 )
 FILTERING_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+# Request and response bodies smaller than this number of bytes are not
+# compressed
+GZIP_MINIMUM_SIZE = 1000
+# Maximum size in bytes of gzip encoded request bodies that the server accepts,
+# before and after decompression
+GZIP_MAXIMUM_REQUEST_SIZE = 16 * 1024 * 1024
+GZIP_MAXIMUM_DECOMPRESSED_REQUEST_SIZE = 128 * 1024 * 1024
+
+# Number of seconds for which the client caches the active user and stack
+CLIENT_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_CLIENT_CACHE_TTL, default=30
+)
+
+# Number of seconds for which the server caches authenticated users. Changes
+# to users are only picked up after this time by other server replicas.
+SERVER_AUTH_CACHE_TTL: int = handle_int_env_var(
+    ENV_ZENML_SERVER_AUTH_CACHE_TTL, default=30
+)
+SERVER_AUTH_CACHE_MAX_SIZE = 1000
+
 # Metadata constants
 METADATA_ORCHESTRATOR_URL = "orchestrator_url"
 METADATA_EXPERIMENT_TRACKER_URL = "experiment_tracker_url"
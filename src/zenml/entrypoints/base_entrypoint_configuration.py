@@ -170,10 +170,21 @@ class BaseEntrypointConfiguration(ABC):
     def load_deployment(self) -> "PipelineDeploymentResponseModel":
         """Loads the deployment.
 
+        If the orchestrator passed a deployment snapshot to this process, the
+        deployment is loaded from the snapshot instead of the ZenML store.
+
         Returns:
             The deployment.
         """
+        from zenml.orchestrators.snapshot_utils import (
+            load_deployment_snapshot,
+        )
+
         deployment_id = UUID(self.entrypoint_args[DEPLOYMENT_ID_OPTION])
+        snapshot = load_deployment_snapshot(deployment_id=deployment_id)
+        if snapshot:
+            return snapshot.deployment
+
         return Client().zen_store.get_deployment(deployment_id=deployment_id)
 
     @abstractmethod
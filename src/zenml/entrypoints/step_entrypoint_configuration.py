@@ -19,6 +19,7 @@ from zenml.entrypoints.base_entrypoint_configuration import (
     BaseEntrypointConfiguration,
 )
 from zenml.integrations.registry import integration_registry
+from zenml.utils import code_utils
 
 if TYPE_CHECKING:
     from zenml.config.step_configurations import Step
@@ -152,6 +153,11 @@ class StepEntrypointConfiguration(BaseEntrypointConfiguration):
         # and stack component flavors are registered.
         integration_registry.activate_integrations()
 
+        if deployment.code_path:
+            # Instantiating the artifact store registers its filesystem
+            _ = Client().active_stack.artifact_store
+            code_utils.download_code(deployment.code_path)
+
         step = deployment.step_configurations[step_name]
         self._run_step(step, deployment=deployment)
 
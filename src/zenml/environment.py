@@ -15,6 +15,7 @@
 
 import os
 import platform
+import threading
 from importlib.util import find_spec
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Type, cast
@@ -120,7 +121,38 @@ class Environment(metaclass=SingletonMetaClass):
         only get called once. All following `Environment()` calls will return
         the previously initialized instance.
         """
-        self._components: Dict[str, "BaseEnvironmentComponent"] = {}
+        self._global_components: Dict[str, "BaseEnvironmentComponent"] = {}
+        self._thread_local = threading.local()
+
+    def _get_registry(self) -> Dict[str, "BaseEnvironmentComponent"]:
+        """Get the registry in which the calling thread registers components.
+
+        Components registered from the main thread are visible to all threads.
+        Components registered from any other thread (e.g. a step that is
+        executed concurrently with other steps) are only visible to that
+        thread so that concurrent registrations don't interfere.
+
+        Returns:
+            The component registry of the calling thread.
+        """
+        if threading.current_thread() is threading.main_thread():
+            return self._global_components
+
+        if not hasattr(self._thread_local, "components"):
+            self._thread_local.components = {}
+        return cast(
+            Dict[str, "BaseEnvironmentComponent"],
+            self._thread_local.components,
+        )
+
+    @property
+    def _components(self) -> Dict[str, "BaseEnvironmentComponent"]:
+        """All environment components visible to the calling thread.
+
+        Returns:
+            The environment components visible to the calling thread.
+        """
+        return {**self._global_components, **self._get_registry()}
 
     @property
     def step_is_running(self) -> bool:
@@ -332,7 +364,7 @@ class Environment(metaclass=SingletonMetaClass):
             component that was already registered under the given name.
         """
         if component.NAME not in self._components:
-            self._components[component.NAME] = component
+            self._get_registry()[component.NAME] = component
             logger.debug(f"Registered environment component {component.NAME}")
             return component
         else:
@@ -350,8 +382,9 @@ class Environment(metaclass=SingletonMetaClass):
         Args:
             component: a BaseEnvironmentComponent instance.
         """
-        if self._components.get(component.NAME) is component:
-            del self._components[component.NAME]
+        registry = self._get_registry()
+        if registry.get(component.NAME) is component:
+            del registry[component.NAME]
             logger.debug(
                 f"Deregistered environment component {component.NAME}"
             )
@@ -13,9 +13,18 @@
 #  permissions and limitations under the License.
 """Image build context."""
 
+import gzip as gzip_module
+import hashlib
+import json
 import os
+import re
+import stat
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import IO, Dict, List, Optional, Set, Tuple, cast
+from typing import IO, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 from zenml.constants import REPOSITORY_DIRECTORY_NAME
 from zenml.io import fileio
@@ -24,6 +33,17 @@ from zenml.utils import io_utils, string_utils
 
 logger = get_logger(__name__)
 
+MANIFEST_DIRECTORY = "build_context_manifests"
+# Files modified less than this many seconds before a manifest gets written
+# are hashed again next time, as a later modification within the resolution
+# of the file system timestamps would otherwise go unnoticed.
+MANIFEST_MTIME_RESOLUTION_SECONDS = 2
+COMPRESSION_BLOCK_SIZE = 4 * 1024 * 1024
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Hash, size and modification time in nanoseconds of a file
+_ManifestEntry = Tuple[str, int, int]
+
 
 class BuildContext:
     """Image build context.
@@ -117,6 +137,10 @@ class BuildContext:
     def write_archive(self, output_file: IO[bytes], gzip: bool = True) -> None:
         """Writes an archive of the build context to the given file.
 
+        Compressed archives consist of multiple gzip members that are
+        compressed in parallel. This is a valid gzip file which can be
+        decompressed by any gzip implementation.
+
         Args:
             output_file: The file to write the archive to.
             gzip: Whether to use `gzip` to compress the file.
@@ -126,15 +150,28 @@ class BuildContext:
         files = self._get_files()
         extra_files = self._get_extra_files()
 
-        context_archive = docker_build_utils.create_archive(
-            fileobj=output_file,
-            root=self._root,
-            files=sorted(files),
-            gzip=gzip,
-            extra_files=extra_files,
-        )
+        if gzip:
+            with tempfile.TemporaryFile() as tar_file:
+                docker_build_utils.create_archive(
+                    fileobj=tar_file,
+                    root=self._root,
+                    files=sorted(files),
+                    gzip=False,
+                    extra_files=extra_files,
+                )
+                _compress_in_parallel(tar_file, output_file)
+        else:
+            docker_build_utils.create_archive(
+                fileobj=output_file,
+                root=self._root,
+                files=sorted(files),
+                gzip=False,
+                extra_files=extra_files,
+            )
 
-        build_context_size = os.path.getsize(context_archive.name)
+        output_file.seek(0, os.SEEK_END)
+        build_context_size = output_file.tell()
+        output_file.seek(0)
         if (
             self._root
             and build_context_size > 50 * 1024 * 1024
@@ -151,6 +188,118 @@ class BuildContext:
                 os.path.join(self._root, ".dockerignore"),
             )
 
+    def compute_checksum(self) -> str:
+        """Computes a checksum of the paths and contents of all files.
+
+        Two build contexts with the same checksum lead to identical archives,
+        which allows reusing images that were built from the same context.
+
+        The hashes of all files are stored in a manifest inside the global
+        config directory, and files whose size and modification time didn't
+        change since the last checksum computation are not read again.
+
+        Returns:
+            The checksum.
+        """
+        hash_ = hashlib.sha256()
+        if self._root:
+            for file, file_hash, file_size in self._hash_files():
+                # Include the size so file boundaries are part of the checksum
+                posix_path = file.replace(os.path.sep, "/")
+                hash_.update(f"{posix_path}\0{file_size}\0".encode())
+                hash_.update(bytes.fromhex(file_hash))
+
+        for destination, content in sorted(self._get_extra_files()):
+            encoded_content = content.encode()
+            hash_.update(f"{destination}\0{len(encoded_content)}\0".encode())
+            hash_.update(encoded_content)
+
+        return hash_.hexdigest()
+
+    @property
+    def _manifest_path(self) -> Optional[str]:
+        """Path of the manifest that stores the file hashes of this context.
+
+        Returns:
+            The manifest path or `None` if the build context has no root
+            directory.
+        """
+        if not self._root:
+            return None
+
+        root_hash = hashlib.sha256(
+            os.path.abspath(self._root).encode()
+        ).hexdigest()
+        return os.path.join(
+            io_utils.get_global_config_directory(),
+            MANIFEST_DIRECTORY,
+            f"{root_hash[:16]}.json",
+        )
+
+    def _hash_files(self) -> List[Tuple[str, str, int]]:
+        """Hashes all files in the build context root directory.
+
+        Returns:
+            Tuples (path, hash, size) for all files, sorted by path.
+        """
+        assert self._root and self._manifest_path
+        manifest = _load_manifest(self._manifest_path)
+
+        stats: Dict[str, os.stat_result] = {}
+        for file in self._get_files():
+            try:
+                file_stat = os.stat(os.path.join(self._root, file))
+            except OSError:
+                continue
+            if stat.S_ISREG(file_stat.st_mode):
+                stats[file] = file_stat
+
+        hashes: Dict[str, str] = {}
+        files_to_hash = []
+        for file, file_stat in stats.items():
+            entry = manifest.get(file)
+            if entry and entry[1:] == (
+                file_stat.st_size,
+                file_stat.st_mtime_ns,
+            ):
+                hashes[file] = entry[0]
+            else:
+                files_to_hash.append(file)
+
+        if files_to_hash:
+            logger.debug(
+                "Hashing %d of %d build context files.",
+                len(files_to_hash),
+                len(stats),
+            )
+            with ThreadPoolExecutor() as executor:
+                paths = [
+                    os.path.join(self._root, file) for file in files_to_hash
+                ]
+                hashes.update(
+                    zip(files_to_hash, executor.map(_hash_file, paths))
+                )
+
+            mtime_threshold = (
+                time.time() - MANIFEST_MTIME_RESOLUTION_SECONDS
+            ) * 1e9
+            _save_manifest(
+                self._manifest_path,
+                {
+                    file: (
+                        hashes[file],
+                        file_stat.st_size,
+                        file_stat.st_mtime_ns,
+                    )
+                    for file, file_stat in stats.items()
+                    if file_stat.st_mtime_ns < mtime_threshold
+                },
+            )
+
+        return [
+            (file, hashes[file], stats[file].st_size) for file in sorted(stats)
+        ]
+
     def _get_files(self) -> Set[str]:
         """Gets all non-ignored files in the build context root directory.
 
@@ -159,14 +308,10 @@ class BuildContext:
         """
         if self._root:
             exclude_patterns = self._get_exclude_patterns()
-            from docker.utils import build as docker_build_utils
-
-            return cast(
-                Set[str],
-                docker_build_utils.exclude_paths(
-                    self._root, patterns=exclude_patterns
-                ),
-            )
+            # Same as the default of `docker.utils.build.exclude_paths`
+            exclude_patterns.append("!Dockerfile")
+            matcher = _PathMatcher(exclude_patterns)
+            return set(matcher.walk(self._root))
         else:
             return set()
 
@@ -226,3 +371,242 @@ class BuildContext:
                 exclude_patterns.append(line)
 
         return exclude_patterns
+
+
+class _Pattern:
+    """Precompiled dockerignore pattern."""
+
+    def __init__(self, pattern: str) -> None:
+        """Initializes the pattern.
+
+        Args:
+            pattern: The dockerignore pattern.
+        """
+        from docker.utils import build as docker_build_utils
+        from docker.utils import fnmatch
+
+        parsed_pattern = docker_build_utils.Pattern(pattern)
+        self.exclusion: bool = parsed_pattern.exclusion
+        self.depth = len(parsed_pattern.dirs)
+        self.cleaned_pattern: str = parsed_pattern.cleaned_pattern
+        self._regex = re.compile(
+            fnmatch.translate(self.cleaned_pattern.lower())
+        )
+
+    def match(self, path: str) -> bool:
+        """Checks whether a normalized, lowercase path matches the pattern.
+
+        Args:
+            path: The path to check.
+
+        Returns:
+            Whether the path matches the pattern.
+        """
+        return self._regex.match(path) is not None
+
+
+class _PathMatcher:
+    """Matches paths against dockerignore patterns.
+
+    This behaves exactly like `docker.utils.build.PatternMatcher`, but
+    compiles the patterns only once and uses `os.scandir` to walk directories,
+    which makes it considerably faster for large build contexts.
+    """
+
+    def __init__(self, patterns: List[str]) -> None:
+        """Initializes the matcher.
+
+        Args:
+            patterns: The dockerignore patterns.
+        """
+        self.patterns = [_Pattern(p) for p in patterns]
+        self.patterns = [p for p in self.patterns if p.depth > 0]
+        self.patterns.append(_Pattern("!.dockerignore"))
+
+    def match_parents(self, directory: str) -> List[bool]:
+        """Checks which patterns match the parent directories of a path.
+
+        This is the same for all paths inside a directory, so the walk only
+        computes it once for each directory.
+
+        Args:
+            directory: The parent directory relative to the root directory.
+
+        Returns:
+            Whether the pattern at the same index matches the parent
+            directories.
+        """
+        from docker.utils import build as docker_build_utils
+
+        parent_dirs = docker_build_utils.split_path(
+            docker_build_utils.normalize_slashes(directory).lower()
+        )
+        return [
+            bool(parent_dirs)
+            and pattern.depth <= len(parent_dirs)
+            and pattern.match(os.path.sep.join(parent_dirs[: pattern.depth]))
+            for pattern in self.patterns
+        ]
+
+    def matches(
+        self, path: str, parent_matches: Optional[List[bool]] = None
+    ) -> bool:
+        """Checks whether a path is excluded by the patterns.
+
+        Args:
+            path: The path relative to the root directory.
+            parent_matches: Optional result of `match_parents(...)` for the
+                parent directory of the path.
+
+        Returns:
+            Whether the path is excluded.
+        """
+        from docker.utils import build as docker_build_utils
+
+        if parent_matches is None:
+            parent_matches = self.match_parents(os.path.dirname(path))
+
+        path = docker_build_utils.normalize_slashes(path).lower()
+        matched = False
+        for pattern, parent_match in zip(self.patterns, parent_matches):
+            if parent_match or pattern.match(path):
+                matched = not pattern.exclusion
+
+        return matched
+
+    def walk(self, root: str) -> Iterator[str]:
+        """Walks a directory and yields all paths that are not excluded.
+
+        Excluded directories are not walked unless an exclusion pattern might
+        include some of their contents again.
+
+        Args:
+            root: The root directory.
+
+        Yields:
+            All non-excluded paths relative to the root directory.
+        """
+        from docker.utils import build as docker_build_utils
+
+        exclusion_patterns = [
+            p.cleaned_pattern for p in self.patterns if p.exclusion
+        ]
+
+        directories = [""]
+        while directories:
+            directory = directories.pop()
+            parent_matches = self.match_parents(directory)
+            with os.scandir(os.path.join(root, directory)) as entries:
+                for entry in entries:
+                    path = os.path.join(directory, entry.name)
+                    excluded = self.matches(path, parent_matches)
+                    if not excluded:
+                        yield path
+
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+
+                    if excluded:
+                        normalized_path = docker_build_utils.normalize_slashes(
+                            path
+                        )
+                        if not any(
+                            pattern.startswith(normalized_path)
+                            for pattern in exclusion_patterns
+                        ):
+                            continue
+
+                    directories.append(path)
+
+
+def _hash_file(path: str) -> str:
+    """Computes the SHA256 hash of a file.
+
+    Args:
+        path: Path of the file.
+
+    Returns:
+        The hex digest of the file hash.
+    """
+    hash_ = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            hash_.update(chunk)
+    return hash_.hexdigest()
+
+
+def _load_manifest(path: str) -> Dict[str, _ManifestEntry]:
+    """Loads a build context manifest.
+
+    Args:
+        path: Path of the manifest.
+
+    Returns:
+        The manifest entries. If the manifest doesn't exist or is invalid,
+        this will be empty.
+    """
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+        return {
+            file: (file_hash, size, mtime_ns)
+            for file, (file_hash, size, mtime_ns) in manifest.items()
+        }
+    except FileNotFoundError:
+        return {}
+    except (ValueError, TypeError, AttributeError):
+        logger.debug("Ignoring invalid build context manifest `%s`.", path)
+        return {}
+
+
+def _save_manifest(path: str, entries: Dict[str, _ManifestEntry]) -> None:
+    """Saves a build context manifest.
+
+    Args:
+        path: Path of the manifest.
+        entries: The manifest entries.
+    """
+    directory = os.path.dirname(path)
+    try:
+        io_utils.create_dir_recursive_if_not_exists(directory)
+        # Write to a temporary file first so concurrent builds never read a
+        # partially written manifest
+        with tempfile.NamedTemporaryFile(
+            "w", dir=directory, suffix=".tmp", delete=False
+        ) as f:
+            json.dump(entries, f)
+        os.replace(f.name, path)
+    except OSError as e:
+        logger.debug("Failed to save build context manifest: %s", e)
+
+
+def _compress_in_parallel(
+    input_file: IO[bytes], output_file: IO[bytes]
+) -> None:
+    """Compresses a file with gzip using multiple threads.
+
+    The input is split into blocks that are compressed as separate gzip
+    members. `zlib` releases the GIL while compressing, so the blocks get
+    compressed in parallel.
+
+    Args:
+        input_file: The file to compress. It will be read from the start.
+        output_file: The file to write the compressed data to.
+    """
+    input_file.seek(0)
+    max_workers = os.cpu_count() or 1
+    pending: Deque["Future[bytes]"] = deque()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for block in iter(
+            lambda: input_file.read(COMPRESSION_BLOCK_SIZE), b""
+        ):
+            # Limit the number of blocks in memory
+            if len(pending) >= 2 * max_workers:
+                output_file.write(pending.popleft().result())
+            pending.append(executor.submit(gzip_module.compress, block))
+
+        while pending:
+            output_file.write(pending.popleft().result())
+
+    output_file.flush()
@@ -17,11 +17,13 @@ The Airflow integration sub-module powers an alternative to the local
 orchestrator. You can enable it by registering the Airflow orchestrator with
 the CLI tool, then bootstrap using the ``zenml orchestrator up`` command.
 """
-from typing import List, Optional, Type
+from typing import TYPE_CHECKING, List, Optional, Type
 
 from zenml.integrations.constants import AIRFLOW
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 AIRFLOW_ORCHESTRATOR_FLAVOR = "airflow"
 
@@ -33,7 +35,7 @@ class AirflowIntegration(Integration):
     REQUIREMENTS = ["apache-airflow~=2.4.0"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Airflow integration.
 
         Returns:
@@ -44,6 +46,3 @@ class AirflowIntegration(Integration):
         )
 
         return [AirflowOrchestratorFlavor]
-
-
-AirflowIntegration.check_installation()
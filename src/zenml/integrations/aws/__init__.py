@@ -18,11 +18,13 @@ through AWS, a way to use the aws container registry. Additionally, the
 Sagemaker integration submodule provides a way to run ZenML steps in
 Sagemaker.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import AWS
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 AWS_SECRET_MANAGER_FLAVOR = "aws"
 AWS_CONTAINER_REGISTRY_FLAVOR = "aws"
@@ -39,7 +41,7 @@ class AWSIntegration(Integration):
     ]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the AWS integration.
 
         Returns:
@@ -58,6 +60,3 @@ class AWSIntegration(Integration):
             SagemakerStepOperatorFlavor,
             SagemakerOrchestratorFlavor,
         ]
-
-
-AWSIntegration.check_installation()
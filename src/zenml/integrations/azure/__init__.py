@@ -19,11 +19,13 @@ and an `io` module to handle file operations on Azure Blob Storage.
 The Azure Step Operator integration submodule provides a way to run ZenML steps
 in AzureML.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import AZURE
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 AZURE_ARTIFACT_STORE_FLAVOR = "azure"
 AZURE_SECRETS_MANAGER_FLAVOR = "azure"
@@ -43,7 +45,7 @@ class AzureIntegration(Integration):
     ]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declares the flavors for the integration.
 
         Returns:
@@ -60,6 +62,3 @@ class AzureIntegration(Integration):
             AzureSecretsManagerFlavor,
             AzureMLStepOperatorFlavor,
         ]
-
-
-AzureIntegration.check_installation()
@@ -16,11 +16,13 @@
 The BentoML integration allows you to use the BentoML model serving
 to implement continuous model deployment.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import BENTOML
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 BENTOML_MODEL_DEPLOYER_FLAVOR = "bentoml"
 
@@ -42,7 +44,7 @@ class BentoMLIntegration(Integration):
         from zenml.integrations.bentoml import steps  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for KServe.
 
         Returns:
@@ -53,6 +55,3 @@ class BentoMLIntegration(Integration):
         )
 
         return [BentoMLModelDeployerFlavor]
-
-
-BentoMLIntegration.check_installation()
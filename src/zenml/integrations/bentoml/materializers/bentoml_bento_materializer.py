@@ -50,17 +50,10 @@ class BentoMaterializer(BaseMaterializer):
             An bento.Bento object.
         """
         super().load(data_type)
-
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory()
-
-        # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
-
-        # Load the Bento from the temporary directory
-        imported_bento = Bento.import_from(
-            os.path.join(temp_dir.name, DEFAULT_BENTO_FILENAME)
-        )
+        with io_utils.local_view(self.uri) as view:
+            imported_bento = Bento.import_from(
+                os.path.join(view.path, DEFAULT_BENTO_FILENAME)
+            )
 
         # Try save the Bento to the local BentoML store
         try:
@@ -27,6 +27,3 @@ class DashIntegration(Integration):
         "dash-bootstrap-components>=1.0.1",
         "jupyter-dash>=0.4.2",
     ]
-
-
-DashIntegration.check_installation()
@@ -22,12 +22,14 @@ a visualizer to visualize the results in an easy way on a notebook and in your
 browser.
 """
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import DEEPCHECKS
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 DEEPCHECKS_DATA_VALIDATOR_FLAVOR = "deepchecks"
 
@@ -46,7 +48,7 @@ class DeepchecksIntegration(Integration):
         from zenml.integrations.deepchecks import visualizers  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Deepchecks integration.
 
         Returns:
@@ -57,6 +59,3 @@ class DeepchecksIntegration(Integration):
         )
 
         return [DeepchecksDataValidatorFlavor]
-
-
-DeepchecksIntegration.check_installation()
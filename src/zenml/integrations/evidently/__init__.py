@@ -22,12 +22,14 @@ dashboard (visualized as an html file or in your Jupyter notebook), or as a JSON
 file.
 """
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import EVIDENTLY
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 EVIDENTLY_DATA_VALIDATOR_FLAVOR = "evidently"
 
@@ -45,7 +47,7 @@ class EvidentlyIntegration(Integration):
         from zenml.integrations.evidently import visualizers  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Great Expectations integration.
 
         Returns:
@@ -56,6 +58,3 @@ class EvidentlyIntegration(Integration):
         )
 
         return [EvidentlyDataValidatorFlavor]
-
-
-EvidentlyIntegration.check_installation()
@@ -31,6 +31,3 @@ class FacetsIntegration(Integration):
         "facets-overview>=1.0.0",
         "IPython",
     ]
-
-
-FacetsIntegration.check_installation()
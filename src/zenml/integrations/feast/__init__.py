@@ -17,12 +17,14 @@ The Feast integration offers a way to connect to a Feast Feature Store. ZenML
 implements a dedicated stack component that you can access as part of your ZenML
 steps in the usual ways.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import FEAST
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 FEAST_FEATURE_STORE_FLAVOR = "feast"
 
@@ -34,7 +36,7 @@ class FeastIntegration(Integration):
     REQUIREMENTS = ["feast[redis]~=0.26.0", "redis-server>=6.0.9"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Feast integration.
 
         Returns:
@@ -43,6 +45,3 @@ class FeastIntegration(Integration):
         from zenml.integrations.feast.flavors import FeastFeatureStoreFlavor
 
         return [FeastFeatureStoreFlavor]
-
-
-FeastIntegration.check_installation()
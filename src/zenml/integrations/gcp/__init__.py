@@ -25,11 +25,13 @@ The Vertex AI integration submodule provides a way to run ZenML pipelines in a
 Vertex AI environment.
 """
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import GCP
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 GCP_ARTIFACT_STORE_FLAVOR = "gcp"
 GCP_IMAGE_BUILDER_FLAVOR = "gcp"
@@ -57,7 +59,7 @@ class GcpIntegration(Integration):
     ]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the GCP integration.
 
         Returns:
@@ -78,6 +80,3 @@ class GcpIntegration(Integration):
             VertexOrchestratorFlavor,
             VertexStepOperatorFlavor,
         ]
-
-
-GcpIntegration.check_installation()
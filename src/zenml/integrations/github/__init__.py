@@ -13,15 +13,17 @@
 #  permissions and limitations under the License.
 """Initialization of the GitHub ZenML integration.
 
-The GitHub integration provides a way to orchestrate pipelines using GitHub 
+The GitHub integration provides a way to orchestrate pipelines using GitHub
 Actions.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import GITHUB
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 GITHUB_SECRET_MANAGER_FLAVOR = "github"
 GITHUB_ORCHESTRATOR_FLAVOR = "github"
@@ -34,7 +36,7 @@ class GitHubIntegration(Integration):
     REQUIREMENTS: List[str] = ["PyNaCl~=1.5.0"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the GitHub integration.
 
         Returns:
@@ -46,6 +48,3 @@ class GitHubIntegration(Integration):
         )
 
         return [GitHubActionsOrchestratorFlavor, GitHubSecretsManagerFlavor]
-
-
-GitHubIntegration.check_installation()
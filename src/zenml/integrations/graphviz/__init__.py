@@ -22,6 +22,3 @@ class GraphvizIntegration(Integration):
 
     NAME = GRAPHVIZ
     REQUIREMENTS = ["graphviz>=0.17"]
-
-
-GraphvizIntegration.check_installation()
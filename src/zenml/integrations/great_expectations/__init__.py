@@ -17,12 +17,14 @@ The Great Expectations integration enables you to use Great Expectations as a
 way of profiling and validating your data.
 """
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import GREAT_EXPECTATIONS
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 GREAT_EXPECTATIONS_DATA_VALIDATOR_FLAVOR = "great_expectations"
 
@@ -41,7 +43,7 @@ class GreatExpectationsIntegration(Integration):
         from zenml.integrations.great_expectations import materializers  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Great Expectations integration.
 
         Returns:
@@ -52,6 +54,3 @@ class GreatExpectationsIntegration(Integration):
         )
 
         return [GreatExpectationsDataValidatorFlavor]
-
-
-GreatExpectationsIntegration.check_installation()
@@ -27,6 +27,3 @@ class HuggingfaceIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.huggingface import materializers  # noqa
-
-
-HuggingfaceIntegration.check_installation()
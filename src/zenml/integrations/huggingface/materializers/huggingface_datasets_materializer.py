@@ -15,7 +15,7 @@
 
 import os
 from collections import defaultdict
-from tempfile import TemporaryDirectory, mkdtemp
+from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Dict, Type, Union
 
 from datasets import Dataset, load_from_disk
@@ -51,12 +51,13 @@ class HFDatasetMaterializer(BaseMaterializer):
             The dataset read from the specified dir.
         """
         super().load(data_type)
-        temp_dir = mkdtemp()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_DATASET_DIR),
-            temp_dir,
-        )
-        return load_from_disk(temp_dir)
+        with io_utils.local_view(
+            os.path.join(self.uri, DEFAULT_DATASET_DIR)
+        ) as view:
+            dataset = load_from_disk(view.path)
+            # The dataset memory-maps the files of the local view
+            view.keep_alive_with(dataset)
+            return dataset
 
     def save(self, ds: Union[Dataset, DatasetDict]) -> None:
         """Writes a Dataset to the specified dir.
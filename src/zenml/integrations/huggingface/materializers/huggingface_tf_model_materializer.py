@@ -44,18 +44,15 @@ class HFTFModelMaterializer(BaseMaterializer):
             The model read from the specified dir.
         """
         super().load(data_type)
-
-        temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_TF_MODEL_DIR), temp_dir.name
-        )
-
-        config = AutoConfig.from_pretrained(temp_dir.name)
-        architecture = "TF" + config.architectures[0]
-        model_cls = getattr(
-            importlib.import_module("transformers"), architecture
-        )
-        return model_cls.from_pretrained(temp_dir.name)
+        with io_utils.local_view(
+            os.path.join(self.uri, DEFAULT_TF_MODEL_DIR)
+        ) as view:
+            config = AutoConfig.from_pretrained(view.path)
+            architecture = "TF" + config.architectures[0]
+            model_cls = getattr(
+                importlib.import_module("transformers"), architecture
+            )
+            return model_cls.from_pretrained(view.path)
 
     def save(self, model: TFPreTrainedModel) -> None:
         """Writes a Model to the specified dir.
@@ -45,13 +45,10 @@ class HFTokenizerMaterializer(BaseMaterializer):
             The tokenizer read from the specified dir.
         """
         super().load(data_type)
-
-        temp_dir = TemporaryDirectory()
-        io_utils.copy_dir(
-            os.path.join(self.uri, DEFAULT_TOKENIZER_DIR), temp_dir.name
-        )
-
-        return AutoTokenizer.from_pretrained(temp_dir.name)
+        with io_utils.local_view(
+            os.path.join(self.uri, DEFAULT_TOKENIZER_DIR)
+        ) as view:
+            return AutoTokenizer.from_pretrained(view.path)
 
     def save(self, tokenizer: Type[Any]) -> None:
         """Writes a Tokenizer to the specified dir.
@@ -13,17 +13,129 @@
 #  permissions and limitations under the License.
 """Base and meta classes for ZenML integrations."""
 
-from typing import Any, Dict, List, Optional, Tuple, Type, cast
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, cast
 
-import pkg_resources
+from packaging.requirements import InvalidRequirement, Requirement
+from packaging.specifiers import SpecifierSet
+from packaging.version import InvalidVersion
 
 from zenml.integrations.registry import integration_registry
 from zenml.logger import get_logger
-from zenml.stack.flavor import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack.flavor import Flavor
+
+if sys.version_info >= (3, 8):
+    from importlib import metadata as importlib_metadata
+else:
+    import importlib_metadata
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_installed_version(distribution_name: str) -> Optional[str]:
+    """Gets the installed version of a distribution.
+
+    Args:
+        distribution_name: Name of the distribution.
+
+    Returns:
+        The installed version or `None` if the distribution is not installed.
+    """
+    try:
+        return cast(str, importlib_metadata.version(distribution_name))
+    except importlib_metadata.PackageNotFoundError:
+        return None
+
+
+def _is_distribution_installed(
+    distribution_name: str, specifier: SpecifierSet
+) -> bool:
+    """Checks whether a distribution is installed in a matching version.
+
+    Args:
+        distribution_name: Name of the distribution.
+        specifier: Version specifier that the installed version must match.
+
+    Returns:
+        True if the distribution is installed in a matching version, False
+        otherwise.
+    """
+    version = _get_installed_version(distribution_name)
+    if version is None:
+        logger.debug(f"Unable to find required package '{distribution_name}'.")
+        return False
+
+    try:
+        matches = specifier.contains(version, prereleases=True)
+    except InvalidVersion:
+        matches = False
+
+    if not matches:
+        logger.debug(
+            f"Installed version {version} of package '{distribution_name}' "
+            f"does not match `{specifier}`."
+        )
+    return matches
+
+
+@lru_cache(maxsize=None)
+def is_requirement_installed(requirement: str) -> bool:
+    """Checks whether a requirement is installed in the active environment.
+
+    Unlike `pkg_resources`, this only checks the requirement itself and the
+    packages of its extras, but not their transitive dependencies. The
+    results are cached, so checking the same requirement again is free.
+
+    Args:
+        requirement: The requirement string, e.g. `torch>=1.12`.
+
+    Returns:
+        True if the requirement is installed, False otherwise.
+    """
+    try:
+        parsed_requirement = Requirement(requirement)
+    except InvalidRequirement:
+        logger.debug(f"Unable to parse requirement `{requirement}`.")
+        return False
+
+    if parsed_requirement.marker and not parsed_requirement.marker.evaluate():
+        # The requirement doesn't apply to the active environment
+        return True
+
+    if not _is_distribution_installed(
+        parsed_requirement.name, parsed_requirement.specifier
+    ):
+        return False
+
+    if not parsed_requirement.extras:
+        return True
+
+    for extra_requirement_string in (
+        importlib_metadata.requires(parsed_requirement.name) or []
+    ):
+        try:
+            extra_requirement = Requirement(extra_requirement_string)
+        except InvalidRequirement:
+            continue
+
+        if not extra_requirement.marker or not any(
+            extra_requirement.marker.evaluate({"extra": extra})
+            for extra in parsed_requirement.extras
+        ):
+            continue
+
+        if not _is_distribution_installed(
+            extra_requirement.name, extra_requirement.specifier
+        ):
+            return False
+
+    return True
+
+
 class IntegrationMeta(type):
     """Metaclass responsible for registering different Integration subclasses."""
 
@@ -61,26 +173,19 @@ class Integration(metaclass=IntegrationMeta):
         Returns:
             True if all required packages are installed, False otherwise.
         """
-        try:
-            for r in cls.get_requirements():
-                pkg_resources.get_distribution(r)
-            logger.debug(
-                f"Integration {cls.NAME} is installed correctly with "
-                f"requirements {cls.get_requirements()}."
-            )
-            return True
-        except pkg_resources.DistributionNotFound as e:
-            logger.debug(
-                f"Unable to find required package '{e.req}' for "
-                f"integration {cls.NAME}."
-            )
-            return False
-        except pkg_resources.VersionConflict as e:
-            logger.debug(
-                f"VersionConflict error when loading installation {cls.NAME}: "
-                f"{str(e)}"
-            )
-            return False
+        for requirement in cls.get_requirements():
+            if not is_requirement_installed(requirement):
+                logger.debug(
+                    f"Requirement `{requirement}` of integration {cls.NAME} "
+                    "is not installed."
+                )
+                return False
+
+        logger.debug(
+            f"Integration {cls.NAME} is installed correctly with "
+            f"requirements {cls.get_requirements()}."
+        )
+        return True
 
     @classmethod
     def get_requirements(cls, target_os: Optional[str] = None) -> List[str]:
@@ -99,7 +204,7 @@ class Integration(metaclass=IntegrationMeta):
         """Abstract method to activate the integration."""
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Abstract method to declare new stack component flavors.
 
         Returns:
@@ -12,11 +12,13 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Kaniko integration for image building."""
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import KANIKO
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 KANIKO_IMAGE_BUILDER_FLAVOR = "kaniko"
 
@@ -28,7 +30,7 @@ class KanikoIntegration(Integration):
     REQUIREMENTS = []
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Kaniko integration.
 
         Returns:
@@ -37,6 +39,3 @@ class KanikoIntegration(Integration):
         from zenml.integrations.kaniko.flavors import KanikoImageBuilderFlavor
 
         return [KanikoImageBuilderFlavor]
-
-
-KanikoIntegration.check_installation()
@@ -16,12 +16,14 @@
 The KServe integration allows you to use the KServe model serving
 platform to implement continuous model deployment.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import KSERVE
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 KSERVE_MODEL_DEPLOYER_FLAVOR = "kserve"
 
@@ -44,7 +46,7 @@ class KServeIntegration(Integration):
         from zenml.integrations.kserve import steps  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for KServe.
 
         Returns:
@@ -53,6 +55,3 @@ class KServeIntegration(Integration):
         from zenml.integrations.kserve.flavors import KServeModelDeployerFlavor
 
         return [KServeModelDeployerFlavor]
-
-
-KServeIntegration.check_installation()
@@ -17,11 +17,13 @@ The Kubeflow integration sub-module powers an alternative to the local
 orchestrator. You can enable it by registering the Kubeflow orchestrator with
 the CLI tool.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import KUBEFLOW
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 KUBEFLOW_ORCHESTRATOR_FLAVOR = "kubeflow"
 
@@ -33,7 +35,7 @@ class KubeflowIntegration(Integration):
     REQUIREMENTS = ["kfp==1.8.16"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Kubeflow integration.
 
         Returns:
@@ -44,6 +46,3 @@ class KubeflowIntegration(Integration):
         )
 
         return [KubeflowOrchestratorFlavor]
-
-
-KubeflowIntegration.check_installation()
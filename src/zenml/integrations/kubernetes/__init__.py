@@ -17,11 +17,13 @@ The Kubernetes integration sub-module powers an alternative to the local
 orchestrator. You can enable it by registering the Kubernetes orchestrator with
 the CLI tool.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import KUBERNETES
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 KUBERNETES_ORCHESTRATOR_FLAVOR = "kubernetes"
 
@@ -33,7 +35,7 @@ class KubernetesIntegration(Integration):
     REQUIREMENTS = ["kubernetes==18.20.0"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Kubernetes integration.
 
         Returns:
@@ -44,6 +46,3 @@ class KubernetesIntegration(Integration):
         )
 
         return [KubernetesOrchestratorFlavor]
-
-
-KubernetesIntegration.check_installation()
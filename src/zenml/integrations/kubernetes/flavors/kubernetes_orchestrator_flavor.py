@@ -15,7 +15,7 @@
 
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type
 
-from pydantic import root_validator
+from pydantic import NonNegativeInt, root_validator
 
 from zenml.config.base_settings import BaseSettings
 from zenml.integrations.kubernetes import KUBERNETES_ORCHESTRATOR_FLAVOR
@@ -37,10 +37,23 @@ class KubernetesOrchestratorSettings(BaseSettings):
         timeout: How many seconds to wait for synchronous runs. `0` means
             to wait for an unlimited duration.
         pod_settings: Pod settings to apply.
+        max_parallelism: The maximum number of step pods that run at the same
+            time. If not set, at most `min(32, CPU count + 4)` steps run at
+            the same time.
+        fail_fast: If `True`, no new steps will be started once a step failed.
+            If `False`, all steps that don't depend on a failed step will still
+            be run.
+        worker_pool_size: Number of long-lived worker pods to start for each
+            run. Steps that use the image and pod settings of the pipeline
+            run in a process forked from an already initialized worker instead
+            of a new pod. `0` runs every step in a separate pod.
     """
 
     synchronous: bool = False
     timeout: int = 0
+    max_parallelism: Optional[int] = None
+    fail_fast: bool = True
+    worker_pool_size: NonNegativeInt = 0
 
     pod_settings: Optional[KubernetesPodSettings] = None
 
@@ -31,14 +31,15 @@ Internal interface: no backwards compatibility guarantees.
 Adjusted from https://github.com/tensorflow/tfx/blob/master/tfx/utils/kube_utils.py.
 """
 
-import datetime
 import enum
 import re
+import threading
 import time
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar, cast
 
 from kubernetes import client as k8s_client
 from kubernetes import config as k8s_config
+from kubernetes import watch as k8s_watch
 from kubernetes.client.rest import ApiException
 
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
@@ -50,6 +51,12 @@ from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+WATCH_TIMEOUT = 300
+MAXIMUM_BACKOFF = 32
+MAXIMUM_WATCH_FAILURES = 5
+POLLING_INTERVAL = 5
+LOG_STREAM_JOIN_TIMEOUT = 30
+
 
 class PodPhase(enum.Enum):
     """Phase of the Kubernetes pod.
@@ -169,14 +176,350 @@ def get_pod(
         raise RuntimeError from e
 
 
+class PodWatcher:
+    """Watch based cache of pods.
+
+    The watcher lists the matching pods once and then keeps its cache up to
+    date using the Kubernetes watch API, similar to a shared informer. A
+    single watcher can be shared to wait for many pods without polling the
+    API server for each of them. If listing or watching the pods keeps
+    failing, e.g. because of missing permissions, the watcher gives up and
+    waiting for pods falls back to polling them.
+    """
+
+    def __init__(
+        self,
+        core_api: k8s_client.CoreV1Api,
+        namespace: str,
+        label_selector: Optional[str] = None,
+        field_selector: Optional[str] = None,
+    ) -> None:
+        """Initializes the pod watcher.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+            namespace: The namespace of the pods.
+            label_selector: Optional selector to restrict the watched pods by
+                their labels.
+            field_selector: Optional selector to restrict the watched pods by
+                their fields.
+        """
+        self._core_api = core_api
+        self._namespace = namespace
+        self._selectors: Dict[str, str] = {}
+        if label_selector:
+            self._selectors["label_selector"] = label_selector
+        if field_selector:
+            self._selectors["field_selector"] = field_selector
+
+        self._pods: Dict[str, k8s_client.V1Pod] = {}
+        self._failed = False
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._watch: Optional[k8s_watch.Watch] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PodWatcher":
+        """Starts the watcher when entering a context.
+
+        Returns:
+            The watcher.
+        """
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Stops the watcher when exiting a context.
+
+        Args:
+            *args: The exception info.
+        """
+        self.stop()
+
+    def start(self) -> None:
+        """Starts watching the pods in a background thread."""
+        if self._thread:
+            return
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops watching the pods."""
+        self._stopped.set()
+        if self._watch:
+            self._watch.stop()
+
+    def _list_pods(self) -> str:
+        """Lists the pods and replaces the cache.
+
+        Returns:
+            The resource version from which to watch for changes.
+        """
+        pod_list = self._core_api.list_namespaced_pod(
+            namespace=self._namespace, **self._selectors
+        )
+        with self._condition:
+            self._pods = {pod.metadata.name: pod for pod in pod_list.items}
+            self._condition.notify_all()
+
+        return cast(str, pod_list.metadata.resource_version)
+
+    def _run(self) -> None:
+        """Keeps the cache up to date until the watcher is stopped."""
+        resource_version: Optional[str] = None
+        backoff_interval = 1
+        failures = 0
+
+        while not self._stopped.is_set():
+            try:
+                if resource_version is None:
+                    resource_version = self._list_pods()
+
+                self._watch = k8s_watch.Watch()
+                for event in self._watch.stream(
+                    self._core_api.list_namespaced_pod,
+                    namespace=self._namespace,
+                    resource_version=resource_version,
+                    timeout_seconds=WATCH_TIMEOUT,
+                    **self._selectors,
+                ):
+                    if event["type"] == "ERROR":
+                        # The resource version expired, list all pods again.
+                        resource_version = None
+                        break
+
+                    pod = event["object"]
+                    resource_version = pod.metadata.resource_version
+                    with self._condition:
+                        if event["type"] == "DELETED":
+                            self._pods.pop(pod.metadata.name, None)
+                        else:
+                            self._pods[pod.metadata.name] = pod
+                        self._condition.notify_all()
+
+                backoff_interval = 1
+                failures = 0
+            except Exception as e:
+                if isinstance(e, ApiException) and e.status == 410:
+                    resource_version = None
+                    continue
+
+                failures += 1
+                if failures >= MAXIMUM_WATCH_FAILURES:
+                    logger.warning(
+                        "Watching pods in namespace `%s` failed %d times, "
+                        "polling the pods instead: %s",
+                        self._namespace,
+                        failures,
+                        e,
+                    )
+                    with self._condition:
+                        self._failed = True
+                        self._condition.notify_all()
+                    return
+
+                logger.warning(
+                    "Watching pods in namespace `%s` failed, retrying in %d "
+                    "seconds: %s",
+                    self._namespace,
+                    backoff_interval,
+                    e,
+                )
+                self._stopped.wait(backoff_interval)
+                backoff_interval = min(backoff_interval * 2, MAXIMUM_BACKOFF)
+
+    def wait(
+        self,
+        pod_name: str,
+        condition: Callable[[k8s_client.V1Pod], bool],
+        timeout_sec: float = 0,
+    ) -> k8s_client.V1Pod:
+        """Waits for a pod to meet a condition.
+
+        Args:
+            pod_name: The name of the pod.
+            condition: Function that returns `True` once the pod meets the
+                condition.
+            timeout_sec: Timeout in seconds to wait for the pod to meet the
+                condition, or 0 to wait for an unlimited duration.
+
+        Raises:
+            RuntimeError: If the pod was deleted, the function timed out or
+                polling the pod failed.
+
+        Returns:
+            The pod object which meets the condition.
+        """
+        deadline = time.monotonic() + timeout_sec if timeout_sec else None
+        pod_seen = False
+
+        def _meets_condition(pod: Optional[k8s_client.V1Pod]) -> bool:
+            """Checks whether the pod meets the condition.
+
+            Args:
+                pod: The current state of the pod, if it exists.
+
+            Raises:
+                RuntimeError: If the pod was deleted.
+
+            Returns:
+                Whether the pod meets the condition.
+            """
+            nonlocal pod_seen
+            if pod:
+                pod_seen = True
+                return condition(pod)
+            elif pod_seen:
+                raise RuntimeError(
+                    f"Pod `{self._namespace}:{pod_name}` was deleted."
+                )
+            return False
+
+        def _remaining_time() -> Optional[float]:
+            """Gets the remaining time to wait for the pod.
+
+            Raises:
+                RuntimeError: If the timeout is exceeded.
+
+            Returns:
+                The remaining time in seconds or `None` if there is no
+                timeout.
+            """
+            if deadline is None:
+                return None
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise RuntimeError(
+                    f"Waiting for pod `{self._namespace}:{pod_name}` "
+                    f"timed out after {timeout_sec} seconds."
+                )
+            return remaining
+
+        with self._condition:
+            while not self._failed:
+                pod = self._pods.get(pod_name)
+                if _meets_condition(pod):
+                    return pod
+                self._condition.wait(timeout=_remaining_time())
+
+        # The watcher gave up, poll the pod instead. This happens without
+        # holding the lock so waiters for different pods poll concurrently.
+        while True:
+            pod = get_pod(
+                self._core_api, pod_name=pod_name, namespace=self._namespace
+            )
+            if _meets_condition(pod):
+                return pod
+            remaining = _remaining_time()
+            time.sleep(min(remaining or POLLING_INTERVAL, POLLING_INTERVAL))
+
+
+def _iter_log_lines(response: Any) -> Iterator[str]:
+    """Iterates over the lines of a streamed log response.
+
+    Args:
+        response: The unprocessed response of a log request.
+
+    Yields:
+        The log lines.
+    """
+    buffer = b""
+    try:
+        for chunk in response.stream():
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                yield line.decode("utf-8", errors="replace")
+        if buffer:
+            yield buffer.decode("utf-8", errors="replace")
+    finally:
+        response.release_conn()
+
+
+def _log_timestamp_key(timestamp: str) -> str:
+    """Converts a log timestamp into a string that sorts chronologically.
+
+    Args:
+        timestamp: RFC3339 timestamp with optional fractional seconds.
+
+    Returns:
+        The timestamp with its fractional seconds padded to nanoseconds.
+    """
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    return f"{seconds}.{fraction.ljust(9, '0')}"
+
+
+def stream_pod_logs(
+    core_api: k8s_client.CoreV1Api, pod_name: str, namespace: str
+) -> None:
+    """Streams the logs of a pod to `zenml.logger.info()`.
+
+    The log is followed until the container terminates, so each line is only
+    downloaded once. If the connection breaks while the pod is still running,
+    streaming resumes from shortly before the last received line and skips
+    the lines that were already logged.
+
+    Args:
+        core_api: Client of `CoreV1Api` of Kubernetes API.
+        pod_name: The name of the pod.
+        namespace: The namespace of the pod.
+    """
+    last_timestamp_key: Optional[str] = None
+    last_line_time: Optional[float] = None
+    backoff_interval = 1
+
+    while True:
+        kwargs: Dict[str, Any] = {}
+        if last_line_time is not None:
+            kwargs["since_seconds"] = int(time.time() - last_line_time) + 2
+
+        try:
+            response = core_api.read_namespaced_pod_log(
+                name=pod_name,
+                namespace=namespace,
+                follow=True,
+                timestamps=True,
+                _preload_content=False,
+                **kwargs,
+            )
+            for line in _iter_log_lines(response):
+                timestamp, _, message = line.partition(" ")
+                timestamp_key = _log_timestamp_key(timestamp)
+                if (
+                    last_timestamp_key is not None
+                    and timestamp_key <= last_timestamp_key
+                ):
+                    continue
+
+                last_timestamp_key = timestamp_key
+                last_line_time = time.time()
+                logger.info(message)
+        except Exception as e:
+            logger.debug(
+                "Streaming logs of pod `%s:%s` interrupted: %s",
+                namespace,
+                pod_name,
+                e,
+            )
+
+        pod = get_pod(core_api, pod_name=pod_name, namespace=namespace)
+        if not pod or pod.status.phase != PodPhase.RUNNING.value:
+            return
+
+        time.sleep(backoff_interval)
+        backoff_interval = min(backoff_interval * 2, MAXIMUM_BACKOFF)
+
+
 def wait_pod(
     core_api: k8s_client.CoreV1Api,
     pod_name: str,
     namespace: str,
     exit_condition_lambda: Callable[[k8s_client.V1Pod], bool],
     timeout_sec: int = 0,
-    exponential_backoff: bool = False,
     stream_logs: bool = False,
+    pod_watcher: Optional[PodWatcher] = None,
 ) -> k8s_client.V1Pod:
     """Wait for a pod to meet an exit condition.
 
@@ -185,67 +528,75 @@ def wait_pod(
         pod_name: The name of the pod.
         namespace: The namespace of the pod.
         exit_condition_lambda: A lambda
-            which will be called periodically to wait for a pod to exit. The
-            function returns True to exit.
+            which will be called whenever the pod changes to check whether
+            to exit. The function returns True to exit.
         timeout_sec: Timeout in seconds to wait for pod to reach exit
             condition, or 0 to wait for an unlimited duration.
             Defaults to unlimited.
-        exponential_backoff: Whether to use exponential back off for polling.
-            Defaults to False.
         stream_logs: Whether to stream the pod logs to
             `zenml.logger.info()`. Defaults to False.
+        pod_watcher: Watcher of the pod to use. If not given, a watcher for
+            only this pod will be used.
 
     Raises:
-        RuntimeError: when the function times out.
+        RuntimeError: when the pod failed or the function times out.
 
     Returns:
         The pod object which meets the exit condition.
     """
-    start_time = datetime.datetime.utcnow()
-
-    # Link to exponential back-off algorithm used here:
-    # https://cloud.google.com/storage/docs/exponential-backoff
-    backoff_interval = 1
-    maximum_backoff = 32
-
-    logged_lines = 0
-
-    while True:
-        resp = get_pod(core_api, pod_name, namespace)
-
-        # Stream logs to `zenml.logger.info()`.
-        # TODO: can we do this without parsing all logs every time?
-        if stream_logs and pod_is_not_pending(resp):
-            response = core_api.read_namespaced_pod_log(
-                name=pod_name,
+    if pod_watcher is None:
+        with PodWatcher(
+            core_api=core_api,
+            namespace=namespace,
+            field_selector=f"metadata.name={pod_name}",
+        ) as watcher:
+            return wait_pod(
+                core_api=core_api,
+                pod_name=pod_name,
                 namespace=namespace,
+                exit_condition_lambda=exit_condition_lambda,
+                timeout_sec=timeout_sec,
+                stream_logs=stream_logs,
+                pod_watcher=watcher,
             )
-            logs = response.splitlines()
-            if len(logs) > logged_lines:
-                for line in logs[logged_lines:]:
-                    logger.info(line)
-                logged_lines = len(logs)
-
-        # Raise an error if the pod failed.
-        if pod_failed(resp):
-            raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
 
-        # Check if pod is in desired state (e.g. finished / running / ...).
-        if exit_condition_lambda(resp):
-            return resp
-
-        # Check if wait timed out.
-        elapse_time = datetime.datetime.utcnow() - start_time
-        if elapse_time.seconds >= timeout_sec and timeout_sec != 0:
-            raise RuntimeError(
-                f"Waiting for pod `{namespace}:{pod_name}` timed out after "
-                f"{timeout_sec} seconds."
+    log_thread: Optional[threading.Thread] = None
+
+    def _condition(pod: k8s_client.V1Pod) -> bool:
+        """Checks whether to stop waiting for the pod.
+
+        Starts streaming the logs once the pod is no longer pending.
+
+        Args:
+            pod: Kubernetes pod.
+
+        Returns:
+            True if the pod failed or meets the exit condition.
+        """
+        nonlocal log_thread
+        if stream_logs and not log_thread and pod_is_not_pending(pod):
+            log_thread = threading.Thread(
+                target=stream_pod_logs,
+                kwargs={
+                    "core_api": core_api,
+                    "pod_name": pod_name,
+                    "namespace": namespace,
+                },
+                daemon=True,
             )
+            log_thread.start()
 
-        # Wait (using exponential backoff).
-        time.sleep(backoff_interval)
-        if exponential_backoff and backoff_interval < maximum_backoff:
-            backoff_interval *= 2
+        return pod_failed(pod) or exit_condition_lambda(pod)
+
+    try:
+        pod = pod_watcher.wait(pod_name, _condition, timeout_sec=timeout_sec)
+        if pod_failed(pod):
+            raise RuntimeError(f"Pod `{namespace}:{pod_name}` failed.")
+        return pod
+    finally:
+        if log_thread:
+            # Give the log stream a chance to catch up with the final lines.
+            log_thread.join(timeout=LOG_STREAM_JOIN_TIMEOUT)
 
 
 FuncT = TypeVar("FuncT", bound=Callable[..., Any])
@@ -14,9 +14,12 @@
 """Entrypoint of the Kubernetes master/orchestrator pod."""
 
 import argparse
+import secrets
 import socket
+from typing import Optional, cast
 
 from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
 
 from zenml.client import Client
 from zenml.entrypoints.step_entrypoint_configuration import (
@@ -30,11 +33,26 @@ from zenml.integrations.kubernetes.orchestrators.kubernetes_orchestrator import
     ENV_ZENML_KUBERNETES_RUN_ID,
     KubernetesOrchestrator,
 )
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_entrypoint import (
+    get_worker_entrypoint_arguments,
+    get_worker_entrypoint_command,
+)
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_pool import (
+    KubernetesWorkerPool,
+    WorkerUnavailableError,
+)
 from zenml.integrations.kubernetes.orchestrators.manifest_utils import (
+    add_worker_token_env,
+    build_deployment_snapshot_secret_manifest,
     build_pod_manifest,
+    build_worker_token_secret_manifest,
 )
 from zenml.logger import get_logger
 from zenml.orchestrators.dag_runner import ThreadedDagRunner
+from zenml.orchestrators.snapshot_utils import (
+    create_deployment_snapshot,
+    serialize_deployment_snapshot,
+)
 
 logger = get_logger(__name__)
 
@@ -81,17 +99,138 @@ def main() -> None:
 
     active_stack = Client().active_stack
     mount_local_stores = active_stack.orchestrator.config.is_local
+    orchestrator_settings = cast(
+        KubernetesOrchestratorSettings,
+        active_stack.orchestrator.get_settings(deployment_config),
+    )
+
+    # Pass a snapshot of the deployment and stack to the step pods so they
+    # don't need to fetch them from the ZenML store individually.
+    snapshot_secret_name: Optional[str] = kube_utils.sanitize_pod_name(
+        f"{orchestrator_run_id}-snapshot"
+    )
+    try:
+        snapshot = create_deployment_snapshot(deployment_config)
+        core_api.create_namespaced_secret(
+            namespace=args.kubernetes_namespace,
+            body=build_deployment_snapshot_secret_manifest(
+                name=snapshot_secret_name,
+                snapshot=serialize_deployment_snapshot(snapshot),
+                namespace=args.kubernetes_namespace,
+            ),
+        )
+    except Exception as e:
+        logger.warning(
+            "Failed to create deployment snapshot, the steps will load the "
+            "deployment from the ZenML store instead: %s",
+            e,
+        )
+        snapshot_secret_name = None
+
+    # Watch all pods of this run at once instead of polling each of them.
+    pod_watcher = kube_utils.PodWatcher(
+        core_api=core_api,
+        namespace=args.kubernetes_namespace,
+        label_selector=f"run={args.run_name}",
+    )
+    pod_watcher.start()
+
+    worker_pool: Optional[KubernetesWorkerPool] = None
+    worker_image: Optional[str] = None
+    worker_token_secret_name: Optional[str] = None
+    if orchestrator_settings.worker_pool_size > 0:
+        # The workers only run steps sent with this token, which is passed
+        # to them in a secret that only exists while this run is running.
+        worker_token = secrets.token_urlsafe(32)
+        token_secret_name = kube_utils.sanitize_pod_name(
+            f"{orchestrator_run_id}-worker-token"
+        )
+        try:
+            core_api.create_namespaced_secret(
+                namespace=args.kubernetes_namespace,
+                body=build_worker_token_secret_manifest(
+                    name=token_secret_name,
+                    token=worker_token,
+                    namespace=args.kubernetes_namespace,
+                ),
+            )
+            worker_token_secret_name = token_secret_name
+        except ApiException as e:
+            logger.warning(
+                "Failed to create worker token secret, running all steps in "
+                "separate pods instead: %s",
+                e,
+            )
+
+    if worker_token_secret_name:
+        pipeline_image = KubernetesOrchestrator.get_image(
+            deployment=deployment_config
+        )
+        worker_image = pipeline_image
+        orchestrator_pod = kube_utils.get_pod(
+            core_api,
+            pod_name=orchestrator_run_id,
+            namespace=args.kubernetes_namespace,
+        )
+
+        def build_worker_pod_manifest(pod_name: str) -> k8s_client.V1Pod:
+            """Build the manifest of a worker pod.
+
+            Args:
+                pod_name: Name of the worker pod.
+
+            Returns:
+                Pod manifest.
+            """
+            pod_manifest = build_pod_manifest(
+                pod_name=pod_name,
+                run_name=args.run_name,
+                pipeline_name=deployment_config.pipeline_configuration.name,
+                image_name=pipeline_image,
+                command=get_worker_entrypoint_command(),
+                args=get_worker_entrypoint_arguments(),
+                env={ENV_ZENML_KUBERNETES_RUN_ID: orchestrator_run_id},
+                settings=orchestrator_settings,
+                mount_local_stores=mount_local_stores,
+                deployment_snapshot_secret_name=snapshot_secret_name,
+            )
+            add_worker_token_env(
+                pod_manifest.spec, secret_name=token_secret_name
+            )
+            if orchestrator_pod:
+                # Let Kubernetes clean up the workers if the orchestrator pod
+                # gets deleted before it could shut them down.
+                pod_manifest.metadata.owner_references = [
+                    k8s_client.V1OwnerReference(
+                        api_version="v1",
+                        kind="Pod",
+                        name=orchestrator_pod.metadata.name,
+                        uid=orchestrator_pod.metadata.uid,
+                    )
+                ]
+            return pod_manifest
+
+        worker_pool = KubernetesWorkerPool(
+            core_api=core_api,
+            namespace=args.kubernetes_namespace,
+            pod_names=[
+                kube_utils.sanitize_pod_name(
+                    f"{orchestrator_run_id}-worker-{i}"
+                )
+                for i in range(orchestrator_settings.worker_pool_size)
+            ],
+            pod_manifest_factory=build_worker_pod_manifest,
+            worker_token=worker_token,
+            pod_watcher=pod_watcher,
+        )
+        worker_pool.start()
 
     def run_step_on_kubernetes(step_name: str) -> None:
-        """Run a pipeline step in a separate Kubernetes pod.
+        """Run a pipeline step on a worker or in a separate Kubernetes pod.
 
         Args:
             step_name: Name of the step.
         """
-        # Define Kubernetes pod name.
-        pod_name = f"{orchestrator_run_id}-{step_name}"
-        pod_name = kube_utils.sanitize_pod_name(pod_name)
-
         pipeline_step_name = step_name_to_pipeline_step_name[step_name]
         image = KubernetesOrchestrator.get_image(
             deployment=deployment_config, step_name=pipeline_step_name
@@ -107,6 +246,27 @@ def main() -> None:
             step_config.settings.get("orchestrator.kubernetes", {})
         )
 
+        if (
+            worker_pool
+            and image == worker_image
+            and settings.pod_settings
+            in (None, orchestrator_settings.pod_settings)
+        ):
+            try:
+                logger.info(f"Running step `{step_name}` on a worker pod...")
+                worker_pool.run_step(step_args)
+                logger.info(f"Step `{step_name}` completed.")
+                return
+            except WorkerUnavailableError:
+                logger.warning(
+                    f"No worker pods available, running step `{step_name}` "
+                    "in a separate pod instead."
+                )
+
+        # Define Kubernetes pod name.
+        pod_name = f"{orchestrator_run_id}-{step_name}"
+        pod_name = kube_utils.sanitize_pod_name(pod_name)
+
         # Define Kubernetes pod manifest.
         pod_manifest = build_pod_manifest(
             pod_name=pod_name,
@@ -118,6 +278,7 @@ def main() -> None:
             env={ENV_ZENML_KUBERNETES_RUN_ID: orchestrator_run_id},
             settings=settings,
             mount_local_stores=mount_local_stores,
+            deployment_snapshot_secret_name=snapshot_secret_name,
         )
 
         # Create and run pod.
@@ -134,10 +295,34 @@ def main() -> None:
             namespace=args.kubernetes_namespace,
             exit_condition_lambda=kube_utils.pod_is_done,
             stream_logs=True,
+            pod_watcher=pod_watcher,
         )
         logger.info(f"Pod of step `{step_name}` completed.")
 
-    ThreadedDagRunner(dag=pipeline_dag, run_fn=run_step_on_kubernetes).run()
+    try:
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=run_step_on_kubernetes,
+            max_parallelism=orchestrator_settings.max_parallelism,
+            fail_fast=orchestrator_settings.fail_fast,
+        ).run()
+    finally:
+        pod_watcher.stop()
+        if worker_pool:
+            worker_pool.shutdown()
+
+        for secret_name in (snapshot_secret_name, worker_token_secret_name):
+            if not secret_name:
+                continue
+            try:
+                core_api.delete_namespaced_secret(
+                    name=secret_name,
+                    namespace=args.kubernetes_namespace,
+                )
+            except ApiException as e:
+                logger.warning(
+                    "Failed to delete secret `%s`: %s", secret_name, e
+                )
 
     logger.info("Orchestration pod completed.")
 
@@ -0,0 +1,288 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Entrypoint of the Kubernetes worker pods.
+
+A worker pod imports ZenML and activates all integrations once and then
+serves step runs over HTTP. Each step runs in a process forked from the warm
+worker process, so steps are isolated from each other without paying the
+interpreter startup and import costs again.
+
+Protocol:
+    * `GET /health`: Returns `200` once the worker is ready to run steps.
+    * `POST /run`: Runs the entrypoint with the JSON encoded list of command
+      line arguments in the request body. The response streams the output of
+      the step, followed by a final line containing `EXIT_CODE_PREFIX` and
+      the exit code of the step process. Requests need to include the token
+      of the run, which the worker reads from the
+      `ENV_ZENML_KUBERNETES_WORKER_TOKEN` environment variable, in the
+      `WORKER_TOKEN_HEADER` header.
+"""
+
+import argparse
+import hmac
+import json
+import os
+import sys
+import traceback
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Any, List, Optional, Tuple
+
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+WORKER_PORT = 8000
+HEALTH_PATH = "/health"
+RUN_PATH = "/run"
+EXIT_CODE_PREFIX = "__zenml_worker_exit_code__="
+WORKER_TOKEN_HEADER = "X-ZenML-Worker-Token"
+ENV_ZENML_KUBERNETES_WORKER_TOKEN = "ZENML_KUBERNETES_WORKER_TOKEN"
+
+
+def get_worker_entrypoint_command() -> List[str]:
+    """Returns the command that runs the worker entrypoint.
+
+    Returns:
+        Entrypoint command.
+    """
+    return [
+        "python",
+        "-m",
+        "zenml.integrations.kubernetes.orchestrators.kubernetes_worker_entrypoint",
+    ]
+
+
+def get_worker_entrypoint_arguments(port: int = WORKER_PORT) -> List[str]:
+    """Gets all arguments that the worker entrypoint should be called with.
+
+    Args:
+        port: The port on which the worker listens for step runs.
+
+    Returns:
+        List of entrypoint arguments.
+    """
+    return ["--port", str(port)]
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse entrypoint arguments.
+
+    Returns:
+        Parsed args.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=WORKER_PORT)
+    return parser.parse_args()
+
+
+def _run_entrypoint(arguments: List[str]) -> None:
+    """Runs the ZenML entrypoint with the given arguments.
+
+    Args:
+        arguments: The command line arguments of the entrypoint.
+    """
+    from zenml.entrypoints import entrypoint
+
+    sys.argv = [sys.argv[0], *arguments]
+    entrypoint.main()
+
+
+def _child_exit_code(arguments: List[str]) -> int:
+    """Runs the entrypoint in the current (child) process.
+
+    Args:
+        arguments: The command line arguments of the entrypoint.
+
+    Returns:
+        The exit code of the entrypoint.
+    """
+    try:
+        _run_entrypoint(arguments)
+    except SystemExit as e:
+        # Map the exit code the same way the interpreter does
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+    return 0
+
+
+def run_in_forked_process(
+    arguments: List[str], output: Optional[Any] = None
+) -> int:
+    """Runs the entrypoint in a process forked from the current process.
+
+    Args:
+        arguments: The command line arguments of the entrypoint.
+        output: Optional binary file-like object to which the output of the
+            forked process gets streamed in addition to the stdout of the
+            current process.
+
+    Returns:
+        The exit code of the forked process.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.dup2(write_fd, 1)
+        os.dup2(write_fd, 2)
+        os.close(write_fd)
+        sys.stdout = open(1, "w", buffering=1, closefd=False)
+        sys.stderr = open(2, "w", buffering=1, closefd=False)
+
+        exit_code = _child_exit_code(arguments)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as child_output:
+        for line in child_output:
+            sys.stdout.buffer.write(line)
+            sys.stdout.flush()
+            if output is not None:
+                try:
+                    output.write(line)
+                    output.flush()
+                except OSError:
+                    # The orchestrator disconnected, keep consuming the
+                    # output so the step process doesn't block.
+                    output = None
+
+    _, status = os.waitpid(pid, 0)
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status)
+    return 1
+
+
+class WorkerServer(HTTPServer):
+    """Server that runs the steps sent by the orchestrator."""
+
+    def __init__(self, server_address: Tuple[str, int], token: str) -> None:
+        """Initializes the server.
+
+        Args:
+            server_address: The address on which to listen for step runs.
+            token: The token that step run requests need to include.
+        """
+        super().__init__(server_address, _WorkerRequestHandler)
+        self.token = token
+
+
+class _WorkerRequestHandler(BaseHTTPRequestHandler):
+    """Request handler of the worker server."""
+
+    server: WorkerServer
+
+    def _is_authorized(self) -> bool:
+        """Checks whether the request includes the token of the run.
+
+        Returns:
+            Whether the request includes the token of the run.
+        """
+        token = self.headers.get(WORKER_TOKEN_HEADER, "")
+        return hmac.compare_digest(token.encode(), self.server.token.encode())
+
+    def do_GET(self) -> None:
+        """Handles health checks."""
+        if self.path != HEALTH_PATH:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        """Handles step runs."""
+        if self.path != RUN_PATH:
+            self.send_error(404)
+            return
+
+        if not self._is_authorized():
+            self.send_error(401, "Invalid worker token.")
+            return
+
+        content_length = int(self.headers.get("Content-Length", 0))
+        try:
+            arguments = json.loads(self.rfile.read(content_length))
+        except ValueError:
+            self.send_error(400, "Invalid entrypoint arguments.")
+            return
+
+        if not isinstance(arguments, list) or not all(
+            isinstance(argument, str) for argument in arguments
+        ):
+            self.send_error(400, "Invalid entrypoint arguments.")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.end_headers()
+
+        exit_code = run_in_forked_process(arguments, output=self.wfile)
+        try:
+            self.wfile.write(f"{EXIT_CODE_PREFIX}{exit_code}\n".encode())
+        except OSError:
+            logger.warning("Orchestrator disconnected during the step run.")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Logs requests on debug level.
+
+        Args:
+            format: The message format string.
+            *args: The message arguments.
+        """
+        logger.debug(format, *args)
+
+
+def main() -> None:
+    """Entrypoint of the k8s worker pods."""
+    logger.info("Kubernetes worker pod started.")
+    args = parse_args()
+
+    token = os.environ.get(ENV_ZENML_KUBERNETES_WORKER_TOKEN)
+    if not token:
+        raise RuntimeError(
+            "Missing worker token, the worker pod needs to be started with "
+            f"the `{ENV_ZENML_KUBERNETES_WORKER_TOKEN}` environment variable."
+        )
+
+    # Import the step entrypoint and activate all integrations once, the
+    # processes running the steps are forked from this warm process.
+    import zenml.entrypoints.entrypoint  # noqa: F401
+    import zenml.entrypoints.step_entrypoint_configuration  # noqa: F401
+    from zenml.integrations.registry import integration_registry
+
+    integration_registry.activate_integrations()
+
+    # Only one step runs in a worker at a time, the single threaded server
+    # queues all other requests.
+    server = WorkerServer(("", args.port), token=token)
+    logger.info("Worker listening for steps on port %d.", args.port)
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,308 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Pool of warm worker pods that run the steps of a pipeline run."""
+
+import json
+import threading
+import time
+import urllib.request
+from typing import Callable, List, Optional
+
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_entrypoint import (
+    EXIT_CODE_PREFIX,
+    HEALTH_PATH,
+    RUN_PATH,
+    WORKER_PORT,
+    WORKER_TOKEN_HEADER,
+)
+from zenml.logger import get_logger
+
+logger = get_logger(__name__)
+
+WORKER_STARTUP_TIMEOUT = 600
+
+
+class WorkerUnavailableError(Exception):
+    """Raised when a step can't be dispatched to a worker of the pool."""
+
+
+class KubernetesWorker:
+    """A worker pod of the pool."""
+
+    def __init__(self, pod_name: str, token: str) -> None:
+        """Initializes the worker.
+
+        Args:
+            pod_name: Name of the worker pod.
+            token: The token with which to authenticate to the worker.
+        """
+        self.pod_name = pod_name
+        self.token = token
+        self.address: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        """The URL of the worker server.
+
+        Returns:
+            The URL of the worker server.
+        """
+        return f"http://{self.address}:{WORKER_PORT}"
+
+    def is_healthy(self) -> bool:
+        """Checks whether the worker is ready to run steps.
+
+        Returns:
+            Whether the worker is ready to run steps.
+        """
+        try:
+            with urllib.request.urlopen(
+                self.url + HEALTH_PATH, timeout=5
+            ) as response:
+                return bool(response.status == 200)
+        except OSError:
+            return False
+
+    def run(self, arguments: List[str]) -> int:
+        """Runs the step entrypoint on the worker.
+
+        The output of the step gets streamed to the logs of this process.
+
+        Args:
+            arguments: The step entrypoint arguments.
+
+        Returns:
+            The exit code of the step.
+
+        Raises:
+            WorkerUnavailableError: If the worker can't be reached.
+            RuntimeError: If the connection to the worker broke during the
+                step run.
+        """
+        request = urllib.request.Request(
+            self.url + RUN_PATH,
+            data=json.dumps(arguments).encode(),
+            headers={
+                "Content-Type": "application/json",
+                WORKER_TOKEN_HEADER: self.token,
+            },
+            method="POST",
+        )
+        try:
+            response = urllib.request.urlopen(request)
+        except OSError as e:
+            raise WorkerUnavailableError(
+                f"Worker pod `{self.pod_name}` is not reachable: {e}"
+            ) from e
+
+        with response:
+            try:
+                for raw_line in response:
+                    line = raw_line.decode("utf-8", errors="replace")
+                    line = line.rstrip("\n")
+                    if line.startswith(EXIT_CODE_PREFIX):
+                        return int(line[len(EXIT_CODE_PREFIX) :])
+                    logger.info(line)
+            except OSError as e:
+                raise RuntimeError(
+                    f"Lost connection to worker pod `{self.pod_name}`: {e}"
+                ) from e
+
+        raise RuntimeError(
+            f"Worker pod `{self.pod_name}` disconnected during the step run."
+        )
+
+
+class KubernetesWorkerPool:
+    """Pool of long-lived worker pods.
+
+    Each worker runs one step at a time. Workers that can't be reached are
+    removed from the pool, and once no workers are left no more steps are
+    dispatched to the pool.
+    """
+
+    def __init__(
+        self,
+        core_api: k8s_client.CoreV1Api,
+        namespace: str,
+        pod_names: List[str],
+        pod_manifest_factory: Callable[[str], k8s_client.V1Pod],
+        worker_token: str,
+        pod_watcher: Optional[kube_utils.PodWatcher] = None,
+    ) -> None:
+        """Initializes the worker pool.
+
+        Args:
+            core_api: Client of `CoreV1Api` of Kubernetes API.
+            namespace: The namespace in which to run the worker pods.
+            pod_names: Names of the worker pods.
+            pod_manifest_factory: Function that builds the manifest of a
+                worker pod with the given name.
+            worker_token: The token with which to authenticate to the
+                workers.
+            pod_watcher: Optional watcher of the worker pods.
+        """
+        self._core_api = core_api
+        self._namespace = namespace
+        self._pod_names = pod_names
+        self._pod_manifest_factory = pod_manifest_factory
+        self._worker_token = worker_token
+        self._pod_watcher = pod_watcher
+
+        self._idle_workers: List[KubernetesWorker] = []
+        self._num_workers = 0
+        self._condition = threading.Condition()
+
+    def start(self) -> None:
+        """Starts the worker pods.
+
+        This doesn't wait for the workers to be ready, each worker is added to
+        the pool as soon as it accepts steps. Workers that fail to start are
+        left out of the pool.
+        """
+        created_pod_names = []
+        for pod_name in self._pod_names:
+            try:
+                self._core_api.create_namespaced_pod(
+                    namespace=self._namespace,
+                    body=self._pod_manifest_factory(pod_name),
+                )
+            except ApiException as e:
+                logger.warning(
+                    "Failed to create worker pod `%s`: %s", pod_name, e
+                )
+                continue
+
+            created_pod_names.append(pod_name)
+            with self._condition:
+                self._num_workers += 1
+
+        for pod_name in created_pod_names:
+            threading.Thread(
+                target=self._wait_for_worker, args=(pod_name,), daemon=True
+            ).start()
+
+    def _wait_for_worker(self, pod_name: str) -> None:
+        """Waits for a worker pod to be ready and adds it to the pool.
+
+        Args:
+            pod_name: Name of the worker pod.
+        """
+        worker = KubernetesWorker(pod_name=pod_name, token=self._worker_token)
+        start_time = time.time()
+        try:
+            pod = kube_utils.wait_pod(
+                core_api=self._core_api,
+                pod_name=pod_name,
+                namespace=self._namespace,
+                exit_condition_lambda=kube_utils.pod_is_not_pending,
+                timeout_sec=WORKER_STARTUP_TIMEOUT,
+                pod_watcher=self._pod_watcher,
+            )
+            worker.address = pod.status.pod_ip
+
+            while not worker.is_healthy():
+                if time.time() - start_time > WORKER_STARTUP_TIMEOUT:
+                    raise RuntimeError(
+                        f"Worker pod `{pod_name}` did not become ready."
+                    )
+                time.sleep(1)
+        except Exception as e:
+            logger.warning("Worker pod `%s` failed to start: %s", pod_name, e)
+            self._remove_worker()
+            return
+
+        logger.info("Worker pod `%s` is ready.", pod_name)
+        self.release(worker)
+
+    def _remove_worker(self) -> None:
+        """Removes an unavailable worker from the pool."""
+        with self._condition:
+            self._num_workers = max(self._num_workers - 1, 0)
+            self._condition.notify_all()
+
+    def acquire(self) -> Optional[KubernetesWorker]:
+        """Waits for an idle worker.
+
+        Returns:
+            An idle worker or `None` if the pool has no workers left.
+        """
+        with self._condition:
+            while not self._idle_workers:
+                if self._num_workers == 0:
+                    return None
+                self._condition.wait()
+
+            return self._idle_workers.pop()
+
+    def release(self, worker: KubernetesWorker) -> None:
+        """Returns a worker to the pool.
+
+        Args:
+            worker: The worker to return.
+        """
+        with self._condition:
+            self._idle_workers.append(worker)
+            self._condition.notify()
+
+    def run_step(self, arguments: List[str]) -> None:
+        """Runs a step on a worker of the pool.
+
+        Args:
+            arguments: The step entrypoint arguments.
+
+        Raises:
+            WorkerUnavailableError: If the pool has no workers left.
+            RuntimeError: If the step failed.
+        """
+        while True:
+            worker = self.acquire()
+            if not worker:
+                raise WorkerUnavailableError("No worker pods available.")
+
+            try:
+                exit_code = worker.run(arguments)
+            except WorkerUnavailableError as e:
+                # The step was never started, try the next worker.
+                logger.warning("%s Removing it from the pool.", e)
+                self._remove_worker()
+                continue
+            except RuntimeError:
+                self._remove_worker()
+                raise
+
+            self.release(worker)
+            if exit_code != 0:
+                raise RuntimeError(
+                    f"Step failed on worker pod `{worker.pod_name}` with "
+                    f"exit code {exit_code}."
+                )
+            return
+
+    def shutdown(self) -> None:
+        """Deletes all worker pods."""
+        for pod_name in self._pod_names:
+            try:
+                self._core_api.delete_namespaced_pod(
+                    name=pod_name, namespace=self._namespace
+                )
+            except ApiException as e:
+                if e.status != 404:
+                    logger.warning(
+                        "Failed to delete worker pod `%s`: %s", pod_name, e
+                    )
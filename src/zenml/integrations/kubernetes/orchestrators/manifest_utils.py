@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Utility functions for building manifests for k8s pods."""
 
+import base64
 import os
 import sys
 from typing import Any, Dict, List, Optional
@@ -21,15 +22,25 @@ from kubernetes import client as k8s_client
 
 from zenml.client import Client
 from zenml.config.global_config import GlobalConfiguration
-from zenml.constants import ENV_ZENML_ENABLE_REPO_INIT_WARNINGS
+from zenml.constants import (
+    ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH,
+    ENV_ZENML_ENABLE_REPO_INIT_WARNINGS,
+)
 from zenml.integrations.airflow.orchestrators.dag_generator import (
     ENV_ZENML_LOCAL_STORES_PATH,
 )
 from zenml.integrations.kubernetes.flavors import (
     KubernetesOrchestratorSettings,
 )
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_entrypoint import (
+    ENV_ZENML_KUBERNETES_WORKER_TOKEN,
+)
 from zenml.integrations.kubernetes.pod_settings import KubernetesPodSettings
 
+DEPLOYMENT_SNAPSHOT_FILE_NAME = "deployment_snapshot.json.gz"
+DEPLOYMENT_SNAPSHOT_MOUNT_PATH = "/etc/zenml/deployment-snapshot"
+WORKER_TOKEN_SECRET_KEY = "worker_token"
+
 
 def add_local_stores_mount(
     pod_spec: k8s_client.V1PodSpec,
@@ -93,6 +104,76 @@ def add_local_stores_mount(
     )
 
 
+def add_deployment_snapshot_mount(
+    pod_spec: k8s_client.V1PodSpec, secret_name: str
+) -> None:
+    """Makes changes in place to the configuration of the pod spec.
+
+    Mounts the secret containing the deployment snapshot of the run and
+    points the step entrypoint to the mounted file.
+
+    Args:
+        pod_spec: The pod spec to update.
+        secret_name: Name of the secret containing the deployment snapshot.
+    """
+    assert len(pod_spec.containers) == 1
+    container_spec: k8s_client.V1Container = pod_spec.containers[0]
+
+    pod_spec.volumes = pod_spec.volumes or []
+    pod_spec.volumes.append(
+        k8s_client.V1Volume(
+            name="deployment-snapshot",
+            secret=k8s_client.V1SecretVolumeSource(secret_name=secret_name),
+        )
+    )
+    container_spec.volume_mounts = container_spec.volume_mounts or []
+    container_spec.volume_mounts.append(
+        k8s_client.V1VolumeMount(
+            name="deployment-snapshot",
+            mount_path=DEPLOYMENT_SNAPSHOT_MOUNT_PATH,
+            read_only=True,
+        )
+    )
+
+    container_spec.env = container_spec.env or []
+    container_spec.env.append(
+        k8s_client.V1EnvVar(
+            name=ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH,
+            value=os.path.join(
+                DEPLOYMENT_SNAPSHOT_MOUNT_PATH, DEPLOYMENT_SNAPSHOT_FILE_NAME
+            ),
+        )
+    )
+
+
+def add_worker_token_env(
+    pod_spec: k8s_client.V1PodSpec, secret_name: str
+) -> None:
+    """Makes changes in place to the configuration of the pod spec.
+
+    Passes the token with which the orchestrator authenticates to the worker
+    pods from the given secret to the pod.
+
+    Args:
+        pod_spec: The pod spec to update.
+        secret_name: Name of the secret containing the worker token.
+    """
+    assert len(pod_spec.containers) == 1
+    container_spec: k8s_client.V1Container = pod_spec.containers[0]
+
+    container_spec.env = container_spec.env or []
+    container_spec.env.append(
+        k8s_client.V1EnvVar(
+            name=ENV_ZENML_KUBERNETES_WORKER_TOKEN,
+            value_from=k8s_client.V1EnvVarSource(
+                secret_key_ref=k8s_client.V1SecretKeySelector(
+                    name=secret_name, key=WORKER_TOKEN_SECRET_KEY
+                )
+            ),
+        )
+    )
+
+
 def build_pod_manifest(
     pod_name: str,
     run_name: str,
@@ -104,6 +185,7 @@ def build_pod_manifest(
     service_account_name: Optional[str] = None,
     env: Optional[Dict[str, str]] = None,
     mount_local_stores: bool = False,
+    deployment_snapshot_secret_name: Optional[str] = None,
 ) -> k8s_client.V1Pod:
     """Build a Kubernetes pod manifest for a ZenML run or step.
 
@@ -121,6 +203,9 @@ def build_pod_manifest(
         env: Environment variables to set.
         mount_local_stores: Whether to mount the local stores path inside the
             pod.
+        deployment_snapshot_secret_name: Optional name of a secret containing
+            the deployment snapshot of the run, which will be mounted inside
+            the pod.
 
     Returns:
         Pod manifest.
@@ -168,6 +253,11 @@ def build_pod_manifest(
     if mount_local_stores:
         add_local_stores_mount(pod_spec)
 
+    if deployment_snapshot_secret_name:
+        add_deployment_snapshot_mount(
+            pod_spec, secret_name=deployment_snapshot_secret_name
+        )
+
     return pod_manifest
 
 
@@ -315,6 +405,68 @@ def build_service_account_manifest(
     }
 
 
+def build_deployment_snapshot_secret_manifest(
+    name: str, snapshot: bytes, namespace: str = "default"
+) -> Dict[str, Any]:
+    """Build the manifest for a secret containing a deployment snapshot.
+
+    A secret is used instead of a config map as the snapshot contains the
+    configuration of all stack components, which might include credentials.
+
+    Args:
+        name: Name of the secret.
+        snapshot: The serialized deployment snapshot.
+        namespace: Kubernetes namespace. Defaults to "default".
+
+    Returns:
+        Manifest of the secret.
+    """
+    return {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "type": "Opaque",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+        },
+        "data": {
+            DEPLOYMENT_SNAPSHOT_FILE_NAME: base64.b64encode(snapshot).decode(
+                "ascii"
+            ),
+        },
+    }
+
+
+def build_worker_token_secret_manifest(
+    name: str, token: str, namespace: str = "default"
+) -> Dict[str, Any]:
+    """Build the manifest for a secret containing a worker token.
+
+    Args:
+        name: Name of the secret.
+        token: The token with which the orchestrator authenticates to the
+            worker pods.
+        namespace: Kubernetes namespace. Defaults to "default".
+
+    Returns:
+        Manifest of the secret.
+    """
+    return {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "type": "Opaque",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+        },
+        "data": {
+            WORKER_TOKEN_SECRET_KEY: base64.b64encode(token.encode()).decode(
+                "ascii"
+            ),
+        },
+    }
+
+
 def build_namespace_manifest(namespace: str) -> Dict[str, Any]:
     """Build the manifest for a new namespace.
 
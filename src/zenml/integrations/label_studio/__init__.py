@@ -12,12 +12,14 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Initialization of the Label Studio integration."""
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import LABEL_STUDIO
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 LABEL_STUDIO_ANNOTATOR_FLAVOR = "label_studio"
 
@@ -29,7 +31,7 @@ class LabelStudioIntegration(Integration):
     REQUIREMENTS = ["label-studio==1.6.0", "label-studio-sdk>=0.0.17"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Label Studio integration.
 
         Returns:
@@ -40,6 +42,3 @@ class LabelStudioIntegration(Integration):
         )
 
         return [LabelStudioAnnotatorFlavor]
-
-
-LabelStudioIntegration.check_installation()
@@ -22,6 +22,7 @@ import lightgbm as lgb
 from zenml.enums import ArtifactType
 from zenml.io import fileio
 from zenml.materializers.base_materializer import BaseMaterializer
+from zenml.utils import io_utils
 
 if TYPE_CHECKING:
     from zenml.metadata.metadata_types import MetadataType
@@ -46,17 +47,12 @@ class LightGBMDatasetMaterializer(BaseMaterializer):
         """
         super().load(data_type)
         filepath = os.path.join(self.uri, DEFAULT_FILENAME)
-
-        # Create a temporary folder
-        temp_dir = tempfile.mkdtemp(prefix="zenml-temp-")
-        temp_file = os.path.join(str(temp_dir), DEFAULT_FILENAME)
-
-        # Copy from artifact store to temporary file
-        fileio.copy(filepath, temp_file)
-        matrix = lgb.Dataset(temp_file, free_raw_data=False)
-
-        # No clean up this time because matrix is lazy loaded
-        return matrix
+        with io_utils.local_view(filepath) as view:
+            matrix = lgb.Dataset(view.path, free_raw_data=False)
+            # The matrix is lazily loaded and needs to read the file of the
+            # local view when the object gets used
+            view.keep_alive_with(matrix)
+            return matrix
 
     def save(self, matrix: lgb.Dataset) -> None:
         """Creates a binary serialization for a lightgbm.Dataset object.
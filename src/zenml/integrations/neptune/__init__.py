@@ -13,11 +13,13 @@
 #  permissions and limitations under the License.
 """Module containing Neptune integration."""
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.integrations.constants import NEPTUNE
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 # This is the flavor that will be used when registering this stack component
 #  `zenml experiment_tracker register ... -f neptune`
@@ -34,7 +36,7 @@ class NeptuneIntegration(Integration):
     ]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Neptune integration.
 
         Returns:
@@ -47,6 +49,3 @@ class NeptuneIntegration(Integration):
         return [
             NeptuneExperimentTrackerFlavor,
         ]
-
-
-NeptuneIntegration.check_installation()  # this checks if the requirements are installed
@@ -15,7 +15,6 @@
 
 from zenml.integrations.constants import NEURAL_PROPHET
 from zenml.integrations.integration import Integration
-from zenml.utils.source_utils import import_class_by_path
 
 
 class NeuralProphetIntegration(Integration):
@@ -28,6 +27,3 @@ class NeuralProphetIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.neural_prophet import materializers  # noqa
-
-
-NeuralProphetIntegration.check_installation()
@@ -15,7 +15,6 @@
 
 from zenml.integrations.constants import PILLOW
 from zenml.integrations.integration import Integration
-from zenml.utils.source_utils import import_class_by_path
 
 
 class PillowIntegration(Integration):
@@ -28,6 +27,3 @@ class PillowIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.pillow import materializers  # noqa
-
-
-PillowIntegration.check_installation()
@@ -58,16 +58,12 @@ class PillowImageMaterializer(BaseMaterializer):
         files = io_utils.find_files(self.uri, f"{DEFAULT_IMAGE_FILENAME}.*")
         filepath = [file for file in files if not fileio.isdir(file)][0]
 
-        # create a temporary folder
-        temp_dir = tempfile.TemporaryDirectory(prefix="zenml-temp-")
-        temp_file = os.path.join(
-            temp_dir.name,
-            f"{DEFAULT_IMAGE_FILENAME}{os.path.splitext(filepath)[1]}",
-        )
-
-        # copy from artifact store to temporary file
-        fileio.copy(filepath, temp_file)
-        return Image.open(temp_file)
+        with io_utils.local_view(filepath) as view:
+            image = Image.open(view.path)
+            # Images are lazily loaded, so we read the image data before the
+            # local view gets deleted
+            image.load()
+            return image
 
     def save(self, image: Image.Image) -> None:
         """Write to artifact store.
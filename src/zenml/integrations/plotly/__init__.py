@@ -22,6 +22,3 @@ class PlotlyIntegration(Integration):
 
     NAME = PLOTLY
     REQUIREMENTS = ["plotly>=5.4.0"]
-
-
-PlotlyIntegration.check_installation()
@@ -17,7 +17,6 @@ import platform
 from typing import List, Optional
 from zenml.integrations.constants import PYTORCH
 from zenml.integrations.integration import Integration
-from zenml.utils.source_utils import import_class_by_path
 
 
 class PytorchIntegration(Integration):
@@ -30,6 +29,3 @@ class PytorchIntegration(Integration):
     def activate(cls) -> None:
         """Activates the integration."""
         from zenml.integrations.pytorch import materializers  # noqa
-
-
-PytorchIntegration.check_installation()
@@ -16,12 +16,14 @@
 The S3 integration allows the use of cloud artifact stores and file
 operations on S3 buckets.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import S3
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 S3_ARTIFACT_STORE_FLAVOR = "s3"
 
@@ -33,7 +35,7 @@ class S3Integration(Integration):
     REQUIREMENTS = ["s3fs>2022.3.0,<=2022.11.0"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the s3 integration.
 
         Returns:
@@ -42,6 +44,3 @@ class S3Integration(Integration):
         from zenml.integrations.s3.flavors import S3ArtifactStoreFlavor
 
         return [S3ArtifactStoreFlavor]
-
-
-S3Integration.check_installation()
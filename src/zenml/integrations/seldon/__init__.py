@@ -16,12 +16,14 @@
 The Seldon Core integration allows you to use the Seldon Core model serving
 platform to implement continuous model deployment.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import SELDON
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 SELDON_MODEL_DEPLOYER_FLAVOR = "seldon"
 
@@ -42,7 +44,7 @@ class SeldonIntegration(Integration):
         from zenml.integrations.seldon import services  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Seldon Core.
 
         Returns:
@@ -51,6 +53,3 @@ class SeldonIntegration(Integration):
         from zenml.integrations.seldon.flavors import SeldonModelDeployerFlavor
 
         return [SeldonModelDeployerFlavor]
-
-
-SeldonIntegration.check_installation()
@@ -13,12 +13,14 @@
 #  permissions and limitations under the License.
 """Slack integration for alerter components."""
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import SLACK
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 SLACK_ALERTER_FLAVOR = "slack"
 
@@ -33,7 +35,7 @@ class SlackIntegration(Integration):
     REQUIREMENTS = ["slack-sdk>=3.16.1", "aiohttp>=3.8.1"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Slack integration.
 
         Returns:
@@ -42,6 +44,3 @@ class SlackIntegration(Integration):
         from zenml.integrations.slack.flavors import SlackAlerterFlavor
 
         return [SlackAlerterFlavor]
-
-
-SlackIntegration.check_installation()
@@ -14,12 +14,14 @@
 
 """The Spark integration module to enable distributed processing for steps."""
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import SPARK
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 SPARK_KUBERNETES_STEP_OPERATOR = "spark-kubernetes"
 
@@ -36,7 +38,7 @@ class SparkIntegration(Integration):
         from zenml.integrations.spark import materializers  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Spark integration.
 
         Returns:
@@ -47,6 +49,3 @@ class SparkIntegration(Integration):
         )
 
         return [KubernetesSparkStepOperatorFlavor]
-
-
-SparkIntegration.check_installation()
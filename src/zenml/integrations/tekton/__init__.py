@@ -17,12 +17,14 @@ The Tekton integration sub-module powers an alternative to the local
 orchestrator. You can enable it by registering the Tekton orchestrator with
 the CLI tool.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import TEKTON
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 TEKTON_ORCHESTRATOR_FLAVOR = "tekton"
 
@@ -34,7 +36,7 @@ class TektonIntegration(Integration):
     REQUIREMENTS = ["kfp-tekton==1.4.1"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Tekton integration.
 
         Returns:
@@ -43,6 +45,3 @@ class TektonIntegration(Integration):
         from zenml.integrations.tekton.flavors import TektonOrchestratorFlavor
 
         return [TektonOrchestratorFlavor]
-
-
-TektonIntegration.check_installation()
@@ -60,6 +60,3 @@ class TensorflowIntegration(Integration):
                 "protobuf>=3.6.0,<4.0.0",
             ]
         return requirements
-
-
-TensorflowIntegration.check_installation()
@@ -44,20 +44,8 @@ class KerasMaterializer(BaseMaterializer):
             A tf.keras.Model model.
         """
         super().load(data_type)
-
-        # Create a temporary directory to store the model
-        temp_dir = tempfile.TemporaryDirectory()
-
-        # Copy from artifact store to temporary directory
-        io_utils.copy_dir(self.uri, temp_dir.name)
-
-        # Load the model from the temporary directory
-        model = keras.models.load_model(temp_dir.name)
-
-        # Cleanup and return
-        fileio.rmtree(temp_dir.name)
-
-        return model
+        with io_utils.local_view(self.uri) as view:
+            return keras.models.load_model(view.path)
 
     def save(self, model: keras.Model) -> None:
         """Writes a keras model to the artifact store.
@@ -46,13 +46,13 @@ class TensorflowDatasetMaterializer(BaseMaterializer):
             A tf.data.Dataset object.
         """
         super().load(data_type)
-        temp_dir = tempfile.mkdtemp()
-        io_utils.copy_dir(self.uri, temp_dir)
-        path = os.path.join(temp_dir, DEFAULT_FILENAME)
-        dataset = tf.data.experimental.load(path)
-        # Don't delete the temporary directory here as the dataset is lazily
-        # loaded and needs to read it when the object gets used
-        return dataset
+        with io_utils.local_view(self.uri) as view:
+            path = os.path.join(view.path, DEFAULT_FILENAME)
+            dataset = tf.data.experimental.load(path)
+            # The dataset is lazily loaded and needs to read the files of the
+            # local view when the object gets used
+            view.keep_alive_with(dataset)
+            return dataset
 
     def save(self, dataset: tf.data.Dataset) -> None:
         """Persists a tf.data.Dataset object.
@@ -13,16 +13,18 @@
 #  permissions and limitations under the License.
 """Initialization for the Vault Secrets Manager integration.
 
-The Vault secrets manager integration submodule provides a way 
-to access the HashiCorp Vault secrets manager from within your ZenML 
+The Vault secrets manager integration submodule provides a way
+to access the HashiCorp Vault secrets manager from within your ZenML
 pipeline runs.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import VAULT
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 VAULT_SECRETS_MANAGER_FLAVOR = "vault"
 
@@ -34,7 +36,7 @@ class VaultSecretsManagerIntegration(Integration):
     REQUIREMENTS = ["hvac>=0.11.2"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Vault integration.
 
         Returns:
@@ -43,6 +45,3 @@ class VaultSecretsManagerIntegration(Integration):
         from zenml.integrations.vault.flavors import VaultSecretsManagerFlavor
 
         return [VaultSecretsManagerFlavor]
-
-
-VaultSecretsManagerIntegration.check_installation()
@@ -16,12 +16,14 @@
 The wandb integrations currently enables you to use wandb tracking as a
 convenient way to visualize your experiment runs within the wandb ui.
 """
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import WANDB
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 WANDB_EXPERIMENT_TRACKER_FLAVOR = "wandb"
 
@@ -33,7 +35,7 @@ class WandbIntegration(Integration):
     REQUIREMENTS = ["wandb>=0.12.12", "Pillow>=9.1.0"]
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Weights and Biases integration.
 
         Returns:
@@ -44,6 +46,3 @@ class WandbIntegration(Integration):
         )
 
         return [WandbExperimentTrackerFlavor]
-
-
-WandbIntegration.check_installation()
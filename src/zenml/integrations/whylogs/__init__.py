@@ -13,12 +13,14 @@
 #  permissions and limitations under the License.
 """Initialization of the whylogs integration."""
 
-from typing import List, Type
+from typing import TYPE_CHECKING, List, Type
 
 from zenml.enums import StackComponentType
 from zenml.integrations.constants import WHYLOGS
 from zenml.integrations.integration import Integration
-from zenml.stack import Flavor
+
+if TYPE_CHECKING:
+    from zenml.stack import Flavor
 
 WHYLOGS_DATA_VALIDATOR_FLAVOR = "whylogs"
 
@@ -37,7 +39,7 @@ class WhylogsIntegration(Integration):
         from zenml.integrations.whylogs import visualizers  # noqa
 
     @classmethod
-    def flavors(cls) -> List[Type[Flavor]]:
+    def flavors(cls) -> List[Type["Flavor"]]:
         """Declare the stack component flavors for the Great Expectations integration.
 
         Returns:
@@ -48,6 +50,3 @@ class WhylogsIntegration(Integration):
         )
 
         return [WhylogsDataValidatorFlavor]
-
-
-WhylogsIntegration.check_installation()
@@ -13,6 +13,7 @@
 #  permissions and limitations under the License.
 """Functionality for reading, writing and managing files."""
 import os
+import shutil
 from typing import Any, Callable, Iterable, List, Optional, Tuple, Type
 
 # this import required for CI to get local filesystem
@@ -86,11 +87,11 @@ def copy(src: "PathType", dst: "PathType", overwrite: bool = False) -> None:
                 f"Destination file '{convert_to_str(dst)}' already exists "
                 f"and `overwrite` is false."
             )
-        with open(src, mode="rb") as f:
-            contents = f.read()
-
-        with open(dst, mode="wb") as f:
-            f.write(contents)
+        # Stream the file in chunks so that large files don't need to fit
+        # into memory
+        with open(src, mode="rb") as src_file:
+            with open(dst, mode="wb") as dst_file:
+                shutil.copyfileobj(src_file, dst_file)
 
 
 def exists(path: "PathType") -> bool:
@@ -24,7 +24,10 @@ from zenml.materializers.built_in_materializer import (
     BuiltInMaterializer,
     BytesMaterializer,
 )
-from zenml.materializers.numpy_materializer import NumpyMaterializer
+from zenml.materializers.numpy_materializer import (
+    ChunkedNumpyMaterializer,
+    NumpyMaterializer,
+)
 from zenml.materializers.pandas_materializer import PandasMaterializer
 from zenml.materializers.pydantic_materializer import PydanticMaterializer
 from zenml.materializers.service_materializer import ServiceMaterializer
@@ -34,6 +37,7 @@ __all__ = [
     "BuiltInContainerMaterializer",
     "BuiltInMaterializer",
     "BytesMaterializer",
+    "ChunkedNumpyMaterializer",
     "NumpyMaterializer",
     "PandasMaterializer",
     "PydanticMaterializer",
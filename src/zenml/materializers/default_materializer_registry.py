@@ -75,6 +75,7 @@ class MaterializerRegistry:
             StepInterfaceError: If the key (or any of its superclasses) is not
                 registered.
         """
+        self._activate_integrations_if_necessary(key)
         for class_ in key.__mro__:
             materializer = self.materializer_types.get(class_, None)
             if materializer:
@@ -108,7 +109,26 @@ class MaterializerRegistry:
             True if a materializer is registered for the given type, False
             otherwise.
         """
+        self._activate_integrations_if_necessary(key)
         return any(issubclass(key, type_) for type_ in self.materializer_types)
 
+    def _activate_integrations_if_necessary(self, key: Type[Any]) -> None:
+        """Activates the integrations if they might provide a materializer.
+
+        Integrations register their materializers when they get activated.
+        Instead of activating all integrations upfront, this happens the first
+        time a materializer is requested for a type without a materializer
+        registered for exactly this type.
+
+        Args:
+            key: The type for which a materializer is requested.
+        """
+        if key in self.materializer_types or key.__module__ == "builtins":
+            return
+
+        from zenml.integrations.registry import integration_registry
+
+        integration_registry.activate_integrations()
+
 
 default_materializer_registry = MaterializerRegistry()
@@ -15,7 +15,16 @@
 
 import os
 from collections import Counter
-from typing import TYPE_CHECKING, Any, Dict, Type, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    cast,
+)
 
 import numpy as np
 
@@ -24,6 +33,7 @@ from zenml.io import fileio
 from zenml.logger import get_logger
 from zenml.materializers.base_materializer import BaseMaterializer
 from zenml.metadata.metadata_types import DType, MetadataType
+from zenml.utils import io_utils, yaml_utils
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -32,6 +42,13 @@ logger = get_logger(__name__)
 
 
 NUMPY_FILENAME = "data.npy"
+CHUNKS_DIRECTORY = "chunks"
+CHUNKS_METADATA_FILENAME = "chunks.json"
+
+# Number of array elements that are processed at once when computing
+# statistics, and the approximate size of the chunks of the chunked format
+STATISTICS_CHUNK_SIZE = 1_000_000
+STORAGE_CHUNK_SIZE_BYTES = 64 * 1024 * 1024
 
 DATA_FILENAME = "data.parquet"
 SHAPE_FILENAME = "shape.json"
@@ -62,13 +79,18 @@ class NumpyMaterializer(BaseMaterializer):
         numpy_file = os.path.join(self.uri, NUMPY_FILENAME)
 
         if fileio.exists(numpy_file):
-            with fileio.open(numpy_file, "rb") as f:
-                # This function is untyped for numpy versions supporting python
-                # 3.7, but typed for numpy versions installed on python 3.8+.
-                # We need to cast it to any here so that numpy doesn't complain
-                # about either an untyped function call or an unused ignore
-                # statement
-                return cast(Any, np.load)(f, allow_pickle=True)
+            return self._load_npy(numpy_file)
+        elif fileio.exists(os.path.join(self.uri, CHUNKS_METADATA_FILENAME)):
+            chunks_metadata = self._read_chunks_metadata()
+            arr = np.empty(
+                tuple(chunks_metadata["shape"]),
+                dtype=np.dtype(chunks_metadata["dtype"]),
+            )
+            start = 0
+            for chunk in self.iter_chunks():
+                arr[start : start + len(chunk)] = chunk
+                start += len(chunk)
+            return arr
         elif fileio.exists(os.path.join(self.uri, DATA_FILENAME)):
             logger.warning(
                 "A legacy artifact was found. "
@@ -103,6 +125,68 @@ class NumpyMaterializer(BaseMaterializer):
                     "You can install `pyarrow` by running `pip install pyarrow`.",
                 )
 
+    @staticmethod
+    def _load_npy(path: str) -> Any:
+        """Loads a numpy array from a `.npy` file.
+
+        Local files are memory-mapped in copy-on-write mode, so that only the
+        parts of the array that are accessed get read from disk and changes
+        to the array never modify the stored artifact.
+
+        Args:
+            path: The path of the `.npy` file.
+
+        Returns:
+            The numpy array.
+        """
+        # This function is untyped for numpy versions supporting python
+        # 3.7, but typed for numpy versions installed on python 3.8+.
+        # We need to cast it to any here so that numpy doesn't complain
+        # about either an untyped function call or an unused ignore
+        # statement
+        load = cast(Any, np.load)
+        if not io_utils.is_remote(path):
+            try:
+                return load(path, mmap_mode="c", allow_pickle=True)
+            except ValueError:
+                # Arrays of python objects can't be memory-mapped
+                pass
+
+        with fileio.open(path, "rb") as f:
+            return load(f, allow_pickle=True)
+
+    def _read_chunks_metadata(self) -> Dict[str, Any]:
+        """Reads the metadata of an array stored in the chunked format.
+
+        Returns:
+            The shape, dtype and number of chunks of the array.
+        """
+        return cast(
+            Dict[str, Any],
+            yaml_utils.read_json(
+                os.path.join(self.uri, CHUNKS_METADATA_FILENAME)
+            ),
+        )
+
+    def iter_chunks(self) -> Iterator["NDArray[Any]"]:
+        """Iterates over the chunks of the stored array along its first axis.
+
+        This allows processing arrays that don't fit into memory. Arrays that
+        were not stored in the chunked format are returned as a single chunk.
+
+        Yields:
+            The chunks of the array.
+        """
+        if not fileio.exists(os.path.join(self.uri, CHUNKS_METADATA_FILENAME)):
+            yield self.load(np.ndarray)
+            return
+
+        num_chunks = self._read_chunks_metadata()["num_chunks"]
+        for index in range(num_chunks):
+            yield self._load_npy(
+                os.path.join(self.uri, CHUNKS_DIRECTORY, f"{index:05d}.npy")
+            )
+
     def save(self, arr: "NDArray[Any]") -> None:
         """Writes a np.ndarray to the artifact store as a `.npy` file.
 
@@ -129,21 +213,34 @@ class NumpyMaterializer(BaseMaterializer):
         Returns:
             A dictionary of metadata.
         """
-        # These functions are untyped for numpy versions supporting python
-        # 3.7, but typed for numpy versions installed on python 3.8+.
-        # We need to cast them to Any here so that numpy doesn't complain
-        # about either an untyped function call or an unused ignore statement.
-        min_val = cast(Any, np.min)(arr).item()
-        max_val = cast(Any, np.max)(arr).item()
-
         numpy_metadata: Dict[str, "MetadataType"] = {
             "shape": tuple(arr.shape),
             "dtype": DType(arr.dtype.type),
-            "mean": np.mean(arr).item(),
-            "std": np.std(arr).item(),
-            "min": min_val,
-            "max": max_val,
         }
+        if arr.size == 0:
+            return numpy_metadata
+
+        if np.issubdtype(arr.dtype, np.complexfloating):
+            # These functions are untyped for numpy versions supporting python
+            # 3.7, but typed for numpy versions installed on python 3.8+.
+            # We need to cast them to Any here so that numpy doesn't complain
+            # about either an untyped function call or an unused ignore
+            # statement.
+            min_val = cast(Any, np.min)(arr).item()
+            max_val = cast(Any, np.max)(arr).item()
+            mean_val = np.mean(arr).item()
+            std_val = np.std(arr).item()
+        else:
+            min_val, max_val, mean_val, std_val = _compute_statistics(arr)
+
+        numpy_metadata.update(
+            {
+                "mean": mean_val,
+                "std": std_val,
+                "min": min_val,
+                "max": max_val,
+            }
+        )
         return numpy_metadata
 
     def extract_text_metadata(
@@ -194,3 +291,108 @@ class NumpyMaterializer(BaseMaterializer):
             return {**base_metadata, **self.extract_text_metadata(arr)}
         else:
             return {**base_metadata}
+
+
+class ChunkedNumpyMaterializer(NumpyMaterializer):
+    """Materializer that stores numpy arrays in chunks along the first axis.
+
+    Each chunk is written and read separately, so arrays that don't fit into
+    memory (e.g. memory-mapped arrays) can be stored, and the stored array can
+    be processed chunk by chunk using `iter_chunks()`. This materializer needs
+    to be selected explicitly for a step output:
+
+    ```python
+    @step(output_materializers=ChunkedNumpyMaterializer)
+    def my_step() -> np.ndarray:
+        ...
+    ```
+    """
+
+    def save(self, arr: "NDArray[Any]") -> None:
+        """Writes a np.ndarray to the artifact store in chunks.
+
+        Args:
+            arr: The numpy array to write.
+        """
+        if arr.ndim == 0 or arr.dtype.hasobject:
+            # Scalars and arrays of python objects can't be split into chunks
+            super().save(arr)
+            return
+
+        BaseMaterializer.save(self, arr)
+        row_size = max(arr[0:1].nbytes, 1)
+        rows_per_chunk = max(STORAGE_CHUNK_SIZE_BYTES // row_size, 1)
+
+        chunks_directory = os.path.join(self.uri, CHUNKS_DIRECTORY)
+        fileio.makedirs(chunks_directory)
+        num_chunks = 0
+        for start in range(0, max(len(arr), 1), rows_per_chunk):
+            chunk_path = os.path.join(
+                chunks_directory, f"{num_chunks:05d}.npy"
+            )
+            with fileio.open(chunk_path, "wb") as f:
+                cast(Any, np.save)(f, arr[start : start + rows_per_chunk])
+            num_chunks += 1
+
+        yaml_utils.write_json(
+            os.path.join(self.uri, CHUNKS_METADATA_FILENAME),
+            {
+                "shape": list(arr.shape),
+                "dtype": arr.dtype.str,
+                "num_chunks": num_chunks,
+            },
+        )
+
+
+def _compute_statistics(
+    arr: "NDArray[Any]",
+) -> Tuple[Any, Any, float, float]:
+    """Computes the min, max, mean and standard deviation of an array.
+
+    The statistics are computed in a single pass over chunks of the array,
+    which avoids reading memory-mapped arrays multiple times and keeps the
+    memory usage for temporary results bounded.
+
+    Args:
+        arr: The numeric numpy array.
+
+    Returns:
+        The minimum, maximum, mean and standard deviation of the array.
+    """
+    flat_arr = arr.reshape(-1)
+    min_val: Optional[Any] = None
+    max_val: Optional[Any] = None
+    count = 0
+    mean = 0.0
+    # Sum of the squared differences from the mean
+    m2 = 0.0
+    for start in range(0, flat_arr.size, STATISTICS_CHUNK_SIZE):
+        chunk = flat_arr[start : start + STATISTICS_CHUNK_SIZE]
+        chunk_min, chunk_max = np.min(chunk), np.max(chunk)
+        min_val = (
+            chunk_min if min_val is None else np.minimum(min_val, chunk_min)
+        )
+        max_val = (
+            chunk_max if max_val is None else np.maximum(max_val, chunk_max)
+        )
+
+        chunk_count = chunk.size
+        chunk_mean = float(np.mean(chunk, dtype=np.float64))
+        chunk_m2 = float(
+            np.sum(np.square(chunk - chunk_mean, dtype=np.float64))
+        )
+        # Combine the statistics of both parts, see
+        # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance
+        total_count = count + chunk_count
+        delta = chunk_mean - mean
+        mean += delta * chunk_count / total_count
+        m2 += chunk_m2 + delta**2 * count * chunk_count / total_count
+        count = total_count
+
+    std = float(np.sqrt(m2 / count))
+    return (
+        cast(Any, min_val).item(),
+        cast(Any, max_val).item(),
+        mean,
+        std,
+    )
@@ -14,7 +14,7 @@
 """Materializer for Pandas."""
 
 import os
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 
 import pandas as pd
 
@@ -29,11 +29,37 @@ logger = get_logger(__name__)
 PARQUET_FILENAME = "df.parquet.gzip"
 COMPRESSION_TYPE = "gzip"
 
+# Maximum number of rows per Parquet row group. Each row group stores
+# statistics for its columns, which allows skipping row groups that don't
+# match the filters when loading the data.
+PARQUET_ROW_GROUP_SIZE = 100_000
+
 CSV_FILENAME = "df.csv"
 
+SERIES_COLUMN_NAME = "series"
+
+# A filter is a tuple `(column, operator, value)`, e.g. `("age", ">", 18)`.
+# Supported operators are `==`, `=`, `!=`, `<`, `<=`, `>`, `>=`, `in` and
+# `not in`.
+Filter = Tuple[str, str, Any]
+
 
 class PandasMaterializer(BaseMaterializer):
-    """Materializer to read data to and from pandas."""
+    """Materializer to read data to and from pandas.
+
+    DataFrames are stored as Parquet files with bounded row groups if
+    `pyarrow` is installed. Steps that only need some of the columns or rows
+    of a large DataFrame can use an `UnmaterializedArtifact` input and only
+    read the data they need:
+
+    ```python
+    @step
+    def my_step(df_artifact: UnmaterializedArtifact) -> ...:
+        df = PandasMaterializer(df_artifact.uri).load_columns(
+            columns=["age", "income"], filters=[("age", ">", 18)]
+        )
+    ```
+    """
 
     ASSOCIATED_TYPES = (pd.DataFrame, pd.Series)
     ASSOCIATED_ARTIFACT_TYPE = ArtifactType.DATA
@@ -75,21 +101,7 @@ class PandasMaterializer(BaseMaterializer):
             The pandas dataframe or series.
         """
         super().load(data_type)
-        if fileio.exists(self.parquet_path):
-            if self.pyarrow_exists:
-                with fileio.open(self.parquet_path, mode="rb") as f:
-                    df = pd.read_parquet(f)
-            else:
-                raise ImportError(
-                    "You have an old version of a `PandasMaterializer` "
-                    "data artifact stored in the artifact store "
-                    "as a `.parquet` file, which requires `pyarrow` "
-                    "for reading, You can install `pyarrow` by running "
-                    "'`pip install pyarrow fastparquet`'."
-                )
-        else:
-            with fileio.open(self.csv_path, mode="rb") as f:
-                df = pd.read_csv(f, index_col=0, parse_dates=True)
+        df = self.load_columns()
 
         # validate the type of the data.
         def is_dataframe_or_series(
@@ -114,6 +126,61 @@ class PandasMaterializer(BaseMaterializer):
 
         return is_dataframe_or_series(df)
 
+    def load_columns(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[List[Filter]] = None,
+    ) -> pd.DataFrame:
+        """Reads a subset of the columns and rows of the stored data.
+
+        For data stored as Parquet, only the requested columns are read and
+        row groups whose column statistics don't match the filters are
+        skipped without reading them. The index of the stored data is always
+        included.
+
+        Args:
+            columns: Names of the columns to read. If not given, all columns
+                are read.
+            filters: Filters that all rows of the result must match, e.g.
+                `[("age", ">", 18)]`.
+
+        Raises:
+            ImportError: If the data was stored as a `.parquet` file and
+                pyarrow is not installed.
+
+        Returns:
+            The pandas dataframe. Series are returned as a dataframe with a
+            single column called `series`.
+        """
+        if fileio.exists(self.parquet_path):
+            if not self.pyarrow_exists:
+                raise ImportError(
+                    "You have an old version of a `PandasMaterializer` "
+                    "data artifact stored in the artifact store "
+                    "as a `.parquet` file, which requires `pyarrow` "
+                    "for reading, You can install `pyarrow` by running "
+                    "'`pip install pyarrow fastparquet`'."
+                )
+
+            import pyarrow.parquet as pq
+
+            with fileio.open(self.parquet_path, mode="rb") as f:
+                table = pq.read_table(
+                    f,
+                    columns=list(columns) if columns is not None else None,
+                    filters=filters or None,
+                    use_pandas_metadata=True,
+                )
+            return table.to_pandas()
+
+        with fileio.open(self.csv_path, mode="rb") as f:
+            df = pd.read_csv(f, index_col=0, parse_dates=True)
+        if filters:
+            df = _apply_filters(df, filters)
+        if columns is not None:
+            df = df[list(columns)]
+        return df
+
     def save(self, df: Union[pd.DataFrame, pd.Series]) -> None:
         """Writes a pandas dataframe or series to the specified filename.
 
@@ -124,11 +191,22 @@ class PandasMaterializer(BaseMaterializer):
 
         if isinstance(df, pd.Series):
 
-            df = df.to_frame(name="series")
+            df = df.to_frame(name=SERIES_COLUMN_NAME)
 
         if self.pyarrow_exists:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            # The index is always stored as a column so that rows keep their
+            # original index when loading them with filters
+            table = pa.Table.from_pandas(df, preserve_index=True)
             with fileio.open(self.parquet_path, mode="wb") as f:
-                df.to_parquet(f, compression=COMPRESSION_TYPE)
+                pq.write_table(
+                    table,
+                    f,
+                    compression=COMPRESSION_TYPE,
+                    row_group_size=PARQUET_ROW_GROUP_SIZE,
+                )
         else:
             with fileio.open(self.csv_path, mode="wb") as f:
                 df.to_csv(f, index=True)
@@ -138,6 +216,10 @@ class PandasMaterializer(BaseMaterializer):
     ) -> Dict[str, "MetadataType"]:
         """Extract metadata from the given pandas dataframe or series.
 
+        If the data was stored as Parquet, the minimum and maximum of the
+        numeric columns are taken from the column statistics of the Parquet
+        file instead of scanning the data again.
+
         Args:
             df: The pandas dataframe or series to extract metadata from.
 
@@ -149,15 +231,107 @@ class PandasMaterializer(BaseMaterializer):
 
         if isinstance(df, pd.Series):
             pandas_metadata["dtype"] = DType(df.dtype.type)
+        else:
+            pandas_metadata["dtype"] = {
+                str(key): DType(value.type) for key, value in df.dtypes.items()
+            }
+
+        if self.pyarrow_exists and fileio.exists(self.parquet_path):
+            min_values, max_values = self._read_parquet_statistics()
+            if isinstance(df, pd.Series):
+                if SERIES_COLUMN_NAME in min_values:
+                    pandas_metadata["min"] = min_values[SERIES_COLUMN_NAME]
+                    pandas_metadata["max"] = max_values[SERIES_COLUMN_NAME]
+            else:
+                column_names = {str(column) for column in df.columns}
+                pandas_metadata["min"] = {
+                    key: value
+                    for key, value in min_values.items()
+                    if key in column_names
+                }
+                pandas_metadata["max"] = {
+                    key: value
+                    for key, value in max_values.items()
+                    if key in column_names
+                }
+        else:
+            pandas_metadata.update(self._compute_statistics(df))
+
+        return {**base_metadata, **pandas_metadata}
+
+    def _read_parquet_statistics(
+        self,
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Reads the min and max of numeric columns from the Parquet footer.
+
+        Returns:
+            The minimum and maximum value of each numeric column for which
+            all row groups have statistics.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with fileio.open(self.parquet_path, mode="rb") as f:
+            parquet_metadata = pq.read_metadata(f)
+
+        arrow_schema = parquet_metadata.schema.to_arrow_schema()
+        numeric_columns = {
+            field.name
+            for field in arrow_schema
+            if pa.types.is_integer(field.type)
+            or pa.types.is_floating(field.type)
+        }
+
+        min_values: Dict[str, float] = {}
+        max_values: Dict[str, float] = {}
+        incomplete_columns = set()
+        for row_group_index in range(parquet_metadata.num_row_groups):
+            row_group = parquet_metadata.row_group(row_group_index)
+            for column_index in range(row_group.num_columns):
+                column = row_group.column(column_index)
+                name = column.path_in_schema
+                if name not in numeric_columns:
+                    continue
+
+                statistics = column.statistics
+                if statistics is None or not statistics.has_min_max:
+                    if column.num_values > (
+                        statistics.null_count if statistics else 0
+                    ):
+                        incomplete_columns.add(name)
+                    continue
+
+                min_values[name] = min(
+                    float(statistics.min), min_values.get(name, float("inf"))
+                )
+                max_values[name] = max(
+                    float(statistics.max), max_values.get(name, float("-inf"))
+                )
+
+        for name in incomplete_columns:
+            min_values.pop(name, None)
+            max_values.pop(name, None)
+        return min_values, max_values
+
+    def _compute_statistics(
+        self, df: Union[pd.DataFrame, pd.Series]
+    ) -> Dict[str, "MetadataType"]:
+        """Computes statistics of the numeric columns of the data.
+
+        Args:
+            df: The pandas dataframe or series.
+
+        Returns:
+            The mean, standard deviation, minimum and maximum.
+        """
+        pandas_metadata: Dict[str, "MetadataType"] = {}
+        if isinstance(df, pd.Series):
             pandas_metadata["mean"] = float(df.mean().item())
             pandas_metadata["std"] = float(df.std().item())
             pandas_metadata["min"] = float(df.min().item())
             pandas_metadata["max"] = float(df.max().item())
 
         else:
-            pandas_metadata["dtype"] = {
-                str(key): DType(value.type) for key, value in df.dtypes.items()
-            }
             for stat_name, stat in {
                 "mean": df.mean,
                 "std": df.std,
@@ -169,4 +343,41 @@ class PandasMaterializer(BaseMaterializer):
                     for key, value in stat(numeric_only=True).to_dict().items()
                 }
 
-        return {**base_metadata, **pandas_metadata}
+        return pandas_metadata
+
+
+def _apply_filters(df: pd.DataFrame, filters: List[Filter]) -> pd.DataFrame:
+    """Selects the rows of a dataframe that match all filters.
+
+    Args:
+        df: The dataframe to filter.
+        filters: The filters to apply.
+
+    Raises:
+        ValueError: If a filter uses an unsupported operator.
+
+    Returns:
+        The rows of the dataframe that match all filters.
+    """
+    mask = pd.Series(True, index=df.index)
+    for column, operator, value in filters:
+        values = df[column]
+        if operator in ("==", "="):
+            mask &= values == value
+        elif operator == "!=":
+            mask &= values != value
+        elif operator == "<":
+            mask &= values < value
+        elif operator == "<=":
+            mask &= values <= value
+        elif operator == ">":
+            mask &= values > value
+        elif operator == ">=":
+            mask &= values >= value
+        elif operator == "in":
+            mask &= values.isin(value)
+        elif operator == "not in":
+            mask &= ~values.isin(value)
+        else:
+            raise ValueError(f"Unsupported filter operator `{operator}`.")
+    return df[mask]
@@ -92,10 +92,13 @@ from zenml.models.stack_models import (
     StackUpdateModel,
 )
 from zenml.models.step_run_models import (
+    CachedStepRunModel,
+    StepRunCompletionModel,
     StepRunFilterModel,
     StepRunRequestModel,
     StepRunResponseModel,
     StepRunUpdateModel,
+    UpstreamStepRunModel,
 )
 from zenml.models.team_models import (
     TeamFilterModel,
@@ -200,6 +203,10 @@ StepRunResponseModel.update_forward_refs(
     RunMetadataResponseModel=RunMetadataResponseModel,
 )
 
+UpstreamStepRunModel.update_forward_refs(
+    ArtifactResponseModel=ArtifactResponseModel,
+)
+
 ArtifactResponseModel.update_forward_refs(
     UserResponseModel=UserResponseModel,
     WorkspaceResponseModel=WorkspaceResponseModel,
@@ -271,9 +278,12 @@ __all__ = [
     "StackResponseModel",
     "StackUpdateModel",
     "StackFilterModel",
+    "CachedStepRunModel",
     "StepRunRequestModel",
     "StepRunResponseModel",
     "StepRunUpdateModel",
+    "UpstreamStepRunModel",
+    "StepRunCompletionModel",
     "StepRunFilterModel",
     "TeamRequestModel",
     "TeamResponseModel",
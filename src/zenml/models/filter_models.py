@@ -14,8 +14,11 @@
 """Base filter model definitions."""
 from __future__ import annotations
 
+import base64
+import json
 from abc import ABC, abstractmethod
 from datetime import datetime
+from enum import Enum
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -253,6 +256,12 @@ class BaseFilterModel(BaseModel):
         size=50
     )
     ```
+
+    Instead of a page number, an opaque `after` cursor (as returned in
+    `Page.next_cursor`) can be passed to fetch the items following the last
+    item of a previous page. Pages fetched this way don't get slower the
+    deeper they are, and combined with `include_total=False` no query counting
+    all matching items is needed either.
     """
 
     # List of fields that cannot be used as filters.
@@ -261,10 +270,12 @@ class BaseFilterModel(BaseModel):
         "page",
         "size",
         "logical_operator",
+        "after",
+        "include_total",
     ]
 
     # List of fields that are not even mentioned as options in the CLI.
-    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = []
+    CLI_EXCLUDE_FIELDS: ClassVar[List[str]] = ["after", "include_total"]
 
     sort_by: str = Field("created", description="Which column to sort by.")
     logical_operator: LogicalOperators = Field(
@@ -278,6 +289,17 @@ class BaseFilterModel(BaseModel):
     size: int = Field(
         PAGE_SIZE_DEFAULT, ge=1, le=PAGE_SIZE_MAXIMUM, description="Page size"
     )
+    after: Optional[str] = Field(
+        None,
+        description="Cursor pointing to the last item of the previous page. "
+        "If set, the page number is ignored and the items following this "
+        "cursor are returned.",
+    )
+    include_total: bool = Field(
+        True,
+        description="Whether to count the total number of items matching the "
+        "filter.",
+    )
 
     id: Union[UUID, str] = Field(None, description="Id for this resource")
     created: Union[datetime, str] = Field(None, description="Created")
@@ -331,6 +353,20 @@ class BaseFilterModel(BaseModel):
                 "You can only sort by valid fields of this resource"
             )
 
+    @validator("after")
+    def validate_after(cls, v: Optional[str]) -> Optional[str]:
+        """Validate that the cursor can be decoded.
+
+        Args:
+            v: The after field value.
+
+        Returns:
+            The validated after field value.
+        """
+        if v is not None:
+            cls.decode_cursor(v)
+        return v
+
     @root_validator(pre=True)
     def filter_ops(cls, values: Dict[str, Any]) -> Dict[str, Any]:
         """Parse incoming filters to ensure all filters are legal.
@@ -374,6 +410,52 @@ class BaseFilterModel(BaseModel):
 
         return column, operator
 
+    @staticmethod
+    def encode_cursor(sort_value: Any, id: UUID) -> str:
+        """Encodes the position of an item in a sorted list as a cursor.
+
+        Args:
+            sort_value: The value of the sort column of the item.
+            id: The ID of the item.
+
+        Returns:
+            The opaque cursor.
+        """
+        if isinstance(sort_value, datetime):
+            sort_value = {"datetime": sort_value.isoformat()}
+        elif isinstance(sort_value, UUID):
+            sort_value = {"uuid": str(sort_value)}
+        elif isinstance(sort_value, Enum):
+            sort_value = sort_value.value
+
+        cursor = json.dumps([sort_value, str(id)])
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[Any, UUID]:
+        """Decodes a cursor created by `encode_cursor`.
+
+        Args:
+            cursor: The opaque cursor.
+
+        Returns:
+            The value of the sort column and the ID of the item that the
+            cursor points to.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        try:
+            sort_value, id = json.loads(base64.urlsafe_b64decode(cursor))
+            if isinstance(sort_value, dict):
+                if "datetime" in sort_value:
+                    sort_value = datetime.fromisoformat(sort_value["datetime"])
+                else:
+                    sort_value = UUID(sort_value["uuid"])
+            return sort_value, UUID(id)
+        except Exception as e:
+            raise ValueError(f"Invalid pagination cursor `{cursor}`.") from e
+
     @classmethod
     def _generate_filter_list(cls, values: Dict[str, Any]) -> List[Filter]:
         """Create a list of filters from a (column, value) dictionary.
@@ -713,6 +795,51 @@ class BaseFilterModel(BaseModel):
         else:
             raise RuntimeError("No valid logical operator was supplied.")
 
+    def generate_cursor_filter(
+        self, table: Type[SQLModel]
+    ) -> Optional["BooleanClauseList[Any]"]:
+        """Generate the filter selecting the items after the `after` cursor.
+
+        Items are ordered by the sort column and their ID, which breaks ties
+        between items with the same sort value. `NULL` values are considered
+        smaller than all other values, which is how both SQLite and MySQL sort
+        them.
+
+        Args:
+            table: The Table that is being queried from.
+
+        Returns:
+            The filter expression for the query or `None` if no cursor is set.
+        """
+        from sqlalchemy import and_, or_
+
+        if self.after is None:
+            return None
+
+        sort_value, id = self.decode_cursor(self.after)
+        column, operand = self.sorting_params
+        sort_column = getattr(table, column)
+        id_column = getattr(table, "id")
+
+        if operand == SorterOps.DESCENDING:
+            if sort_value is None:
+                return and_(sort_column.is_(None), id_column < id)
+            return or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < id),
+                sort_column.is_(None),
+            )
+        else:
+            if sort_value is None:
+                return or_(
+                    sort_column.is_not(None),
+                    and_(sort_column.is_(None), id_column > id),
+                )
+            return or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > id),
+            )
+
 
 class WorkspaceScopedFilterModel(BaseFilterModel):
     """Model to enable advanced scoping with workspace."""
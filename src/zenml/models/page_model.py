@@ -40,7 +40,7 @@ fastapi-pagination library: https://github.com/uriyyo/fastapi-pagination
 """
 from __future__ import annotations
 
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, Optional, Sequence, TypeVar
 
 from pydantic import SecretStr
 from pydantic.generics import GenericModel
@@ -53,13 +53,22 @@ B = TypeVar("B", bound=BaseResponseModel)
 
 
 class Page(GenericModel, Generic[B]):
-    """Return Model for List Models to accommodate pagination."""
+    """Return Model for List Models to accommodate pagination.
+
+    If the page was requested without counting the total number of items,
+    `total` and `total_pages` only account for the items up to and including
+    this page, plus one more page if there are more items.
+
+    `next_cursor` can be passed as the `after` parameter of a filter model to
+    fetch the next page. It is `None` if this is the last page.
+    """
 
     index: PositiveInt
     max_size: PositiveInt
     total_pages: NonNegativeInt
     total: NonNegativeInt
     items: Sequence[B]
+    next_cursor: Optional[str] = None
 
     __params_type__ = BaseFilterModel
 
@@ -56,6 +56,8 @@ class PipelineBuildBaseModel(pydantic_utils.YAMLSerializationMixin):
         images: Docker images of this build.
         is_local: Whether the images are stored locally or in a container
             registry.
+        checksum: Checksum of the contents of all image builds, used to reuse
+            the build for later runs with identical build contexts.
     """
 
     images: Dict[str, BuildItem] = Field(
@@ -64,6 +66,9 @@ class PipelineBuildBaseModel(pydantic_utils.YAMLSerializationMixin):
     is_local: bool = Field(
         title="Whether the build images are stored in a container registry or locally.",
     )
+    checksum: Optional[str] = Field(
+        title="The checksum of the contents of all image builds."
+    )
 
     @staticmethod
     def get_image_key(component_key: str, step: Optional[str] = None) -> str:
@@ -186,6 +191,9 @@ class PipelineBuildFilterModel(WorkspaceScopedFilterModel):
     stack_id: Union[UUID, str, None] = Field(
         description="Stack used for the Pipeline Run"
     )
+    checksum: Optional[str] = Field(
+        description="The checksum of the contents of all image builds."
+    )
 
 
 # ------- #
@@ -78,6 +78,9 @@ class PipelineDeploymentResponseModel(
     schedule: Optional["ScheduleResponseModel"] = Field(
         title="The schedule associated with the deployment."
     )
+    code_path: Optional[str] = Field(
+        title="Path of the code archive in the artifact store."
+    )
 
 
 # ------ #
@@ -128,3 +131,6 @@ class PipelineDeploymentRequestModel(
     schedule: Optional[UUID] = Field(
         title="The schedule associated with the deployment."
     )
+    code_path: Optional[str] = Field(
+        title="Path of the code archive in the artifact store."
+    )
@@ -14,19 +14,21 @@
 """Models representing steps of pipeline runs."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, root_validator
 
 from zenml.config.step_configurations import Step
 from zenml.enums import ExecutionStatus
+from zenml.models.artifact_models import ArtifactRequestModel
 from zenml.models.base_models import (
     WorkspaceScopedRequestModel,
     WorkspaceScopedResponseModel,
 )
 from zenml.models.constants import STR_FIELD_MAX_LENGTH, TEXT_FIELD_MAX_LENGTH
 from zenml.models.filter_models import WorkspaceScopedFilterModel
+from zenml.models.run_metadata_models import RunMetadataRequestModel
 
 if TYPE_CHECKING:
     from zenml.models import ArtifactResponseModel, RunMetadataResponseModel
@@ -84,6 +86,30 @@ class StepRunResponseModel(StepRunBaseModel, WorkspaceScopedResponseModel):
     )
 
 
+class CachedStepRunModel(BaseModel):
+    """Lightweight model of a step run that can be used as a cache hit."""
+
+    id: UUID = Field(title="The ID of the cached step run.")
+    output_artifacts: Dict[str, UUID] = Field(
+        default={},
+        title="The IDs of the output artifacts of the cached step run.",
+    )
+
+
+class UpstreamStepRunModel(BaseModel):
+    """Lightweight model of a step run whose outputs are inputs of a step."""
+
+    id: UUID = Field(title="The ID of the upstream step run.")
+    name: str = Field(
+        title="The name of the upstream step run.",
+        max_length=STR_FIELD_MAX_LENGTH,
+    )
+    output_artifacts: Dict[str, "ArtifactResponseModel"] = Field(
+        default={},
+        title="The output artifacts of the upstream step run.",
+    )
+
+
 # ------ #
 # FILTER #
 # ------ #
@@ -159,3 +185,45 @@ class StepRunUpdateModel(BaseModel):
     output_artifacts: Dict[str, UUID] = {}
     status: Optional[ExecutionStatus] = None
     end_time: Optional[datetime] = None
+
+
+class StepRunCompletionModel(BaseModel):
+    """Model to publish the outputs of a successful step run at once."""
+
+    end_time: datetime = Field(title="The end time of the step run.")
+    output_artifacts: Dict[str, ArtifactRequestModel] = Field(
+        default={},
+        title="The output artifacts to register, keyed by output name.",
+    )
+    output_artifact_metadata: Dict[str, List[RunMetadataRequestModel]] = Field(
+        default={},
+        title="The metadata of the output artifacts, keyed by output name.",
+    )
+    run_metadata: List[RunMetadataRequestModel] = Field(
+        default=[],
+        title="The metadata of the step run.",
+    )
+
+    @root_validator
+    def validate_output_artifact_metadata(
+        cls, values: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Validates that all artifact metadata belongs to an output artifact.
+
+        Args:
+            values: The values to validate.
+
+        Returns:
+            The validated values.
+
+        Raises:
+            ValueError: If metadata is given for an unknown output.
+        """
+        unknown_outputs = set(
+            values.get("output_artifact_metadata", {})
+        ) - set(values.get("output_artifacts", {}))
+        if unknown_outputs:
+            raise ValueError(
+                f"Metadata was provided for unknown outputs {unknown_outputs}."
+            )
+        return values
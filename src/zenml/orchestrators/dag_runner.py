@@ -13,15 +13,27 @@
 #  permissions and limitations under the License.
 """DAG (Directed Acyclic Graph) Runners."""
 
-import threading
+import heapq
+import itertools
+import os
 from collections import defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
 from enum import Enum
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from zenml.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Same default as `ThreadPoolExecutor`, so wide DAGs don't start one thread
+# per node.
+DEFAULT_MAX_PARALLELISM = min(32, (os.cpu_count() or 1) + 4)
+
 
 def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """Reverse a DAG.
@@ -47,12 +59,91 @@ def reverse_dag(dag: Dict[str, List[str]]) -> Dict[str, List[str]]:
     return reversed_dag
 
 
+def _get_longest_path_lengths(
+    dag: Dict[str, List[str]], node_weights: Dict[str, float]
+) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    """Compute the length of the longest weighted path ending in each node.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+        node_weights: Weight for each node. Nodes without a weight count as
+            `1`.
+
+    Returns:
+        The length of the longest path ending in each node, and the upstream
+        node preceding each node on that path. Nodes that are part of a
+        cycle are not included.
+    """
+    reversed_dag = reverse_dag(dag)
+    num_pending_upstream_nodes = {
+        node: len(dag.get(node, [])) for node in reversed_dag
+    }
+    ready_nodes = [
+        node for node, count in num_pending_upstream_nodes.items() if not count
+    ]
+    lengths: Dict[str, float] = {}
+    predecessors: Dict[str, Optional[str]] = {}
+
+    # Process the nodes in topological order. Nodes that are part of a cycle
+    # never become ready and are therefore ignored.
+    while ready_nodes:
+        node = ready_nodes.pop()
+        best_upstream_node = max(
+            dag.get(node, []), key=lengths.__getitem__, default=None
+        )
+        upstream_length = (
+            0 if best_upstream_node is None else lengths[best_upstream_node]
+        )
+        lengths[node] = upstream_length + node_weights.get(node, 1)
+        predecessors[node] = best_upstream_node
+
+        for downstream_node in reversed_dag[node]:
+            num_pending_upstream_nodes[downstream_node] -= 1
+            if not num_pending_upstream_nodes[downstream_node]:
+                ready_nodes.append(downstream_node)
+
+    return lengths, predecessors
+
+
+def get_critical_path(
+    dag: Dict[str, List[str]],
+    node_weights: Optional[Dict[str, float]] = None,
+) -> Tuple[float, List[str]]:
+    """Compute the critical (i.e. the longest weighted) path through a DAG.
+
+    Args:
+        dag: Adjacency list representation of a DAG.
+        node_weights: Optional weight (e.g. duration) for each node. Nodes
+            without a weight count as `1`.
+
+    Returns:
+        The length of the critical path and the nodes on it, ordered from
+        the first to the last node.
+    """
+    lengths, predecessors = _get_longest_path_lengths(
+        dag=dag, node_weights=node_weights or {}
+    )
+    if not lengths:
+        return 0, []
+
+    last_node: Optional[str] = max(lengths, key=lengths.__getitem__)
+    assert last_node is not None
+    length = lengths[last_node]
+    path = []
+    while last_node is not None:
+        path.append(last_node)
+        last_node = predecessors[last_node]
+    return length, path[::-1]
+
+
 class NodeStatus(Enum):
     """Status of the execution of a node."""
 
     WAITING = "Waiting"
     RUNNING = "Running"
     COMPLETED = "Completed"
+    FAILED = "Failed"
+    SKIPPED = "Skipped"
 
 
 class ThreadedDagRunner:
@@ -62,11 +153,18 @@ class ThreadedDagRunner:
     well as a custom `run_fn` as input, then calls `run_fn(node)` for each
     string node in the DAG.
 
-    Steps that can be executed in parallel will be started in separate threads.
+    Nodes whose upstream nodes have all completed are put in a ready queue and
+    executed by a fixed-size pool of worker threads. If more nodes are ready
+    than there are idle workers, the nodes with the longest remaining path
+    through the DAG are started first.
     """
 
     def __init__(
-        self, dag: Dict[str, List[str]], run_fn: Callable[[str], Any]
+        self,
+        dag: Dict[str, List[str]],
+        run_fn: Callable[[str], Any],
+        max_parallelism: Optional[int] = None,
+        fail_fast: bool = True,
     ) -> None:
         """Define attributes and initialize all nodes in waiting state.
 
@@ -75,13 +173,36 @@ class ThreadedDagRunner:
                 E.g.: [(1->2), (1->3), (2->4), (3->4)] should be represented as
                 `dag={2: [1], 3: [1], 4: [2, 3]}`
             run_fn: A function `run_fn(node)` that runs a single node
+            max_parallelism: The maximum number of nodes that run at the same
+                time. Defaults to `DEFAULT_MAX_PARALLELISM`.
+            fail_fast: If `True`, no new nodes will be started once a node
+                failed. If `False`, all nodes that don't depend on a failed
+                node will still be run.
+
+        Raises:
+            ValueError: If `max_parallelism` is not a positive integer.
         """
+        if max_parallelism is not None and max_parallelism < 1:
+            raise ValueError(
+                f"Invalid value `{max_parallelism}` for `max_parallelism`, "
+                "the value needs to be a positive integer."
+            )
+
         self.dag = dag
         self.reversed_dag = reverse_dag(dag)
         self.run_fn = run_fn
+        self.max_parallelism = max_parallelism
+        self.fail_fast = fail_fast
         self.nodes = dag.keys()
         self.node_states = {node: NodeStatus.WAITING for node in self.nodes}
-        self._lock = threading.Lock()
+        self.node_exceptions: Dict[str, BaseException] = {}
+
+        # Nodes that are part of the longest remaining path get started first.
+        self._priorities, _ = _get_longest_path_lengths(
+            dag=self.reversed_dag, node_weights={}
+        )
+        self._ready_queue: List[Tuple[float, int, str]] = []
+        self._insertion_counter = itertools.count()
 
     def _can_run(self, node: str) -> bool:
         """Determine whether a node is ready to be run.
@@ -101,93 +222,128 @@ class ThreadedDagRunner:
 
         # Check that all upstream nodes of this node have already completed.
         for upstream_node in self.dag[node]:
-            if not self.node_states[upstream_node] == NodeStatus.COMPLETED:
+            if not self.node_states.get(upstream_node) == NodeStatus.COMPLETED:
                 return False
 
         return True
 
-    def _run_node(self, node: str) -> None:
-        """Run a single node.
-
-        Calls the user-defined run_fn, then calls `self._finish_node`.
+    def _enqueue(self, node: str) -> None:
+        """Put a node that can be run in the ready queue.
 
         Args:
             node: The node.
         """
-        self.run_fn(node)
-        self._finish_node(node)
-
-    def _run_node_in_thread(self, node: str) -> threading.Thread:
-        """Run a single node in a separate thread.
-
-        First updates the node status to running.
-        Then calls self._run_node() in a new thread and returns the thread.
+        heapq.heappush(
+            self._ready_queue,
+            (
+                -self._priorities.get(node, 0),
+                next(self._insertion_counter),
+                node,
+            ),
+        )
+
+    def _skip_downstream_nodes(self, node: str) -> None:
+        """Mark all nodes downstream of a failed node as skipped.
 
         Args:
-            node: The node.
-
-        Returns:
-            The thread in which the node was run.
+            node: The failed node.
         """
-        # Update node status to running.
-        assert self.node_states[node] == NodeStatus.WAITING
-        with self._lock:
-            self.node_states[node] = NodeStatus.RUNNING
-
-        # Run node in new thread.
-        thread = threading.Thread(target=self._run_node, args=(node,))
-        thread.start()
-        return thread
-
-    def _finish_node(self, node: str) -> None:
+        nodes_to_skip = list(self.reversed_dag[node])
+        while nodes_to_skip:
+            downstream_node = nodes_to_skip.pop()
+            if self.node_states.get(downstream_node) == NodeStatus.WAITING:
+                self.node_states[downstream_node] = NodeStatus.SKIPPED
+                nodes_to_skip.extend(self.reversed_dag[downstream_node])
+
+    def _finish_node(self, node: str, future: "Future[Any]") -> None:
         """Finish a node run.
 
-        First updates the node status to completed.
-        Then starts all other nodes that can now be run and waits for them.
+        Updates the node status depending on the outcome of the run and puts
+        all downstream nodes that can now be run in the ready queue.
 
         Args:
             node: The node.
+            future: The future of the node run.
         """
-        # Update node status to completed.
         assert self.node_states[node] == NodeStatus.RUNNING
-        with self._lock:
-            self.node_states[node] = NodeStatus.COMPLETED
-
-        # Run downstream nodes.
-        threads = []
-        for downstram_node in self.reversed_dag[node]:
-            if self._can_run(downstram_node):
-                thread = self._run_node_in_thread(downstram_node)
-                threads.append(thread)
-
-        # Wait for all downstream nodes to complete.
-        for thread in threads:
-            thread.join()
+        exception = future.exception()
+        if exception is not None:
+            logger.error(f"Node `{node}` failed: {exception}")
+            self.node_states[node] = NodeStatus.FAILED
+            self.node_exceptions[node] = exception
+            self._skip_downstream_nodes(node)
+            return
+
+        self.node_states[node] = NodeStatus.COMPLETED
+        for downstream_node in self.reversed_dag[node]:
+            if self._can_run(downstream_node):
+                self._enqueue(downstream_node)
 
     def run(self) -> None:
         """Call `self.run_fn` on all nodes in `self.dag`.
 
         The order of execution is determined using topological sort.
-        Each node is run in a separate thread to enable parallelism.
+        Nodes are executed by a pool of worker threads to enable parallelism.
+
+        Raises:
+            BaseException: The exception raised by `run_fn` for the first
+                node that failed.
         """
-        # Run all nodes that can be started immediately.
-        # These will, in turn, start other nodes once all of their respective
-        # upstream nodes have completed.
-        threads = []
         for node in self.nodes:
             if self._can_run(node):
-                thread = self._run_node_in_thread(node)
-                threads.append(thread)
-
-        # Wait till all nodes have completed.
-        for thread in threads:
-            thread.join()
+                self._enqueue(node)
+
+        max_workers = self.max_parallelism or DEFAULT_MAX_PARALLELISM
+        running: Dict["Future[Any]", str] = {}
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="dag_runner"
+        ) as executor:
+            while self._ready_queue or running:
+                stop_scheduling = self.fail_fast and bool(self.node_exceptions)
+                while (
+                    self._ready_queue
+                    and len(running) < max_workers
+                    and not stop_scheduling
+                ):
+                    _, _, node = heapq.heappop(self._ready_queue)
+                    self.node_states[node] = NodeStatus.RUNNING
+                    running[executor.submit(self.run_fn, node)] = node
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._finish_node(running.pop(future), future)
 
-        # Make sure all nodes were run, otherwise print a warning.
         for node in self.nodes:
             if self.node_states[node] == NodeStatus.WAITING:
-                upstream_nodes = self.dag[node]
-                logger.warning(
-                    f"Node `{node}` was never run, because it was still"
-                    f" waiting for the following nodes: `{upstream_nodes}`."
+                if self.node_exceptions:
+                    self.node_states[node] = NodeStatus.SKIPPED
+                else:
+                    # Make sure all nodes were run, otherwise print a warning.
+                    upstream_nodes = self.dag[node]
+                    logger.warning(
+                        f"Node `{node}` was never run, because it was still"
+                        f" waiting for the following nodes: `{upstream_nodes}`."
+                    )
+
+        skipped_nodes = [
+            node
+            for node in self.nodes
+            if self.node_states[node] == NodeStatus.SKIPPED
+        ]
+        if skipped_nodes:
+            logger.warning(
+                f"Nodes `{skipped_nodes}` were skipped because other nodes "
+                "failed."
+            )
+
+        if self.node_exceptions:
+            failed_node, exception = next(iter(self.node_exceptions.items()))
+            if len(self.node_exceptions) > 1:
+                logger.error(
+                    f"Nodes `{list(self.node_exceptions)}` failed, raising the "
+                    f"exception of node `{failed_node}`."
                 )
+            raise exception
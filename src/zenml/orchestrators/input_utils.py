@@ -19,20 +19,28 @@ from uuid import UUID
 from zenml.client import Client
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.models import StepRunFilterModel
 
 if TYPE_CHECKING:
     from zenml.models.artifact_models import ArtifactResponseModel
+    from zenml.models.pipeline_deployment_models import (
+        PipelineDeploymentResponseModel,
+    )
 
 
 def resolve_step_inputs(
-    step: "Step", run_id: UUID
+    step: "Step",
+    run_id: UUID,
+    deployment: "PipelineDeploymentResponseModel",
 ) -> Tuple[Dict[str, "ArtifactResponseModel"], List[UUID]]:
     """Resolves inputs for the current step.
 
+    Only the upstream step runs of the step are fetched from the ZenML store,
+    so the cost of this doesn't depend on the number of steps in the run.
+
     Args:
         step: The step for which to resolve the inputs.
         run_id: The ID of the current pipeline run.
+        deployment: The deployment that contains the step.
 
     Raises:
         InputResolutionError: If input resolving failed due to a missing
@@ -42,17 +50,32 @@ def resolve_step_inputs(
         The IDs of the input artifacts and the IDs of parent steps of the
         current step.
     """
-    current_run_steps = {
-        run_step.step.config.name: run_step
-        for run_step in Client()
-        .zen_store.list_run_steps(StepRunFilterModel(pipeline_run_id=run_id))
-        .items
+    # Inputs reference steps by their configured name, while step runs are
+    # stored with the name of the step inside the pipeline
+    step_names_in_pipeline = {
+        step_.config.name: name
+        for name, step_ in deployment.step_configurations.items()
+    }
+    upstream_steps = set(step.spec.upstream_steps).union(
+        input_.step_name for input_ in step.spec.inputs.values()
+    )
+    upstream_step_names = {
+        upstream_step: step_names_in_pipeline.get(upstream_step, upstream_step)
+        for upstream_step in upstream_steps
+    }
+    step_runs = Client().zen_store.get_upstream_step_runs(
+        run_id=run_id, step_names=sorted(set(upstream_step_names.values()))
+    )
+    upstream_step_runs = {
+        upstream_step: step_runs[step_name]
+        for upstream_step, step_name in upstream_step_names.items()
+        if step_name in step_runs
     }
 
     input_artifacts: Dict[str, "ArtifactResponseModel"] = {}
     for name, input_ in step.spec.inputs.items():
         try:
-            step_run = current_run_steps[input_.step_name]
+            step_run = upstream_step_runs[input_.step_name]
         except KeyError:
             raise InputResolutionError(
                 f"No step `{input_.step_name}` found in current run."
@@ -69,7 +92,7 @@ def resolve_step_inputs(
         input_artifacts[name] = artifact
 
     parent_step_ids = [
-        current_run_steps[upstream_step].id
+        upstream_step_runs[upstream_step].id
         for upstream_step in step.spec.upstream_steps
     ]
 
@@ -14,7 +14,7 @@
 """Implementation of the ZenML local orchestrator."""
 
 import time
-from typing import TYPE_CHECKING, Any, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Optional, Type, cast
 from uuid import uuid4
 
 from zenml.client import Client
@@ -25,10 +25,16 @@ from zenml.orchestrators.base_orchestrator import (
     BaseOrchestratorConfig,
     BaseOrchestratorFlavor,
 )
+from zenml.orchestrators.dag_runner import (
+    ThreadedDagRunner,
+    get_critical_path,
+)
+from zenml.orchestrators.step_process_pool import StepProcessPool
 from zenml.stack import Stack
 from zenml.utils import string_utils
 
 if TYPE_CHECKING:
+    from zenml.config.step_configurations import Step
     from zenml.models.pipeline_deployment_models import (
         PipelineDeploymentResponseModel,
     )
@@ -39,18 +45,31 @@ logger = get_logger(__name__)
 class LocalOrchestrator(BaseOrchestrator):
     """Orchestrator responsible for running pipelines locally.
 
-    This orchestrator does not allow for concurrent execution of steps and also
-    does not support running on a schedule.
+    By default, this orchestrator executes all steps sequentially. If
+    `max_concurrency` is set to a value greater than 1 in the orchestrator
+    config, independent steps are executed concurrently in separate threads.
+    If `use_processes` is enabled, steps are executed in a pool of worker
+    processes instead, which allows CPU-bound steps to run in parallel.
+    This orchestrator does not support running on a schedule.
     """
 
     _orchestrator_run_id: Optional[str] = None
 
+    @property
+    def config(self) -> "LocalOrchestratorConfig":
+        """Returns the `LocalOrchestratorConfig` config.
+
+        Returns:
+            The configuration.
+        """
+        return cast(LocalOrchestratorConfig, self._config)
+
     def prepare_or_run_pipeline(
         self,
         deployment: "PipelineDeploymentResponseModel",
         stack: "Stack",
     ) -> Any:
-        """Iterates through all steps and executes them sequentially.
+        """Iterates through all steps and executes them.
 
         Args:
             deployment: The pipeline deployment to prepare or run.
@@ -66,7 +85,6 @@ class LocalOrchestrator(BaseOrchestrator):
         self._orchestrator_run_id = str(uuid4())
         start_time = time.time()
 
-        # Run each step
         for step in deployment.step_configurations.values():
             if self.requires_resources_in_orchestration_environment(step):
                 logger.warning(
@@ -76,9 +94,21 @@ class LocalOrchestrator(BaseOrchestrator):
                     step.config.name,
                 )
 
-            self.run_step(
-                step=step,
+        step_durations: Dict[str, float] = {}
+        if self.config.use_processes:
+            self._run_steps_in_processes(
+                deployment=deployment, step_durations=step_durations
             )
+        elif self.config.max_concurrency > 1:
+            self._run_steps_concurrently(
+                deployment=deployment, step_durations=step_durations
+            )
+        else:
+            # Run each step
+            for step in deployment.step_configurations.values():
+                self._run_and_time_step(
+                    step=step, step_durations=step_durations
+                )
 
         run_duration = time.time() - start_time
         run_id = orchestrator_utils.get_run_id_for_orchestrator_run_id(
@@ -90,8 +120,148 @@ class LocalOrchestrator(BaseOrchestrator):
             run_model.name,
             string_utils.get_human_readable_time(run_duration),
         )
+        self._log_step_durations(
+            deployment=deployment, step_durations=step_durations
+        )
         self._orchestrator_run_id = None
 
+    def _run_and_time_step(
+        self, step: "Step", step_durations: Dict[str, float]
+    ) -> None:
+        """Runs a step and records its wall time.
+
+        Args:
+            step: The step to run.
+            step_durations: Dictionary in which the wall time of the step will
+                be stored.
+        """
+        step_start_time = time.time()
+        try:
+            self.run_step(step=step)
+        finally:
+            step_durations[step.config.name] = time.time() - step_start_time
+
+    def _run_steps_concurrently(
+        self,
+        deployment: "PipelineDeploymentResponseModel",
+        step_durations: Dict[str, float],
+    ) -> None:
+        """Runs all steps of a deployment, executing independent steps concurrently.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            step_durations: Dictionary in which the wall time of each step will
+                be stored.
+        """
+        steps = {
+            step.config.name: step
+            for step in deployment.step_configurations.values()
+        }
+        pipeline_dag = {
+            step_name: step.spec.upstream_steps
+            for step_name, step in steps.items()
+        }
+        logger.info(
+            "Running up to %d steps concurrently.",
+            self.config.max_concurrency,
+        )
+        ThreadedDagRunner(
+            dag=pipeline_dag,
+            run_fn=lambda step_name: self._run_and_time_step(
+                step=steps[step_name], step_durations=step_durations
+            ),
+            max_parallelism=self.config.max_concurrency,
+        ).run()
+
+    def _run_steps_in_processes(
+        self,
+        deployment: "PipelineDeploymentResponseModel",
+        step_durations: Dict[str, float],
+    ) -> None:
+        """Runs all steps of a deployment in a pool of worker processes.
+
+        Args:
+            deployment: The pipeline deployment to run.
+            step_durations: Dictionary in which the wall time of each step will
+                be stored.
+        """
+        name_in_pipeline = {
+            step.config.name: name
+            for name, step in deployment.step_configurations.items()
+        }
+        pipeline_dag = {
+            step.config.name: step.spec.upstream_steps
+            for step in deployment.step_configurations.values()
+        }
+        orchestrator_run_id = self.get_orchestrator_run_id()
+
+        def _run_step(step_name: str) -> None:
+            step_start_time = time.time()
+            try:
+                pool.run_step(
+                    step_name=name_in_pipeline[step_name],
+                    orchestrator_run_id=orchestrator_run_id,
+                )
+            finally:
+                step_durations[step_name] = time.time() - step_start_time
+
+        logger.info(
+            "Running steps in %d worker processes.",
+            self.config.max_concurrency,
+        )
+        with StepProcessPool(
+            deployment_id=deployment.id,
+            max_workers=self.config.max_concurrency,
+        ) as pool:
+            ThreadedDagRunner(
+                dag=pipeline_dag,
+                run_fn=_run_step,
+                max_parallelism=self.config.max_concurrency,
+            ).run()
+
+    @staticmethod
+    def _log_step_durations(
+        deployment: "PipelineDeploymentResponseModel",
+        step_durations: Dict[str, float],
+    ) -> None:
+        """Logs the wall time of all steps and the critical path of a run.
+
+        Args:
+            deployment: The pipeline deployment that was run.
+            step_durations: The wall time of each executed step.
+        """
+        if not step_durations:
+            return
+
+        name_in_pipeline = {
+            step.config.name: name
+            for name, step in deployment.step_configurations.items()
+        }
+        for step_name, duration in sorted(
+            step_durations.items(), key=lambda item: item[1], reverse=True
+        ):
+            logger.info(
+                "Step `%s` wall time: %s.",
+                name_in_pipeline.get(step_name, step_name),
+                string_utils.get_human_readable_time(duration),
+            )
+
+        pipeline_dag = {
+            step.config.name: step.spec.upstream_steps
+            for step in deployment.step_configurations.values()
+        }
+        critical_path_length, critical_path = get_critical_path(
+            dag=pipeline_dag, node_weights=step_durations
+        )
+        logger.info(
+            "Critical path (%s): %s.",
+            string_utils.get_human_readable_time(critical_path_length),
+            " -> ".join(
+                f"`{name_in_pipeline.get(step_name, step_name)}`"
+                for step_name in critical_path
+            ),
+        )
+
     def get_orchestrator_run_id(self) -> str:
         """Returns the active orchestrator run id.
 
@@ -109,7 +279,21 @@ class LocalOrchestrator(BaseOrchestrator):
 
 
 class LocalOrchestratorConfig(BaseOrchestratorConfig):
-    """Local orchestrator config."""
+    """Local orchestrator config.
+
+    Attributes:
+        max_concurrency: The maximum number of steps that are executed
+            concurrently. Steps are only executed concurrently if they don't
+            depend on each other. If set to `1`, all steps are executed
+            sequentially.
+        use_processes: If `True`, steps are executed in a pool of
+            `max_concurrency` worker processes instead of the current process.
+            Steps running in different processes don't share the Python GIL,
+            which speeds up CPU-bound steps.
+    """
+
+    max_concurrency: int = 1
+    use_processes: bool = False
 
     @property
     def is_local(self) -> bool:
@@ -14,8 +14,7 @@
 """Utilities to publish pipeline and step runs."""
 
 from datetime import datetime
-from functools import partial
-from typing import TYPE_CHECKING, Dict, List
+from typing import TYPE_CHECKING, Dict, Optional
 
 from zenml.client import Client
 from zenml.enums import ExecutionStatus
@@ -24,10 +23,10 @@ from zenml.models.pipeline_run_models import (
     PipelineRunUpdateModel,
 )
 from zenml.models.step_run_models import (
+    StepRunCompletionModel,
     StepRunResponseModel,
     StepRunUpdateModel,
 )
-from zenml.utils.pagination_utils import depaginate
 
 if TYPE_CHECKING:
     from uuid import UUID
@@ -74,23 +73,53 @@ def publish_output_artifact_metadata(
 
 
 def publish_successful_step_run(
-    step_run_id: "UUID", output_artifact_ids: Dict[str, "UUID"]
+    step_run_id: "UUID",
+    output_artifacts: Dict[str, "ArtifactRequestModel"],
+    output_artifact_metadata: Optional[
+        Dict[str, Dict[str, "MetadataType"]]
+    ] = None,
+    step_run_metadata: Optional[
+        Dict["UUID", Dict[str, "MetadataType"]]
+    ] = None,
 ) -> "StepRunResponseModel":
-    """Publishes a successful step run.
+    """Publishes a successful step run together with its outputs.
+
+    The output artifacts, their metadata, the step run metadata and the new
+    status of the step run are sent to the ZenML store in a single request.
 
     Args:
         step_run_id: The ID of the step run to update.
-        output_artifact_ids: The output artifact IDs for the step run.
+        output_artifacts: The output artifacts to register.
+        output_artifact_metadata: A mapping from output names to metadata.
+        step_run_metadata: A dictionary mapping stack component IDs to the
+            metadata they created for the step run.
 
     Returns:
         The updated step run.
     """
-    return Client().zen_store.update_run_step(
+    client = Client()
+
+    artifact_metadata = {
+        output_name: client._get_run_metadata_requests(metadata=metadata)
+        for output_name, metadata in (output_artifact_metadata or {}).items()
+    }
+    run_metadata = [
+        metadata_request
+        for stack_component_id, metadata in (step_run_metadata or {}).items()
+        for metadata_request in client._get_run_metadata_requests(
+            metadata=metadata,
+            step_run_id=step_run_id,
+            stack_component_id=stack_component_id,
+        )
+    ]
+
+    return client.zen_store.complete_run_step(
         step_run_id=step_run_id,
-        step_run_update=StepRunUpdateModel(
-            status=ExecutionStatus.COMPLETED,
+        step_run_completion=StepRunCompletionModel(
             end_time=datetime.utcnow(),
-            output_artifacts=output_artifact_ids,
+            output_artifacts=output_artifacts,
+            output_artifact_metadata=artifact_metadata,
+            run_metadata=run_metadata,
         ),
     )
 
@@ -133,56 +162,6 @@ def publish_failed_pipeline_run(
     )
 
 
-def get_pipeline_run_status(
-    step_statuses: List[ExecutionStatus], num_steps: int
-) -> ExecutionStatus:
-    """Gets the pipeline run status for the given step statuses.
-
-    Args:
-        step_statuses: The status of steps in this run.
-        num_steps: The total amount of steps in this run.
-
-    Returns:
-        The run status.
-    """
-    if ExecutionStatus.FAILED in step_statuses:
-        return ExecutionStatus.FAILED
-    if (
-        ExecutionStatus.RUNNING in step_statuses
-        or len(step_statuses) < num_steps
-    ):
-        return ExecutionStatus.RUNNING
-
-    return ExecutionStatus.COMPLETED
-
-
-def update_pipeline_run_status(pipeline_run: PipelineRunResponseModel) -> None:
-    """Updates the status of the current pipeline run.
-
-    Args:
-        pipeline_run: The model of the current pipeline run.
-    """
-    assert pipeline_run.num_steps is not None
-    client = Client()
-    steps_in_current_run = depaginate(
-        partial(client.list_run_steps, pipeline_run_id=pipeline_run.id)
-    )
-
-    new_status = get_pipeline_run_status(
-        step_statuses=[step_run.status for step_run in steps_in_current_run],
-        num_steps=pipeline_run.num_steps,
-    )
-
-    if new_status != pipeline_run.status:
-        run_update = PipelineRunUpdateModel(status=new_status)
-        if new_status in {ExecutionStatus.COMPLETED, ExecutionStatus.FAILED}:
-            run_update.end_time = datetime.utcnow()
-
-        Client().zen_store.update_run(
-            run_id=pipeline_run.id, run_update=run_update
-        )
-
-
 def publish_pipeline_run_metadata(
     pipeline_run_id: "UUID",
     pipeline_run_metadata: Dict["UUID", Dict[str, "MetadataType"]],
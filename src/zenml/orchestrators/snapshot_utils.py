@@ -0,0 +1,145 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities for deployment snapshots.
+
+A deployment snapshot contains the deployment of a pipeline run together with
+the flavors of its stack components. Orchestrators can pass a snapshot to the
+step entrypoints of a run, which then don't need to fetch the deployment,
+stack and flavors from the ZenML store in every step.
+"""
+
+import gzip
+import os
+from typing import TYPE_CHECKING, List, Optional
+
+from pydantic import BaseModel
+
+from zenml.client import Client
+from zenml.constants import ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH
+from zenml.logger import get_logger
+from zenml.models import FlavorResponseModel, PipelineDeploymentResponseModel
+
+if TYPE_CHECKING:
+    from uuid import UUID
+
+logger = get_logger(__name__)
+
+
+class DeploymentSnapshot(BaseModel):
+    """Snapshot of a deployment and the flavors of its stack components."""
+
+    deployment: PipelineDeploymentResponseModel
+    flavors: List[FlavorResponseModel] = []
+
+    class Config:
+        """Pydantic configuration class."""
+
+        allow_mutation = False
+
+
+def create_deployment_snapshot(
+    deployment: PipelineDeploymentResponseModel,
+) -> DeploymentSnapshot:
+    """Creates a snapshot of a deployment.
+
+    Args:
+        deployment: The deployment for which to create the snapshot.
+
+    Returns:
+        The deployment snapshot.
+    """
+    client = Client()
+    flavors = []
+    if deployment.stack:
+        for components in deployment.stack.components.values():
+            for component in components:
+                flavors.append(
+                    client.get_flavor_by_name_and_type(
+                        name=component.flavor, component_type=component.type
+                    )
+                )
+
+    return DeploymentSnapshot(deployment=deployment, flavors=flavors)
+
+
+def serialize_deployment_snapshot(snapshot: DeploymentSnapshot) -> bytes:
+    """Serializes a deployment snapshot.
+
+    Args:
+        snapshot: The snapshot to serialize.
+
+    Returns:
+        The gzip compressed JSON representation of the snapshot.
+    """
+    return gzip.compress(snapshot.json().encode("utf-8"))
+
+
+def deserialize_deployment_snapshot(data: bytes) -> DeploymentSnapshot:
+    """Deserializes a deployment snapshot.
+
+    Args:
+        data: The serialized snapshot.
+
+    Returns:
+        The deployment snapshot.
+    """
+    return DeploymentSnapshot.parse_raw(gzip.decompress(data))
+
+
+def load_deployment_snapshot(
+    deployment_id: "UUID",
+) -> Optional[DeploymentSnapshot]:
+    """Loads the deployment snapshot passed to this process.
+
+    If a snapshot is available, the stack and flavors it contains are pinned
+    in the client cache so building the stack doesn't query the ZenML store.
+
+    Args:
+        deployment_id: ID of the deployment for which to load the snapshot.
+
+    Returns:
+        The deployment snapshot or `None` if no valid snapshot for the
+        deployment was passed to this process.
+    """
+    snapshot_path = os.environ.get(ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH)
+    if not snapshot_path:
+        return None
+
+    try:
+        with open(snapshot_path, "rb") as f:
+            snapshot = deserialize_deployment_snapshot(f.read())
+    except Exception as e:
+        logger.warning(
+            "Failed to load deployment snapshot from `%s`, falling back to "
+            "the ZenML store: %s",
+            snapshot_path,
+            e,
+        )
+        return None
+
+    if snapshot.deployment.id != deployment_id:
+        logger.warning(
+            "Ignoring deployment snapshot for deployment `%s` as it does not "
+            "match the deployment `%s` of this run.",
+            snapshot.deployment.id,
+            deployment_id,
+        )
+        return None
+
+    if snapshot.deployment.stack:
+        Client()._pin_stack_and_flavors(
+            stack=snapshot.deployment.stack, flavors=snapshot.flavors
+        )
+
+    return snapshot
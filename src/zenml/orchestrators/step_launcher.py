@@ -203,8 +203,6 @@ class StepLauncher:
                     logger.error(f"Failed to run step `{self._step_name}`.")
                     publish_utils.publish_failed_step_run(step_run_response.id)
                     raise
-
-            publish_utils.update_pipeline_run_status(pipeline_run=pipeline_run)
         except:  # noqa: E722
             logger.error(f"Pipeline run `{pipeline_run.name}` failed.")
             publish_utils.publish_failed_pipeline_run(pipeline_run.id)
@@ -299,7 +297,9 @@ class StepLauncher:
             well as the response model of the registered step run.
         """
         input_artifacts, parent_step_ids = input_utils.resolve_step_inputs(
-            step=self._step, run_id=step_run.pipeline_run_id
+            step=self._step,
+            run_id=step_run.pipeline_run_id,
+            deployment=self._deployment,
         )
         input_artifact_ids = {
             input_name: artifact.id
@@ -330,12 +330,8 @@ class StepLauncher:
             if cached_step_run:
                 logger.info(f"Using cached version of `{self._step_name}`.")
                 execution_needed = False
-                cached_outputs = cached_step_run.output_artifacts
                 step_run.original_step_run_id = cached_step_run.id
-                step_run.output_artifacts = {
-                    output_name: artifact.id
-                    for output_name, artifact in cached_outputs.items()
-                }
+                step_run.output_artifacts = cached_step_run.output_artifacts
                 step_run.status = ExecutionStatus.CACHED
                 step_run.end_time = step_run.start_time
 
@@ -0,0 +1,225 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Pool of worker processes that run steps in parallel."""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from types import TracebackType
+from typing import TYPE_CHECKING, Dict, Optional, Type
+from uuid import UUID
+
+from zenml.constants import ENV_ZENML_PREVENT_PIPELINE_EXECUTION
+from zenml.logger import get_logger
+from zenml.utils import source_utils
+
+if TYPE_CHECKING:
+    from zenml.models.pipeline_deployment_models import (
+        PipelineDeploymentResponseModel,
+    )
+
+logger = get_logger(__name__)
+
+# Deployments that were loaded by a worker process, keyed by their ID
+_worker_deployments: Dict[UUID, "PipelineDeploymentResponseModel"] = {}
+
+
+def _get_deployment(deployment_id: UUID) -> "PipelineDeploymentResponseModel":
+    """Gets a deployment in a worker process.
+
+    Args:
+        deployment_id: The ID of the deployment.
+
+    Returns:
+        The deployment.
+    """
+    if deployment_id not in _worker_deployments:
+        from zenml.client import Client
+
+        deployment = Client().zen_store.get_deployment(deployment_id)
+        _worker_deployments[deployment_id] = deployment
+    return _worker_deployments[deployment_id]
+
+
+def _initialize_worker(
+    deployment_id: UUID, source_root: Optional[str]
+) -> None:
+    """Prepares a worker process for running the steps of a deployment.
+
+    Activates all integrations and imports the sources of all steps, so that
+    running a step in this worker doesn't have to pay these costs anymore.
+
+    Args:
+        deployment_id: The ID of the deployment.
+        source_root: The source root of the process that started the worker.
+    """
+    from zenml import constants
+    from zenml.integrations.registry import integration_registry
+
+    # Importing user modules must never run an entire pipeline
+    constants.SHOULD_PREVENT_PIPELINE_EXECUTION = True
+    # The main module of the worker process is not the one of the user, so
+    # the source root needs to be the same as in the process starting it
+    source_utils.set_custom_source_root(source_root)
+    integration_registry.activate_integrations()
+
+    try:
+        deployment = _get_deployment(deployment_id)
+    except Exception as e:
+        # The error will be raised again once the worker runs a step
+        logger.debug("Failed to prepare step worker process: %s", e)
+        return
+
+    for step in deployment.step_configurations.values():
+        try:
+            source_utils.load_source_path(step.spec.source)
+        except Exception as e:
+            logger.debug(
+                "Failed to import source `%s` of step `%s`: %s",
+                step.spec.source,
+                step.config.name,
+                e,
+            )
+
+
+def _warm_up() -> None:
+    """Task used to start the worker processes of a pool eagerly."""
+
+
+def _run_step(
+    deployment_id: UUID, step_name: str, orchestrator_run_id: str
+) -> None:
+    """Runs a step in a worker process.
+
+    Args:
+        deployment_id: The ID of the deployment that contains the step.
+        step_name: The name of the step in the pipeline.
+        orchestrator_run_id: The orchestrator run ID.
+    """
+    from zenml.orchestrators.step_launcher import StepLauncher
+
+    deployment = _get_deployment(deployment_id)
+    StepLauncher(
+        deployment=deployment,
+        step=deployment.step_configurations[step_name],
+        orchestrator_run_id=orchestrator_run_id,
+    ).launch()
+
+
+class StepProcessPool:
+    """Pool of worker processes that run the steps of a deployment.
+
+    Steps running in separate processes don't share the GIL, which allows
+    CPU-bound steps to run in parallel on all cores of a machine. The worker
+    processes are started when entering the pool and are reused for all steps
+    of the deployment. Only IDs are sent to the workers: each worker loads
+    the deployment from the ZenML store, and the step inputs and outputs are
+    read from and written to the artifact store.
+
+    ```python
+    with StepProcessPool(deployment_id=deployment.id, max_workers=4) as pool:
+        pool.run_step(step_name="trainer", orchestrator_run_id=run_id)
+    ```
+    """
+
+    def __init__(self, deployment_id: UUID, max_workers: int) -> None:
+        """Initializes the pool.
+
+        Args:
+            deployment_id: The ID of the deployment whose steps to run.
+            max_workers: The number of worker processes.
+        """
+        self._deployment_id = deployment_id
+        self._max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._previous_prevent_execution_value: Optional[str] = None
+
+    def __enter__(self) -> "StepProcessPool":
+        """Starts the worker processes.
+
+        Returns:
+            The pool.
+        """
+        # Worker processes are started using `spawn`, which imports the main
+        # module of this process again. The environment variable makes sure
+        # this doesn't run a module-level `pipeline.run()` call once more.
+        self._previous_prevent_execution_value = os.environ.get(
+            ENV_ZENML_PREVENT_PIPELINE_EXECUTION
+        )
+        os.environ[ENV_ZENML_PREVENT_PIPELINE_EXECUTION] = "True"
+
+        source_root: Optional[str]
+        try:
+            source_root = source_utils.get_source_root_path()
+        except RuntimeError:
+            source_root = None
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(self._deployment_id, source_root),
+        )
+        for _ in range(self._max_workers):
+            self._executor.submit(_warm_up)
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Shuts down the worker processes.
+
+        Args:
+            exc_type: The class of the exception.
+            exc_value: The instance of the exception.
+            traceback: The traceback of the exception.
+        """
+        if self._executor:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._previous_prevent_execution_value is None:
+            os.environ.pop(ENV_ZENML_PREVENT_PIPELINE_EXECUTION, None)
+        else:
+            os.environ[
+                ENV_ZENML_PREVENT_PIPELINE_EXECUTION
+            ] = self._previous_prevent_execution_value
+
+    def run_step(self, step_name: str, orchestrator_run_id: str) -> None:
+        """Runs a step in one of the worker processes.
+
+        This blocks until the step has finished, so it is meant to be called
+        from multiple threads, e.g. by a `ThreadedDagRunner`.
+
+        Args:
+            step_name: The name of the step in the pipeline.
+            orchestrator_run_id: The orchestrator run ID.
+
+        Raises:
+            RuntimeError: If the pool was not started.
+        """
+        if not self._executor:
+            raise RuntimeError(
+                "The step process pool needs to be used as a context manager."
+            )
+
+        self._executor.submit(
+            _run_step,
+            self._deployment_id,
+            step_name,
+            orchestrator_run_id,
+        ).result()
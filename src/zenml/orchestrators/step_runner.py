@@ -40,8 +40,6 @@ from zenml.models.artifact_models import (
     ArtifactResponseModel,
 )
 from zenml.orchestrators.publish_utils import (
-    publish_output_artifact_metadata,
-    publish_output_artifacts,
     publish_step_run_metadata,
     publish_successful_step_run,
 )
@@ -146,56 +144,64 @@ class StepRunner:
                 step_run_metadata = self._stack.get_step_run_metadata(
                     info=step_run_info,
                 )
-                publish_step_run_metadata(
-                    step_run_id=step_run_info.step_run_id,
-                    step_run_metadata=step_run_metadata,
-                )
+                if step_failed:
+                    # Successful step runs publish their metadata together
+                    # with their outputs
+                    publish_step_run_metadata(
+                        step_run_id=step_run_info.step_run_id,
+                        step_run_metadata=step_run_metadata,
+                    )
                 self._stack.cleanup_step_run(
                     info=step_run_info, step_failed=step_failed
                 )
-                if not step_failed:
-                    success_hook_source = (
-                        self.configuration.success_hook_source
+
+            try:
+                success_hook_source = self.configuration.success_hook_source
+                if success_hook_source:
+                    logger.info("Detected success hook. Running...")
+                    self.load_and_run_hook(
+                        success_hook_source,
+                        step_exception=None,
+                        output_artifact_uris=output_artifact_uris,
+                        output_materializers=output_materializers,
                     )
-                    if success_hook_source:
-                        logger.info("Detected success hook. Running...")
-                        self.load_and_run_hook(
-                            success_hook_source,
-                            step_exception=None,
-                            output_artifact_uris=output_artifact_uris,
-                            output_materializers=output_materializers,
-                        )
-
-            # Store and publish the output artifacts of the step function.
-            output_annotations = parse_return_type_annotations(
-                spec.annotations
-            )
-            output_data = self._validate_outputs(
-                return_values, output_annotations
-            )
-            artifact_metadata_enabled = is_setting_enabled(
-                is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
-                is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
-            )
-            output_artifacts, artifact_metadata = self._store_output_artifacts(
-                output_data=output_data,
-                output_artifact_uris=output_artifact_uris,
-                output_materializers=output_materializers,
-                artifact_metadata_enabled=artifact_metadata_enabled,
-            )
 
-        output_artifact_ids = publish_output_artifacts(
-            output_artifacts=output_artifacts,
-        )
-        publish_output_artifact_metadata(
-            output_artifact_ids=output_artifact_ids,
-            output_artifact_metadata=artifact_metadata,
-        )
+                # Store and publish the output artifacts of the step function.
+                output_annotations = parse_return_type_annotations(
+                    spec.annotations
+                )
+                output_data = self._validate_outputs(
+                    return_values, output_annotations
+                )
+                artifact_metadata_enabled = is_setting_enabled(
+                    is_enabled_on_step=step_run_info.config.enable_artifact_metadata,
+                    is_enabled_on_pipeline=step_run_info.pipeline.enable_artifact_metadata,
+                )
+                (
+                    output_artifacts,
+                    artifact_metadata,
+                ) = self._store_output_artifacts(
+                    output_data=output_data,
+                    output_artifact_uris=output_artifact_uris,
+                    output_materializers=output_materializers,
+                    artifact_metadata_enabled=artifact_metadata_enabled,
+                )
+            except BaseException:
+                # The step run won't be published as successful, so the
+                # metadata needs to be published on its own
+                publish_step_run_metadata(
+                    step_run_id=step_run_info.step_run_id,
+                    step_run_metadata=step_run_metadata,
+                )
+                raise
 
-        # Update the status and output artifacts of the step run.
+        # Register the outputs and metadata and update the status of the step
+        # run.
         publish_successful_step_run(
             step_run_id=step_run_info.step_run_id,
-            output_artifact_ids=output_artifact_ids,
+            output_artifacts=output_artifacts,
+            output_artifact_metadata=artifact_metadata,
+            step_run_metadata=step_run_metadata,
         )
 
     def _load_step_entrypoint(self) -> Callable[..., Any]:
@@ -374,7 +380,13 @@ class StepRunner:
         ] = source_utils.load_and_validate_class(
             artifact.materializer, expected_class=BaseMaterializer
         )
-        materializer = materializer_class(artifact.uri)
+        uri = artifact.uri
+        artifact_store = self._stack.artifact_store
+        if artifact.artifact_store_id == artifact_store.id:
+            uri = artifact_store.get_local_artifact_uri(
+                artifact_id=artifact.id, uri=artifact.uri
+            )
+        materializer = materializer_class(uri)
         return materializer.load(data_type=data_type)
 
     def _validate_outputs(
@@ -71,8 +71,10 @@ from zenml.stack import Stack
 from zenml.steps import BaseStep
 from zenml.steps.base_step import BaseStepMeta
 from zenml.utils import (
+    code_utils,
     dashboard_utils,
     dict_utils,
+    docker_utils,
     pydantic_utils,
     settings_utils,
     yaml_utils,
@@ -84,6 +86,7 @@ from zenml.utils.pipeline_docker_image_builder import (
 
 if TYPE_CHECKING:
     from zenml.config.base_settings import SettingsOrDict
+    from zenml.config.build_configuration import BuildConfiguration
     from zenml.post_execution import PipelineRunView
 
     StepConfigurationUpdateOrDict = Union[
@@ -349,11 +352,6 @@ class BasePipeline(metaclass=BasePipelineMeta):
         Returns:
             The registered pipeline model.
         """
-        # Activating the built-in integrations to load all materializers
-        from zenml.integrations.registry import integration_registry
-
-        integration_registry.activate_integrations()
-
         custom_configurations = self.configuration.dict(
             exclude_defaults=True, exclude={"name"}
         )
@@ -518,6 +516,9 @@ class BasePipeline(metaclass=BasePipelineMeta):
                 build=build,
             )
             build_id = build_model.id if build_model else None
+            code_path = self._upload_code_if_necessary(
+                deployment=deployment, stack=stack
+            )
 
             deployment_request = PipelineDeploymentRequestModel(
                 user=Client().active_user.id,
@@ -526,6 +527,7 @@ class BasePipeline(metaclass=BasePipelineMeta):
                 pipeline=pipeline_id,
                 build=build_id,
                 schedule=schedule_id,
+                code_path=code_path,
                 **deployment.dict(),
             )
             deployment_model = Client().zen_store.create_deployment(
@@ -976,11 +978,6 @@ class BasePipeline(metaclass=BasePipelineMeta):
             A tuple containing the deployment, spec, schedule and build of
             the compiled pipeline.
         """
-        # Activating the built-in integrations to load all materializers
-        from zenml.integrations.registry import integration_registry
-
-        integration_registry.activate_integrations()
-
         if config_path:
             run_config = PipelineRunConfiguration.from_yaml(config_path)
         else:
@@ -1208,14 +1205,9 @@ class BasePipeline(metaclass=BasePipelineMeta):
             logger.debug("No docker builds required.")
             return None
 
-        logger.info(
-            "Building Docker image(s) for pipeline `%s`.",
-            deployment.pipeline_configuration.name,
-        )
-
         docker_image_builder = PipelineDockerImageBuilder()
-        images: Dict[str, BuildItem] = {}
-        image_names: Dict[str, str] = {}
+        settings_checksums: Dict[str, str] = {}
+        build_configs: Dict[str, "BuildConfiguration"] = {}
 
         for build_config in required_builds:
             combined_key = PipelineBuildBaseModel.get_image_key(
@@ -1223,8 +1215,8 @@ class BasePipeline(metaclass=BasePipelineMeta):
             )
             checksum = build_config.compute_settings_checksum(stack=stack)
 
-            if combined_key in images:
-                previous_checksum = images[combined_key].settings_checksum
+            if combined_key in settings_checksums:
+                previous_checksum = settings_checksums[combined_key]
 
                 if previous_checksum != checksum:
                     raise RuntimeError(
@@ -1240,26 +1232,64 @@ class BasePipeline(metaclass=BasePipelineMeta):
                 else:
                     continue
 
-            if checksum in image_names:
-                image_name_or_digest = image_names[checksum]
-            else:
-                tag = deployment.pipeline_configuration.name
-                if build_config.step_name:
-                    tag += f"-{build_config.step_name}"
-                tag += f"-{build_config.key}"
-
-                image_name_or_digest = docker_image_builder.build_docker_image(
+            settings_checksums[combined_key] = checksum
+            # Images with identical settings are only built once
+            build_configs.setdefault(checksum, build_config)
+
+        def _get_tag(build_config: "BuildConfiguration") -> str:
+            tag = deployment.pipeline_configuration.name
+            if build_config.step_name:
+                tag += f"-{build_config.step_name}"
+            tag += f"-{build_config.key}"
+            return tag
+
+        build_hash = hashlib.sha256()
+        for combined_key, checksum in sorted(settings_checksums.items()):
+            build_config = build_configs[checksum]
+            build_hash.update(combined_key.encode())
+            build_hash.update(
+                docker_image_builder.compute_build_checksum(
                     docker_settings=build_config.settings,
-                    tag=tag,
+                    tag=_get_tag(build_config),
                     stack=stack,
                     entrypoint=build_config.entrypoint,
                     extra_files=build_config.extra_files,
-                )
+                ).encode()
+            )
+        build_checksum = build_hash.hexdigest()
 
-            images[combined_key] = BuildItem(
-                image=image_name_or_digest, settings_checksum=checksum
+        existing_build = self._find_reusable_build(
+            stack_id=client.active_stack_model.id, checksum=build_checksum
+        )
+        if existing_build:
+            logger.info(
+                "Reusing existing build `%s` as the contents of all Docker "
+                "images are unchanged.",
+                existing_build.id,
+            )
+            return existing_build
+
+        logger.info(
+            "Building Docker image(s) for pipeline `%s`.",
+            deployment.pipeline_configuration.name,
+        )
+
+        image_names: Dict[str, str] = {}
+        for checksum, build_config in build_configs.items():
+            image_names[checksum] = docker_image_builder.build_docker_image(
+                docker_settings=build_config.settings,
+                tag=_get_tag(build_config),
+                stack=stack,
+                entrypoint=build_config.entrypoint,
+                extra_files=build_config.extra_files,
             )
-            image_names[checksum] = image_name_or_digest
+
+        images = {
+            combined_key: BuildItem(
+                image=image_names[checksum], settings_checksum=checksum
+            )
+            for combined_key, checksum in settings_checksums.items()
+        }
 
         logger.info("Finished building Docker image(s).")
 
@@ -1271,5 +1301,78 @@ class BasePipeline(metaclass=BasePipelineMeta):
             pipeline=pipeline_id,
             is_local=is_local,
             images=images,
+            checksum=build_checksum,
         )
         return client.zen_store.create_build(build_request)
+
+    @staticmethod
+    def _upload_code_if_necessary(
+        deployment: "PipelineDeploymentBaseModel", stack: "Stack"
+    ) -> Optional[str]:
+        """Uploads the user code to the artifact store if necessary.
+
+        This is the case if the Docker images of the deployment don't include
+        the user files, but download them from the artifact store instead.
+
+        Args:
+            deployment: The compiled pipeline deployment.
+            stack: The stack on which the pipeline will be deployed.
+
+        Returns:
+            The path of the uploaded code in the artifact store, or `None` if
+            no upload was necessary.
+        """
+        for build_config in stack.get_docker_builds(deployment=deployment):
+            settings = build_config.settings
+            if (
+                settings.code_from_artifact_store
+                and settings.copy_files
+                and not settings.skip_build
+            ):
+                return code_utils.upload_code(
+                    artifact_store=stack.artifact_store,
+                    dockerignore_file=settings.dockerignore,
+                )
+
+        return None
+
+    @staticmethod
+    def _find_reusable_build(
+        stack_id: UUID, checksum: str
+    ) -> Optional["PipelineBuildResponseModel"]:
+        """Finds an existing build with identical contents.
+
+        Args:
+            stack_id: The ID of the stack for which the images are built.
+            checksum: The checksum of the contents of all image builds.
+
+        Returns:
+            The most recent build for the same stack with the given checksum
+            whose images are still available, or `None` if no such build
+            exists.
+        """
+        builds = Client().list_builds(
+            stack_id=stack_id,
+            checksum=checksum,
+            sort_by="desc:created",
+            size=1,
+        )
+        if not builds.items:
+            return None
+
+        build = builds.items[0]
+        if build.is_local:
+            # Local images might have been removed in the meantime
+            try:
+                images_exist = all(
+                    docker_utils.is_local_image(item.image)
+                    for item in build.images.values()
+                )
+            except Exception as e:
+                logger.debug("Failed to check for local images: %s", e)
+                images_exist = False
+
+            if not images_exist:
+                return None
+
+        return build
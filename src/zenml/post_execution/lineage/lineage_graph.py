@@ -17,6 +17,7 @@ from typing import List, Optional, Tuple, Union
 
 from pydantic import BaseModel
 
+from zenml.client import Client
 from zenml.enums import ExecutionStatus
 from zenml.post_execution.lineage.edge import Edge
 from zenml.post_execution.lineage.node import (
@@ -40,12 +41,18 @@ class LineageGraph(BaseModel):
     root_step_id: Optional[str]
     run_metadata: List[Tuple[str, str, str]] = []
 
-    def generate_step_nodes_and_edges(self, step: StepView) -> None:
+    def generate_step_nodes_and_edges(
+        self, step: StepView, status: Optional[ExecutionStatus] = None
+    ) -> None:
         """Generates the step nodes and the edges between them.
 
         Args:
             step: The step to generate the nodes and edges for.
+            status: The current status of the step. If not given, the status
+                is fetched from the ZenStore.
         """
+        if status is None:
+            status = step.status
         step_id = STEP_PREFIX + str(step.id)
         if self.root_step_id is None:
             self.root_step_id = step_id
@@ -62,7 +69,7 @@ class LineageGraph(BaseModel):
                 data=StepNodeDetails(
                     execution_id=str(step.id),
                     name=step.name,  # redundant for consistency
-                    status=step.status,
+                    status=status,
                     entrypoint_name=step.entrypoint_name,  # redundant for consistency
                     parameters=step.parameters,
                     configuration=step_config,
@@ -84,8 +91,8 @@ class LineageGraph(BaseModel):
                     data=ArtifactNodeDetails(
                         execution_id=str(artifact.id),
                         name=artifact_name,
-                        status=step.status,
-                        is_cached=step.status == ExecutionStatus.CACHED,
+                        status=status,
+                        is_cached=status == ExecutionStatus.CACHED,
                         artifact_type=artifact.type,
                         artifact_data_type=artifact.data_type,
                         parent_step_id=str(step.id),
@@ -125,5 +132,11 @@ class LineageGraph(BaseModel):
         self.run_metadata = [
             (m.key, str(m.value), str(m.type)) for m in run.metadata.values()
         ]
-        for step in run.steps:
-            self.generate_step_nodes_and_edges(step)
+        steps = run.steps
+        # Fetch the current status of all steps concurrently instead of
+        # sending one request per step
+        step_models = Client().get_run_steps_by_ids(
+            [step.id for step in steps]
+        )
+        for step, step_model in zip(steps, step_models):
+            self.generate_step_nodes_and_edges(step, status=step_model.status)
@@ -18,6 +18,7 @@ from functools import partial
 from typing import Any, Dict, List, Optional, cast
 
 from zenml.client import Client
+from zenml.constants import PAGE_SIZE_MAXIMUM
 from zenml.enums import ExecutionStatus
 from zenml.logger import get_apidocs_link, get_logger
 from zenml.models import PipelineRunResponseModel
@@ -264,7 +265,11 @@ class PipelineRunView(BaseView):
 
         client = Client()
         steps = depaginate(
-            partial(client.list_run_steps, pipeline_run_id=self.model.id)
+            partial(
+                client.list_run_steps,
+                pipeline_run_id=self.model.id,
+                size=PAGE_SIZE_MAXIMUM,
+            )
         )
 
         self._steps = {step.name: StepView(step) for step in steps}
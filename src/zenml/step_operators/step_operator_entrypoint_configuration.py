@@ -92,7 +92,7 @@ class StepOperatorEntrypointConfiguration(StepEntrypointConfiguration):
 
         stack = Client().active_stack
         input_artifacts, _ = input_utils.resolve_step_inputs(
-            step=step, run_id=pipeline_run.id
+            step=step, run_id=pipeline_run.id, deployment=deployment
         )
         output_artifact_uris = output_utils.prepare_output_artifact_uris(
             step_run=step_run, stack=stack, step=step
@@ -0,0 +1,92 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Utilities to upload user code to and download it from artifact stores."""
+import os
+import tarfile
+import tempfile
+from typing import TYPE_CHECKING, Optional
+
+from zenml.io import fileio
+from zenml.logger import get_logger
+from zenml.utils import source_utils
+
+if TYPE_CHECKING:
+    from zenml.artifact_stores import BaseArtifactStore
+
+logger = get_logger(__name__)
+
+CODE_UPLOAD_DIRECTORY = "code_uploads"
+
+
+def upload_code(
+    artifact_store: "BaseArtifactStore",
+    dockerignore_file: Optional[str] = None,
+) -> str:
+    """Uploads an archive of all files in the source root to an artifact store.
+
+    The archive is named after the checksum of its contents, so uploading the
+    same files again doesn't create another copy.
+
+    Args:
+        artifact_store: The artifact store to upload the code to.
+        dockerignore_file: Optional path to a dockerignore file that specifies
+            which files to exclude. If not given, a file called
+            `.dockerignore` in the source root will be used if it exists.
+
+    Returns:
+        The path of the uploaded archive in the artifact store.
+    """
+    from zenml.image_builders import BuildContext
+
+    build_context = BuildContext(
+        root=source_utils.get_source_root_path(),
+        dockerignore_file=dockerignore_file,
+    )
+    checksum = build_context.compute_checksum()
+    upload_path = os.path.join(
+        artifact_store.path, CODE_UPLOAD_DIRECTORY, f"{checksum}.tar.gz"
+    )
+
+    if fileio.exists(upload_path):
+        logger.info(
+            "Code already exists in the artifact store, skipping upload."
+        )
+        return upload_path
+
+    logger.info("Uploading code to `%s`.", upload_path)
+    with tempfile.NamedTemporaryFile(suffix=".tar.gz") as f:
+        build_context.write_archive(f, gzip=True)
+        f.flush()
+        fileio.makedirs(os.path.dirname(upload_path))
+        fileio.copy(f.name, upload_path, overwrite=True)
+
+    return upload_path
+
+
+def download_code(code_path: str, extract_dir: Optional[str] = None) -> None:
+    """Downloads and extracts code that was uploaded to an artifact store.
+
+    Args:
+        code_path: The path of the code archive in the artifact store.
+        extract_dir: The directory in which to extract the code. Defaults to
+            the current working directory.
+    """
+    extract_dir = extract_dir or os.getcwd()
+    logger.info("Downloading code from `%s`.", code_path)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        local_path = os.path.join(tmpdir, os.path.basename(code_path))
+        fileio.copy(code_path, local_path)
+        with tarfile.open(local_path, "r:gz") as archive:
+            archive.extractall(extract_dir)
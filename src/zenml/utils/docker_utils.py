@@ -328,6 +328,32 @@ def is_local_image(image_name: str) -> bool:
         return False
 
 
+def image_exists(image_name: str, check_registry: bool = False) -> bool:
+    """Checks whether an image exists.
+
+    Args:
+        image_name: Name of the image to check.
+        check_registry: If `True`, also checks whether the image exists in
+            the registry specified in the image name.
+
+    Returns:
+        `True` if the image exists, `False` otherwise or if Docker is not
+        available to check it.
+    """
+    try:
+        docker_client = DockerClient.from_env()
+        if docker_client.images.list(name=image_name):
+            return True
+
+        if check_registry:
+            docker_client.images.get_registry_data(image_name)
+            return True
+    except Exception:
+        logger.debug("Image `%s` not found.", image_name, exc_info=True)
+
+    return False
+
+
 def _process_stream(stream: Iterable[bytes]) -> List[Dict[str, Any]]:
     """Processes the output stream of a docker command call.
 
@@ -15,8 +15,21 @@
 
 import fnmatch
 import os
+import shutil
+import tempfile
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Iterable
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
 import click
 
@@ -37,6 +50,9 @@ from zenml.io.fileio import (
 if TYPE_CHECKING:
     from zenml.io.filesystem import PathType
 
+# Number of files that are downloaded in parallel for a local view
+LOCAL_VIEW_DOWNLOAD_THREADS = 8
+
 
 def is_root(path: str) -> bool:
     """Returns true if path has no parent in local filesystem.
@@ -248,3 +264,110 @@ def get_parent(dir_path: str) -> str:
     if not os.path.exists(dir_path):
         raise ValueError(f"Path '{dir_path}' does not exist.")
     return Path(dir_path).parent.stem
+
+
+class LocalView:
+    """Local path that provides the contents of an path of an artifact store.
+
+    For remote artifact stores, the local path is a temporary copy that gets
+    deleted once the view is no longer needed.
+    """
+
+    def __init__(
+        self, path: str, temporary_directory: Optional[str] = None
+    ) -> None:
+        """Initializes the local view.
+
+        Args:
+            path: The local path.
+            temporary_directory: The temporary directory that contains the
+                local copy, if any.
+        """
+        self.path = path
+        self._temporary_directory = temporary_directory
+
+    def keep_alive_with(self, obj: Any) -> None:
+        """Keeps the local copy until the given object is garbage collected.
+
+        This is required for lazily loaded objects that keep reading from the
+        local path after the view was closed.
+
+        Args:
+            obj: The object that reads from the local path.
+        """
+        if self._temporary_directory:
+            weakref.finalize(
+                obj, shutil.rmtree, self._temporary_directory, True
+            )
+            self._temporary_directory = None
+
+    def cleanup(self) -> None:
+        """Deletes the local copy, if any."""
+        if self._temporary_directory:
+            shutil.rmtree(self._temporary_directory, ignore_errors=True)
+            self._temporary_directory = None
+
+
+@contextmanager
+def local_view(path: "PathType") -> Iterator[LocalView]:
+    """Provides the contents of an artifact store path on the local disk.
+
+    Local paths are used as they are. Remote files and directories are
+    downloaded in parallel into a temporary directory, which is deleted
+    when the context manager exits unless the view is kept alive with
+    `LocalView.keep_alive_with(...)`.
+
+    Usage:
+        with io_utils.local_view(self.uri) as view:
+            model = load_model(view.path)
+
+    Args:
+        path: The artifact store path.
+
+    Yields:
+        The local view.
+    """
+    path = convert_to_str(path)
+    if not is_remote(path):
+        yield LocalView(path=path)
+        return
+
+    temporary_directory = tempfile.mkdtemp(prefix="zenml-local-view-")
+    local_path = os.path.join(temporary_directory, "view")
+    view = LocalView(path=local_path, temporary_directory=temporary_directory)
+    try:
+        _download(path, local_path)
+        yield view
+    finally:
+        view.cleanup()
+
+
+def _download(path: str, local_path: str) -> None:
+    """Downloads a file or directory to the local disk.
+
+    Args:
+        path: The artifact store path of the file or directory.
+        local_path: The local path to download to.
+    """
+    files: List[Tuple[str, str]] = []
+    directories = [(path, local_path)]
+    if not isdir(path):
+        files, directories = [(path, local_path)], []
+
+    while directories:
+        source_dir, destination_dir = directories.pop()
+        os.makedirs(destination_dir, exist_ok=True)
+        for name in listdir(source_dir):
+            name = convert_to_str(name)
+            source_path = os.path.join(source_dir, name)
+            destination_path = os.path.join(destination_dir, name)
+            if isdir(source_path):
+                directories.append((source_path, destination_path))
+            else:
+                files.append((source_path, destination_path))
+
+    with ThreadPoolExecutor(
+        max_workers=LOCAL_VIEW_DOWNLOAD_THREADS
+    ) as executor:
+        # Consume the results to raise any errors of the downloads
+        list(executor.map(lambda file: copy(*file), files))
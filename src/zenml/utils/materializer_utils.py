@@ -15,8 +15,9 @@
 
 import os
 import tempfile
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
+from zenml.artifact_stores import BaseArtifactStore
 from zenml.client import Client
 from zenml.constants import MODEL_METADATA_YAML_FILE_NAME
 from zenml.enums import StackComponentType
@@ -108,19 +109,26 @@ def load_artifact(artifact: "ArtifactResponseModel") -> Any:
     Returns:
         The artifact loaded into memory.
     """
-    artifact_store_loaded = False
+    artifact_store = None
     if artifact.artifact_store_id:
         try:
             artifact_store_model = Client().get_stack_component(
                 component_type=StackComponentType.ARTIFACT_STORE,
                 name_id_or_prefix=artifact.artifact_store_id,
             )
-            _ = StackComponent.from_model(artifact_store_model)
-            artifact_store_loaded = True
+            artifact_store = cast(
+                BaseArtifactStore,
+                StackComponent.from_model(artifact_store_model),
+            )
         except KeyError:
             pass
 
-    if not artifact_store_loaded:
+    uri = artifact.uri
+    if artifact_store:
+        uri = artifact_store.get_local_artifact_uri(
+            artifact_id=artifact.id, uri=artifact.uri
+        )
+    else:
         logger.warning(
             "Unable to restore artifact store while trying to load artifact "
             "`%s`. If this artifact is stored in a remote artifact store, "
@@ -131,7 +139,7 @@ def load_artifact(artifact: "ArtifactResponseModel") -> Any:
     return _load_artifact(
         materializer=artifact.materializer,
         data_type=artifact.data_type,
-        uri=artifact.uri,
+        uri=uri,
     )
 
 
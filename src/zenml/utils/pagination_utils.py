@@ -28,6 +28,9 @@ def depaginate(
 ) -> List[AnyResponseModel]:
     """Depaginate the results from a client or store method that returns pages.
 
+    If the pages contain a cursor to the next page, the following pages are
+    fetched using that cursor and without counting the total number of items.
+
     Args:
         list_method: The list method to wrap around.
 
@@ -37,7 +40,14 @@ def depaginate(
     page = list_method()
     items = list(page.items)
     while page.index < page.total_pages:
-        page = list_method(page=page.index + 1)
+        if page.next_cursor:
+            page = list_method(
+                page=page.index + 1,
+                after=page.next_cursor,
+                include_total=False,
+            )
+        else:
+            page = list_method(page=page.index + 1)
         items += list(page.items)
 
     return items
@@ -12,6 +12,7 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Implementation of Docker image builds to run ZenML pipelines."""
+import hashlib
 import itertools
 import os
 import subprocess
@@ -46,6 +47,8 @@ DOCKER_IMAGE_ZENML_CONFIG_PATH = (
     f"{DOCKER_IMAGE_WORKDIR}/{DOCKER_IMAGE_ZENML_CONFIG_DIR}"
 )
 
+DEPENDENCY_IMAGE_TAG_PREFIX = "dependencies-"
+
 DEFAULT_DOCKER_PARENT_IMAGE = (
     f"zenmldocker/zenml:{zenml.__version__}-"
     f"py{sys.version_info.major}.{sys.version_info.minor}"
@@ -200,28 +203,9 @@ class PipelineDockerImageBuilder:
                     image_name_or_digest = target_image_name
 
         if requires_zenml_build:
-            logger.info("Building Docker image `%s`.", target_image_name)
-            # Leave the build context empty if we don't want to copy any files
-            build_context_root = (
-                source_utils.get_source_root_path()
-                if docker_settings.copy_files
-                else None
-            )
-            build_context = build_context_class(
-                root=build_context_root,
-                dockerignore_file=docker_settings.dockerignore,
-            )
-
-            requirements_file_names = self._add_requirements_files(
-                docker_settings=docker_settings,
-                build_context=build_context,
-                stack=stack,
+            apt_packages = self._get_apt_packages(
+                docker_settings=docker_settings, stack=stack
             )
-
-            apt_packages = docker_settings.apt_packages
-            if docker_settings.install_stack_requirements:
-                apt_packages += stack.apt_packages
-
             if apt_packages:
                 logger.info(
                     "Including apt packages: %s",
@@ -247,45 +231,282 @@ class PipelineDockerImageBuilder:
                     parent_image
                 )
 
-            build_options = {"pull": pull_parent_image, "rm": False}
+            # Requirements and apt packages are installed in a separate
+            # dependency image, which is only rebuilt if the dependencies
+            # change. The image containing the user files is built on top of
+            # it and is therefore fast to build.
+            dependency_build_context = build_context_class()
+            requirements_file_names = self._add_requirements_files(
+                docker_settings=docker_settings,
+                build_context=dependency_build_context,
+                stack=stack,
+            )
+            if requirements_file_names or apt_packages:
+                dependency_build_context.add_file(
+                    destination="Dockerfile",
+                    source=self._generate_dependency_dockerfile(
+                        parent_image=parent_image,
+                        requirements_files=requirements_file_names,
+                        apt_packages=apt_packages,
+                    ),
+                )
+                parent_image = self._build_dependency_image(
+                    build_context=dependency_build_context,
+                    docker_settings=docker_settings,
+                    stack=stack,
+                    pull_parent_image=pull_parent_image,
+                    # The contents of the parent image built from a custom
+                    # Dockerfile are not part of the dependency checksum
+                    reuse_existing=not docker_settings.dockerfile,
+                )
+                pull_parent_image = not image_builder.is_building_locally
 
+            logger.info("Building Docker image `%s`.", target_image_name)
+            build_context = build_context_class(
+                root=self._get_build_context_root(docker_settings),
+                dockerignore_file=docker_settings.dockerignore,
+            )
             dockerfile = self._generate_zenml_pipeline_dockerfile(
                 parent_image=parent_image,
                 docker_settings=docker_settings,
-                requirements_files=requirements_file_names,
-                apt_packages=apt_packages,
                 entrypoint=entrypoint,
             )
             build_context.add_file(destination="Dockerfile", source=dockerfile)
 
-            if docker_settings.copy_global_config:
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    GlobalConfiguration().copy_configuration(
-                        tmpdir,
-                        load_config_path=PurePosixPath(
-                            DOCKER_IMAGE_ZENML_CONFIG_PATH
-                        ),
-                    )
-                    build_context.add_directory(
-                        source=tmpdir,
-                        destination=DOCKER_IMAGE_ZENML_CONFIG_DIR,
-                    )
-
-            if extra_files:
-                for destination, source in extra_files.items():
-                    build_context.add_file(
-                        destination=destination, source=source
-                    )
+            self._add_files(
+                docker_settings=docker_settings,
+                build_context=build_context,
+                extra_files=extra_files,
+            )
 
             image_name_or_digest = image_builder.build(
                 image_name=target_image_name,
                 build_context=build_context,
-                docker_build_options=build_options,
+                docker_build_options={"pull": pull_parent_image, "rm": False},
                 container_registry=container_registry,
             )
 
         return image_name_or_digest
 
+    def compute_build_checksum(
+        self,
+        docker_settings: "DockerSettings",
+        tag: str,
+        stack: "Stack",
+        entrypoint: Optional[str] = None,
+        extra_files: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """Computes a checksum of everything that goes into an image build.
+
+        The checksum covers the settings, the target image name, the custom
+        Dockerfile and its build context as well as the contents of all files
+        of the ZenML build context: requirements files, copied source files,
+        the global configuration and extra files. Building the same inputs
+        again results in the same checksum, which allows reusing images across
+        pipeline runs.
+
+        Args:
+            docker_settings: The settings for the image build.
+            tag: The tag to use for the image.
+            stack: The stack on which the pipeline will be deployed.
+            entrypoint: Entrypoint to use for the final image.
+            extra_files: Extra files to add to the build context. Keys are the
+                path inside the build context, values are either the file
+                content or a file path.
+
+        Returns:
+            The checksum.
+        """
+        from zenml.image_builders import BuildContext
+
+        hash_ = hashlib.sha256()
+        # The ZenML and Python versions determine the default parent image
+        # and the generated Dockerfile
+        hash_.update(DEFAULT_DOCKER_PARENT_IMAGE.encode())
+        hash_.update(docker_settings.json(sort_keys=True).encode())
+        hash_.update(
+            self._get_target_image_name(
+                docker_settings=docker_settings,
+                tag=tag,
+                container_registry=stack.container_registry,
+            ).encode()
+        )
+        if entrypoint:
+            hash_.update(entrypoint.encode())
+
+        if docker_settings.skip_build:
+            return hash_.hexdigest()
+
+        for apt_package in self._get_apt_packages(
+            docker_settings=docker_settings, stack=stack
+        ):
+            hash_.update(apt_package.encode())
+
+        build_context_class = (
+            stack.image_builder.build_context_class
+            if stack.image_builder
+            else BuildContext
+        )
+        if docker_settings.dockerfile:
+            build_context = build_context_class(
+                root=docker_settings.build_context_root
+            )
+            build_context.add_file(
+                source=docker_settings.dockerfile, destination="Dockerfile"
+            )
+            hash_.update(build_context.compute_checksum().encode())
+
+        build_context = build_context_class(
+            root=self._get_build_context_root(docker_settings),
+            dockerignore_file=docker_settings.dockerignore,
+        )
+        self._add_requirements_files(
+            docker_settings=docker_settings,
+            build_context=build_context,
+            stack=stack,
+            log=False,
+        )
+        self._add_files(
+            docker_settings=docker_settings,
+            build_context=build_context,
+            extra_files=extra_files,
+        )
+        hash_.update(build_context.compute_checksum().encode())
+
+        return hash_.hexdigest()
+
+    def _build_dependency_image(
+        self,
+        build_context: "BuildContext",
+        docker_settings: "DockerSettings",
+        stack: "Stack",
+        pull_parent_image: bool,
+        reuse_existing: bool = True,
+    ) -> str:
+        """Builds an image that contains the requirements and apt packages.
+
+        The image is tagged with a checksum of its build context, which
+        consists of the Dockerfile and the requirements files. If an image with
+        this tag already exists, it is used without building it again.
+
+        Args:
+            build_context: The build context of the dependency image.
+            docker_settings: The settings for the image build.
+            stack: The stack on which the pipeline will be deployed.
+            pull_parent_image: Whether to pull the parent image.
+            reuse_existing: Whether to use an existing image with the same
+                checksum.
+
+        Returns:
+            The name of the dependency image.
+        """
+        image_builder = stack.image_builder
+        assert image_builder
+
+        # Remote image builders can only use parent images from a registry
+        container_registry = (
+            None
+            if image_builder.is_building_locally
+            else stack.container_registry
+        )
+        checksum = build_context.compute_checksum()
+        image_name = self._get_target_image_name(
+            docker_settings=docker_settings,
+            tag=f"{DEPENDENCY_IMAGE_TAG_PREFIX}{checksum[:16]}",
+            container_registry=container_registry,
+        )
+
+        if reuse_existing and docker_utils.image_exists(
+            image_name, check_registry=container_registry is not None
+        ):
+            logger.info(
+                "Reusing dependency image `%s` as the requirements and apt "
+                "packages are unchanged.",
+                image_name,
+            )
+            return image_name
+
+        logger.info("Building dependency image `%s`.", image_name)
+        image_builder.build(
+            image_name=image_name,
+            build_context=build_context,
+            docker_build_options={"pull": pull_parent_image, "rm": False},
+            container_registry=container_registry,
+        )
+        return image_name
+
+    @staticmethod
+    def _get_build_context_root(
+        docker_settings: "DockerSettings",
+    ) -> Optional[str]:
+        """Gets the root directory of the files to copy into the image.
+
+        Args:
+            docker_settings: The settings for the image build.
+
+        Returns:
+            The source root if user files should be copied into the image,
+            `None` otherwise.
+        """
+        if (
+            docker_settings.copy_files
+            and not docker_settings.code_from_artifact_store
+        ):
+            return source_utils.get_source_root_path()
+        else:
+            # Leave the build context empty if we don't want to copy any files
+            return None
+
+    @staticmethod
+    def _get_apt_packages(
+        docker_settings: "DockerSettings", stack: "Stack"
+    ) -> List[str]:
+        """Gets all apt packages to install in the image.
+
+        Args:
+            docker_settings: The settings for the image build.
+            stack: The stack on which the pipeline will be deployed.
+
+        Returns:
+            The apt packages.
+        """
+        apt_packages = list(docker_settings.apt_packages)
+        if docker_settings.install_stack_requirements:
+            apt_packages += stack.apt_packages
+        return apt_packages
+
+    @staticmethod
+    def _add_files(
+        docker_settings: "DockerSettings",
+        build_context: "BuildContext",
+        extra_files: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Adds the global configuration and extra files to a build context.
+
+        Args:
+            docker_settings: The settings for the image build.
+            build_context: The build context to add the files to.
+            extra_files: Extra files to add to the build context. Keys are the
+                path inside the build context, values are either the file
+                content or a file path.
+        """
+        if docker_settings.copy_global_config:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                GlobalConfiguration().copy_configuration(
+                    tmpdir,
+                    load_config_path=PurePosixPath(
+                        DOCKER_IMAGE_ZENML_CONFIG_PATH
+                    ),
+                )
+                build_context.add_directory(
+                    source=tmpdir,
+                    destination=DOCKER_IMAGE_ZENML_CONFIG_DIR,
+                )
+
+        if extra_files:
+            for destination, source in extra_files.items():
+                build_context.add_file(destination=destination, source=source)
+
     @staticmethod
     def _get_target_image_name(
         docker_settings: "DockerSettings",
@@ -320,6 +541,7 @@ class PipelineDockerImageBuilder:
         docker_settings: DockerSettings,
         build_context: "BuildContext",
         stack: "Stack",
+        log: bool = True,
     ) -> List[str]:
         """Adds requirements files to the build context.
 
@@ -328,6 +550,7 @@ class PipelineDockerImageBuilder:
                 requirements to install.
             build_context: Build context to add the requirements files to.
             stack: The stack on which the pipeline will run.
+            log: If `True`, will log the requirements.
 
         Returns:
             Name of the requirements files in the build context.
@@ -338,7 +561,7 @@ class PipelineDockerImageBuilder:
         """
         requirements_file_names = []
         requirements_files = cls._gather_requirements_files(
-            docker_settings=docker_settings, stack=stack
+            docker_settings=docker_settings, stack=stack, log=log
         )
         for filename, file_content in requirements_files:
             build_context.add_file(source=file_content, destination=filename)
@@ -460,6 +683,40 @@ class PipelineDockerImageBuilder:
 
         return requirements_files
 
+    @staticmethod
+    def _generate_dependency_dockerfile(
+        parent_image: str,
+        requirements_files: Sequence[str] = (),
+        apt_packages: Sequence[str] = (),
+    ) -> str:
+        """Generates a Dockerfile that installs requirements and apt packages.
+
+        Args:
+            parent_image: The image to use as parent for the Dockerfile.
+            requirements_files: Paths of requirements files to install.
+            apt_packages: APT packages to install.
+
+        Returns:
+            The generated Dockerfile.
+        """
+        lines = [f"FROM {parent_image}", f"WORKDIR {DOCKER_IMAGE_WORKDIR}"]
+
+        if apt_packages:
+            apt_packages = " ".join(f"'{p}'" for p in apt_packages)
+
+            lines.append(
+                "RUN apt-get update && apt-get install -y "
+                f"--no-install-recommends {apt_packages}"
+            )
+
+        for file in requirements_files:
+            lines.append(f"COPY {file} .")
+            lines.append(
+                f"RUN pip install --default-timeout=60 --no-cache-dir -r {file}"
+            )
+
+        return "\n".join(lines)
+
     @staticmethod
     def _generate_zenml_pipeline_dockerfile(
         parent_image: str,
@@ -0,0 +1,154 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""In-memory cache with expiring entries."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, NamedTuple, Optional, Tuple, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a cache.
+
+    Attributes:
+        hits: Number of lookups that were answered from the cache.
+        misses: Number of lookups that had to load the value.
+        size: Number of entries currently in the cache.
+    """
+
+    hits: int
+    misses: int
+    size: int
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that were answered from the cache.
+
+        Returns:
+            The hit rate or 0 if there were no lookups yet.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe cache whose entries expire after a fixed time.
+
+    If a maximum size is given, the least recently used entry is evicted
+    when the cache is full. A non-positive TTL disables caching.
+    """
+
+    def __init__(self, ttl: float, max_size: Optional[int] = None) -> None:
+        """Initializes the cache.
+
+        Args:
+            ttl: Number of seconds after which an entry expires.
+            max_size: Maximum number of entries in the cache.
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        """Gets a value from the cache.
+
+        Args:
+            key: The key of the value.
+
+        Returns:
+            The cached value or `None` if the key is not cached or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Stores a value in the cache.
+
+        Args:
+            key: The key of the value.
+            value: The value to store.
+            ttl: Number of seconds after which this entry expires. Defaults
+                to the TTL of the cache, `math.inf` keeps the entry until it
+                is invalidated or evicted.
+        """
+        ttl = self._ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if self._max_size is not None:
+                while len(self._entries) > self._max_size:
+                    self._entries.popitem(last=False)
+
+    def get_or_load(self, key: K, load: Callable[[], V]) -> V:
+        """Gets a value from the cache and loads it if it isn't cached.
+
+        Args:
+            key: The key of the value.
+            load: Function to load the value if it isn't cached.
+
+        Returns:
+            The cached or loaded value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = load()
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Optional[K] = None) -> None:
+        """Removes entries from the cache.
+
+        Args:
+            key: The key of the entry to remove. If not given, all entries
+                are removed.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def cache_info(self) -> CacheInfo:
+        """Returns statistics of the cache.
+
+        Returns:
+            The number of cache hits, misses and the current cache size.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits, misses=self._misses, size=len(self._entries)
+            )
@@ -13,7 +13,10 @@
 #  permissions and limitations under the License.
 """Authentication module for ZenML server."""
 
+import hashlib
+import hmac
 import os
+import secrets
 from typing import Callable, List, Optional, Set, Union
 from uuid import UUID
 
@@ -26,13 +29,21 @@ from fastapi.security import (
 )
 from pydantic import BaseModel
 
-from zenml.constants import API, ENV_ZENML_AUTH_TYPE, LOGIN, VERSION_1
+from zenml.constants import (
+    API,
+    ENV_ZENML_AUTH_TYPE,
+    LOGIN,
+    SERVER_AUTH_CACHE_MAX_SIZE,
+    SERVER_AUTH_CACHE_TTL,
+    VERSION_1,
+)
 from zenml.enums import PermissionType
 from zenml.exceptions import AuthorizationException
 from zenml.logger import get_logger
 from zenml.models import UserResponseModel
 from zenml.models.user_models import JWTToken, JWTTokenType, UserAuthModel
 from zenml.utils.enum_utils import StrEnum
+from zenml.utils.ttl_cache import TTLCache
 from zenml.zen_server.utils import ROOT_URL_PATH, zen_store
 from zenml.zen_stores.base_zen_store import DEFAULT_USERNAME
 
@@ -83,6 +94,66 @@ def authentication_scheme() -> AuthScheme:
     return auth_scheme
 
 
+_auth_cache: TTLCache[str, AuthContext] = TTLCache(
+    ttl=SERVER_AUTH_CACHE_TTL, max_size=SERVER_AUTH_CACHE_MAX_SIZE
+)
+# Secret used to derive the cache keys of credentials, so that no passwords
+# are kept in memory
+_auth_cache_key_secret = secrets.token_bytes(32)
+
+
+def _get_auth_cache_key(
+    user_name_or_id: Optional[Union[str, UUID]] = None,
+    password: Optional[str] = None,
+    access_token: Optional[str] = None,
+    activation_token: Optional[str] = None,
+) -> Optional[str]:
+    """Gets the key under which the authentication context is cached.
+
+    Access tokens are decoded and verified for every request, only the user
+    lookups are cached. Activation tokens are never cached.
+
+    Args:
+        user_name_or_id: The username or user ID.
+        password: The password.
+        access_token: The access token.
+        activation_token: The activation token.
+
+    Returns:
+        The cache key or None if the credentials should not be cached.
+    """
+    if activation_token is not None:
+        return None
+    elif access_token is not None:
+        try:
+            token = JWTToken.decode(
+                token_type=JWTTokenType.ACCESS_TOKEN, token=access_token
+            )
+        except AuthorizationException:
+            return None
+        return f"token:{token.user_id}"
+    elif password is not None:
+        if not user_name_or_id:
+            return None
+        digest = hmac.new(
+            _auth_cache_key_secret,
+            f"{user_name_or_id}:{password}".encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"password:{digest}"
+    elif user_name_or_id:
+        return f"user:{user_name_or_id}"
+    return None
+
+
+def invalidate_auth_cache() -> None:
+    """Invalidates all cached authentication contexts.
+
+    This needs to be called whenever a user or the roles of a user change.
+    """
+    _auth_cache.invalidate()
+
+
 def authenticate_credentials(
     user_name_or_id: Optional[Union[str, UUID]] = None,
     password: Optional[str] = None,
@@ -108,6 +179,17 @@ def authenticate_credentials(
         The authenticated account details, if the account is valid, otherwise
         None.
     """
+    cache_key = _get_auth_cache_key(
+        user_name_or_id=user_name_or_id,
+        password=password,
+        access_token=access_token,
+        activation_token=activation_token,
+    )
+    if cache_key is not None:
+        cached_auth_context = _auth_cache.get(cache_key)
+        if cached_auth_context is not None:
+            return cached_auth_context
+
     user: Optional[UserAuthModel] = None
     auth_context: Optional[AuthContext] = None
     if user_name_or_id:
@@ -137,6 +219,8 @@ def authenticate_credentials(
         if not UserAuthModel.verify_activation_token(activation_token, user):
             return None
 
+    if cache_key is not None and auth_context is not None:
+        _auth_cache.set(cache_key, auth_context)
     return auth_context
 
 
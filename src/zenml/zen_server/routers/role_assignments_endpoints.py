@@ -24,7 +24,11 @@ from zenml.models import (
     UserRoleAssignmentResponseModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_cache,
+)
 from zenml.zen_server.utils import (
     error_response,
     handle_exceptions,
@@ -84,9 +88,11 @@ def create_role_assignment(
     Returns:
         The created role assignment.
     """
-    return zen_store().create_user_role_assignment(
+    created_role_assignment = zen_store().create_user_role_assignment(
         user_role_assignment=role_assignment
     )
+    invalidate_auth_cache()
+    return created_role_assignment
 
 
 @router.get(
@@ -129,3 +135,4 @@ def delete_role_assignment(
     zen_store().delete_user_role_assignment(
         user_role_assignment_id=role_assignment_id
     )
+    invalidate_auth_cache()
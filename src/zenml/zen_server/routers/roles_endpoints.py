@@ -26,7 +26,11 @@ from zenml.models import (
     RoleUpdateModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_cache,
+)
 from zenml.zen_server.utils import (
     error_response,
     handle_exceptions,
@@ -131,7 +135,11 @@ def update_role(
     Returns:
         The created role.
     """
-    return zen_store().update_role(role_id=role_id, role_update=role_update)
+    updated_role = zen_store().update_role(
+        role_id=role_id, role_update=role_update
+    )
+    invalidate_auth_cache()
+    return updated_role
 
 
 @router.delete(
@@ -149,3 +157,4 @@ def delete_role(
         role_name_or_id: Name or ID of the role.
     """
     zen_store().delete_role(role_name_or_id=role_name_or_id)
+    invalidate_auth_cache()
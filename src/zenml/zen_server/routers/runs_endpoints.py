@@ -12,10 +12,10 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """Endpoint definitions for pipeline runs."""
-from typing import Any, Dict
+from typing import Any, Dict, List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, Depends, Query, Security
 
 from zenml.constants import (
     API,
@@ -24,6 +24,7 @@ from zenml.constants import (
     RUNS,
     STATUS,
     STEPS,
+    UPSTREAM_STEPS,
     VERSION_1,
 )
 from zenml.enums import ExecutionStatus, PermissionType
@@ -33,6 +34,7 @@ from zenml.models import (
     PipelineRunUpdateModel,
     StepRunFilterModel,
     StepRunResponseModel,
+    UpstreamStepRunModel,
 )
 from zenml.models.page_model import Page
 from zenml.post_execution.lineage.lineage_graph import LineageGraph
@@ -185,6 +187,31 @@ def get_run_steps(
     return zen_store().list_run_steps(step_run_filter_model)
 
 
+@router.get(
+    "/{run_id}" + UPSTREAM_STEPS,
+    response_model=Dict[str, UpstreamStepRunModel],
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_upstream_step_runs(
+    run_id: UUID,
+    step_names: List[str] = Query(...),
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> Dict[str, UpstreamStepRunModel]:
+    """Get step runs of a pipeline run together with their outputs.
+
+    Args:
+        run_id: ID of the pipeline run.
+        step_names: The names of the step runs to get.
+
+    Returns:
+        The IDs and output artifacts of the step runs, keyed by the step name.
+    """
+    return zen_store().get_upstream_step_runs(
+        run_id=run_id, step_names=step_names
+    )
+
+
 @router.get(
     "/{run_id}" + PIPELINE_CONFIGURATION,
     response_model=Dict[str, Any],
@@ -13,14 +13,24 @@
 #  permissions and limitations under the License.
 """Endpoint definitions for steps (and artifacts) of pipeline runs."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Security
 
-from zenml.constants import API, STATUS, STEP_CONFIGURATION, STEPS, VERSION_1
+from zenml.constants import (
+    API,
+    CACHED,
+    COMPLETE,
+    STATUS,
+    STEP_CONFIGURATION,
+    STEPS,
+    VERSION_1,
+)
 from zenml.enums import ExecutionStatus, PermissionType
 from zenml.models import (
+    CachedStepRunModel,
+    StepRunCompletionModel,
     StepRunFilterModel,
     StepRunRequestModel,
     StepRunResponseModel,
@@ -89,6 +99,33 @@ def create_run_step(
     return zen_store().create_run_step(step_run=step)
 
 
+@router.get(
+    CACHED,
+    response_model=Optional[CachedStepRunModel],
+    responses={401: error_response, 422: error_response},
+)
+@handle_exceptions
+def get_cached_step_run(
+    workspace_id: UUID,
+    cache_key: str,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.READ]),
+) -> Optional[CachedStepRunModel]:
+    """Get the latest successful step run with the given cache key.
+
+    Args:
+        workspace_id: The ID of the workspace in which to look for the step
+            run.
+        cache_key: The cache key of the step run.
+
+    Returns:
+        The ID and output artifact IDs of the step run, or `None` if no
+        successful step run with the given cache key exists.
+    """
+    return zen_store().get_cached_step_run(
+        workspace_id=workspace_id, cache_key=cache_key
+    )
+
+
 @router.get(
     "/{step_id}",
     response_model=StepRunResponseModel,
@@ -135,6 +172,31 @@ def update_step(
     )
 
 
+@router.post(
+    "/{step_id}" + COMPLETE,
+    response_model=StepRunResponseModel,
+    responses={401: error_response, 404: error_response, 422: error_response},
+)
+@handle_exceptions
+def complete_step(
+    step_id: UUID,
+    step_completion: StepRunCompletionModel,
+    _: AuthContext = Security(authorize, scopes=[PermissionType.WRITE]),
+) -> StepRunResponseModel:
+    """Publishes the outputs of a successful step and completes it.
+
+    Args:
+        step_id: ID of the step.
+        step_completion: The outputs of the step.
+
+    Returns:
+        The completed step model.
+    """
+    return zen_store().complete_run_step(
+        step_run_id=step_id, step_run_completion=step_completion
+    )
+
+
 @router.get(
     "/{step_id}" + STEP_CONFIGURATION,
     response_model=Dict[str, Any],
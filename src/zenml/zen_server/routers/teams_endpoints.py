@@ -28,7 +28,11 @@ from zenml.models import (
     TeamUpdateModel,
 )
 from zenml.models.page_model import Page
-from zenml.zen_server.auth import AuthContext, authorize
+from zenml.zen_server.auth import (
+    AuthContext,
+    authorize,
+    invalidate_auth_cache,
+)
 from zenml.zen_server.utils import (
     error_response,
     handle_exceptions,
@@ -132,7 +136,11 @@ def update_team(
     Returns:
         The updated team.
     """
-    return zen_store().update_team(team_id=team_id, team_update=team_update)
+    updated_team = zen_store().update_team(
+        team_id=team_id, team_update=team_update
+    )
+    invalidate_auth_cache()
+    return updated_team
 
 
 @router.delete(
@@ -150,6 +158,7 @@ def delete_team(
         team_name_or_id: Name or ID of the team.
     """
     zen_store().delete_team(team_name_or_id=team_name_or_id)
+    invalidate_auth_cache()
 
 
 @router.get(
@@ -15,14 +15,21 @@
 
 import inspect
 import os
+import zlib
 from functools import wraps
 from typing import Any, Callable, List, Optional, Type, TypeVar, cast
 
 from fastapi import HTTPException
 from pydantic import BaseModel, ValidationError
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from zenml.config.global_config import GlobalConfiguration
-from zenml.constants import ENV_ZENML_SERVER_ROOT_URL_PATH
+from zenml.constants import (
+    ENV_ZENML_SERVER_ROOT_URL_PATH,
+    GZIP_MAXIMUM_DECOMPRESSED_REQUEST_SIZE,
+    GZIP_MAXIMUM_REQUEST_SIZE,
+)
 from zenml.enums import StoreType
 from zenml.exceptions import (
     EntityExistsError,
@@ -239,3 +246,99 @@ def make_dependable(cls: Type[BaseModel]) -> Callable[..., Any]:
     init_cls_and_handle_errors.__signature__ = inspect.signature(cls)  # type: ignore[attr-defined]
 
     return init_cls_and_handle_errors
+
+
+class GZipRequestMiddleware:
+    """ASGI middleware that decompresses gzip encoded request bodies.
+
+    Requests without a `Content-Encoding: gzip` header are passed through
+    unchanged. As this runs before requests are authenticated, gzip encoded
+    bodies that exceed the size limits before or after decompression are
+    rejected with a `413` response.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_size: int = GZIP_MAXIMUM_REQUEST_SIZE,
+        max_decompressed_size: int = GZIP_MAXIMUM_DECOMPRESSED_REQUEST_SIZE,
+    ) -> None:
+        """Initializes the middleware.
+
+        Args:
+            app: The ASGI application to wrap.
+            max_size: Maximum size in bytes of a gzip encoded request body.
+            max_decompressed_size: Maximum size in bytes of a request body
+                after decompression.
+        """
+        self.app = app
+        self.max_size = max_size
+        self.max_decompressed_size = max_decompressed_size
+
+    async def __call__(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        """Decompresses the request body if it is gzip encoded.
+
+        Args:
+            scope: The ASGI connection scope.
+            receive: The ASGI receive channel.
+            send: The ASGI send channel.
+        """
+        headers = dict(scope.get("headers", []))
+        if (
+            scope["type"] != "http"
+            or headers.get(b"content-encoding", b"").lower() != b"gzip"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        too_large_response = PlainTextResponse(
+            "Request body too large.", status_code=413
+        )
+        chunks: List[bytes] = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self.max_size:
+                await too_large_response(scope, receive, send)
+                return
+            chunks.append(chunk)
+            more_body = message.get("more_body", False)
+
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        try:
+            # Stop decompressing as soon as the body exceeds the limit
+            body: Optional[bytes] = decompressor.decompress(
+                b"".join(chunks), self.max_decompressed_size + 1
+            )
+        except zlib.error:
+            body = None
+
+        if body is not None and len(body) > self.max_decompressed_size:
+            await too_large_response(scope, receive, send)
+            return
+
+        if body is None or not decompressor.eof:
+            response = PlainTextResponse(
+                "Invalid gzip encoded request body.", status_code=400
+            )
+            await response(scope, receive, send)
+            return
+
+        headers.pop(b"content-encoding")
+        headers[b"content-length"] = str(len(body)).encode()
+        scope = {**scope, "headers": list(headers.items())}
+        body_sent = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal body_sent
+            if body_sent:
+                return await receive()
+            body_sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        await self.app(scope, receive_decompressed, send)
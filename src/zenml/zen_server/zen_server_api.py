@@ -22,10 +22,11 @@ from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from genericpath import isfile
 from starlette.middleware.cors import CORSMiddleware
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.responses import FileResponse
 
 import zenml
-from zenml.constants import API, HEALTH
+from zenml.constants import API, GZIP_MINIMUM_SIZE, HEALTH
 from zenml.zen_server.routers import (
     artifacts_endpoints,
     auth_endpoints,
@@ -48,7 +49,11 @@ from zenml.zen_server.routers import (
     users_endpoints,
     workspaces_endpoints,
 )
-from zenml.zen_server.utils import ROOT_URL_PATH, initialize_zen_store
+from zenml.zen_server.utils import (
+    ROOT_URL_PATH,
+    GZipRequestMiddleware,
+    initialize_zen_store,
+)
 
 DASHBOARD_DIRECTORY = "dashboard"
 
@@ -79,6 +84,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE)
+app.add_middleware(GZipRequestMiddleware)
 
 
 @app.on_event("startup")
@@ -0,0 +1,837 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+"""Asynchronous REST Zen Store implementation for concurrent reads."""
+import asyncio
+from types import TracebackType
+from typing import Any, Dict, Optional, Type, Union, cast
+from uuid import UUID
+
+import httpx
+
+from zenml.constants import (
+    API,
+    ARTIFACTS,
+    FLAVORS,
+    LOGIN,
+    PIPELINE_BUILDS,
+    PIPELINE_DEPLOYMENTS,
+    PIPELINES,
+    ROLES,
+    RUN_METADATA,
+    RUNS,
+    SCHEDULES,
+    STACK_COMPONENTS,
+    STACKS,
+    STEPS,
+    TEAMS,
+    USERS,
+    VERSION_1,
+    WORKSPACES,
+)
+from zenml.exceptions import AuthorizationException
+from zenml.logger import get_logger
+from zenml.models import (
+    ArtifactFilterModel,
+    ArtifactResponseModel,
+    BaseFilterModel,
+    ComponentFilterModel,
+    ComponentResponseModel,
+    FlavorFilterModel,
+    FlavorResponseModel,
+    PipelineBuildFilterModel,
+    PipelineBuildResponseModel,
+    PipelineDeploymentFilterModel,
+    PipelineDeploymentResponseModel,
+    PipelineFilterModel,
+    PipelineResponseModel,
+    PipelineRunFilterModel,
+    PipelineRunResponseModel,
+    RoleFilterModel,
+    RoleResponseModel,
+    RunMetadataFilterModel,
+    RunMetadataResponseModel,
+    ScheduleFilterModel,
+    ScheduleResponseModel,
+    StackFilterModel,
+    StackResponseModel,
+    StepRunFilterModel,
+    StepRunResponseModel,
+    TeamFilterModel,
+    TeamResponseModel,
+    UserFilterModel,
+    UserResponseModel,
+    WorkspaceFilterModel,
+    WorkspaceResponseModel,
+)
+from zenml.models.page_model import Page
+from zenml.zen_stores.rest_zen_store import (
+    AnyResponseModel,
+    Json,
+    RestZenStore,
+)
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 10
+
+
+class AsyncRestZenStore:
+    """Asynchronous counterpart of the read side of the REST Zen Store.
+
+    The store reuses the configuration and the authentication token of an
+    existing `RestZenStore`, but sends its requests with an `httpx` async
+    client so that many independent reads can run concurrently, e.g. with
+    `asyncio.gather`. The number of requests in flight is bounded to not
+    overload the server. If the token expires, the store logs in again
+    through its own client without touching the token of the sync store.
+
+    Usage:
+        async with AsyncRestZenStore(Client().zen_store) as store:
+            steps = await asyncio.gather(
+                *(store.get_run_step(step_id) for step_id in step_ids)
+            )
+    """
+
+    def __init__(
+        self,
+        rest_store: RestZenStore,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """Initializes the store.
+
+        Args:
+            rest_store: The REST store to take the configuration and the
+                authentication token from.
+            max_concurrent_requests: The maximum number of requests to send
+                to the server at the same time.
+        """
+        self._rest_store = rest_store
+        self._max_concurrent_requests = max_concurrent_requests
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._auth_lock: Optional[asyncio.Lock] = None
+        self._api_token: Optional[str] = None
+
+    async def __aenter__(self) -> "AsyncRestZenStore":
+        """Opens the connection pool of the store.
+
+        Returns:
+            The store.
+        """
+        config = self._rest_store.config
+        self._client = httpx.AsyncClient(
+            base_url=self._rest_store.url + API + VERSION_1,
+            verify=config.verify_ssl,
+            timeout=config.http_timeout,
+            limits=httpx.Limits(
+                max_connections=self._max_concurrent_requests,
+                max_keepalive_connections=self._max_concurrent_requests,
+            ),
+            transport=httpx.AsyncHTTPTransport(
+                verify=config.verify_ssl,
+                retries=config.max_retries,
+            ),
+        )
+        self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+        self._auth_lock = asyncio.Lock()
+        self._api_token = None
+        await self._authenticate()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Closes the connection pool of the store.
+
+        Args:
+            exc_type: The type of the raised exception, if any.
+            exc_value: The raised exception, if any.
+            traceback: The traceback of the raised exception, if any.
+        """
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Closes the connection pool of the store."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _authenticate(self, expired_token: Optional[str] = None) -> None:
+        """Sets the authentication token of the async client.
+
+        The token of the sync store is reused initially. Once a token
+        expired, the store logs in again with the configured username and
+        password. Only one request logs in at a time, requests that failed
+        with the same expired token reuse the new token.
+
+        Args:
+            expired_token: The token that was rejected by the server, if any.
+
+        Raises:
+            AuthorizationException: If the token expired and no username and
+                password are configured to log in again.
+            ValueError: If the response from the server isn't in the right
+                format.
+        """
+        assert self._client is not None and self._auth_lock is not None
+        config = self._rest_store.config
+
+        async with self._auth_lock:
+            if (
+                self._api_token is not None
+                and self._api_token != expired_token
+            ):
+                # Another request already refreshed the token.
+                return
+
+            token = None
+            if expired_token is None:
+                token = self._rest_store._api_token or config.api_token
+
+            if token is None:
+                if config.username is None or config.password is None:
+                    raise AuthorizationException(
+                        "The API token of the async REST store is not valid "
+                        "and no username and password are configured to log "
+                        "in again."
+                    )
+
+                response = self._handle_response(
+                    await self._client.post(
+                        LOGIN,
+                        data={
+                            "username": config.username,
+                            "password": config.password,
+                        },
+                    )
+                )
+                if (
+                    not isinstance(response, dict)
+                    or "access_token" not in response
+                ):
+                    raise ValueError(
+                        f"Bad API Response. Expected access token dict, got "
+                        f"{type(response)}"
+                    )
+                token = response["access_token"]
+
+            self._api_token = token
+            self._client.headers["Authorization"] = f"Bearer {token}"
+
+    # --------------
+    # Generic access
+    # --------------
+
+    async def get(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Json:
+        """Make a GET request to the given endpoint path.
+
+        Args:
+            path: The path to the endpoint.
+            params: The query parameters to pass to the endpoint.
+
+        Returns:
+            The response body.
+
+        Raises:
+            RuntimeError: If the store is used outside of an `async with`
+                block.
+        """
+        if self._client is None or self._semaphore is None:
+            raise RuntimeError(
+                "The async REST store needs to be opened with "
+                "`async with AsyncRestZenStore(...)` before sending requests."
+            )
+
+        params = {k: str(v) for k, v in params.items()} if params else {}
+        logger.debug(f"Sending async GET request to {path}...")
+        async with self._semaphore:
+            token = self._api_token
+            response = await self._client.get(path, params=params)
+            try:
+                return self._handle_response(response)
+            except AuthorizationException:
+                # The authentication token could have expired; refresh it and
+                # try again
+                await self._authenticate(expired_token=token)
+                response = await self._client.get(path, params=params)
+                return self._handle_response(response)
+
+    @staticmethod
+    def _handle_response(response: httpx.Response) -> Json:
+        """Handle API response, translating http status codes to Exception.
+
+        Args:
+            response: The response to handle.
+
+        Returns:
+            The parsed response.
+        """
+        # `httpx` responses provide the same interface as `requests`
+        # responses, so the error handling of the sync store applies as is.
+        return RestZenStore._handle_response(cast(Any, response))
+
+    async def _get_resource(
+        self,
+        resource_id: Union[str, UUID],
+        route: str,
+        response_model: Type[AnyResponseModel],
+    ) -> AnyResponseModel:
+        """Retrieve a single resource.
+
+        Args:
+            resource_id: The ID of the resource to retrieve.
+            route: The resource REST API route to use.
+            response_model: Model to use to serialize the response body.
+
+        Returns:
+            The retrieved resource.
+        """
+        body = await self.get(f"{route}/{str(resource_id)}")
+        return response_model.parse_obj(body)
+
+    async def _list_paginated_resources(
+        self,
+        route: str,
+        response_model: Type[AnyResponseModel],
+        filter_model: BaseFilterModel,
+    ) -> Page[AnyResponseModel]:
+        """Retrieve a list of resources filtered by some criteria.
+
+        Args:
+            route: The resource REST API route to use.
+            response_model: Model to use to serialize the response body.
+            filter_model: The filter model to use for the list query.
+
+        Returns:
+            List of retrieved resources matching the filter criteria.
+
+        Raises:
+            ValueError: If the value returned by the server is not a list.
+        """
+        body = await self.get(
+            route, params=filter_model.dict(exclude_none=True)
+        )
+        if not isinstance(body, dict):
+            raise ValueError(
+                f"Bad API Response. Expected list, got {type(body)}"
+            )
+        page_of_items: Page[AnyResponseModel] = Page.parse_obj(body)
+        page_of_items.items = [
+            response_model.parse_obj(generic_item)
+            for generic_item in page_of_items.items
+        ]
+        return page_of_items
+
+    # ---------
+    # Resources
+    # ---------
+
+    async def get_stack(self, stack_id: UUID) -> StackResponseModel:
+        """Gets a stack.
+
+        Args:
+            stack_id: The ID of the stack to get.
+
+        Returns:
+            The stack.
+        """
+        return await self._get_resource(
+            resource_id=stack_id,
+            route=STACKS,
+            response_model=StackResponseModel,
+        )
+
+    async def list_stacks(
+        self, stack_filter_model: StackFilterModel
+    ) -> Page[StackResponseModel]:
+        """List all stacks matching the given filter criteria.
+
+        Args:
+            stack_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all stacks matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=STACKS,
+            response_model=StackResponseModel,
+            filter_model=stack_filter_model,
+        )
+
+    async def get_stack_component(
+        self, component_id: UUID
+    ) -> ComponentResponseModel:
+        """Gets a stack component.
+
+        Args:
+            component_id: The ID of the stack component to get.
+
+        Returns:
+            The stack component.
+        """
+        return await self._get_resource(
+            resource_id=component_id,
+            route=STACK_COMPONENTS,
+            response_model=ComponentResponseModel,
+        )
+
+    async def list_stack_components(
+        self, component_filter_model: ComponentFilterModel
+    ) -> Page[ComponentResponseModel]:
+        """List all stack components matching the given filter criteria.
+
+        Args:
+            component_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all stack components matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=STACK_COMPONENTS,
+            response_model=ComponentResponseModel,
+            filter_model=component_filter_model,
+        )
+
+    async def get_flavor(self, flavor_id: UUID) -> FlavorResponseModel:
+        """Gets a flavor.
+
+        Args:
+            flavor_id: The ID of the flavor to get.
+
+        Returns:
+            The flavor.
+        """
+        return await self._get_resource(
+            resource_id=flavor_id,
+            route=FLAVORS,
+            response_model=FlavorResponseModel,
+        )
+
+    async def list_flavors(
+        self, flavor_filter_model: FlavorFilterModel
+    ) -> Page[FlavorResponseModel]:
+        """List all flavors matching the given filter criteria.
+
+        Args:
+            flavor_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all flavors matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=FLAVORS,
+            response_model=FlavorResponseModel,
+            filter_model=flavor_filter_model,
+        )
+
+    async def get_user(
+        self, user_name_or_id: Union[str, UUID]
+    ) -> UserResponseModel:
+        """Gets an user.
+
+        Args:
+            user_name_or_id: The name or ID of the user to get.
+
+        Returns:
+            The user.
+        """
+        return await self._get_resource(
+            resource_id=user_name_or_id,
+            route=USERS,
+            response_model=UserResponseModel,
+        )
+
+    async def list_users(
+        self, user_filter_model: UserFilterModel
+    ) -> Page[UserResponseModel]:
+        """List all users matching the given filter criteria.
+
+        Args:
+            user_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all users matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=USERS,
+            response_model=UserResponseModel,
+            filter_model=user_filter_model,
+        )
+
+    async def get_team(
+        self, team_name_or_id: Union[str, UUID]
+    ) -> TeamResponseModel:
+        """Gets a team.
+
+        Args:
+            team_name_or_id: The name or ID of the team to get.
+
+        Returns:
+            The team.
+        """
+        return await self._get_resource(
+            resource_id=team_name_or_id,
+            route=TEAMS,
+            response_model=TeamResponseModel,
+        )
+
+    async def list_teams(
+        self, team_filter_model: TeamFilterModel
+    ) -> Page[TeamResponseModel]:
+        """List all teams matching the given filter criteria.
+
+        Args:
+            team_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all teams matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=TEAMS,
+            response_model=TeamResponseModel,
+            filter_model=team_filter_model,
+        )
+
+    async def get_role(
+        self, role_name_or_id: Union[str, UUID]
+    ) -> RoleResponseModel:
+        """Gets a role.
+
+        Args:
+            role_name_or_id: The name or ID of the role to get.
+
+        Returns:
+            The role.
+        """
+        return await self._get_resource(
+            resource_id=role_name_or_id,
+            route=ROLES,
+            response_model=RoleResponseModel,
+        )
+
+    async def list_roles(
+        self, role_filter_model: RoleFilterModel
+    ) -> Page[RoleResponseModel]:
+        """List all roles matching the given filter criteria.
+
+        Args:
+            role_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all roles matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=ROLES,
+            response_model=RoleResponseModel,
+            filter_model=role_filter_model,
+        )
+
+    async def get_workspace(
+        self, workspace_name_or_id: Union[str, UUID]
+    ) -> WorkspaceResponseModel:
+        """Gets a workspace.
+
+        Args:
+            workspace_name_or_id: The name or ID of the workspace to get.
+
+        Returns:
+            The workspace.
+        """
+        return await self._get_resource(
+            resource_id=workspace_name_or_id,
+            route=WORKSPACES,
+            response_model=WorkspaceResponseModel,
+        )
+
+    async def list_workspaces(
+        self, workspace_filter_model: WorkspaceFilterModel
+    ) -> Page[WorkspaceResponseModel]:
+        """List all workspaces matching the given filter criteria.
+
+        Args:
+            workspace_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all workspaces matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=WORKSPACES,
+            response_model=WorkspaceResponseModel,
+            filter_model=workspace_filter_model,
+        )
+
+    async def get_pipeline(self, pipeline_id: UUID) -> PipelineResponseModel:
+        """Gets a pipeline.
+
+        Args:
+            pipeline_id: The ID of the pipeline to get.
+
+        Returns:
+            The pipeline.
+        """
+        return await self._get_resource(
+            resource_id=pipeline_id,
+            route=PIPELINES,
+            response_model=PipelineResponseModel,
+        )
+
+    async def list_pipelines(
+        self, pipeline_filter_model: PipelineFilterModel
+    ) -> Page[PipelineResponseModel]:
+        """List all pipelines matching the given filter criteria.
+
+        Args:
+            pipeline_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all pipelines matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=PIPELINES,
+            response_model=PipelineResponseModel,
+            filter_model=pipeline_filter_model,
+        )
+
+    async def get_build(self, build_id: UUID) -> PipelineBuildResponseModel:
+        """Gets a build.
+
+        Args:
+            build_id: The ID of the build to get.
+
+        Returns:
+            The build.
+        """
+        return await self._get_resource(
+            resource_id=build_id,
+            route=PIPELINE_BUILDS,
+            response_model=PipelineBuildResponseModel,
+        )
+
+    async def list_builds(
+        self, build_filter_model: PipelineBuildFilterModel
+    ) -> Page[PipelineBuildResponseModel]:
+        """List all builds matching the given filter criteria.
+
+        Args:
+            build_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all builds matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=PIPELINE_BUILDS,
+            response_model=PipelineBuildResponseModel,
+            filter_model=build_filter_model,
+        )
+
+    async def get_deployment(
+        self, deployment_id: UUID
+    ) -> PipelineDeploymentResponseModel:
+        """Gets a deployment.
+
+        Args:
+            deployment_id: The ID of the deployment to get.
+
+        Returns:
+            The deployment.
+        """
+        return await self._get_resource(
+            resource_id=deployment_id,
+            route=PIPELINE_DEPLOYMENTS,
+            response_model=PipelineDeploymentResponseModel,
+        )
+
+    async def list_deployments(
+        self, deployment_filter_model: PipelineDeploymentFilterModel
+    ) -> Page[PipelineDeploymentResponseModel]:
+        """List all deployments matching the given filter criteria.
+
+        Args:
+            deployment_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all deployments matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=PIPELINE_DEPLOYMENTS,
+            response_model=PipelineDeploymentResponseModel,
+            filter_model=deployment_filter_model,
+        )
+
+    async def get_schedule(self, schedule_id: UUID) -> ScheduleResponseModel:
+        """Gets a schedule.
+
+        Args:
+            schedule_id: The ID of the schedule to get.
+
+        Returns:
+            The schedule.
+        """
+        return await self._get_resource(
+            resource_id=schedule_id,
+            route=SCHEDULES,
+            response_model=ScheduleResponseModel,
+        )
+
+    async def list_schedules(
+        self, schedule_filter_model: ScheduleFilterModel
+    ) -> Page[ScheduleResponseModel]:
+        """List all schedules matching the given filter criteria.
+
+        Args:
+            schedule_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all schedules matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=SCHEDULES,
+            response_model=ScheduleResponseModel,
+            filter_model=schedule_filter_model,
+        )
+
+    async def get_run(
+        self, run_name_or_id: Union[str, UUID]
+    ) -> PipelineRunResponseModel:
+        """Gets a pipeline run.
+
+        Args:
+            run_name_or_id: The name or ID of the pipeline run to get.
+
+        Returns:
+            The pipeline run.
+        """
+        return await self._get_resource(
+            resource_id=run_name_or_id,
+            route=RUNS,
+            response_model=PipelineRunResponseModel,
+        )
+
+    async def list_runs(
+        self, runs_filter_model: PipelineRunFilterModel
+    ) -> Page[PipelineRunResponseModel]:
+        """List all pipeline runs matching the given filter criteria.
+
+        Args:
+            runs_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all pipeline runs matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=RUNS,
+            response_model=PipelineRunResponseModel,
+            filter_model=runs_filter_model,
+        )
+
+    async def get_run_step(self, step_run_id: UUID) -> StepRunResponseModel:
+        """Gets a step run.
+
+        Args:
+            step_run_id: The ID of the step run to get.
+
+        Returns:
+            The step run.
+        """
+        return await self._get_resource(
+            resource_id=step_run_id,
+            route=STEPS,
+            response_model=StepRunResponseModel,
+        )
+
+    async def list_run_steps(
+        self, step_run_filter_model: StepRunFilterModel
+    ) -> Page[StepRunResponseModel]:
+        """List all step runs matching the given filter criteria.
+
+        Args:
+            step_run_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all step runs matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=STEPS,
+            response_model=StepRunResponseModel,
+            filter_model=step_run_filter_model,
+        )
+
+    async def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
+        """Gets an artifact.
+
+        Args:
+            artifact_id: The ID of the artifact to get.
+
+        Returns:
+            The artifact.
+        """
+        return await self._get_resource(
+            resource_id=artifact_id,
+            route=ARTIFACTS,
+            response_model=ArtifactResponseModel,
+        )
+
+    async def list_artifacts(
+        self, artifact_filter_model: ArtifactFilterModel
+    ) -> Page[ArtifactResponseModel]:
+        """List all artifacts matching the given filter criteria.
+
+        Args:
+            artifact_filter_model: All filter parameters including pagination
+                params.
+
+        Returns:
+            A page of all artifacts matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=ARTIFACTS,
+            response_model=ArtifactResponseModel,
+            filter_model=artifact_filter_model,
+        )
+
+    async def list_run_metadata(
+        self, run_metadata_filter_model: RunMetadataFilterModel
+    ) -> Page[RunMetadataResponseModel]:
+        """List run metadata matching the given filter criteria.
+
+        Args:
+            run_metadata_filter_model: All filter parameters including
+                pagination params.
+
+        Returns:
+            A page of all run metadata matching the filter criteria.
+        """
+        return await self._list_paginated_resources(
+            route=RUN_METADATA,
+            response_model=RunMetadataResponseModel,
+            filter_model=run_metadata_filter_model,
+        )
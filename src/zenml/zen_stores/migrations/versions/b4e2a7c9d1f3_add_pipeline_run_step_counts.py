@@ -0,0 +1,52 @@
+"""Add pipeline run step counts [b4e2a7c9d1f3].
+
+Revision ID: b4e2a7c9d1f3
+Revises: 5a8c2d4e6f10
+Create Date: 2023-04-04 11:02:37.845216
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b4e2a7c9d1f3"
+down_revision = "5a8c2d4e6f10"
+branch_labels = None
+depends_on = None
+
+STEP_COUNT_COLUMNS = {
+    "num_running_steps": "running",
+    "num_completed_steps": "completed",
+    "num_cached_steps": "cached",
+    "num_failed_steps": "failed",
+}
+
+
+def upgrade() -> None:
+    """Upgrade database schema and/or data, creating a new revision."""
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        for column_name in STEP_COUNT_COLUMNS:
+            batch_op.add_column(
+                sa.Column(
+                    column_name,
+                    sa.Integer(),
+                    nullable=False,
+                    server_default="0",
+                )
+            )
+
+    # Count the step runs of all existing pipeline runs
+    for column_name, status in STEP_COUNT_COLUMNS.items():
+        op.execute(
+            f"UPDATE pipeline_run SET {column_name} = ("
+            "SELECT COUNT(*) FROM step_run "
+            "WHERE step_run.pipeline_run_id = pipeline_run.id "
+            f"AND step_run.status = '{status}')"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema and/or data back to the previous revision."""
+    with op.batch_alter_table("pipeline_run", schema=None) as batch_op:
+        for column_name in STEP_COUNT_COLUMNS:
+            batch_op.drop_column(column_name)
@@ -12,7 +12,9 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 """REST Zen Store implementation."""
+import gzip
 import os
+import random
 import re
 from pathlib import Path, PurePath
 from typing import (
@@ -33,6 +35,8 @@ from uuid import UUID
 import requests
 import urllib3
 from pydantic import BaseModel, root_validator, validator
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import zenml
 from zenml.config.global_config import GlobalConfiguration
@@ -41,11 +45,14 @@ from zenml.config.store_config import StoreConfiguration
 from zenml.constants import (
     API,
     ARTIFACTS,
+    CACHED,
+    COMPLETE,
     CURRENT_USER,
     DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     ENV_ZENML_DISABLE_CLIENT_SERVER_MISMATCH_WARNING,
     FLAVORS,
     GET_OR_CREATE,
+    GZIP_MINIMUM_SIZE,
     INFO,
     LOGIN,
     PIPELINE_BUILDS,
@@ -60,6 +67,7 @@ from zenml.constants import (
     STEPS,
     TEAM_ROLE_ASSIGNMENTS,
     TEAMS,
+    UPSTREAM_STEPS,
     USER_ROLE_ASSIGNMENTS,
     USERS,
     VERSION_1,
@@ -81,6 +89,7 @@ from zenml.models import (
     ArtifactRequestModel,
     ArtifactResponseModel,
     BaseFilterModel,
+    CachedStepRunModel,
     ComponentFilterModel,
     ComponentRequestModel,
     ComponentResponseModel,
@@ -116,6 +125,7 @@ from zenml.models import (
     StackRequestModel,
     StackResponseModel,
     StackUpdateModel,
+    StepRunCompletionModel,
     StepRunFilterModel,
     StepRunRequestModel,
     StepRunResponseModel,
@@ -125,6 +135,7 @@ from zenml.models import (
     TeamRoleAssignmentFilterModel,
     TeamRoleAssignmentRequestModel,
     TeamRoleAssignmentResponseModel,
+    UpstreamStepRunModel,
     UserFilterModel,
     UserRequestModel,
     UserResponseModel,
@@ -169,6 +180,28 @@ AnyResponseModel = TypeVar("AnyResponseModel", bound=BaseResponseModel)
 
 
 DEFAULT_HTTP_TIMEOUT = 30
+DEFAULT_HTTP_POOL_CONNECTIONS = 10
+DEFAULT_HTTP_POOL_MAXSIZE = 20
+DEFAULT_HTTP_MAX_RETRIES = 3
+DEFAULT_HTTP_RETRY_BACKOFF_FACTOR = 0.5
+# Status codes of transient errors, e.g. of a proxy in front of the server
+HTTP_RETRY_STATUS_CODES = [502, 503, 504]
+
+
+class JitteredRetry(Retry):
+    """Retry policy that randomizes the exponential backoff time.
+
+    Using a random backoff time between zero and the exponential backoff time
+    keeps concurrent clients from retrying in lockstep.
+    """
+
+    def get_backoff_time(self) -> float:
+        """Get a random backoff time before the next retry.
+
+        Returns:
+            The backoff time in seconds.
+        """
+        return random.uniform(0, super().get_backoff_time())
 
 
 class RestZenStoreConfiguration(StoreConfiguration):
@@ -185,7 +218,17 @@ class RestZenStoreConfiguration(StoreConfiguration):
             verify the server's TLS certificate, or a string, in which case it
             must be a path to a CA bundle to use or the CA bundle value itself.
         http_timeout: The timeout to use for all requests.
-
+        pool_connections: The number of connection pools to cache.
+        pool_maxsize: The maximum number of connections to keep per pool.
+            This should be at least the number of steps or threads that
+            use the store concurrently.
+        max_retries: The maximum number of retries of idempotent requests
+            that failed due to connection errors or transient server errors.
+        retry_backoff_factor: The factor of the exponential backoff between
+            retries. The actual backoff time is randomized between zero and
+            the exponential backoff time.
+        compress_requests: Whether to gzip compress large request bodies.
+            This requires a ZenML server that accepts compressed requests.
     """
 
     type: StoreType = StoreType.REST
@@ -197,6 +240,11 @@ class RestZenStoreConfiguration(StoreConfiguration):
     api_token: Optional[str] = None
     verify_ssl: Union[bool, str] = True
     http_timeout: int = DEFAULT_HTTP_TIMEOUT
+    pool_connections: int = DEFAULT_HTTP_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_HTTP_POOL_MAXSIZE
+    max_retries: int = DEFAULT_HTTP_MAX_RETRIES
+    retry_backoff_factor: float = DEFAULT_HTTP_RETRY_BACKOFF_FACTOR
+    compress_requests: bool = False
 
     @validator("secrets_store")
     def validate_secrets_store(
@@ -1670,6 +1718,63 @@ class RestZenStore(BaseZenStore):
             filter_model=step_run_filter_model,
         )
 
+    def get_cached_step_run(
+        self, workspace_id: UUID, cache_key: str
+    ) -> Optional[CachedStepRunModel]:
+        """Get the latest successful step run with the given cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to look for the
+                step run.
+            cache_key: The cache key of the step run.
+
+        Returns:
+            The ID and output artifact IDs of the step run, or `None` if no
+            successful step run with the given cache key exists.
+        """
+        body = self.get(
+            STEPS + CACHED,
+            params={"workspace_id": str(workspace_id), "cache_key": cache_key},
+        )
+        if body is None:
+            return None
+        return CachedStepRunModel.parse_obj(body)
+
+    def get_upstream_step_runs(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, UpstreamStepRunModel]:
+        """Get step runs of a pipeline run together with their outputs.
+
+        This is used to resolve the inputs of a step, which are outputs of
+        other (upstream) steps in the same pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the step runs to get.
+
+        Returns:
+            The IDs and output artifacts of the step runs, keyed by the step
+            name. Step names for which no step run exists are not included.
+
+        Raises:
+            ValueError: If the server returned an invalid response.
+        """
+        if not step_names:
+            return {}
+
+        body = self.get(
+            f"{RUNS}/{str(run_id)}{UPSTREAM_STEPS}",
+            params={"step_names": step_names},
+        )
+        if not isinstance(body, dict):
+            raise ValueError(
+                f"Bad API Response. Expected dict, got {type(body)}"
+            )
+        return {
+            step_name: UpstreamStepRunModel.parse_obj(step_run)
+            for step_name, step_run in body.items()
+        }
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -1691,6 +1796,25 @@ class RestZenStore(BaseZenStore):
             route=STEPS,
         )
 
+    def complete_run_step(
+        self,
+        step_run_id: UUID,
+        step_run_completion: StepRunCompletionModel,
+    ) -> StepRunResponseModel:
+        """Publishes the outputs of a successful step run and completes it.
+
+        Args:
+            step_run_id: The ID of the step run to complete.
+            step_run_completion: The outputs of the step run.
+
+        Returns:
+            The completed step run.
+        """
+        body = self.post(
+            f"{STEPS}/{str(step_run_id)}{COMPLETE}", body=step_run_completion
+        )
+        return StepRunResponseModel.parse_obj(body)
+
     # ---------
     # Artifacts
     # ---------
@@ -1860,6 +1984,19 @@ class RestZenStore(BaseZenStore):
 
             self._session = requests.Session()
             self._session.verify = self.config.verify_ssl
+            adapter = HTTPAdapter(
+                pool_connections=self.config.pool_connections,
+                pool_maxsize=self.config.pool_maxsize,
+                max_retries=JitteredRetry(
+                    total=self.config.max_retries,
+                    backoff_factor=self.config.retry_backoff_factor,
+                    status_forcelist=HTTP_RETRY_STATUS_CODES,
+                    allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+                    raise_on_status=False,
+                ),
+            )
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
             token = self._get_auth_token()
             self._session.headers.update({"Authorization": "Bearer " + token})
             logger.debug("Authenticated to ZenML server.")
@@ -1994,6 +2131,20 @@ class RestZenStore(BaseZenStore):
             The parsed response.
         """
         params = {k: str(v) for k, v in params.items()} if params else {}
+
+        data = kwargs.get("data")
+        if (
+            self.config.compress_requests
+            and isinstance(data, str)
+            and len(data) >= GZIP_MINIMUM_SIZE
+        ):
+            kwargs["data"] = gzip.compress(data.encode())
+            kwargs["headers"] = {
+                **kwargs.get("headers", {}),
+                "Content-Encoding": "gzip",
+                "Content-Type": "application/json",
+            }
+
         try:
             return self._handle_response(
                 self.session.request(
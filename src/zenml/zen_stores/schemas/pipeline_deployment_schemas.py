@@ -123,6 +123,7 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
         )
     )
     client_environment: str = Field(sa_column=Column(TEXT, nullable=False))
+    code_path: Optional[str] = Field(nullable=True)
 
     @classmethod
     def from_request(
@@ -151,6 +152,7 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
                 default=pydantic_encoder,
             ),
             client_environment=json.dumps(request.client_environment),
+            code_path=request.code_path,
         )
 
     def to_model(
@@ -179,4 +181,5 @@ class PipelineDeploymentSchema(BaseSchema, table=True):
             ),
             step_configurations=json.loads(self.step_configurations),
             client_environment=json.loads(self.client_environment),
+            code_path=self.code_path,
         )
@@ -44,6 +44,14 @@ if TYPE_CHECKING:
     from zenml.zen_stores.schemas.step_run_schemas import StepRunSchema
 
 
+_STEP_COUNT_ATTRIBUTES = {
+    ExecutionStatus.RUNNING: "num_running_steps",
+    ExecutionStatus.COMPLETED: "num_completed_steps",
+    ExecutionStatus.CACHED: "num_cached_steps",
+    ExecutionStatus.FAILED: "num_failed_steps",
+}
+
+
 class PipelineRunSchema(NamedSchema, table=True):
     """SQL Model for pipeline runs."""
 
@@ -132,6 +140,11 @@ class PipelineRunSchema(NamedSchema, table=True):
     status: ExecutionStatus
     pipeline_configuration: str = Field(sa_column=Column(TEXT, nullable=False))
     num_steps: Optional[int]
+    # Number of step runs per status, see `update_step_counts`.
+    num_running_steps: int = Field(default=0)
+    num_completed_steps: int = Field(default=0)
+    num_cached_steps: int = Field(default=0)
+    num_failed_steps: int = Field(default=0)
     client_version: str
     server_version: Optional[str] = Field(nullable=True)
     client_environment: Optional[str] = Field(
@@ -290,3 +303,50 @@ class PipelineRunSchema(NamedSchema, table=True):
 
         self.updated = datetime.utcnow()
         return self
+
+    def update_step_counts(
+        self,
+        old_status: Optional[ExecutionStatus],
+        new_status: ExecutionStatus,
+    ) -> "PipelineRunSchema":
+        """Updates the step counts and status after a step run changed.
+
+        This needs to be called whenever a step run of this pipeline run is
+        created or changes its status, so the status of the pipeline run can
+        be derived without looking at all its step runs.
+
+        Args:
+            old_status: The previous status of the step run, or `None` if the
+                step run was just created.
+            new_status: The new status of the step run.
+
+        Returns:
+            The updated `PipelineRunSchema`.
+        """
+        if old_status == new_status:
+            return self
+
+        if old_status is not None:
+            attribute = _STEP_COUNT_ATTRIBUTES[old_status]
+            setattr(self, attribute, getattr(self, attribute) - 1)
+        attribute = _STEP_COUNT_ATTRIBUTES[new_status]
+        setattr(self, attribute, getattr(self, attribute) + 1)
+
+        if self.num_failed_steps > 0:
+            status = ExecutionStatus.FAILED
+        elif (
+            self.num_running_steps > 0
+            or self.num_completed_steps + self.num_cached_steps
+            < (self.num_steps or 0)
+        ):
+            status = ExecutionStatus.RUNNING
+        else:
+            status = ExecutionStatus.COMPLETED
+
+        if status != self.status:
+            self.status = status
+            if status in {ExecutionStatus.COMPLETED, ExecutionStatus.FAILED}:
+                self.end_time = datetime.utcnow()
+
+        self.updated = datetime.utcnow()
+        return self
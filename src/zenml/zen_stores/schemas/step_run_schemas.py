@@ -19,7 +19,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional
 from uuid import UUID
 
 from pydantic.json import pydantic_encoder
-from sqlalchemy import TEXT, Column
+from sqlalchemy import TEXT, Column, Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from zenml.config.step_configurations import Step
@@ -46,6 +46,23 @@ class StepRunSchema(NamedSchema, table=True):
     """SQL Model for steps of pipeline runs."""
 
     __tablename__ = "step_run"
+    __table_args__ = (
+        # Used to look up cached step runs, see `SqlZenStore.get_cached_step_run`.
+        Index(
+            "ix_step_run_cache_lookup",
+            "workspace_id",
+            "cache_key",
+            "status",
+            "created",
+        ),
+        # Used to resolve step inputs, see
+        # `SqlZenStore.get_upstream_step_runs`.
+        Index(
+            "ix_step_run_pipeline_run_id_name",
+            "pipeline_run_id",
+            "name",
+        ),
+    )
 
     pipeline_run_id: UUID = build_foreign_key_field(
         source=__tablename__,
@@ -19,6 +19,7 @@ import logging
 import math
 import os
 import re
+from collections import defaultdict
 from contextvars import ContextVar
 from pathlib import Path, PurePath
 from typing import (
@@ -40,8 +41,13 @@ import pymysql
 from pydantic import root_validator, validator
 from sqlalchemy import asc, desc, func, text
 from sqlalchemy.engine import URL, Engine, make_url
-from sqlalchemy.exc import ArgumentError, NoResultFound, OperationalError
-from sqlalchemy.orm import noload
+from sqlalchemy.exc import (
+    ArgumentError,
+    IntegrityError,
+    NoResultFound,
+    OperationalError,
+)
+from sqlalchemy.orm import noload, selectinload
 from sqlmodel import Session, create_engine, or_, select
 from sqlmodel.sql.expression import Select, SelectOfScalar
 
@@ -72,6 +78,7 @@ from zenml.models import (
     ArtifactRequestModel,
     ArtifactResponseModel,
     BaseFilterModel,
+    CachedStepRunModel,
     ComponentFilterModel,
     ComponentRequestModel,
     ComponentResponseModel,
@@ -107,6 +114,7 @@ from zenml.models import (
     StackRequestModel,
     StackResponseModel,
     StackUpdateModel,
+    StepRunCompletionModel,
     StepRunFilterModel,
     StepRunRequestModel,
     StepRunResponseModel,
@@ -118,6 +126,7 @@ from zenml.models import (
     TeamRoleAssignmentRequestModel,
     TeamRoleAssignmentResponseModel,
     TeamUpdateModel,
+    UpstreamStepRunModel,
     UserAuthModel,
     UserFilterModel,
     UserRequestModel,
@@ -671,6 +680,9 @@ class SqlZenStore(BaseZenStore):
         custom_schema_to_model_conversion: Optional[
             Callable[[AnySchema], B]
         ] = None,
+        custom_schemas_to_models_conversion: Optional[
+            Callable[[List[AnySchema]], List[B]]
+        ] = None,
     ) -> Page[B]:
         """Given a query, return a Page instance with a list of filtered Models.
 
@@ -683,6 +695,11 @@ class SqlZenStore(BaseZenStore):
                 into a model. This is used if the Model contains additional
                 data that is not explicitly stored as a field or relationship
                 on the model.
+            custom_schemas_to_models_conversion: Callable to convert all
+                schemas of the page into models at once. This should be used
+                instead of `custom_schema_to_model_conversion` if the
+                additional data can be fetched for all schemas in bulk, so
+                that the number of queries doesn't grow with the page size.
 
         Returns:
             The Domain Model representation of the DB resource
@@ -698,44 +715,66 @@ class SqlZenStore(BaseZenStore):
             query = query.where(filters)
 
         # Get the total amount of items in the database for a given query
-        total = session.scalar(
-            select([func.count("*")]).select_from(
-                query.options(noload("*")).subquery()
+        total: Optional[int] = None
+        if filter_model.include_total:
+            total = session.scalar(
+                select([func.count("*")]).select_from(
+                    query.options(noload("*")).subquery()
+                )
             )
-        )
 
-        # Sorting
+        # Sorting, using the ID to break ties so that the order is stable
         column, operand = filter_model.sorting_params
-        if operand == SorterOps.DESCENDING:
-            query = query.order_by(desc(getattr(table, column)))
-        else:
-            query = query.order_by(asc(getattr(table, column)))
+        order = desc if operand == SorterOps.DESCENDING else asc
+        query = query.order_by(
+            order(getattr(table, column)), order(getattr(table, "id"))
+        )
 
         # Get the total amount of pages in the database for a given query
-        if total == 0:
-            total_pages = 1
-        else:
-            total_pages = math.ceil(total / filter_model.size)
+        if total is not None:
+            total_pages = max(math.ceil(total / filter_model.size), 1)
 
-        if filter_model.page > total_pages:
-            raise ValueError(
-                f"Invalid page {filter_model.page}. The requested page size is "
-                f"{filter_model.size} and there are a total of {total} items "
-                f"for this query. The maximum page value therefore is "
-                f"{total_pages}."
-            )
+            if filter_model.after is None and filter_model.page > total_pages:
+                raise ValueError(
+                    f"Invalid page {filter_model.page}. The requested page "
+                    f"size is {filter_model.size} and there are a total of "
+                    f"{total} items for this query. The maximum page value "
+                    f"therefore is {total_pages}."
+                )
 
-        # Get a page of the actual data
+        # Get a page of the actual data, plus one item to find out whether
+        # there is a next page
+        cursor_filter = filter_model.generate_cursor_filter(table=table)
+        if cursor_filter is not None:
+            query = query.where(cursor_filter)
+        else:
+            query = query.offset(filter_model.offset)
         item_schemas: List[AnySchema] = (
-            session.exec(
-                query.limit(filter_model.size).offset(filter_model.offset)
-            )
-            .unique()
-            .all()
+            session.exec(query.limit(filter_model.size + 1)).unique().all()
         )
 
+        next_cursor: Optional[str] = None
+        if len(item_schemas) > filter_model.size:
+            item_schemas = item_schemas[: filter_model.size]
+            last_item = item_schemas[-1]
+            next_cursor = filter_model.encode_cursor(
+                sort_value=getattr(last_item, column),
+                id=getattr(last_item, "id"),
+            )
+
+        if total is None:
+            # Without counting, only the items seen so far are known
+            total = filter_model.offset + len(item_schemas)
+            total_pages = filter_model.page
+            if next_cursor:
+                total += 1
+                total_pages += 1
+
         # Convert this page of items from schemas to models.
         items: List[B] = []
+        if custom_schemas_to_models_conversion:
+            items = custom_schemas_to_models_conversion(item_schemas)
+            item_schemas = []
         for schema in item_schemas:
             # If a custom conversion function is provided, use it.
             if custom_schema_to_model_conversion:
@@ -758,6 +797,7 @@ class SqlZenStore(BaseZenStore):
             items=items,
             index=filter_model.page,
             max_size=filter_model.size,
+            next_cursor=next_cursor,
         )
 
     # ====================================
@@ -3181,7 +3221,16 @@ class SqlZenStore(BaseZenStore):
             # Create the pipeline run
             new_run = PipelineRunSchema.from_request(pipeline_run)
             session.add(new_run)
-            session.commit()
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another client (e.g. a concurrently running step of the same
+                # run) created the run after the existence checks above.
+                raise EntityExistsError(
+                    f"Unable to create pipeline run: A pipeline run with ID "
+                    f"'{pipeline_run.id}' or name '{pipeline_run.name}' "
+                    f"already exists."
+                )
 
             return new_run.to_model()
 
@@ -3328,11 +3377,12 @@ class SqlZenStore(BaseZenStore):
         """
         with Session(self.engine) as session:
 
-            # Check if the pipeline run exists
+            # Check if the pipeline run exists. The row is locked as its
+            # step counts get updated below.
             run = session.exec(
-                select(PipelineRunSchema).where(
-                    PipelineRunSchema.id == step_run.pipeline_run_id
-                )
+                select(PipelineRunSchema)
+                .where(PipelineRunSchema.id == step_run.pipeline_run_id)
+                .with_for_update()
             ).first()
             if run is None:
                 raise KeyError(
@@ -3385,6 +3435,12 @@ class SqlZenStore(BaseZenStore):
                     session=session,
                 )
 
+            # Update the status of the pipeline run.
+            run.update_step_counts(
+                old_status=None, new_status=step_schema.status
+            )
+            session.add(run)
+
             session.commit()
 
             return self._run_step_schema_to_model(step_schema)
@@ -3576,54 +3632,124 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The run step model.
         """
+        return self._run_step_schemas_to_models([step_run])[0]
+
+    def _run_step_schemas_to_models(
+        self, step_runs: List[StepRunSchema]
+    ) -> List[StepRunResponseModel]:
+        """Converts run step schemas to step models.
+
+        The parent steps and artifacts of all step runs are fetched in bulk,
+        so the number of queries doesn't depend on the number of step runs.
+
+        Args:
+            step_runs: The run step schemas to convert.
+
+        Returns:
+            The run step models, in the same order as the schemas.
+        """
+        if not step_runs:
+            return []
+
+        step_run_ids = [step_run.id for step_run in step_runs]
+        parent_step_ids: Dict[UUID, List[UUID]] = defaultdict(list)
+        input_artifact_schemas: Dict[
+            UUID, List[Tuple[str, ArtifactSchema]]
+        ] = defaultdict(list)
+        output_artifact_schemas: Dict[
+            UUID, List[Tuple[str, ArtifactSchema]]
+        ] = defaultdict(list)
+
         with Session(self.engine) as session:
             # Get parent steps.
-            parent_steps = session.exec(
-                select(StepRunSchema)
-                .where(StepRunParentsSchema.child_id == step_run.id)
-                .where(StepRunParentsSchema.parent_id == StepRunSchema.id)
+            parents = session.exec(
+                select(
+                    StepRunParentsSchema.child_id,
+                    StepRunParentsSchema.parent_id,
+                ).where(
+                    StepRunParentsSchema.child_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
             ).all()
-            parent_step_ids = [parent_step.id for parent_step in parent_steps]
+            for child_id, parent_id in parents:
+                parent_step_ids[child_id].append(parent_id)
 
             # Get input artifacts.
             input_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
                     StepRunInputArtifactSchema.name,
+                    StepRunInputArtifactSchema.step_id,
                 )
                 .where(
                     ArtifactSchema.id == StepRunInputArtifactSchema.artifact_id
                 )
-                .where(StepRunInputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunInputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+                .options(selectinload(ArtifactSchema.run_metadata))
             ).all()
-            input_artifacts = {
-                input_name: self._artifact_schema_to_model(artifact)
-                for (artifact, input_name) in input_artifact_list
-            }
+            for artifact, input_name, step_id in input_artifact_list:
+                input_artifact_schemas[step_id].append((input_name, artifact))
 
             # Get output artifacts.
             output_artifact_list = session.exec(
                 select(
                     ArtifactSchema,
                     StepRunOutputArtifactSchema.name,
+                    StepRunOutputArtifactSchema.step_id,
                 )
                 .where(
                     ArtifactSchema.id
                     == StepRunOutputArtifactSchema.artifact_id
                 )
-                .where(StepRunOutputArtifactSchema.step_id == step_run.id)
+                .where(
+                    StepRunOutputArtifactSchema.step_id.in_(  # type: ignore[attr-defined]
+                        step_run_ids
+                    )
+                )
+                .options(selectinload(ArtifactSchema.run_metadata))
             ).all()
-            output_artifacts = {
-                output_name: self._artifact_schema_to_model(artifact)
-                for (artifact, output_name) in output_artifact_list
+            for artifact, output_name, step_id in output_artifact_list:
+                output_artifact_schemas[step_id].append(
+                    (output_name, artifact)
+                )
+
+            # Convert all artifacts at once.
+            artifact_schemas = {
+                artifact.id: artifact
+                for artifact, _, _ in input_artifact_list
+                + output_artifact_list
+            }
+            artifact_models = {
+                artifact_model.id: artifact_model
+                for artifact_model in self._artifact_schemas_to_models(
+                    list(artifact_schemas.values()), session=session
+                )
             }
 
-            # Convert to model.
-            return step_run.to_model(
-                parent_step_ids=parent_step_ids,
-                input_artifacts=input_artifacts,
-                output_artifacts=output_artifacts,
-            )
+            # Convert to models.
+            return [
+                step_run.to_model(
+                    parent_step_ids=parent_step_ids[step_run.id],
+                    input_artifacts={
+                        input_name: artifact_models[artifact.id]
+                        for input_name, artifact in input_artifact_schemas[
+                            step_run.id
+                        ]
+                    },
+                    output_artifacts={
+                        output_name: artifact_models[artifact.id]
+                        for output_name, artifact in output_artifact_schemas[
+                            step_run.id
+                        ]
+                    },
+                )
+                for step_run in step_runs
+            ]
 
     def list_run_steps(
         self, step_run_filter_model: StepRunFilterModel
@@ -3638,15 +3764,129 @@ class SqlZenStore(BaseZenStore):
             A list of all step runs matching the filter criteria.
         """
         with Session(self.engine) as session:
-            query = select(StepRunSchema)
+            query = select(StepRunSchema).options(
+                selectinload(StepRunSchema.run_metadata)
+            )
             return self.filter_and_paginate(
                 session=session,
                 query=query,
                 table=StepRunSchema,
                 filter_model=step_run_filter_model,
-                custom_schema_to_model_conversion=self._run_step_schema_to_model,
+                custom_schemas_to_models_conversion=self._run_step_schemas_to_models,
+            )
+
+    def get_cached_step_run(
+        self, workspace_id: UUID, cache_key: str
+    ) -> Optional[CachedStepRunModel]:
+        """Get the latest successful step run with the given cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to look for the
+                step run.
+            cache_key: The cache key of the step run.
+
+        Returns:
+            The ID and output artifact IDs of the step run, or `None` if no
+            successful step run with the given cache key exists.
+        """
+        with Session(self.engine) as session:
+            # This query is covered by the `ix_step_run_cache_lookup` index.
+            step_run_id = session.exec(
+                select(StepRunSchema.id)
+                .where(StepRunSchema.workspace_id == workspace_id)
+                .where(StepRunSchema.cache_key == cache_key)
+                .where(StepRunSchema.status == ExecutionStatus.COMPLETED)
+                .order_by(desc(StepRunSchema.created))
+                .limit(1)
+            ).first()
+            if step_run_id is None:
+                return None
+
+            output_artifacts = session.exec(
+                select(
+                    StepRunOutputArtifactSchema.name,
+                    StepRunOutputArtifactSchema.artifact_id,
+                ).where(StepRunOutputArtifactSchema.step_id == step_run_id)
+            ).all()
+            return CachedStepRunModel(
+                id=step_run_id,
+                output_artifacts={
+                    name: artifact_id for name, artifact_id in output_artifacts
+                },
             )
 
+    def get_upstream_step_runs(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, UpstreamStepRunModel]:
+        """Get step runs of a pipeline run together with their outputs.
+
+        This is used to resolve the inputs of a step, which are outputs of
+        other (upstream) steps in the same pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the step runs to get.
+
+        Returns:
+            The IDs and output artifacts of the step runs, keyed by the step
+            name. Step names for which no step run exists are not included.
+        """
+        if not step_names:
+            return {}
+
+        with Session(self.engine) as session:
+            # The step runs are looked up using the
+            # `ix_step_run_pipeline_run_id_name` index. Step runs without
+            # outputs are still returned thanks to the outer joins.
+            rows = session.exec(
+                select(
+                    StepRunSchema.id,
+                    StepRunSchema.name,
+                    StepRunOutputArtifactSchema.name,
+                    ArtifactSchema,
+                )
+                .outerjoin(
+                    StepRunOutputArtifactSchema,
+                    StepRunOutputArtifactSchema.step_id == StepRunSchema.id,
+                )
+                .outerjoin(
+                    ArtifactSchema,
+                    ArtifactSchema.id
+                    == StepRunOutputArtifactSchema.artifact_id,
+                )
+                .where(StepRunSchema.pipeline_run_id == run_id)
+                .where(
+                    StepRunSchema.name.in_(  # type: ignore[attr-defined]
+                        step_names
+                    )
+                )
+                .options(selectinload(ArtifactSchema.run_metadata))
+            ).all()
+
+            artifact_schemas = {
+                artifact.id: artifact
+                for _, _, _, artifact in rows
+                if artifact is not None
+            }
+            artifact_models = {
+                artifact_model.id: artifact_model
+                for artifact_model in self._artifact_schemas_to_models(
+                    list(artifact_schemas.values()), session=session
+                )
+            }
+
+            step_runs: Dict[str, UpstreamStepRunModel] = {}
+            for step_run_id, step_name, output_name, artifact in rows:
+                step_run = step_runs.setdefault(
+                    step_name,
+                    UpstreamStepRunModel(id=step_run_id, name=step_name),
+                )
+                if artifact is not None:
+                    step_run.output_artifacts[output_name] = artifact_models[
+                        artifact.id
+                    ]
+            return step_runs
+
     def update_run_step(
         self,
         step_run_id: UUID,
@@ -3677,8 +3917,14 @@ class SqlZenStore(BaseZenStore):
                 )
 
             # Update the step
+            old_status = existing_step_run.status
             existing_step_run.update(step_run_update)
             session.add(existing_step_run)
+            self._update_run_step_counts(
+                step_run=existing_step_run,
+                old_status=old_status,
+                session=session,
+            )
 
             # Update the output artifacts.
             for name, artifact_id in step_run_update.output_artifacts.items():
@@ -3697,6 +3943,102 @@ class SqlZenStore(BaseZenStore):
 
             return self._run_step_schema_to_model(existing_step_run)
 
+    def complete_run_step(
+        self,
+        step_run_id: UUID,
+        step_run_completion: StepRunCompletionModel,
+    ) -> StepRunResponseModel:
+        """Publishes the outputs of a successful step run and completes it.
+
+        The output artifacts, their metadata, the metadata of the step run and
+        its new status are all stored in a single transaction.
+
+        Args:
+            step_run_id: The ID of the step run to complete.
+            step_run_completion: The outputs of the step run.
+
+        Returns:
+            The completed step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+        with Session(self.engine) as session:
+            existing_step_run = session.exec(
+                select(StepRunSchema).where(StepRunSchema.id == step_run_id)
+            ).first()
+            if existing_step_run is None:
+                raise KeyError(
+                    f"Unable to complete step with ID {step_run_id}: "
+                    f"No step with this ID found."
+                )
+
+            run_metadata = list(step_run_completion.run_metadata)
+            for metadata in run_metadata:
+                metadata.step_run_id = step_run_id
+
+            artifact_metadata = step_run_completion.output_artifact_metadata
+            for name, artifact in step_run_completion.output_artifacts.items():
+                artifact_schema = ArtifactSchema.from_request(artifact)
+                session.add(artifact_schema)
+                session.add(
+                    StepRunOutputArtifactSchema(
+                        step_id=step_run_id,
+                        artifact_id=artifact_schema.id,
+                        name=name,
+                    )
+                )
+                for metadata in artifact_metadata.get(name, []):
+                    metadata.artifact_id = artifact_schema.id
+                    run_metadata.append(metadata)
+
+            for metadata in run_metadata:
+                session.add(RunMetadataSchema.from_request(metadata))
+
+            old_status = existing_step_run.status
+            existing_step_run.update(
+                StepRunUpdateModel(
+                    status=ExecutionStatus.COMPLETED,
+                    end_time=step_run_completion.end_time,
+                )
+            )
+            session.add(existing_step_run)
+            self._update_run_step_counts(
+                step_run=existing_step_run,
+                old_status=old_status,
+                session=session,
+            )
+            session.commit()
+            session.refresh(existing_step_run)
+
+            return self._run_step_schema_to_model(existing_step_run)
+
+    @staticmethod
+    def _update_run_step_counts(
+        step_run: StepRunSchema,
+        old_status: ExecutionStatus,
+        session: Session,
+    ) -> None:
+        """Updates the pipeline run of a step run after its status changed.
+
+        Args:
+            step_run: The step run whose status changed.
+            old_status: The previous status of the step run.
+            session: The database session to use.
+        """
+        if step_run.status == old_status:
+            return
+
+        run = session.exec(
+            select(PipelineRunSchema)
+            .where(PipelineRunSchema.id == step_run.pipeline_run_id)
+            .with_for_update()
+        ).one()
+        run.update_step_counts(
+            old_status=old_status, new_status=step_run.status
+        )
+        session.add(run)
+
     # ---------
     # Artifacts
     # ---------
@@ -3729,22 +4071,61 @@ class SqlZenStore(BaseZenStore):
         Returns:
             The converted artifact model.
         """
-        # Find the producer step run ID.
-        with Session(self.engine) as session:
-            producer_step_run_id = session.exec(
-                select(StepRunOutputArtifactSchema.step_id)
-                .where(
-                    StepRunOutputArtifactSchema.artifact_id
-                    == artifact_schema.id
+        return self._artifact_schemas_to_models([artifact_schema])[0]
+
+    def _artifact_schemas_to_models(
+        self,
+        artifact_schemas: List[ArtifactSchema],
+        session: Optional[Session] = None,
+    ) -> List[ArtifactResponseModel]:
+        """Converts artifact schemas to models.
+
+        The producer step runs of all artifacts are fetched in a single query.
+
+        Args:
+            artifact_schemas: The artifact schemas to convert.
+            session: Optional session to use for the query. If not given, a
+                new session will be created.
+
+        Returns:
+            The converted artifact models, in the same order as the schemas.
+        """
+        if not artifact_schemas:
+            return []
+
+        if session is None:
+            with Session(self.engine) as new_session:
+                return self._artifact_schemas_to_models(
+                    artifact_schemas, session=new_session
                 )
-                .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
-                .where(StepRunSchema.status != ExecutionStatus.CACHED)
-            ).first()
 
-            # Convert the artifact schema to a model.
-            return artifact_schema.to_model(
-                producer_step_run_id=producer_step_run_id
+        # Find the producer step run IDs.
+        producers = session.exec(
+            select(
+                StepRunOutputArtifactSchema.artifact_id,
+                StepRunOutputArtifactSchema.step_id,
+            )
+            .where(
+                StepRunOutputArtifactSchema.artifact_id.in_(  # type: ignore[attr-defined]
+                    [artifact.id for artifact in artifact_schemas]
+                )
+            )
+            .where(StepRunOutputArtifactSchema.step_id == StepRunSchema.id)
+            .where(StepRunSchema.status != ExecutionStatus.CACHED)
+        ).all()
+        producer_step_run_ids: Dict[UUID, UUID] = {}
+        for artifact_id, step_run_id in producers:
+            producer_step_run_ids.setdefault(artifact_id, step_run_id)
+
+        # Convert the artifact schemas to models.
+        return [
+            artifact_schema.to_model(
+                producer_step_run_id=producer_step_run_ids.get(
+                    artifact_schema.id
+                )
             )
+            for artifact_schema in artifact_schemas
+        ]
 
     def get_artifact(self, artifact_id: UUID) -> ArtifactResponseModel:
         """Gets an artifact.
@@ -3796,10 +4177,10 @@ class SqlZenStore(BaseZenStore):
                 )
             return self.filter_and_paginate(
                 session=session,
-                query=query,
+                query=query.options(selectinload(ArtifactSchema.run_metadata)),
                 table=ArtifactSchema,
                 filter_model=artifact_filter_model,
-                custom_schema_to_model_conversion=self._artifact_schema_to_model,
+                custom_schemas_to_models_conversion=self._artifact_schemas_to_models,
             )
 
     def delete_artifact(self, artifact_id: UUID) -> None:
@@ -13,13 +13,14 @@
 #  permissions and limitations under the License.
 """ZenML Store interface."""
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
 from zenml.models import (
     ArtifactFilterModel,
     ArtifactRequestModel,
     ArtifactResponseModel,
+    CachedStepRunModel,
     ComponentFilterModel,
     ComponentRequestModel,
     ComponentResponseModel,
@@ -54,6 +55,7 @@ from zenml.models import (
     StackRequestModel,
     StackResponseModel,
     StackUpdateModel,
+    StepRunCompletionModel,
     StepRunFilterModel,
     StepRunRequestModel,
     StepRunResponseModel,
@@ -65,6 +67,7 @@ from zenml.models import (
     TeamRoleAssignmentRequestModel,
     TeamRoleAssignmentResponseModel,
     TeamUpdateModel,
+    UpstreamStepRunModel,
     UserAuthModel,
     UserFilterModel,
     UserRequestModel,
@@ -1255,6 +1258,40 @@ class ZenStoreInterface(ABC):
             A list of all step runs matching the filter criteria.
         """
 
+    @abstractmethod
+    def get_cached_step_run(
+        self, workspace_id: UUID, cache_key: str
+    ) -> Optional[CachedStepRunModel]:
+        """Get the latest successful step run with the given cache key.
+
+        Args:
+            workspace_id: The ID of the workspace in which to look for the
+                step run.
+            cache_key: The cache key of the step run.
+
+        Returns:
+            The ID and output artifact IDs of the step run, or `None` if no
+            successful step run with the given cache key exists.
+        """
+
+    @abstractmethod
+    def get_upstream_step_runs(
+        self, run_id: UUID, step_names: List[str]
+    ) -> Dict[str, UpstreamStepRunModel]:
+        """Get step runs of a pipeline run together with their outputs.
+
+        This is used to resolve the inputs of a step, which are outputs of
+        other (upstream) steps in the same pipeline run.
+
+        Args:
+            run_id: The ID of the pipeline run.
+            step_names: The names of the step runs to get.
+
+        Returns:
+            The IDs and output artifacts of the step runs, keyed by the step
+            name. Step names for which no step run exists are not included.
+        """
+
     @abstractmethod
     def update_run_step(
         self,
@@ -1274,6 +1311,28 @@ class ZenStoreInterface(ABC):
             KeyError: if the step run doesn't exist.
         """
 
+    @abstractmethod
+    def complete_run_step(
+        self,
+        step_run_id: UUID,
+        step_run_completion: StepRunCompletionModel,
+    ) -> StepRunResponseModel:
+        """Publishes the outputs of a successful step run and completes it.
+
+        The output artifacts, their metadata, the metadata of the step run and
+        its new status are all stored in a single transaction.
+
+        Args:
+            step_run_id: The ID of the step run to complete.
+            step_run_completion: The outputs of the step run.
+
+        Returns:
+            The completed step run.
+
+        Raises:
+            KeyError: if the step run doesn't exist.
+        """
+
     # ---------
     # Artifacts
     # ---------
@@ -22,7 +22,11 @@ from typing import Dict, Generator, List, Optional, Tuple
 
 import pytest
 
-from zenml.cli import EXAMPLES_RUN_SCRIPT, SHELL_EXECUTABLE, LocalExample
+from zenml.cli.example import (
+    EXAMPLES_RUN_SCRIPT,
+    SHELL_EXECUTABLE,
+    LocalExample,
+)
 from zenml.enums import ExecutionStatus
 from zenml.post_execution.pipeline import get_pipeline
 from zenml.post_execution.pipeline_run import PipelineRunView
@@ -13,13 +13,16 @@
 #  permissions and limitations under the License.
 
 import os
+import subprocess
+import sys
 
 import click
 import pytest
 from click.testing import CliRunner
 
-from zenml.cli.cli import ZenMLCLI, cli
+from zenml.cli.cli import TagGroup, ZenMLCLI, cli
 from zenml.cli.formatter import ZenFormatter
+from zenml.enums import CliCategories
 
 
 @pytest.fixture(scope="function")
@@ -79,3 +82,43 @@ def test_cli_does_not_set_custom_source_root_if_inside_repository(
     runner.invoke(cli, ["version"])
 
     mock_set_custom_source_root.assert_not_called()
+
+
+def test_lazy_commands_match_registered_commands():
+    """Tests that the help shown for lazy commands matches the commands once
+    they are imported."""
+    cli.load_all_commands()
+
+    assert set(cli.commands) == set(cli.lazy_commands)
+    for name, command in cli.commands.items():
+        lazy_command = cli.lazy_commands[name]
+        expected_tag = (
+            command.tag
+            if isinstance(command, TagGroup)
+            else CliCategories.OTHER_COMMANDS
+        )
+        assert lazy_command.tag == expected_tag
+        assert lazy_command.hidden == command.hidden
+        assert lazy_command.help == command.get_short_help_str(limit=1000)
+
+
+def test_cli_help_does_not_import_commands():
+    """Tests that showing the CLI help doesn't import any command modules."""
+    code = (
+        "import sys\n"
+        "from zenml.cli.cli import cli\n"
+        "try:\n"
+        "    cli(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in sys.modules if m.startswith('zenml.cli.')))\n"
+        "print('zenml.client' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+
+    imported_modules, client_imported = result.stdout.splitlines()[-2:]
+    assert imported_modules == str(["zenml.cli.cli", "zenml.cli.formatter"])
+    assert client_imported == "False"
@@ -25,7 +25,7 @@ from pydantic import BaseModel
 from tests.integration.functional.utils import sample_name
 from zenml.client import Client
 from zenml.config.pipeline_configurations import PipelineSpec
-from zenml.enums import SecretScope, StackComponentType
+from zenml.enums import LogicalOperators, SecretScope, StackComponentType
 from zenml.exceptions import (
     EntityExistsError,
     IllegalOperationError,
@@ -227,6 +227,56 @@ def test_activating_a_stack_updates_the_config_file(clean_client):
     assert Client(clean_client.root).active_stack_model.name == stack.name
 
 
+def test_active_stack_model_is_cached(clean_client, mocker):
+    """Tests that the active stack model is only fetched once."""
+    stack = _create_local_stack(client=clean_client, stack_name="new_stack")
+    clean_client.activate_stack(stack.id)
+
+    get_stack_spy = mocker.spy(type(clean_client.zen_store), "get_stack")
+    for _ in range(3):
+        assert clean_client.active_stack_model.id == stack.id
+    assert get_stack_spy.call_count == 0
+
+    clean_client.update_stack(stack.id, name="renamed_stack")
+    assert clean_client.active_stack_model.name == "renamed_stack"
+    assert clean_client.active_stack_model.name == "renamed_stack"
+    assert clean_client.cache_info().hits > 0
+
+    # Reading the active stack while the component is updated in the store
+    # must not cache the stack with the old component
+    zen_store = clean_client.zen_store
+    update_stack_component = type(zen_store).update_stack_component
+
+    def _update_stack_component_with_concurrent_read(**kwargs):
+        clean_client.active_stack_model
+        return update_stack_component(zen_store, **kwargs)
+
+    mocker.patch.object(
+        type(zen_store),
+        "update_stack_component",
+        side_effect=_update_stack_component_with_concurrent_read,
+    )
+    orchestrator = stack.components[StackComponentType.ORCHESTRATOR][0]
+    clean_client.update_stack_component(
+        orchestrator.id,
+        component_type=StackComponentType.ORCHESTRATOR,
+        name="renamed_orchestrator",
+    )
+    orchestrator = clean_client.active_stack_model.components[
+        StackComponentType.ORCHESTRATOR
+    ][0]
+    assert orchestrator.name == "renamed_orchestrator"
+
+
+def test_updating_the_active_user_updates_the_cached_user(clean_client):
+    """Tests that updating the active user refreshes the cached model."""
+    active_user = clean_client.active_user
+
+    clean_client.update_user(active_user.id, updated_full_name="Axl")
+
+    assert clean_client.active_user.full_name == "Axl"
+
+
 def test_registering_a_stack(clean_client):
     """Tests that registering a stack works and the stack gets persisted."""
     orch = _create_local_orchestrator(
@@ -497,6 +547,14 @@ def test_listing_pipelines(clean_client):
         == 0
     )
 
+    # Positional arguments keep their meaning
+    assert (
+        clean_client.list_pipelines(
+            "created", 1, 50, LogicalOperators.OR, None, None, None, "pipeline"
+        ).total
+        == 1
+    )
+
 
 def test_create_run_metadata_for_pipeline_run(clean_client_with_run):
     """Test creating run metadata linked only to a pipeline run."""
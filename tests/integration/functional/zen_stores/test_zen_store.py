@@ -28,7 +28,12 @@ from tests.integration.functional.zen_stores.utils import (
     list_of_entities,
 )
 from zenml.client import Client
-from zenml.enums import StackComponentType, StoreType
+from zenml.enums import (
+    ArtifactType,
+    ExecutionStatus,
+    StackComponentType,
+    StoreType,
+)
 from zenml.exceptions import (
     EntityExistsError,
     IllegalOperationError,
@@ -36,6 +41,7 @@ from zenml.exceptions import (
 )
 from zenml.models import (
     ArtifactFilterModel,
+    ArtifactRequestModel,
     ComponentFilterModel,
     ComponentUpdateModel,
     PipelineRunFilterModel,
@@ -45,7 +51,9 @@ from zenml.models import (
     StackFilterModel,
     StackRequestModel,
     StackUpdateModel,
+    StepRunCompletionModel,
     StepRunFilterModel,
+    StepRunUpdateModel,
     TeamRoleAssignmentRequestModel,
     TeamUpdateModel,
     UserRoleAssignmentRequestModel,
@@ -997,6 +1005,213 @@ def test_get_run_step_inputs_succeeds():
             assert len(run_step_inputs) == 1
 
 
+def test_complete_run_step_publishes_outputs_and_metadata():
+    """Tests completing a step run with outputs and metadata at once."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1):
+        step = store.list_run_steps(StepRunFilterModel(name="step_2")).items[0]
+        artifact = ArtifactRequestModel(
+            name="extra_output",
+            uri="some/uri/",
+            materializer="some_materializer",
+            data_type="some_data_type",
+            type=ArtifactType.DATA,
+            user=client.active_user.id,
+            workspace=client.active_workspace.id,
+        )
+        completion = StepRunCompletionModel(
+            end_time=step.end_time,
+            output_artifacts={"extra_output": artifact},
+            output_artifact_metadata={
+                "extra_output": client._get_run_metadata_requests(
+                    metadata={"artifact_key": "artifact_value"}
+                )
+            },
+            run_metadata=client._get_run_metadata_requests(
+                metadata={"step_key": "value"}
+            ),
+        )
+
+        completed_step = store.complete_run_step(step.id, completion)
+        try:
+            assert completed_step.status == ExecutionStatus.COMPLETED
+            assert completed_step.metadata["step_key"].value == "value"
+            extra_output = completed_step.output_artifacts["extra_output"]
+            assert (
+                extra_output.metadata["artifact_key"].value == "artifact_value"
+            )
+            assert extra_output.producer_step_run_id == step.id
+        finally:
+            store.delete_artifact(
+                completed_step.output_artifacts["extra_output"].id
+            )
+
+
+def test_get_cached_step_run_returns_latest_completed_step():
+    """Tests getting the cached step run for a cache key."""
+    client = Client()
+    store = client.zen_store
+
+    with PipelineRunContext(1):
+        step = store.list_run_steps(
+            StepRunFilterModel(name="step_2", sort_by="desc:created")
+        ).items[0]
+
+        cached_step_run = store.get_cached_step_run(
+            workspace_id=client.active_workspace.id,
+            cache_key=step.cache_key,
+        )
+        assert cached_step_run is not None
+        cached_step = store.get_run_step(cached_step_run.id)
+        assert cached_step.cache_key == step.cache_key
+        assert cached_step.status == ExecutionStatus.COMPLETED
+        assert cached_step_run.output_artifacts == {
+            name: artifact.id
+            for name, artifact in cached_step.output_artifacts.items()
+        }
+
+        assert (
+            store.get_cached_step_run(
+                workspace_id=client.active_workspace.id,
+                cache_key="not_a_cache_key",
+            )
+            is None
+        )
+
+
+def test_run_status_is_updated_with_step_statuses():
+    """Tests that the store derives the run status from its step runs."""
+    store = Client().zen_store
+
+    with PipelineRunContext(1) as runs:
+        run = store.get_run(runs[0].id)
+        assert run.status == ExecutionStatus.COMPLETED
+        assert run.end_time is not None
+
+        step = store.list_run_steps(
+            StepRunFilterModel(pipeline_run_id=run.id, name="step_2")
+        ).items[0]
+        store.update_run_step(
+            step_run_id=step.id,
+            step_run_update=StepRunUpdateModel(status=ExecutionStatus.FAILED),
+        )
+        assert store.get_run(run.id).status == ExecutionStatus.FAILED
+
+
+def test_get_upstream_step_runs_returns_step_runs_with_outputs():
+    """Tests getting step runs of a pipeline run by their names."""
+    store = Client().zen_store
+
+    with PipelineRunContext(1) as runs:
+        steps = {
+            step.name: step
+            for step in store.list_run_steps(
+                StepRunFilterModel(pipeline_run_id=runs[0].id)
+            ).items
+        }
+
+        upstream_step_runs = store.get_upstream_step_runs(
+            run_id=runs[0].id, step_names=["step_1", "not_a_step"]
+        )
+        assert set(upstream_step_runs) == {"step_1"}
+        upstream_step_run = upstream_step_runs["step_1"]
+        assert upstream_step_run.id == steps["step_1"].id
+        assert upstream_step_run.name == "step_1"
+        assert (
+            upstream_step_run.output_artifacts
+            == steps["step_1"].output_artifacts
+        )
+
+        assert (
+            store.get_upstream_step_runs(run_id=runs[0].id, step_names=[])
+            == {}
+        )
+
+
+def _count_queries(store, func):
+    """Counts the SQL queries that a function sends to a SQL Zen Store."""
+    from sqlalchemy import event
+
+    queries = []
+
+    def _record_query(conn, cursor, statement, *args):
+        queries.append(statement)
+
+    event.listen(store.engine, "before_cursor_execute", _record_query)
+    try:
+        func()
+    finally:
+        event.remove(store.engine, "before_cursor_execute", _record_query)
+    return len(queries)
+
+
+def test_list_run_steps_query_count_does_not_depend_on_page_size():
+    """Tests that listing step runs costs a constant number of queries."""
+    store = Client().zen_store
+    if store.type != StoreType.SQL:
+        pytest.skip("Query counting is only possible for SQL Zen Stores.")
+
+    with PipelineRunContext(3):
+        # The first page of two steps contains steps with and without input
+        # artifacts, so the same kind of queries are needed as for larger
+        # pages.
+        queries_for_two_steps = _count_queries(
+            store, lambda: store.list_run_steps(StepRunFilterModel(size=2))
+        )
+        queries_for_six_steps = _count_queries(
+            store, lambda: store.list_run_steps(StepRunFilterModel(size=6))
+        )
+
+        assert len(store.list_run_steps(StepRunFilterModel(size=6))) == 6
+        assert queries_for_six_steps == queries_for_two_steps
+
+
+def test_list_run_steps_with_cursor_returns_all_steps_once():
+    """Tests paginating step runs using the cursor of each page."""
+    store = Client().zen_store
+
+    with PipelineRunContext(3):
+        all_steps = store.list_run_steps(StepRunFilterModel(size=100))
+
+        page = store.list_run_steps(
+            StepRunFilterModel(size=2, include_total=False)
+        )
+        step_ids = [step.id for step in page.items]
+        while page.next_cursor:
+            page = store.list_run_steps(
+                StepRunFilterModel(
+                    size=2, after=page.next_cursor, include_total=False
+                )
+            )
+            step_ids += [step.id for step in page.items]
+
+        assert step_ids == [step.id for step in all_steps.items]
+
+
+def test_list_run_steps_without_total_reports_seen_items():
+    """Tests that pages without a total only account for seen items."""
+    store = Client().zen_store
+
+    with PipelineRunContext(1):
+        num_steps = store.list_run_steps(StepRunFilterModel()).total
+
+        page = store.list_run_steps(
+            StepRunFilterModel(size=1, include_total=False)
+        )
+        assert page.total == 2
+        assert page.total_pages == 2
+        assert page.next_cursor is not None
+
+        page = store.list_run_steps(
+            StepRunFilterModel(page=num_steps, size=1, include_total=False)
+        )
+        assert page.total == num_steps
+        assert page.total_pages == num_steps
+        assert page.next_cursor is None
+
+
 # .-----------.
 # | Artifacts |
 # '-----------'
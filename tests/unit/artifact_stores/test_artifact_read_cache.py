@@ -0,0 +1,134 @@
+#  Copyright (c) ZenML GmbH 2021. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import os
+from datetime import datetime
+from uuid import uuid4
+
+from zenml.artifact_stores import (
+    LocalArtifactStore,
+    LocalArtifactStoreConfig,
+)
+from zenml.artifact_stores.artifact_read_cache import ArtifactReadCache
+from zenml.enums import StackComponentType
+from zenml.utils import io_utils
+
+
+def _create_artifact(path, size: int = 10) -> str:
+    """Creates an artifact directory with a single file of the given size."""
+    os.makedirs(path)
+    with open(os.path.join(path, "data.bin"), "wb") as f:
+        f.write(b"0" * size)
+    return str(path)
+
+
+def test_read_cache_copies_artifact_once(tmp_path, mocker):
+    """Tests that an artifact is only copied on the first read."""
+    uri = _create_artifact(tmp_path / "artifact")
+    cache = ArtifactReadCache(path=str(tmp_path / "cache"), max_size=1000)
+    copy_dir = mocker.spy(io_utils, "copy_dir")
+    artifact_id = uuid4()
+
+    local_path = cache.get(artifact_id=artifact_id, uri=uri)
+    assert local_path == cache.get(artifact_id=artifact_id, uri=uri)
+
+    assert copy_dir.call_count == 1
+    assert local_path.startswith(str(tmp_path / "cache"))
+    assert os.listdir(local_path) == ["data.bin"]
+
+
+def test_read_cache_keys_entries_by_id_and_uri(tmp_path):
+    """Tests that the same artifact ID with another URI is a new entry."""
+    cache = ArtifactReadCache(path=str(tmp_path / "cache"), max_size=1000)
+    artifact_id = uuid4()
+
+    assert cache.get_entry_path(
+        artifact_id=artifact_id, uri="s3://bucket/a"
+    ) != cache.get_entry_path(artifact_id=artifact_id, uri="s3://bucket/b")
+
+
+def test_read_cache_evicts_least_recently_used_entries(tmp_path):
+    """Tests that the cache evicts the entries that were not read recently."""
+    cache = ArtifactReadCache(path=str(tmp_path / "cache"), max_size=25)
+    artifacts = [
+        (uuid4(), _create_artifact(tmp_path / str(i))) for i in range(3)
+    ]
+
+    first_path = cache.get(*artifacts[0])
+    second_path = cache.get(*artifacts[1])
+    # Mark the first entry as least recently used
+    os.utime(first_path, (0, 0))
+    third_path = cache.get(*artifacts[2])
+
+    assert not os.path.exists(first_path)
+    assert os.path.exists(second_path)
+    assert os.path.exists(third_path)
+
+
+def test_read_cache_copies_single_file_artifacts(tmp_path):
+    """Tests that artifacts which are a single file can be cached."""
+    uri = str(tmp_path / "artifact.txt")
+    with open(uri, "w") as f:
+        f.write("aria")
+    cache = ArtifactReadCache(path=str(tmp_path / "cache"), max_size=1000)
+
+    with open(cache.get(artifact_id=uuid4(), uri=uri)) as f:
+        assert f.read() == "aria"
+
+
+def _get_artifact_store(**config_kwargs) -> LocalArtifactStore:
+    """Creates a local artifact store with the given config."""
+    return LocalArtifactStore(
+        name="",
+        id=uuid4(),
+        config=LocalArtifactStoreConfig(**config_kwargs),
+        flavor="local",
+        type=StackComponentType.ARTIFACT_STORE,
+        user=uuid4(),
+        workspace=uuid4(),
+        created=datetime.now(),
+        updated=datetime.now(),
+    )
+
+
+def test_artifact_store_reads_remote_artifacts_from_cache(tmp_path, mocker):
+    """Tests that the artifact store only uses the cache if configured."""
+    uri = _create_artifact(tmp_path / "artifact")
+    mocker.patch(
+        "zenml.artifact_stores.base_artifact_store.io_utils.is_remote",
+        return_value=True,
+    )
+
+    artifact_store = _get_artifact_store()
+    assert artifact_store.get_local_artifact_uri(uuid4(), uri) == uri
+
+    artifact_store = _get_artifact_store(
+        read_cache_size_mb=1, read_cache_path=str(tmp_path / "cache")
+    )
+    local_uri = artifact_store.get_local_artifact_uri(uuid4(), uri)
+    assert local_uri.startswith(str(tmp_path / "cache"))
+
+
+def test_artifact_store_falls_back_to_uri_if_caching_fails(tmp_path, mocker):
+    """Tests that the original URI is used if caching fails."""
+    mocker.patch(
+        "zenml.artifact_stores.base_artifact_store.io_utils.is_remote",
+        return_value=True,
+    )
+    artifact_store = _get_artifact_store(
+        read_cache_size_mb=1, read_cache_path=str(tmp_path / "cache")
+    )
+    uri = str(tmp_path / "does_not_exist")
+
+    assert artifact_store.get_local_artifact_uri(uuid4(), uri) == uri
+    assert os.listdir(tmp_path / "cache") == []
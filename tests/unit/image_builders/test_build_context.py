@@ -12,8 +12,10 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 import os
+import tarfile
 
 from zenml.image_builders import BuildContext
+from zenml.image_builders import build_context as build_context_module
 
 
 def test_adding_extra_files(tmp_path):
@@ -79,3 +81,105 @@ def test_build_context_includes_and_excludes(tmp_path):
         ".zen",
         os.path.join(".zen", "config.yaml"),
     }
+
+
+def test_build_context_checksum(tmp_path):
+    """Tests that the build context checksum depends on the file contents."""
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "1").write_text("file 1")
+
+    build_context = BuildContext(root=str(root))
+    build_context.add_file("extra file", destination="extra")
+    checksum = build_context.compute_checksum()
+    assert build_context.compute_checksum() == checksum
+
+    (root / "1").write_text("modified file 1")
+    assert build_context.compute_checksum() != checksum
+
+    build_context = BuildContext(root=str(root))
+    build_context.add_file("modified extra file", destination="extra")
+    assert build_context.compute_checksum() != checksum
+
+
+def test_build_context_files_match_docker_exclude_paths(tmp_path):
+    """Tests that the build context files are the same that docker would
+    include for the same dockerignore patterns."""
+    from docker.utils import build as docker_build_utils
+
+    for path in [
+        "a.py",
+        "b.txt",
+        "Dockerfile",
+        "src/c.py",
+        "src/d.txt",
+        "src/nested/e.py",
+        "data/large.csv",
+        "data/keep.csv",
+        "build/artifact",
+        ".git/HEAD",
+    ]:
+        file_path = tmp_path / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(path)
+
+    dockerignore = tmp_path / ".dockerignore"
+    dockerignore.write_text(
+        "\n".join(
+            ["*.txt", "data", "!data/keep.csv", "build/", ".git", "**/e.py"]
+        )
+    )
+
+    build_context = BuildContext(root=str(tmp_path))
+    expected_files = docker_build_utils.exclude_paths(
+        str(tmp_path), patterns=build_context._get_exclude_patterns()
+    )
+    assert build_context._get_files() == expected_files
+    assert "data/keep.csv" in expected_files
+
+
+def test_build_context_checksum_reuses_unchanged_file_hashes(tmp_path, mocker):
+    """Tests that the checksum computation doesn't read unchanged files."""
+    root = tmp_path / "root"
+    root.mkdir()
+    for name in ["1", "2"]:
+        file_path = root / name
+        file_path.write_text(f"file {name}")
+        # Files that were just modified are always hashed again
+        os.utime(file_path, (0, 0))
+
+    checksum = BuildContext(root=str(root)).compute_checksum()
+
+    mock_hash_file = mocker.patch(
+        "zenml.image_builders.build_context._hash_file",
+        side_effect=build_context_module._hash_file,
+    )
+    assert BuildContext(root=str(root)).compute_checksum() == checksum
+    mock_hash_file.assert_not_called()
+
+    (root / "2").write_text("modified file 2")
+    assert BuildContext(root=str(root)).compute_checksum() != checksum
+    mock_hash_file.assert_called_once_with(str(root / "2"))
+
+
+def test_writing_compressed_archive(tmp_path):
+    """Tests that the compressed archive contains all build context files."""
+    root = tmp_path / "root"
+    root.mkdir()
+    (root / "1").write_text("file 1")
+    (root / "large").write_bytes(os.urandom(5 * 1024 * 1024))
+
+    build_context = BuildContext(root=str(root))
+    build_context.add_file("extra file", destination="extra")
+
+    archive_path = tmp_path / "archive.tar.gz"
+    with open(archive_path, "w+b") as f:
+        build_context.write_archive(f, gzip=True)
+
+    with tarfile.open(archive_path, "r:gz") as archive:
+        assert set(archive.getnames()) == {"1", "large", "extra"}
+        assert archive.extractfile("1").read() == b"file 1"
+        assert (
+            archive.extractfile("large").read()
+            == (root / "large").read_bytes()
+        )
@@ -0,0 +1,212 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes import client as k8s_client
+from kubernetes.client.rest import ApiException
+
+from zenml.integrations.kubernetes.orchestrators import kube_utils
+
+
+def _pod(name: str, phase: str, resource_version: str = "1"):
+    """Helper function to create a pod object."""
+    return k8s_client.V1Pod(
+        metadata=k8s_client.V1ObjectMeta(
+            name=name, resource_version=resource_version
+        ),
+        status=k8s_client.V1PodStatus(phase=phase),
+    )
+
+
+class _FakeWatch:
+    """Fake watch that emits the given events once and then blocks."""
+
+    events = []
+
+    def __init__(self):
+        self._stopped = threading.Event()
+
+    def stream(self, func, **kwargs):
+        events, _FakeWatch.events = _FakeWatch.events, []
+        yield from events
+        self._stopped.wait(timeout=1)
+
+    def stop(self):
+        self._stopped.set()
+
+
+@pytest.fixture
+def core_api(mocker):
+    """Fixture for a core API client with a single pending pod."""
+    mocker.patch.object(kube_utils.k8s_watch, "Watch", _FakeWatch)
+    core_api = MagicMock()
+    core_api.list_namespaced_pod.return_value = k8s_client.V1PodList(
+        items=[_pod("pod", "Pending")],
+        metadata=k8s_client.V1ListMeta(resource_version="1"),
+    )
+    return core_api
+
+
+def test_pod_watcher_waits_for_pod_changes(core_api):
+    """Tests that the watcher updates pods with watch events."""
+    _FakeWatch.events = [
+        {"type": "MODIFIED", "object": _pod("pod", "Running", "2")},
+        {"type": "MODIFIED", "object": _pod("pod", "Succeeded", "3")},
+    ]
+
+    with kube_utils.PodWatcher(core_api=core_api, namespace="ns") as watcher:
+        pod = watcher.wait("pod", kube_utils.pod_is_done, timeout_sec=5)
+
+    assert pod.metadata.resource_version == "3"
+    core_api.list_namespaced_pod.assert_called_once_with(namespace="ns")
+    core_api.read_namespaced_pod.assert_not_called()
+
+
+def test_pod_watcher_wait_times_out(core_api):
+    """Tests that waiting for a pod times out."""
+    with kube_utils.PodWatcher(core_api=core_api, namespace="ns") as watcher:
+        with pytest.raises(RuntimeError, match="timed out"):
+            watcher.wait("pod", kube_utils.pod_is_done, timeout_sec=0.1)
+
+
+def test_pod_watcher_falls_back_to_polling_if_watching_fails(core_api, mocker):
+    """Tests that waiting for a pod polls it if the pods can't be watched."""
+    mocker.patch.object(kube_utils, "MAXIMUM_WATCH_FAILURES", 1)
+    mocker.patch.object(kube_utils, "POLLING_INTERVAL", 0.01)
+    core_api.list_namespaced_pod.side_effect = ApiException(
+        status=403, reason="Forbidden"
+    )
+    core_api.read_namespaced_pod.side_effect = [
+        _pod("pod", "Running"),
+        _pod("pod", "Succeeded"),
+    ]
+
+    with kube_utils.PodWatcher(core_api=core_api, namespace="ns") as watcher:
+        pod = watcher.wait("pod", kube_utils.pod_is_done)
+
+    assert pod.status.phase == "Succeeded"
+    assert core_api.read_namespaced_pod.call_count == 2
+
+    core_api.read_namespaced_pod.side_effect = ApiException(
+        status=403, reason="Forbidden"
+    )
+    with kube_utils.PodWatcher(core_api=core_api, namespace="ns") as watcher:
+        with pytest.raises(RuntimeError):
+            watcher.wait("pod", kube_utils.pod_is_done)
+
+
+def test_pod_watcher_polls_pods_concurrently(core_api, mocker):
+    """Tests that waiters poll their pods concurrently if the pods can't be
+    watched."""
+    mocker.patch.object(kube_utils, "MAXIMUM_WATCH_FAILURES", 1)
+    core_api.list_namespaced_pod.side_effect = ApiException(
+        status=403, reason="Forbidden"
+    )
+    num_waiters = 4
+    # All waiters need to poll at the same time to pass the barrier
+    barrier = threading.Barrier(num_waiters, timeout=5)
+
+    def _read_pod(name, namespace):
+        barrier.wait()
+        return _pod(name, "Succeeded")
+
+    core_api.read_namespaced_pod.side_effect = _read_pod
+
+    results = {}
+
+    def _wait(pod_name):
+        try:
+            results[pod_name] = watcher.wait(pod_name, kube_utils.pod_is_done)
+        except Exception as e:
+            results[pod_name] = e
+
+    with kube_utils.PodWatcher(core_api=core_api, namespace="ns") as watcher:
+        threads = [
+            threading.Thread(target=_wait, args=(f"pod-{i}",))
+            for i in range(num_waiters)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+    assert len(results) == num_waiters
+    for pod_name, pod in results.items():
+        assert pod.metadata.name == pod_name
+
+
+def test_wait_pod_raises_if_pod_failed(core_api):
+    """Tests that waiting for a failed pod raises an error."""
+    _FakeWatch.events = [
+        {"type": "MODIFIED", "object": _pod("pod", "Failed", "2")},
+    ]
+
+    with pytest.raises(RuntimeError, match="failed"):
+        kube_utils.wait_pod(
+            core_api=core_api,
+            pod_name="pod",
+            namespace="ns",
+            exit_condition_lambda=kube_utils.pod_is_done,
+            timeout_sec=5,
+        )
+
+    core_api.list_namespaced_pod.assert_called_once_with(
+        namespace="ns", field_selector="metadata.name=pod"
+    )
+
+
+def test_streaming_pod_logs_resumes_after_interruption(mocker):
+    """Tests that interrupted log streams resume without duplicate lines."""
+    mocker.patch.object(kube_utils.time, "sleep")
+    mock_logger = mocker.patch.object(kube_utils, "logger")
+
+    interrupted_response = MagicMock()
+    interrupted_response.stream.side_effect = lambda: _interrupted_stream(
+        [b"2023-01-01T00:00:00.1Z line 1\n2023-01-01T00:00:00.2Z li"]
+    )
+    resumed_response = MagicMock()
+    resumed_response.stream.return_value = [
+        b"2023-01-01T00:00:00.1Z line 1\n",
+        b"2023-01-01T00:00:00.25Z line 2\n2023-01-01T00:00:00.3Z line 3\n",
+    ]
+
+    core_api = MagicMock()
+    core_api.read_namespaced_pod_log.side_effect = [
+        interrupted_response,
+        resumed_response,
+    ]
+    core_api.read_namespaced_pod.side_effect = [
+        _pod("pod", "Running"),
+        _pod("pod", "Succeeded"),
+    ]
+
+    kube_utils.stream_pod_logs(core_api, pod_name="pod", namespace="ns")
+
+    assert [call.args[0] for call in mock_logger.info.call_args_list] == [
+        "line 1",
+        "line 2",
+        "line 3",
+    ]
+    first_call, second_call = core_api.read_namespaced_pod_log.call_args_list
+    assert first_call.kwargs["follow"] is True
+    assert "since_seconds" not in first_call.kwargs
+    assert second_call.kwargs["since_seconds"] > 0
+
+
+def _interrupted_stream(chunks):
+    """Yields the chunks and then fails like a broken connection."""
+    yield from chunks
+    raise ConnectionResetError()
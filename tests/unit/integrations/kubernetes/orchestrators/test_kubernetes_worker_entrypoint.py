@@ -0,0 +1,122 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import io
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+from zenml.integrations.kubernetes.orchestrators import (
+    kubernetes_worker_entrypoint,
+)
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_entrypoint import (
+    EXIT_CODE_PREFIX,
+    HEALTH_PATH,
+    RUN_PATH,
+    WORKER_TOKEN_HEADER,
+    WorkerServer,
+    run_in_forked_process,
+)
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="Workers fork the step processes."
+)
+
+
+def _print_arguments(arguments):
+    print(" ".join(arguments))
+
+
+def _fail(arguments):
+    raise RuntimeError("Step failed.")
+
+
+def test_running_entrypoint_in_forked_process(mocker):
+    """Tests running the entrypoint in a forked process."""
+    mocker.patch.object(
+        kubernetes_worker_entrypoint,
+        "_run_entrypoint",
+        side_effect=_print_arguments,
+    )
+    output = io.BytesIO()
+
+    assert run_in_forked_process(["--step_name", "s"], output=output) == 0
+    assert b"--step_name s" in output.getvalue()
+
+    mocker.patch.object(
+        kubernetes_worker_entrypoint, "_run_entrypoint", side_effect=_fail
+    )
+    output = io.BytesIO()
+
+    assert run_in_forked_process([], output=output) == 1
+    assert b"RuntimeError: Step failed." in output.getvalue()
+
+
+@pytest.mark.parametrize(
+    "exit_argument, exit_code",
+    [((), 0), ((None,), 0), ((0,), 0), ((3,), 3), (("Step failed.",), 1)],
+)
+def test_forked_process_exit_codes(mocker, exit_argument, exit_code):
+    """Tests that `sys.exit(...)` calls get mapped to exit codes like the
+    interpreter does."""
+    mocker.patch.object(
+        kubernetes_worker_entrypoint,
+        "_run_entrypoint",
+        side_effect=lambda arguments: sys.exit(*exit_argument),
+    )
+
+    assert run_in_forked_process([]) == exit_code
+
+
+def test_worker_server(mocker):
+    """Tests the health check and step run endpoints of the worker."""
+    mocker.patch.object(
+        kubernetes_worker_entrypoint,
+        "_run_entrypoint",
+        side_effect=_print_arguments,
+    )
+    server = WorkerServer(("127.0.0.1", 0), token="token")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    try:
+        with urllib.request.urlopen(url + HEALTH_PATH) as response:
+            assert response.status == 200
+
+        request = urllib.request.Request(
+            url + RUN_PATH,
+            data=json.dumps(["--step_name", "s"]).encode(),
+            method="POST",
+        )
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(request)
+        assert e.value.code == 401
+
+        request.add_header(WORKER_TOKEN_HEADER, "wrong_token")
+        with pytest.raises(urllib.error.HTTPError) as e:
+            urllib.request.urlopen(request)
+        assert e.value.code == 401
+
+        request.add_header(WORKER_TOKEN_HEADER, "token")
+        with urllib.request.urlopen(request) as response:
+            lines = response.read().decode().splitlines()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "--step_name s" in lines
+    assert lines[-1] == f"{EXIT_CODE_PREFIX}0"
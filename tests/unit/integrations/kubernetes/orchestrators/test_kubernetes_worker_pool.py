@@ -0,0 +1,129 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes import client as k8s_client
+
+from zenml.integrations.kubernetes.orchestrators import (
+    kubernetes_worker_pool,
+)
+from zenml.integrations.kubernetes.orchestrators.kubernetes_worker_pool import (
+    KubernetesWorker,
+    KubernetesWorkerPool,
+    WorkerUnavailableError,
+)
+
+
+@pytest.fixture
+def worker_pool(mocker):
+    """Fixture for a started worker pool with two ready workers."""
+    mocker.patch.object(
+        kubernetes_worker_pool.kube_utils,
+        "wait_pod",
+        return_value=k8s_client.V1Pod(
+            status=k8s_client.V1PodStatus(pod_ip="10.0.0.1")
+        ),
+    )
+    mocker.patch.object(KubernetesWorker, "is_healthy", return_value=True)
+
+    pool = KubernetesWorkerPool(
+        core_api=MagicMock(),
+        namespace="ns",
+        pod_names=["worker-0", "worker-1"],
+        pod_manifest_factory=MagicMock(),
+        worker_token="token",
+    )
+    pool.start()
+    return pool
+
+
+def test_acquiring_and_releasing_workers(worker_pool):
+    """Tests that acquired workers are only handed out again once they are
+    released."""
+    first_worker = worker_pool.acquire()
+    second_worker = worker_pool.acquire()
+
+    assert {first_worker.pod_name, second_worker.pod_name} == {
+        "worker-0",
+        "worker-1",
+    }
+    assert first_worker.address == "10.0.0.1"
+    assert first_worker.token == "token"
+
+    worker_pool.release(first_worker)
+    assert worker_pool.acquire() is first_worker
+
+
+def test_running_a_step_on_a_worker(mocker, worker_pool):
+    """Tests that steps run on a worker which is released afterwards."""
+    mock_run = mocker.patch.object(KubernetesWorker, "run", return_value=0)
+
+    worker_pool.run_step(["--step_name", "s"])
+
+    mock_run.assert_called_once_with(["--step_name", "s"])
+    assert worker_pool.acquire()
+    assert worker_pool.acquire()
+
+
+def test_running_a_failing_step_on_a_worker(mocker, worker_pool):
+    """Tests that a failing step raises an error but keeps the worker."""
+    mocker.patch.object(KubernetesWorker, "run", return_value=1)
+
+    with pytest.raises(RuntimeError, match="exit code 1"):
+        worker_pool.run_step([])
+
+    assert worker_pool.acquire()
+    assert worker_pool.acquire()
+
+
+def test_unreachable_workers_get_removed(mocker, worker_pool):
+    """Tests that steps are sent to the next worker if a worker is not
+    reachable and that the pool raises an error once no workers are left."""
+    mock_run = mocker.patch.object(
+        KubernetesWorker,
+        "run",
+        side_effect=[WorkerUnavailableError("Unreachable."), 0],
+    )
+
+    worker_pool.run_step([])
+    assert mock_run.call_count == 2
+
+    mock_run.side_effect = WorkerUnavailableError("Unreachable.")
+    with pytest.raises(WorkerUnavailableError, match="No worker pods"):
+        worker_pool.run_step([])
+
+    assert worker_pool.acquire() is None
+
+
+def test_workers_that_fail_to_start_are_not_added(mocker):
+    """Tests that workers which don't start are left out of the pool."""
+    mocker.patch.object(
+        kubernetes_worker_pool.kube_utils,
+        "wait_pod",
+        side_effect=RuntimeError("Pod failed."),
+    )
+
+    pool = KubernetesWorkerPool(
+        core_api=MagicMock(),
+        namespace="ns",
+        pod_names=["worker-0"],
+        pod_manifest_factory=MagicMock(),
+        worker_token="token",
+    )
+    pool.start()
+
+    assert pool.acquire() is None
+    with pytest.raises(WorkerUnavailableError):
+        pool.run_step([])
@@ -0,0 +1,67 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.integrations.integration import (
+    Integration,
+    is_requirement_installed,
+)
+from zenml.integrations.registry import (
+    IntegrationRegistry,
+    integration_registry,
+)
+
+
+def test_requirement_installation_check():
+    """Tests checking whether requirements are installed."""
+    assert is_requirement_installed("pytest")
+    assert is_requirement_installed("pytest>=1.0")
+    assert not is_requirement_installed("pytest<1.0")
+    assert not is_requirement_installed("zenml-non-existent-package")
+    assert not is_requirement_installed("not a valid requirement")
+    # Requirements for other environments don't need to be installed
+    assert is_requirement_installed(
+        "zenml-non-existent-package; python_version < '3'"
+    )
+
+
+def test_integrations_are_only_activated_once(mocker):
+    """Tests that activating integrations repeatedly only activates each
+    installed integration once."""
+
+    class InstalledIntegration(Integration):
+        NAME = "zenml_test_installed_integration"
+        REQUIREMENTS = ["pytest"]
+
+    class MissingIntegration(Integration):
+        NAME = "zenml_test_missing_integration"
+        REQUIREMENTS = ["zenml-non-existent-package"]
+
+    # Integration subclasses register themselves in the global registry
+    integration_registry._integrations.pop(InstalledIntegration.NAME)
+    integration_registry._integrations.pop(MissingIntegration.NAME)
+
+    registry = IntegrationRegistry()
+    registry.register_integration(
+        InstalledIntegration.NAME, InstalledIntegration
+    )
+    registry.register_integration(MissingIntegration.NAME, MissingIntegration)
+
+    installed_activate = mocker.patch.object(InstalledIntegration, "activate")
+    missing_activate = mocker.patch.object(MissingIntegration, "activate")
+
+    registry.activate_integrations()
+    registry.activate_integrations()
+
+    installed_activate.assert_called_once()
+    missing_activate.assert_not_called()
@@ -100,3 +100,23 @@ def test_materializer_with_conflicting_parameter_and_explicit_materializer():
 
     with does_not_raise():
         some_step().configure(output_materializers=MyFirstMaterializer)()
+
+
+def test_integrations_are_activated_lazily(mocker):
+    """Tests that the integrations are only activated once a materializer is
+    requested for a type that is not registered directly."""
+    from zenml.integrations.registry import integration_registry
+    from zenml.materializers.default_materializer_registry import (
+        default_materializer_registry,
+    )
+
+    mock_activate = mocker.patch.object(
+        integration_registry, "activate_integrations"
+    )
+
+    assert default_materializer_registry.is_registered(int)
+    default_materializer_registry[MyFirstType]
+    mock_activate.assert_not_called()
+
+    default_materializer_registry[MyConflictingType]
+    mock_activate.assert_called_once()
@@ -15,7 +15,10 @@
 import numpy as np
 
 from tests.unit.test_general import _test_materializer
-from zenml.materializers.numpy_materializer import NumpyMaterializer
+from zenml.materializers.numpy_materializer import (
+    ChunkedNumpyMaterializer,
+    NumpyMaterializer,
+)
 from zenml.metadata.metadata_types import (
     DType,
 )
@@ -81,3 +84,62 @@ def test_numpy_materializer():
     assert text_metadata["total_words"] == 7
     assert text_metadata["most_common_word"] == "world"
     assert text_metadata["most_common_count"] == 2
+
+
+def test_numpy_materializer_memory_maps_local_arrays(tmp_path):
+    """Tests that local arrays are loaded as copy-on-write memory maps."""
+    array = np.arange(10)
+    materializer = NumpyMaterializer(uri=str(tmp_path))
+    materializer.save(array)
+
+    loaded_array = materializer.load(np.ndarray)
+    assert isinstance(loaded_array, np.memmap)
+    assert np.array_equal(loaded_array, array)
+
+    # Modifying the loaded array does not modify the stored artifact
+    loaded_array[0] = 100
+    assert materializer.load(np.ndarray)[0] == 0
+
+
+def test_numpy_materializer_chunked_statistics(mocker):
+    """Tests that statistics computed in chunks match the numpy results."""
+    mocker.patch(
+        "zenml.materializers.numpy_materializer.STATISTICS_CHUNK_SIZE", 7
+    )
+    array = np.random.default_rng(0).normal(5.0, 3.0, size=(10, 5))
+
+    metadata = NumpyMaterializer(uri="").extract_numeric_metadata(array)
+
+    assert metadata["min"] == array.min()
+    assert metadata["max"] == array.max()
+    assert np.isclose(metadata["mean"], array.mean())
+    assert np.isclose(metadata["std"], array.std())
+    assert "mean" not in NumpyMaterializer(uri="").extract_numeric_metadata(
+        np.array([])
+    )
+
+
+def test_chunked_numpy_materializer(mocker):
+    """Tests the chunked numpy materializer."""
+    mocker.patch(
+        "zenml.materializers.numpy_materializer.STORAGE_CHUNK_SIZE_BYTES", 100
+    )
+    array = np.arange(60, dtype=np.float64).reshape(20, 3)
+
+    def _validate_chunks(artifact_uri: str) -> None:
+        materializer = ChunkedNumpyMaterializer(uri=artifact_uri)
+        chunks = list(materializer.iter_chunks())
+        assert len(chunks) == 5
+        assert np.array_equal(np.concatenate(chunks), array)
+        # The default materializer can load the chunked format as well
+        assert np.array_equal(
+            NumpyMaterializer(uri=artifact_uri).load(np.ndarray), array
+        )
+
+    result = _test_materializer(
+        step_output_type=np.ndarray,
+        materializer_class=ChunkedNumpyMaterializer,
+        step_output=array,
+        validation_function=_validate_chunks,
+    )
+    assert np.array_equal(result, array)
@@ -90,3 +90,31 @@ def test_pandas_materializer_with_index():
         step_output=df_datetime_indexed,
     )
     assert df_datetime_indexed.equals(result)
+
+
+def test_pandas_materializer_column_projection_and_filters(tmp_path):
+    """Tests loading a subset of the columns and rows of a dataframe."""
+    df = pandas.DataFrame(
+        {"a": [1, 2, 3, 4], "b": [5.0, 6.0, 7.0, 8.0], "c": list("wxyz")}
+    )
+    materializer = PandasMaterializer(uri=str(tmp_path))
+    materializer.save(df)
+
+    result = materializer.load_columns(
+        columns=["a", "c"], filters=[("a", ">", 1), ("c", "!=", "z")]
+    )
+    expected = df.loc[[1, 2], ["a", "c"]]
+    assert list(result.columns) == ["a", "c"]
+    assert result.equals(expected)
+
+
+def test_pandas_materializer_metadata(tmp_path):
+    """Tests the metadata extracted by the pandas materializer."""
+    df = pandas.DataFrame({"a": [3, 1, 2], "b": [0.5, -1.5, 2.5]})
+    materializer = PandasMaterializer(uri=str(tmp_path))
+    materializer.save(df)
+
+    metadata = materializer.extract_metadata(df)
+    assert metadata["shape"] == (3, 2)
+    assert metadata["min"] == {"a": 1.0, "b": -1.5}
+    assert metadata["max"] == {"a": 3.0, "b": 2.5}
@@ -245,3 +245,30 @@ def test_string_filter_model():
         filter_class=StrFilter,
         filter_value="a_random_string",
     )
+
+
+@pytest.mark.parametrize(
+    "sort_value",
+    [datetime(2023, 1, 1, 12, 30), uuid.uuid4(), "aria", 5, None],
+)
+def test_pagination_cursor_roundtrip(sort_value: Any):
+    """Test that pagination cursors can be decoded after encoding them."""
+    id = uuid.uuid4()
+    cursor = BaseFilterModel.encode_cursor(sort_value=sort_value, id=id)
+
+    assert BaseFilterModel.decode_cursor(cursor) == (sort_value, id)
+    assert SomeFilterModel(after=cursor).after == cursor
+
+
+def test_filter_model_fails_for_invalid_cursor():
+    """Test that filter model creation fails for an invalid cursor."""
+    with pytest.raises(ValidationError):
+        SomeFilterModel(after="not_a_cursor")
+
+
+def test_pagination_fields_are_no_filters():
+    """Test that the pagination fields are not converted to filters."""
+    cursor = BaseFilterModel.encode_cursor(sort_value=1, id=uuid.uuid4())
+    filter_model = SomeFilterModel(after=cursor, include_total=False)
+
+    assert filter_model.list_of_filters == []
@@ -12,8 +12,14 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import os
+import threading
+
 from zenml.enums import StackComponentType
+from zenml.environment import Environment
 from zenml.orchestrators import LocalOrchestratorFlavor
+from zenml.post_execution import get_unlisted_runs
+from zenml.steps import step
 
 
 def test_local_orchestrator_flavor_attributes():
@@ -23,3 +29,86 @@ def test_local_orchestrator_flavor_attributes():
     flavor = LocalOrchestratorFlavor()
     assert flavor.type == StackComponentType.ORCHESTRATOR
     assert flavor.name == "local"
+
+
+# Both steps need to wait for each other, which would time out if the steps
+# were running sequentially.
+_barrier = threading.Barrier(2, timeout=30)
+_step_names = []
+
+
+@step(enable_cache=False)
+def _concurrent_step_1() -> None:
+    _barrier.wait()
+    _step_names.append(Environment().step_environment.step_name)
+
+
+@step(enable_cache=False)
+def _concurrent_step_2() -> None:
+    _barrier.wait()
+    _step_names.append(Environment().step_environment.step_name)
+
+
+def test_local_orchestrator_runs_independent_steps_concurrently(
+    clean_client, unconnected_two_step_pipeline
+):
+    """Tests that the local orchestrator runs independent steps concurrently
+    if `max_concurrency` is configured."""
+    clean_client.create_stack_component(
+        name="concurrent_orchestrator",
+        flavor="local",
+        component_type=StackComponentType.ORCHESTRATOR,
+        configuration={"max_concurrency": 2},
+    )
+    clean_client.create_stack(
+        name="concurrent_stack",
+        components={
+            StackComponentType.ORCHESTRATOR: "concurrent_orchestrator",
+            StackComponentType.ARTIFACT_STORE: "default",
+        },
+    )
+    clean_client.activate_stack("concurrent_stack")
+
+    unconnected_two_step_pipeline(
+        _concurrent_step_1(), _concurrent_step_2()
+    ).run(unlisted=True)
+
+    assert sorted(_step_names) == ["step_1", "step_2"]
+    assert not Environment().step_is_running
+
+
+@step(enable_cache=False)
+def _process_id_step() -> int:
+    return os.getpid()
+
+
+def test_local_orchestrator_runs_steps_in_worker_processes(
+    clean_client, unconnected_two_step_pipeline
+):
+    """Tests that the local orchestrator runs steps in worker processes if
+    `use_processes` is configured."""
+    clean_client.create_stack_component(
+        name="process_orchestrator",
+        flavor="local",
+        component_type=StackComponentType.ORCHESTRATOR,
+        configuration={"max_concurrency": 2, "use_processes": True},
+    )
+    clean_client.create_stack(
+        name="process_stack",
+        components={
+            StackComponentType.ORCHESTRATOR: "process_orchestrator",
+            StackComponentType.ARTIFACT_STORE: "default",
+        },
+    )
+    clean_client.activate_stack("process_stack")
+
+    unconnected_two_step_pipeline(
+        _process_id_step().configure(name="process_id_step_1"),
+        _process_id_step().configure(name="process_id_step_2"),
+    ).run(unlisted=True)
+
+    run = get_unlisted_runs()[0]
+    process_ids = {
+        run.get_step(name).output.read() for name in ("step_1", "step_2")
+    }
+    assert os.getpid() not in process_ids
@@ -12,10 +12,20 @@
 #  or implied. See the License for the specific language governing
 #  permissions and limitations under the License.
 
+import threading
+import time
 from contextlib import ExitStack as does_not_raise
 from typing import Dict, List
 
-from zenml.orchestrators.dag_runner import ThreadedDagRunner, reverse_dag
+import pytest
+
+from zenml.orchestrators import dag_runner
+from zenml.orchestrators.dag_runner import (
+    NodeStatus,
+    ThreadedDagRunner,
+    get_critical_path,
+    reverse_dag,
+)
 
 
 def test_reverse_dag():
@@ -68,3 +78,118 @@ def test_dag_runner_multi_path():  # 3->(2, 5)->1
 def test_dag_runner_cyclic():
     """Test that nothing happens for cyclic graphs, and no error is raised."""
     _test_runner({1: [2], 2: [1]}, correct_results=[0])
+
+
+def test_get_critical_path():
+    """Test `dag_runner.get_critical_path()`."""
+    assert get_critical_path({}) == (0, [])
+
+    # 3->(2, 5)->1
+    dag = {1: [2, 5], 2: [3], 3: [], 5: [3]}
+    assert get_critical_path(dag, node_weights={2: 10}) == (12, [3, 2, 1])
+    assert get_critical_path(dag, node_weights={5: 10}) == (12, [3, 5, 1])
+
+
+def test_get_critical_path_ignores_cycles():
+    """Test that nodes which are part of a cycle are ignored."""
+    assert get_critical_path({1: [2], 2: [1], 3: []}) == (1, [3])
+
+
+def test_dag_runner_respects_max_parallelism():
+    """Test that no more than `max_parallelism` nodes run at the same time."""
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def run_fn(node):
+        with lock:
+            running.append(node)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(node)
+
+    dag = {node: [] for node in range(20)}
+    ThreadedDagRunner(dag, run_fn, max_parallelism=3).run()
+    assert max(max_running) <= 3
+
+
+def test_dag_runner_limits_parallelism_by_default(mocker):
+    """Test that wide DAGs don't run all nodes at the same time by default."""
+    mocker.patch.object(dag_runner, "DEFAULT_MAX_PARALLELISM", 2)
+    lock = threading.Lock()
+    running = []
+    max_running = []
+
+    def run_fn(node):
+        with lock:
+            running.append(node)
+            max_running.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(node)
+
+    dag = {node: [] for node in range(20)}
+    ThreadedDagRunner(dag, run_fn).run()
+    assert max(max_running) <= 2
+
+
+def test_dag_runner_with_invalid_max_parallelism():
+    """Test that a non-positive `max_parallelism` is rejected."""
+    with pytest.raises(ValueError):
+        ThreadedDagRunner({1: []}, lambda node: None, max_parallelism=0)
+
+
+def test_dag_runner_prioritizes_critical_path():
+    """Test that nodes on the longest remaining path are started first."""
+    started = []
+    # 1->2->3 and 4, 5 independent.
+    dag = {1: [], 2: [1], 3: [2], 4: [], 5: []}
+    ThreadedDagRunner(dag, started.append, max_parallelism=1).run()
+    assert started[0] == 1
+
+
+def _failing_run_fn(executed):
+    def run_fn(node):
+        executed.append(node)
+        if node == 2:
+            raise ValueError("Node failed.")
+
+    return run_fn
+
+
+def test_dag_runner_propagates_exceptions():
+    """Test that exceptions of `run_fn` are raised and downstream nodes are
+    skipped."""
+    executed = []
+    # 1->2->3 and 4
+    dag = {1: [], 2: [1], 3: [2], 4: []}
+    runner = ThreadedDagRunner(
+        dag, _failing_run_fn(executed), max_parallelism=1, fail_fast=False
+    )
+    with pytest.raises(ValueError):
+        runner.run()
+
+    assert 3 not in executed
+    assert 4 in executed
+    assert runner.node_states[2] == NodeStatus.FAILED
+    assert runner.node_states[3] == NodeStatus.SKIPPED
+    assert runner.node_states[4] == NodeStatus.COMPLETED
+
+
+def test_dag_runner_fail_fast():
+    """Test that no new nodes are started after a failure in fail-fast
+    mode."""
+    executed = []
+    # 1->2->3 and 4->5
+    dag = {1: [], 2: [1], 3: [2], 4: [1], 5: [4]}
+    runner = ThreadedDagRunner(
+        dag, _failing_run_fn(executed), max_parallelism=1, fail_fast=True
+    )
+    with pytest.raises(ValueError):
+        runner.run()
+
+    assert executed == [1, 2]
+    assert runner.node_states[3] == NodeStatus.SKIPPED
+    assert runner.node_states[4] == NodeStatus.SKIPPED
+    assert runner.node_states[5] == NodeStatus.SKIPPED
@@ -18,11 +18,16 @@ import pytest
 
 from zenml.config.step_configurations import Step
 from zenml.exceptions import InputResolutionError
-from zenml.models.page_model import Page
+from zenml.models import UpstreamStepRunModel
 from zenml.orchestrators import input_utils
 
 
-def test_input_resolution(mocker, sample_artifact_model, create_step_run):
+def test_input_resolution(
+    mocker,
+    sample_artifact_model,
+    create_step_run,
+    sample_deployment_response_model,
+):
     """Tests that input resolution works if the correct models exist in the
     zen store."""
     step_run = create_step_run(
@@ -31,10 +36,14 @@ def test_input_resolution(mocker, sample_artifact_model, create_step_run):
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_upstream_step_runs",
+        return_value={
+            "upstream_step": UpstreamStepRunModel(
+                id=step_run.id,
+                name="upstream_step",
+                output_artifacts=step_run.output_artifacts,
+            )
+        },
     )
     step = Step.parse_obj(
         {
@@ -53,19 +62,21 @@ def test_input_resolution(mocker, sample_artifact_model, create_step_run):
     )
 
     input_artifacts, parent_ids = input_utils.resolve_step_inputs(
-        step=step, run_id=uuid4()
+        step=step,
+        run_id=uuid4(),
+        deployment=sample_deployment_response_model,
     )
     assert input_artifacts == {"input_name": sample_artifact_model}
     assert parent_ids == [step_run.id]
 
 
-def test_input_resolution_with_missing_step_run(mocker):
+def test_input_resolution_with_missing_step_run(
+    mocker, sample_deployment_response_model
+):
     """Tests that input resolution fails if the upstream step run is missing."""
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=0, items=[]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_upstream_step_runs",
+        return_value={},
     )
     step = Step.parse_obj(
         {
@@ -84,10 +95,16 @@ def test_input_resolution_with_missing_step_run(mocker):
     )
 
     with pytest.raises(InputResolutionError):
-        input_utils.resolve_step_inputs(step=step, run_id=uuid4())
+        input_utils.resolve_step_inputs(
+            step=step,
+            run_id=uuid4(),
+            deployment=sample_deployment_response_model,
+        )
 
 
-def test_input_resolution_with_missing_artifact(mocker, create_step_run):
+def test_input_resolution_with_missing_artifact(
+    mocker, create_step_run, sample_deployment_response_model
+):
     """Tests that input resolution fails if the upstream step run output
     artifact is missing."""
     step_run = create_step_run(
@@ -95,10 +112,14 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
     )
 
     mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=1, items=[step_run]
-        ),
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.get_upstream_step_runs",
+        return_value={
+            "upstream_step": UpstreamStepRunModel(
+                id=step_run.id,
+                name="upstream_step",
+                output_artifacts=step_run.output_artifacts,
+            )
+        },
     )
     step = Step.parse_obj(
         {
@@ -117,4 +138,8 @@ def test_input_resolution_with_missing_artifact(mocker, create_step_run):
     )
 
     with pytest.raises(InputResolutionError):
-        input_utils.resolve_step_inputs(step=step, run_id=uuid4())
+        input_utils.resolve_step_inputs(
+            step=step,
+            run_id=uuid4(),
+            deployment=sample_deployment_response_model,
+        )
@@ -14,11 +14,8 @@
 
 from uuid import UUID, uuid4
 
-import pytest
-
 from zenml.enums import ArtifactType, ExecutionStatus
 from zenml.models.artifact_models import ArtifactRequestModel
-from zenml.models.page_model import Page
 from zenml.orchestrators import publish_utils
 
 
@@ -76,24 +73,45 @@ def test_publish_output_artifacts(clean_client):
     assert isinstance(return_val["arias_model"], UUID)
 
 
-def test_publishing_a_successful_step_run(mocker):
+def test_publishing_a_successful_step_run(mocker, clean_client):
     """Tests publishing a successful step run."""
-    mock_update_run_step = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.update_run_step",
+    mock_complete_run_step = mocker.patch(
+        "zenml.zen_stores.sql_zen_store.SqlZenStore.complete_run_step",
     )
 
     step_run_id = uuid4()
-    output_artifact_ids = {"output_name": uuid4()}
+    stack_component_id = uuid4()
+    output_artifact = ArtifactRequestModel(
+        uri="some/uri/abc/",
+        materializer="some_materializer",
+        data_type="np.ndarray",
+        type=ArtifactType.DATA,
+        name="some_name",
+        user=clean_client.active_user.id,
+        workspace=clean_client.active_workspace.id,
+    )
 
     publish_utils.publish_successful_step_run(
-        step_run_id=step_run_id, output_artifact_ids=output_artifact_ids
+        step_run_id=step_run_id,
+        output_artifacts={"output_name": output_artifact},
+        output_artifact_metadata={
+            "output_name": {"key": "value", "key_2": "value_2"}
+        },
+        step_run_metadata={stack_component_id: {"pi": 3.14}},
     )
-    _, call_kwargs = mock_update_run_step.call_args
+    mock_complete_run_step.assert_called_once()
+    _, call_kwargs = mock_complete_run_step.call_args
     assert call_kwargs["step_run_id"] == step_run_id
-    assert (
-        call_kwargs["step_run_update"].output_artifacts == output_artifact_ids
-    )
-    assert call_kwargs["step_run_update"].status == ExecutionStatus.COMPLETED
+
+    completion = call_kwargs["step_run_completion"]
+    assert completion.output_artifacts == {"output_name": output_artifact}
+    assert {
+        metadata.key
+        for metadata in completion.output_artifact_metadata["output_name"]
+    } == {"key", "key_2"}
+    assert len(completion.run_metadata) == 1
+    assert completion.run_metadata[0].step_run_id == step_run_id
+    assert completion.run_metadata[0].stack_component_id == stack_component_id
 
 
 def test_publishing_a_failed_step_run(mocker):
@@ -124,78 +142,6 @@ def test_publishing_a_failed_pipeline_run(mocker):
     assert call_kwargs["run_update"].status == ExecutionStatus.FAILED
 
 
-@pytest.mark.parametrize(
-    "step_statuses, num_steps, expected_run_status",
-    [
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.FAILED],
-            2,
-            ExecutionStatus.FAILED,
-        ),
-        ([ExecutionStatus.COMPLETED], 2, ExecutionStatus.RUNNING),
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.RUNNING],
-            2,
-            ExecutionStatus.RUNNING,
-        ),
-        (
-            [ExecutionStatus.COMPLETED, ExecutionStatus.COMPLETED],
-            2,
-            ExecutionStatus.COMPLETED,
-        ),
-    ],
-)
-def test_pipeline_run_status_computation(
-    step_statuses, num_steps, expected_run_status
-):
-    """Tests computing a pipeline run status from step statuses."""
-    assert (
-        publish_utils.get_pipeline_run_status(
-            step_statuses=step_statuses, num_steps=num_steps
-        )
-        == expected_run_status
-    )
-
-
-@pytest.mark.parametrize(
-    "old_status, new_status",
-    [
-        (ExecutionStatus.RUNNING, ExecutionStatus.RUNNING),
-        (ExecutionStatus.RUNNING, ExecutionStatus.COMPLETED),
-        (ExecutionStatus.RUNNING, ExecutionStatus.FAILED),
-        (ExecutionStatus.RUNNING, ExecutionStatus.CACHED),
-    ],
-)
-def test_updating_the_pipeline_run_status(
-    mocker, sample_pipeline_run_model, old_status, new_status
-):
-    """Tests updating the status of a pipeline run."""
-    mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.list_run_steps",
-        return_value=Page(
-            index=1, max_size=50, total_pages=1, total=0, items=[]
-        ),
-    )
-    mocker.patch(
-        "zenml.orchestrators.publish_utils.get_pipeline_run_status",
-        return_value=new_status,
-    )
-
-    mock_update_run = mocker.patch(
-        "zenml.zen_stores.sql_zen_store.SqlZenStore.update_run",
-    )
-
-    sample_pipeline_run_model.status = old_status
-    publish_utils.update_pipeline_run_status(sample_pipeline_run_model)
-
-    if old_status == new_status:
-        mock_update_run.assert_not_called()
-    else:
-        _, call_kwargs = mock_update_run.call_args
-        call_kwargs["run_id"] == sample_pipeline_run_model.id
-        call_kwargs["run_update"].status == new_status
-
-
 def test_publish_output_artifact_metadata(mocker):
     """Unit test for `publish_output_artifact_metadata`."""
     mock_create_run = mocker.patch(
@@ -0,0 +1,93 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from uuid import uuid4
+
+import pytest
+
+from zenml.client import Client
+from zenml.constants import ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH
+from zenml.models import PipelineDeploymentRequestModel
+from zenml.orchestrators import snapshot_utils
+
+
+@pytest.fixture
+def deployment(clean_client):
+    """Fixture to create a deployment for the active stack."""
+    request = PipelineDeploymentRequestModel(
+        user=clean_client.active_user.id,
+        workspace=clean_client.active_workspace.id,
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline"},
+        stack=clean_client.active_stack.id,
+    )
+    return clean_client.zen_store.create_deployment(request)
+
+
+@pytest.fixture
+def snapshot_path(deployment, tmp_path, monkeypatch):
+    """Fixture to write a snapshot of the deployment to a local file."""
+    snapshot = snapshot_utils.create_deployment_snapshot(deployment)
+    path = tmp_path / "snapshot.json.gz"
+    path.write_bytes(snapshot_utils.serialize_deployment_snapshot(snapshot))
+    monkeypatch.setenv(ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH, str(path))
+    return path
+
+
+def test_snapshot_serialization_round_trip(deployment):
+    """Tests that a snapshot can be serialized and deserialized."""
+    snapshot = snapshot_utils.create_deployment_snapshot(deployment)
+
+    assert {flavor.name for flavor in snapshot.flavors} == {
+        component.flavor
+        for components in deployment.stack.components.values()
+        for component in components
+    }
+    assert (
+        snapshot_utils.deserialize_deployment_snapshot(
+            snapshot_utils.serialize_deployment_snapshot(snapshot)
+        )
+        == snapshot
+    )
+
+
+def test_loading_snapshot_without_path_configured(deployment, monkeypatch):
+    """Tests that no snapshot is loaded if no path is configured."""
+    monkeypatch.delenv(ENV_ZENML_DEPLOYMENT_SNAPSHOT_PATH, raising=False)
+
+    assert snapshot_utils.load_deployment_snapshot(deployment.id) is None
+
+
+def test_loading_snapshot_from_file(deployment, snapshot_path, mocker):
+    """Tests that the stack is built from a loaded snapshot."""
+    snapshot = snapshot_utils.load_deployment_snapshot(deployment.id)
+    assert snapshot.deployment == deployment
+
+    mock_get_stack = mocker.patch.object(Client, "get_stack")
+    mock_list_flavors = mocker.patch.object(Client, "list_flavors")
+    Client().active_stack
+
+    mock_get_stack.assert_not_called()
+    mock_list_flavors.assert_not_called()
+
+
+def test_loading_snapshot_for_other_deployment(deployment, snapshot_path):
+    """Tests that snapshots of other deployments are ignored."""
+    assert snapshot_utils.load_deployment_snapshot(uuid4()) is None
+
+
+def test_loading_invalid_snapshot(deployment, snapshot_path):
+    """Tests that invalid snapshot files are ignored."""
+    snapshot_path.write_bytes(b"not a snapshot")
+
+    assert snapshot_utils.load_deployment_snapshot(deployment.id) is None
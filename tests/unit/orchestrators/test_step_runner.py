@@ -41,9 +41,8 @@ def test_running_a_successful_step(mocker, local_stack):
     and correctly prepares/cleans up."""
     mock_prepare_step_run = mocker.patch.object(Stack, "prepare_step_run")
     mock_cleanup_step_run = mocker.patch.object(Stack, "cleanup_step_run")
-    mock_publish_output_artifacts = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_output_artifacts",
-        return_value={},
+    mock_publish_step_run_metadata = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_step_run_metadata"
     )
     mock_publish_successful_step_run = mocker.patch(
         "zenml.orchestrators.step_runner.publish_successful_step_run"
@@ -86,7 +85,7 @@ def test_running_a_successful_step(mocker, local_stack):
     mock_cleanup_step_run.assert_called_with(
         info=step_run_info, step_failed=False
     )
-    mock_publish_output_artifacts.assert_called_once()
+    mock_publish_step_run_metadata.assert_not_called()
     mock_publish_successful_step_run.assert_called_once()
     if sys.version_info >= (3, 8):
         mock_entrypoint.assert_called_once()
@@ -98,9 +97,8 @@ def test_running_a_failing_step(mocker, local_stack):
 
     mock_prepare_step_run = mocker.patch.object(Stack, "prepare_step_run")
     mock_cleanup_step_run = mocker.patch.object(Stack, "cleanup_step_run")
-    mock_publish_output_artifacts = mocker.patch(
-        "zenml.orchestrators.step_runner.publish_output_artifacts",
-        return_value={},
+    mock_publish_step_run_metadata = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_step_run_metadata"
     )
     mock_publish_successful_step_run = mocker.patch(
         "zenml.orchestrators.step_runner.publish_successful_step_run"
@@ -139,7 +137,57 @@ def test_running_a_failing_step(mocker, local_stack):
     mock_cleanup_step_run.assert_called_with(
         info=step_run_info, step_failed=True
     )
-    mock_publish_output_artifacts.assert_not_called()
+    mock_publish_step_run_metadata.assert_called_once()
+    mock_publish_successful_step_run.assert_not_called()
+
+
+def test_step_run_metadata_is_published_if_storing_outputs_fails(
+    mocker, local_stack
+):
+    """Tests that the step run metadata is published if the step entrypoint
+    succeeded but storing its outputs failed."""
+    mocker.patch.object(Stack, "prepare_step_run")
+    mocker.patch.object(Stack, "cleanup_step_run")
+    mocker.patch.object(
+        StepRunner, "_store_output_artifacts", side_effect=RuntimeError()
+    )
+    mock_publish_step_run_metadata = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_step_run_metadata"
+    )
+    mock_publish_successful_step_run = mocker.patch(
+        "zenml.orchestrators.step_runner.publish_successful_step_run"
+    )
+
+    step = Step.parse_obj(
+        {
+            "spec": {
+                "source": "tests.unit.orchestrators.test_step_runner.successful_step",
+                "upstream_steps": [],
+            },
+            "config": {
+                "name": "step_name",
+            },
+        }
+    )
+    pipeline_config = PipelineConfiguration(name="pipeline_name")
+    step_run_info = StepRunInfo(
+        step_run_id=uuid4(),
+        run_id=uuid4(),
+        run_name="run_name",
+        pipeline_step_name="step_name",
+        config=step.config,
+        pipeline=pipeline_config,
+    )
+
+    runner = StepRunner(step=step, stack=local_stack)
+    with pytest.raises(RuntimeError):
+        runner.run(
+            input_artifacts={},
+            output_artifact_uris={},
+            step_run_info=step_run_info,
+        )
+
+    mock_publish_step_run_metadata.assert_called_once()
     mock_publish_successful_step_run.assert_not_called()
 
 
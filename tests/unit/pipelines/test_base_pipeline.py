@@ -1022,6 +1022,45 @@ def test_building_with_different_keys_and_identical_settings(
     mock_build_docker_image.assert_called_once()
 
 
+def test_build_is_reused_for_identical_contents(
+    clean_client, mocker, empty_pipeline
+):
+    """Tests that a build with identical contents is reused instead of
+    building the images again."""
+    build_config = BuildConfiguration(
+        key="key", settings=DockerSettings(copy_files=False)
+    )
+    mocker.patch.object(
+        Stack, "get_docker_builds", return_value=[build_config]
+    )
+    mock_build_docker_image = mocker.patch.object(
+        PipelineDockerImageBuilder,
+        "build_docker_image",
+        return_value="image_name",
+    )
+    mocker.patch("zenml.utils.docker_utils.is_local_image", return_value=True)
+
+    deployment = PipelineDeploymentBaseModel(
+        run_name_template="",
+        pipeline_configuration={"name": "pipeline"},
+        step_configurations={},
+    )
+
+    build = empty_pipeline()._build(deployment=deployment)
+    assert build.checksum
+    mock_build_docker_image.assert_called_once()
+
+    reused_build = empty_pipeline()._build(deployment=deployment)
+    assert reused_build.id == build.id
+    mock_build_docker_image.assert_called_once()
+
+    build_config.extra_files["new_file"] = "new file content"
+    new_build = empty_pipeline()._build(deployment=deployment)
+    assert new_build.id != build.id
+    assert new_build.checksum != build.checksum
+    assert mock_build_docker_image.call_count == 2
+
+
 def test_stack_with_container_registry_creates_non_local_build(
     clean_client, mocker, empty_pipeline, remote_container_registry
 ):
@@ -0,0 +1,45 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from zenml.client import Client
+from zenml.io import fileio
+from zenml.utils import code_utils, source_utils
+
+
+def test_uploading_and_downloading_code(clean_client, tmp_path):
+    """Tests uploading code to the artifact store and downloading it again."""
+    source_root = tmp_path / "source"
+    source_root.mkdir()
+    (source_root / "run.py").write_text("print('run')")
+    (source_root / "ignored.txt").write_text("ignored")
+    (source_root / ".dockerignore").write_text("ignored.txt")
+
+    artifact_store = Client().active_stack.artifact_store
+    source_utils.set_custom_source_root(str(source_root))
+    try:
+        code_path = code_utils.upload_code(artifact_store=artifact_store)
+        assert fileio.exists(code_path)
+        assert code_path.startswith(artifact_store.path)
+
+        # Uploading the same files again reuses the existing archive
+        assert code_utils.upload_code(artifact_store=artifact_store) == (
+            code_path
+        )
+    finally:
+        source_utils.set_custom_source_root(None)
+
+    extract_dir = tmp_path / "extracted"
+    code_utils.download_code(code_path, extract_dir=str(extract_dir))
+    assert (extract_dir / "run.py").read_text() == "print('run')"
+    assert not (extract_dir / "ignored.txt").exists()
@@ -304,3 +304,53 @@ def test_get_parent_gets_the_parent_directory(tmp_path) -> None:
     )
     parent = io_utils.get_parent(os.path.join(tmp_path, "new_dir/new_dir2"))
     assert parent == "new_dir"
+
+
+def _create_artifact(path) -> str:
+    """Creates an artifact directory with a single file."""
+    os.makedirs(path)
+    with open(os.path.join(path, "data.bin"), "wb") as f:
+        f.write(b"0" * 10)
+    return str(path)
+
+
+def test_local_view_uses_local_paths_without_copying(tmp_path):
+    """Tests that local paths are used as they are."""
+    uri = _create_artifact(tmp_path / "artifact")
+
+    with io_utils.local_view(uri) as view:
+        assert view.path == uri
+
+
+def test_local_view_downloads_remote_paths_temporarily(tmp_path, mocker):
+    """Tests that remote paths are downloaded and deleted afterwards."""
+    uri = _create_artifact(tmp_path / "artifact")
+    os.makedirs(tmp_path / "artifact" / "nested")
+    with open(tmp_path / "artifact" / "nested" / "file.txt", "w") as f:
+        f.write("aria")
+    mocker.patch("zenml.utils.io_utils.is_remote", return_value=True)
+
+    with io_utils.local_view(uri) as view:
+        assert view.path != uri
+        assert sorted(os.listdir(view.path)) == ["data.bin", "nested"]
+        with open(os.path.join(view.path, "nested", "file.txt")) as f:
+            assert f.read() == "aria"
+
+    assert not os.path.exists(view.path)
+
+
+def test_local_view_can_be_kept_alive_with_lazy_objects(tmp_path, mocker):
+    """Tests that the local copy is kept until the object is collected."""
+    uri = _create_artifact(tmp_path / "artifact")
+    mocker.patch("zenml.utils.io_utils.is_remote", return_value=True)
+
+    class LazyObject:
+        pass
+
+    lazy_object = LazyObject()
+    with io_utils.local_view(uri) as view:
+        view.keep_alive_with(lazy_object)
+
+    assert os.path.exists(view.path)
+    del lazy_object
+    assert not os.path.exists(view.path)
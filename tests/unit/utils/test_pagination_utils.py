@@ -0,0 +1,74 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+from unittest.mock import MagicMock, call
+
+from zenml.models.page_model import Page
+from zenml.utils.pagination_utils import depaginate
+
+
+def test_depaginate_uses_page_numbers_without_cursor(
+    sample_build_response_model,
+):
+    """Tests that pages without cursor are fetched by their page number."""
+    list_method = MagicMock(
+        side_effect=[
+            Page(
+                index=1,
+                max_size=1,
+                total_pages=2,
+                total=2,
+                items=[sample_build_response_model],
+            ),
+            Page(
+                index=2,
+                max_size=1,
+                total_pages=2,
+                total=2,
+                items=[sample_build_response_model],
+            ),
+        ]
+    )
+
+    assert len(depaginate(list_method)) == 2
+    assert list_method.call_args_list == [call(), call(page=2)]
+
+
+def test_depaginate_uses_cursor(sample_build_response_model):
+    """Tests that the cursor of a page is used to fetch the next page."""
+    list_method = MagicMock(
+        side_effect=[
+            Page(
+                index=1,
+                max_size=1,
+                total_pages=2,
+                total=2,
+                items=[sample_build_response_model],
+                next_cursor="cursor",
+            ),
+            Page(
+                index=2,
+                max_size=1,
+                total_pages=2,
+                total=2,
+                items=[sample_build_response_model],
+            ),
+        ]
+    )
+
+    assert len(depaginate(list_method)) == 2
+    assert list_method.call_args_list == [
+        call(),
+        call(page=2, after="cursor", include_total=False),
+    ]
@@ -16,6 +16,7 @@ from pathlib import Path
 
 from zenml.client import Client
 from zenml.config import DockerSettings
+from zenml.image_builders import BuildContext
 from zenml.integrations.sklearn import SKLEARN, SklearnIntegration
 from zenml.utils.pipeline_docker_image_builder import (
     PipelineDockerImageBuilder,
@@ -119,3 +120,80 @@ def test_build_skipping():
     assert PipelineDockerImageBuilder().build_docker_image(
         docker_settings=settings, tag="tag", stack=Client().active_stack
     )
+
+
+def test_build_checksum_depends_on_file_contents(local_stack, tmp_path):
+    """Tests that the build checksum changes when the contents of a file in
+    the build context change, even if the settings stay the same."""
+    requirements_file = tmp_path / "requirements.txt"
+    requirements_file.write_text("numpy")
+    source_file = tmp_path / "source.py"
+    source_file.write_text("print('1')")
+
+    settings = DockerSettings(
+        requirements=str(requirements_file), copy_files=False
+    )
+    image_builder = PipelineDockerImageBuilder()
+
+    def _compute_checksum() -> str:
+        return image_builder.compute_build_checksum(
+            docker_settings=settings,
+            tag="tag",
+            stack=local_stack,
+            extra_files={"source.py": str(source_file)},
+        )
+
+    checksum = _compute_checksum()
+    assert _compute_checksum() == checksum
+
+    source_file.write_text("print('2')")
+    new_checksum = _compute_checksum()
+    assert new_checksum != checksum
+
+    requirements_file.write_text("pandas")
+    assert _compute_checksum() not in {checksum, new_checksum}
+
+
+def test_dependencies_are_installed_in_separate_image(mocker):
+    """Tests that requirements are installed in a dependency image that is
+    reused as long as the dependencies don't change."""
+    mocker.patch(
+        "zenml.utils.docker_utils.image_exists", side_effect=[False, True]
+    )
+    stack = mocker.MagicMock(container_registry=None, apt_packages=[])
+    stack.requirements.return_value = set()
+    image_builder = stack.image_builder
+    image_builder.is_building_locally = True
+    image_builder.build_context_class = BuildContext
+    image_builder.build.side_effect = lambda image_name, **kwargs: image_name
+
+    settings = DockerSettings(
+        requirements=["numpy"],
+        copy_files=False,
+        copy_global_config=False,
+    )
+    PipelineDockerImageBuilder().build_docker_image(
+        docker_settings=settings, tag="tag", stack=stack
+    )
+
+    assert image_builder.build.call_count == 2
+    dependency_build, code_build = image_builder.build.call_args_list
+    dependency_image = dependency_build.kwargs["image_name"]
+    assert dependency_image.startswith("zenml:dependencies-")
+    dependency_dockerfile = dict(
+        dependency_build.kwargs["build_context"]._get_extra_files()
+    )["Dockerfile"]
+    assert "pip install" in dependency_dockerfile
+
+    code_dockerfile = dict(
+        code_build.kwargs["build_context"]._get_extra_files()
+    )["Dockerfile"]
+    assert code_dockerfile.startswith(f"FROM {dependency_image}")
+    assert "pip install" not in code_dockerfile
+
+    # The dependency image exists now and doesn't need to be built again
+    PipelineDockerImageBuilder().build_docker_image(
+        docker_settings=settings, tag="tag", stack=stack
+    )
+    assert image_builder.build.call_count == 3
+    assert image_builder.build.call_args.kwargs["image_name"] == "zenml:tag"
@@ -0,0 +1,97 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+
+import math
+from unittest.mock import MagicMock
+
+from zenml.utils.ttl_cache import TTLCache
+
+
+def test_cache_loads_value_only_once():
+    """Tests that a cached value is only loaded on the first lookup."""
+    cache = TTLCache(ttl=60)
+    load = MagicMock(return_value="value")
+
+    assert cache.get_or_load("key", load) == "value"
+    assert cache.get_or_load("key", load) == "value"
+
+    load.assert_called_once()
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.size) == (1, 1, 1)
+    assert info.hit_rate == 0.5
+
+
+def test_cache_entries_expire(mocker):
+    """Tests that cache entries expire after the TTL."""
+    mock_time = mocker.patch(
+        "zenml.utils.ttl_cache.time.monotonic", return_value=0
+    )
+    cache = TTLCache(ttl=10)
+    cache.set("key", "value")
+
+    mock_time.return_value = 9
+    assert cache.get("key") == "value"
+
+    mock_time.return_value = 10
+    assert cache.get("key") is None
+    assert cache.cache_info().size == 0
+
+
+def test_cache_invalidation():
+    """Tests invalidating single or all cache entries."""
+    cache = TTLCache(ttl=60)
+    cache.set("key_1", 1)
+    cache.set("key_2", 2)
+
+    cache.invalidate("key_1")
+    assert cache.get("key_1") is None
+    assert cache.get("key_2") == 2
+
+    cache.invalidate()
+    assert cache.get("key_2") is None
+
+
+def test_cache_evicts_least_recently_used_entry():
+    """Tests that the least recently used entry is evicted if full."""
+    cache = TTLCache(ttl=60, max_size=2)
+    cache.set("key_1", 1)
+    cache.set("key_2", 2)
+    cache.get("key_1")
+    cache.set("key_3", 3)
+
+    assert cache.get("key_1") == 1
+    assert cache.get("key_2") is None
+    assert cache.get("key_3") == 3
+
+
+def test_cache_with_non_positive_ttl_stores_nothing():
+    """Tests that caching is disabled for a non-positive TTL."""
+    cache = TTLCache(ttl=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+
+
+def test_cache_entries_with_custom_ttl(mocker):
+    """Tests that a per-entry TTL overrides the TTL of the cache."""
+    mock_time = mocker.patch(
+        "zenml.utils.ttl_cache.time.monotonic", return_value=0
+    )
+    cache = TTLCache(ttl=0)
+    cache.set("key", "value")
+    cache.set("pinned_key", "pinned_value", ttl=math.inf)
+
+    mock_time.return_value = 10**9
+    assert cache.get("key") is None
+    assert cache.get("pinned_key") == "pinned_value"
@@ -0,0 +1,99 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import pytest
+
+from zenml.client import Client
+from zenml.models import UserRequestModel, UserUpdateModel
+from zenml.models.user_models import UserAuthModel
+from zenml.utils.string_utils import random_str
+from zenml.zen_server import auth
+from zenml.zen_server.auth import (
+    authenticate_credentials,
+    invalidate_auth_cache,
+)
+
+
+@pytest.fixture
+def zen_store(mocker):
+    """Uses the client store as server store and clears the auth cache."""
+    store = Client().zen_store
+    mocker.patch.object(auth, "zen_store", return_value=store)
+    invalidate_auth_cache()
+    yield store
+    invalidate_auth_cache()
+
+
+@pytest.fixture
+def user(zen_store):
+    """Creates an active user with a password."""
+    user = zen_store.create_user(
+        UserRequestModel(
+            name=f"auth_user_{random_str(6)}", password="secret", active=True
+        )
+    )
+    yield user
+    zen_store.delete_user(user.id)
+
+
+def test_access_token_user_lookup_is_cached(mocker, zen_store, user):
+    """Tests that the user of an access token is only looked up once."""
+    token = user.generate_access_token(permissions=["read"])
+    get_auth_user = mocker.spy(type(zen_store), "get_auth_user")
+
+    for _ in range(3):
+        auth_context = authenticate_credentials(access_token=token)
+        assert auth_context.user.id == user.id
+    assert get_auth_user.call_count == 1
+
+    invalidate_auth_cache()
+    authenticate_credentials(access_token=token)
+    assert get_auth_user.call_count == 2
+
+
+def test_invalid_access_token_is_not_cached(zen_store, user):
+    """Tests that invalid access tokens are rejected."""
+    assert authenticate_credentials(access_token="invalid") is None
+
+
+def test_password_verification_is_cached(mocker, zen_store, user):
+    """Tests that valid passwords are only verified once."""
+    verify_password = mocker.spy(UserAuthModel, "verify_password")
+
+    for _ in range(3):
+        auth_context = authenticate_credentials(
+            user_name_or_id=user.name, password="secret"
+        )
+        assert auth_context.user.id == user.id
+    assert verify_password.call_count == 1
+
+    assert (
+        authenticate_credentials(user_name_or_id=user.name, password="wrong")
+        is None
+    )
+    assert (
+        authenticate_credentials(user_name_or_id=user.name, password="wrong")
+        is None
+    )
+    assert verify_password.call_count == 3
+
+
+def test_deactivated_user_is_rejected_after_invalidation(zen_store, user):
+    """Tests that invalidating the cache picks up deactivated users."""
+    token = user.generate_access_token(permissions=["read"])
+    assert authenticate_credentials(access_token=token) is not None
+
+    zen_store.update_user(user.id, UserUpdateModel(active=False))
+    invalidate_auth_cache()
+
+    assert authenticate_credentials(access_token=token) is None
@@ -0,0 +1,94 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import gzip
+import os
+
+from fastapi import FastAPI, Request
+from starlette.testclient import TestClient
+
+from zenml.zen_server.utils import GZipRequestMiddleware
+
+
+def _get_test_client(**middleware_kwargs) -> TestClient:
+    """Creates a test client for an app that echoes the request body."""
+    app = FastAPI()
+    app.add_middleware(GZipRequestMiddleware, **middleware_kwargs)
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {
+            "body": (await request.body()).decode(),
+            "encoding": request.headers.get("content-encoding"),
+        }
+
+    return TestClient(app)
+
+
+def test_gzip_request_middleware_decompresses_request_body():
+    """Tests that gzip encoded request bodies get decompressed."""
+    client = _get_test_client()
+    response = client.post(
+        "/echo",
+        data=gzip.compress(b'{"name": "aria"}'),
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"body": '{"name": "aria"}', "encoding": None}
+
+
+def test_gzip_request_middleware_passes_through_plain_request_body():
+    """Tests that request bodies without encoding are left unchanged."""
+    client = _get_test_client()
+    response = client.post("/echo", data=b"plain")
+
+    assert response.status_code == 200
+    assert response.json() == {"body": "plain", "encoding": None}
+
+
+def test_gzip_request_middleware_rejects_invalid_body():
+    """Tests that invalid gzip encoded request bodies get rejected."""
+    client = _get_test_client()
+    response = client.post(
+        "/echo", data=b"not gzip", headers={"Content-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_gzip_request_middleware_rejects_too_large_body():
+    """Tests that too large gzip encoded request bodies get rejected."""
+    client = _get_test_client(max_size=100)
+    response = client.post(
+        "/echo",
+        data=gzip.compress(os.urandom(1000)),
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    assert response.status_code == 413
+
+
+def test_gzip_request_middleware_rejects_gzip_bomb():
+    """Tests that request bodies which decompress to more than the limit get
+    rejected."""
+    client = _get_test_client(max_decompressed_size=1024 * 1024)
+    compressed_body = gzip.compress(b"0" * 100 * 1024 * 1024)
+    response = client.post(
+        "/echo",
+        data=compressed_body,
+        headers={"Content-Encoding": "gzip"},
+    )
+
+    assert len(compressed_body) < 1024 * 1024
+    assert response.status_code == 413
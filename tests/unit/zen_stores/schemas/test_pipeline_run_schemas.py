@@ -0,0 +1,95 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+from uuid import uuid4
+
+import pytest
+
+from zenml.enums import ExecutionStatus
+from zenml.zen_stores.schemas import PipelineRunSchema
+
+
+def _create_run_schema(num_steps: int) -> PipelineRunSchema:
+    """Creates a running pipeline run schema without any step runs."""
+    return PipelineRunSchema(
+        name="run",
+        workspace_id=uuid4(),
+        status=ExecutionStatus.RUNNING,
+        pipeline_configuration="{}",
+        num_steps=num_steps,
+        client_version="0.0.0",
+    )
+
+
+@pytest.mark.parametrize(
+    "step_statuses, num_steps, expected_run_status",
+    [
+        (
+            [ExecutionStatus.COMPLETED, ExecutionStatus.FAILED],
+            2,
+            ExecutionStatus.FAILED,
+        ),
+        ([ExecutionStatus.COMPLETED], 2, ExecutionStatus.RUNNING),
+        (
+            [ExecutionStatus.COMPLETED, ExecutionStatus.RUNNING],
+            2,
+            ExecutionStatus.RUNNING,
+        ),
+        (
+            [ExecutionStatus.COMPLETED, ExecutionStatus.COMPLETED],
+            2,
+            ExecutionStatus.COMPLETED,
+        ),
+        (
+            [ExecutionStatus.CACHED, ExecutionStatus.COMPLETED],
+            2,
+            ExecutionStatus.COMPLETED,
+        ),
+    ],
+)
+def test_pipeline_run_status_is_derived_from_step_counts(
+    step_statuses, num_steps, expected_run_status
+):
+    """Tests deriving the pipeline run status from the step run counts."""
+    run = _create_run_schema(num_steps=num_steps)
+    for status in step_statuses:
+        run.update_step_counts(old_status=None, new_status=status)
+
+    assert run.status == expected_run_status
+    if expected_run_status == ExecutionStatus.RUNNING:
+        assert run.end_time is None
+    else:
+        assert run.end_time is not None
+
+
+def test_changing_step_status_updates_step_counts():
+    """Tests that status changes of step runs move them between counts."""
+    run = _create_run_schema(num_steps=1)
+
+    run.update_step_counts(old_status=None, new_status=ExecutionStatus.RUNNING)
+    assert run.num_running_steps == 1
+    assert run.status == ExecutionStatus.RUNNING
+
+    run.update_step_counts(
+        old_status=ExecutionStatus.RUNNING,
+        new_status=ExecutionStatus.COMPLETED,
+    )
+    assert run.num_running_steps == 0
+    assert run.num_completed_steps == 1
+    assert run.status == ExecutionStatus.COMPLETED
+
+    run.update_step_counts(
+        old_status=ExecutionStatus.COMPLETED,
+        new_status=ExecutionStatus.COMPLETED,
+    )
+    assert run.num_completed_steps == 1
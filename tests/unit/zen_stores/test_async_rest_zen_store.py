@@ -0,0 +1,182 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import asyncio
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from zenml.client import Client
+from zenml.zen_stores.async_rest_zen_store import AsyncRestZenStore
+from zenml.zen_stores.rest_zen_store import (
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+
+def _get_rest_store() -> RestZenStore:
+    """Creates a REST store without connecting to a server."""
+    config = RestZenStoreConfiguration(
+        url="https://zenml.example.com", api_token="token"
+    )
+    return RestZenStore.construct(config=config, _api_token="token")
+
+
+def _mock_server(mocker, artifact_model, requests):
+    """Mocks a server that returns the given artifact for all requests."""
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(
+            state["max_in_flight"], state["in_flight"]
+        )
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        artifact_id = request.url.path.rsplit("/", 1)[-1]
+        body = artifact_model.copy(update={"id": artifact_id})
+        return httpx.Response(200, content=body.json())
+
+    mocker.patch(
+        "zenml.zen_stores.async_rest_zen_store.httpx.AsyncHTTPTransport",
+        return_value=httpx.MockTransport(handler),
+    )
+    return state
+
+
+def test_async_store_fetches_resources_concurrently(
+    mocker, sample_artifact_model
+):
+    """Tests that the async store sends a bounded number of requests."""
+    requests = []
+    state = _mock_server(mocker, sample_artifact_model, requests)
+    artifact_ids = [uuid4() for _ in range(6)]
+
+    async def _gather():
+        async with AsyncRestZenStore(
+            _get_rest_store(), max_concurrent_requests=3
+        ) as store:
+            return await asyncio.gather(
+                *(store.get_artifact(id_) for id_ in artifact_ids)
+            )
+
+    artifacts = asyncio.run(_gather())
+
+    assert [artifact.id for artifact in artifacts] == artifact_ids
+    assert len(requests) == 6
+    assert requests[0].headers["Authorization"] == "Bearer token"
+    assert requests[0].url.path.startswith("/api/v1/artifacts/")
+    assert 1 < state["max_in_flight"] <= 3
+
+
+def test_async_store_logs_in_once_if_token_expired(
+    mocker, sample_artifact_model
+):
+    """Tests that concurrent requests with an expired token log in once."""
+    requests = []
+    logins = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/login"):
+            logins.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"access_token": "new_token"})
+
+        requests.append(request)
+        if request.headers["Authorization"] != "Bearer new_token":
+            return httpx.Response(401, json={"detail": "Token expired."})
+
+        artifact_id = request.url.path.rsplit("/", 1)[-1]
+        body = sample_artifact_model.copy(update={"id": artifact_id})
+        return httpx.Response(200, content=body.json())
+
+    mocker.patch(
+        "zenml.zen_stores.async_rest_zen_store.httpx.AsyncHTTPTransport",
+        return_value=httpx.MockTransport(handler),
+    )
+    mock_sync_login = mocker.patch(
+        "zenml.zen_stores.rest_zen_store.requests.post"
+    )
+    config = RestZenStoreConfiguration(
+        url="https://zenml.example.com",
+        username="user",
+        password="password",
+        api_token="expired_token",
+    )
+    rest_store = RestZenStore.construct(
+        config=config, _api_token="expired_token"
+    )
+    artifact_ids = [uuid4() for _ in range(5)]
+
+    async def _gather():
+        async with AsyncRestZenStore(
+            rest_store, max_concurrent_requests=5
+        ) as store:
+            return await asyncio.gather(
+                *(store.get_artifact(id_) for id_ in artifact_ids)
+            )
+
+    artifacts = asyncio.run(_gather())
+
+    assert [artifact.id for artifact in artifacts] == artifact_ids
+    assert len(logins) == 1
+    assert len(requests) == 10
+    mock_sync_login.assert_not_called()
+    assert rest_store.config.api_token == "expired_token"
+
+
+def test_async_store_requires_context_manager():
+    """Tests that the async store fails if it wasn't opened."""
+    store = AsyncRestZenStore(_get_rest_store())
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(store.get_artifact(uuid4()))
+
+
+def test_client_gets_resources_concurrently_from_server(
+    mocker, sample_artifact_model
+):
+    """Tests that the client uses the async store when using a server."""
+    requests = []
+    _mock_server(mocker, sample_artifact_model, requests)
+    mocker.patch.object(
+        Client,
+        "zen_store",
+        new_callable=mocker.PropertyMock,
+        return_value=_get_rest_store(),
+    )
+    artifact_ids = [uuid4() for _ in range(3)]
+
+    artifacts = Client().get_artifacts_by_ids(artifact_ids)
+
+    assert [artifact.id for artifact in artifacts] == artifact_ids
+    assert len(requests) == 3
+
+
+def test_client_gets_resources_sequentially_from_local_store(
+    mocker, sample_artifact_model
+):
+    """Tests that the client falls back to the sync store if not remote."""
+    mock_get_artifact = mocker.patch.object(
+        type(Client().zen_store),
+        "get_artifact",
+        return_value=sample_artifact_model,
+    )
+    artifact_ids = [uuid4() for _ in range(3)]
+
+    artifacts = Client().get_artifacts_by_ids(artifact_ids)
+
+    assert artifacts == [sample_artifact_model] * 3
+    assert mock_get_artifact.call_count == 3
@@ -0,0 +1,91 @@
+#  Copyright (c) ZenML GmbH 2023. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at:
+#
+#       https://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express
+#  or implied. See the License for the specific language governing
+#  permissions and limitations under the License.
+import gzip
+import json
+
+from zenml.constants import GZIP_MINIMUM_SIZE
+from zenml.zen_stores.rest_zen_store import (
+    HTTP_RETRY_STATUS_CODES,
+    JitteredRetry,
+    RestZenStore,
+    RestZenStoreConfiguration,
+)
+
+
+def _get_rest_store(mocker, **config_kwargs) -> RestZenStore:
+    """Creates a REST store without connecting to a server."""
+    mocker.patch.object(RestZenStore, "_get_auth_token", return_value="token")
+    config = RestZenStoreConfiguration(
+        url="https://zenml.example.com", api_token="token", **config_kwargs
+    )
+    return RestZenStore.construct(config=config)
+
+
+def test_session_uses_pooled_adapter_with_retries(mocker):
+    """Tests that the session mounts a pooled adapter that retries."""
+    store = _get_rest_store(
+        mocker, pool_maxsize=32, max_retries=5, retry_backoff_factor=1.0
+    )
+
+    adapter = store.session.get_adapter("https://zenml.example.com")
+    assert adapter._pool_maxsize == 32
+    assert isinstance(adapter.max_retries, JitteredRetry)
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 1.0
+    assert set(adapter.max_retries.status_forcelist) == set(
+        HTTP_RETRY_STATUS_CODES
+    )
+    # Non-idempotent requests must not be retried
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_retry_backoff_time_is_jittered():
+    """Tests that the backoff time is randomized up to the exponential one."""
+    retry = JitteredRetry(total=10, backoff_factor=1.0)
+    for _ in range(4):
+        retry = retry.increment(method="GET", url="/")
+
+    backoff_times = {retry.get_backoff_time() for _ in range(20)}
+    assert all(0 <= t <= 8 for t in backoff_times)
+    assert len(backoff_times) > 1
+
+
+def test_large_request_bodies_get_compressed(mocker):
+    """Tests that large request bodies get gzip compressed if enabled."""
+    store = _get_rest_store(mocker, compress_requests=True)
+    mock_request = mocker.patch.object(store.session, "request")
+    mocker.patch.object(RestZenStore, "_handle_response", return_value={})
+
+    data = json.dumps({"value": "a" * GZIP_MINIMUM_SIZE})
+    store._request("POST", "https://zenml.example.com/api", data=data)
+
+    kwargs = mock_request.call_args.kwargs
+    assert kwargs["headers"]["Content-Encoding"] == "gzip"
+    assert gzip.decompress(kwargs["data"]).decode() == data
+
+    store._request("POST", "https://zenml.example.com/api", data="{}")
+    assert mock_request.call_args.kwargs["data"] == "{}"
+
+
+def test_request_bodies_are_not_compressed_by_default(mocker):
+    """Tests that request bodies are sent uncompressed by default."""
+    store = _get_rest_store(mocker)
+    mock_request = mocker.patch.object(store.session, "request")
+    mocker.patch.object(RestZenStore, "_handle_response", return_value={})
+
+    data = json.dumps({"value": "a" * GZIP_MINIMUM_SIZE})
+    store._request("POST", "https://zenml.example.com/api", data=data)
+
+    assert mock_request.call_args.kwargs["data"] == data
+    assert "headers" not in mock_request.call_args.kwargs